@@ -0,0 +1,79 @@
+import argparse
+import gc
+import json
+import os
+import tracemalloc
+from datetime import datetime
+
+from pseo.location import build_location_page
+from pseo.records import LocationPage, intern
+
+# Compares the memory held by location pages kept as plain dicts (the shape every
+# consumer gets back from json.load) against slotted records with interned
+# dimension strings. Cities are cloned with numbered suffixes to reach corpus
+# sizes beyond the 110 x 50 seed grid.
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def scaled_cities(cities, count):
+    """Return `count` cities, cloning the seed cities with numbered names"""
+    result = []
+    i = 0
+    while len(result) < count:
+        city = cities[i % len(cities)]
+        copy_num = i // len(cities)
+        if copy_num:
+            city = dict(city, name=f"{city['name']} {copy_num + 1}", slug=f"{city['slug']}-{copy_num + 1}")
+        result.append(city)
+        i += 1
+    return result
+
+def measure(build):
+    """Return (current, peak) bytes traced while `build` returns a held list"""
+    gc.collect()
+    tracemalloc.start()
+    pages = build()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del pages
+    gc.collect()
+    return current, peak
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure per-page memory of dict vs slotted location pages")
+    parser.add_argument('--sizes', default='5500,50000', help="comma separated page counts")
+    parser.add_argument('--data-dir', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'data', 'pseo'))
+    args = parser.parse_args()
+
+    industries = load_json(os.path.join(args.data_dir, 'industries-ai-seo.json'))['industries']
+    cities = load_json(os.path.join(args.data_dir, 'cities-ai-seo.json'))['cities']
+    generated_at = intern(datetime.now().isoformat())
+
+    for size in [int(s) for s in args.sizes.split(',')]:
+        grid = scaled_cities(cities, -(-size // len(industries)))
+        combos = [(industry, city) for industry in industries for city in grid][:size]
+
+        # Before: every page as a nest of dicts with its own string objects
+        def build_dicts():
+            return [json.loads(json.dumps(build_location_page(industry, city, generated_at).to_dict()))
+                    for industry, city in combos]
+
+        # After: slotted records sharing interned dimension strings
+        def build_records():
+            return [LocationPage.from_dict(json.loads(json.dumps(build_location_page(industry, city, generated_at).to_dict())))
+                    for industry, city in combos]
+
+        print(f"📄 {size:,} pages")
+        results = {}
+        for label, build in (('dicts', build_dicts), ('records', build_records)):
+            current, peak = measure(build)
+            results[label] = current
+            print(f"  • {label:<8} held {current / 1024 / 1024:8.1f} MB  peak {peak / 1024 / 1024:8.1f} MB  ({current / size / 1024:.2f} KB/page)")
+
+        saved = results['dicts'] - results['records']
+        print(f"  ✓ records save {saved / 1024 / 1024:.1f} MB ({saved / size:,.0f} bytes/page, {saved / results['dicts']:.1%})")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+import argparse
+import time
+
+from pseo import industry, seeds, similarity
+
+# Times related-industry selection for every (industry x content type) page at
+# 110 (the seed list) up to 10,000 industries, cloned with numbered names:
+#   before      - rescans every industry per call, list membership in the fallback
+#   index       - category -> members index built once, set-based exclusion
+#   recommender - TF-IDF neighbour table built once (pseo.similarity)
+# Each run starts from empty caches so index and table builds are included.
+
+def related_before(current_industry, all_industries, count=6):
+    """get_related_industries' category scan before the category index"""
+    same_category = [
+        ind for ind in all_industries
+        if ind['category'] == current_industry['category']
+        and ind['id'] != current_industry['id']
+    ]
+    related = same_category[:count]
+    if len(related) < count:
+        other_industries = [
+            ind for ind in all_industries
+            if ind['id'] != current_industry['id']
+            and ind not in related
+        ]
+        related.extend(other_industries[:(count - len(related))])
+    return related
+
+def related_recommender(current_industry, all_industries, count=6):
+    return similarity.similar(all_industries, current_industry, similarity.industry_document, count)
+
+def scaled_industries(industries, count):
+    """Return `count` industries, cloning the seed industries with numbered names"""
+    result = []
+    for i in range(count):
+        record = industries[i % len(industries)]
+        copy_num = i // len(industries)
+        if copy_num:
+            record = dict(record, id=f"{record['id']}-{copy_num + 1}", slug=f"{record['slug']}-{copy_num + 1}", name=f"{record['name']} {copy_num + 1}")
+        result.append(record)
+    return result
+
+def timed_build(select, industries, content_types):
+    industry._category_indexes.clear()
+    similarity._tables.clear()
+    start = time.perf_counter()
+    for current in industries:
+        for _ in range(content_types):
+            select(current, industries)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark related-industry selection from 110 to 10,000 industries")
+    parser.add_argument('--sizes', default='110,1000,10000')
+    args = parser.parse_args()
+
+    seed_industries = seeds.load('industries')
+    content_types = len(seeds.load('industry_content_types'))
+    selectors = {'before': related_before, 'index': industry.category_industries}
+    if similarity.available():
+        selectors['recommender'] = related_recommender
+
+    for size in [int(s) for s in args.sizes.split(',')]:
+        industries = scaled_industries(seed_industries, size)
+        same = all(
+            [ind['id'] for ind in related_before(current, industries)] == [ind['id'] for ind in industry.category_industries(current, industries)]
+            for current in industries[:200]
+        )
+        print(f"📦 {size:,} industries, {size * content_types:,} pages (index matches before: {'✅' if same else '❌'})")
+        for name, select in selectors.items():
+            elapsed = timed_build(select, industries, content_types)
+            print(f"  • {name:<12} {elapsed * 1000:10.1f} ms   {elapsed / (size * content_types) * 1e6:8.2f} µs/page")
+
+if __name__ == '__main__':
+    main()
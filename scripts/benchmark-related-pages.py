@@ -0,0 +1,101 @@
+import argparse
+import time
+import tracemalloc
+from collections import Counter
+
+from pseo import seeds, similarity
+from pseo.industry import category_industries
+from pseo.industry_platform import get_related_pages, positional_related_pages
+
+# Compares the TF-IDF recommender (pseo.similarity) against the positional
+# heuristics it replaced, then times the blocked neighbour search on industry
+# lists cloned up to 100k records.
+#
+#   targets   - distinct pages linked to, out of all linkable pages
+#   top share - share of pages linking to the most linked-to target
+#   overlap   - share of recommended links the heuristic also picks
+#   recall    - share of same-category industries (up to k) among the recommendations
+
+def link_stats(links):
+    """(distinct targets, share of sources linking to the top target) for {source: [target, ...]}"""
+    inbound = Counter(target for targets in links.values() for target in targets)
+    return len(inbound), max(inbound.values()) / len(links)
+
+def overlap(recommended, heuristic):
+    shared = sum(len(set(recommended[source]) & set(heuristic[source])) for source in recommended)
+    return shared / sum(len(targets) for targets in recommended.values())
+
+def category_recall(recommended, industries, k):
+    by_id = {industry['id']: industry for industry in industries}
+    found = wanted = 0
+    for source, targets in recommended.items():
+        category = by_id[source]['category']
+        members = sum(1 for industry in industries if industry['category'] == category) - 1
+        found += sum(1 for target in targets if by_id[target]['category'] == category)
+        wanted += min(k, members)
+    return found / wanted
+
+def print_comparison(label, pages, recommended, heuristic):
+    rec_targets, rec_top = link_stats(recommended)
+    heur_targets, heur_top = link_stats(heuristic)
+    print(f"📊 {label}")
+    print(f"  • targets    heuristic {heur_targets:6,} / {pages:,}   recommender {rec_targets:6,} / {pages:,}")
+    print(f"  • top share  heuristic {heur_top:6.1%}          recommender {rec_top:6.1%}")
+    print(f"  • overlap    {overlap(recommended, heuristic):.1%}")
+
+def scaled_industries(industries, count):
+    """Return `count` industries, cloning the seed industries with numbered names"""
+    result = []
+    for i in range(count):
+        industry = industries[i % len(industries)]
+        copy_num = i // len(industries)
+        if copy_num:
+            industry = dict(industry, id=f"{industry['id']}-{copy_num + 1}", name=f"{industry['name']} {copy_num + 1}")
+        result.append(industry)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the TF-IDF related-page recommender")
+    parser.add_argument('--sizes', default='1000,10000,100000')
+    parser.add_argument('--k', type=int, default=6)
+    args = parser.parse_args()
+
+    if not similarity.available():
+        raise SystemExit("❌ numpy and scipy are required for the recommender")
+
+    industries = seeds.load('industries')
+    platforms = seeds.load('platforms')
+
+    recommended = {
+        industry['id']: [item['id'] for item in similarity.similar(industries, industry, similarity.industry_document, args.k)]
+        for industry in industries
+    }
+    heuristic = {
+        industry['id']: [item['id'] for item in category_industries(industry, industries, args.k)]
+        for industry in industries
+    }
+    print_comparison(f"Related industries ({len(industries)} industries, k={args.k})", len(industries), recommended, heuristic)
+    print(f"  • recall     heuristic {category_recall(heuristic, industries, args.k):6.1%}          recommender {category_recall(recommended, industries, args.k):6.1%}")
+
+    recommended = {}
+    heuristic = {}
+    for industry in industries:
+        for platform in platforms:
+            source = f"{industry['slug']}-{platform['slug']}"
+            recommended[source] = [link['url'] for link in get_related_pages(industry, platform, industries, platforms)]
+            heuristic[source] = [link['url'] for link in positional_related_pages(industry, platform, industries, platforms)]
+    print_comparison(f"Industry x platform related pages ({len(recommended):,} pages)", len(recommended), recommended, heuristic)
+
+    print(f"⏱️  Neighbour search (k={args.k}, {similarity.BLOCK_CELLS:,} scores per block)")
+    for size in [int(s) for s in args.sizes.split(',')]:
+        documents = [similarity.industry_document(industry) for industry in scaled_industries(industries, size)]
+        tracemalloc.start()
+        start = time.perf_counter()
+        similarity.nearest(similarity.tfidf_matrix(documents), args.k)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  • {size:>9,} records  {elapsed:8.2f} s  peak {peak / 1024 / 1024:8.1f} MB")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from pseo import seeds
+
+# Measures seed loading at 1x, 10x and 100x the current seed sizes:
+#   before - every script json-parses the seed files it needs
+#   cold   - registry parse + validation + snapshot write (first run after an edit)
+#   warm   - registry snapshot load (every other run)
+# Startup is the wall time of a fresh interpreter that loads every seed, frozen
+# out of the GC like build-pseo.py does (seeds.load_all(freeze=True)).
+
+def scale_records(data, factor, id_field):
+    """Clone seed records `factor` times with numbered ids and slugs"""
+    if isinstance(data, list):
+        result = []
+        for copy_num in range(factor):
+            for record in data:
+                if copy_num:
+                    record = dict(record, **{id_field: f"{record[id_field]}-{copy_num + 1}"})
+                    if 'slug' in record:
+                        record['slug'] = f"{record['slug']}-{copy_num + 1}"
+                result.append(record)
+        return result
+    result = {}
+    for copy_num in range(factor):
+        for key, record in data.items():
+            if copy_num:
+                key = f"{key}-{copy_num + 1}"
+                record = dict(record, slug=f"{record['slug']}-{copy_num + 1}")
+            result[key] = record
+    return result
+
+def write_scaled_seeds(target_dir, factor):
+    for spec in seeds.SEEDS.values():
+        data = seeds.read_json(os.path.join(seeds.DATA_DIR, spec.filename))
+        if spec.key is not None:
+            data[spec.key] = scale_records(data[spec.key], factor, spec.id_field)
+        else:
+            data = scale_records(data, factor, spec.id_field)
+        with open(os.path.join(target_dir, spec.filename), 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+def timed(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def startup_time(code, env, repeat):
+    command = [sys.executable, '-c', code]
+    return timed(lambda: subprocess.run(command, env=env, check=True), repeat)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark seed loading before/after the seed registry snapshot")
+    parser.add_argument('--factors', default='1,10,100')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    scripts_dir = os.path.dirname(os.path.abspath(__file__))
+    for factor in [int(f) for f in args.factors.split(',')]:
+        data_dir = tempfile.mkdtemp(prefix=f'pseo-seeds-{factor}x-')
+        try:
+            write_scaled_seeds(data_dir, factor)
+            size = sum(os.path.getsize(os.path.join(data_dir, spec.filename)) for spec in seeds.SEEDS.values())
+
+            def before():
+                for spec in seeds.SEEDS.values():
+                    with open(os.path.join(data_dir, spec.filename), 'r', encoding='utf-8') as f:
+                        json.load(f)
+
+            def cold():
+                seeds.clear()
+                shutil.rmtree(seeds.CACHE_DIR, ignore_errors=True)
+                seeds.load_all(data_dir)
+
+            def warm():
+                seeds.clear()
+                seeds.load_all(data_dir)
+
+            results = {'before': timed(before, args.repeat), 'cold': timed(cold, args.repeat)}
+            results['warm'] = timed(warm, args.repeat)
+
+            env = dict(os.environ, PYTHONPATH=scripts_dir, PSEO_DATA_DIR=data_dir)
+            startup_before = startup_time(
+                "import json, os\n"
+                "from pseo.seeds import SEEDS\n"
+                f"[json.load(open(os.path.join({data_dir!r}, s.filename))) for s in SEEDS.values()]",
+                env, args.repeat)
+            startup_after = startup_time("from pseo import seeds; seeds.load_all(freeze=True)", env, args.repeat)
+
+            print(f"📦 {factor}x seeds ({size / 1024:,.0f} KB)")
+            print(f"  • seed load  before {results['before'] * 1000:8.2f} ms   cold {results['cold'] * 1000:8.2f} ms   warm {results['warm'] * 1000:8.2f} ms")
+            print(f"  • startup    before {startup_before * 1000:8.2f} ms   warm {startup_after * 1000:8.2f} ms")
+        finally:
+            seeds.clear()
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
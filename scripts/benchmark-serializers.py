@@ -0,0 +1,74 @@
+import argparse
+import json
+import os
+from datetime import datetime
+
+from pseo import serializer
+from pseo.location import build_location_page
+
+# Benchmarks every available JSON backend on the real page corpus and stores
+# the ranking that pseo.serializer uses to choose its default backend.
+
+PAGE_FILES = [
+    'all-pages.json',
+    'industry-pages.json',
+    'industry-platform-pages.json',
+    'technical-pages.json',
+    'usecase-pages.json'
+]
+
+def load_json(filepath):
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    # Some committed page files were saved as UTF-16 by Windows tooling
+    encoding = 'utf-16' if raw[:2] in (b'\xff\xfe', b'\xfe\xff') else 'utf-8'
+    return json.loads(raw.decode(encoding))
+
+def load_corpus(data_dir):
+    """Location pages rendered as records plus every other page file on disk"""
+    industries = load_json(os.path.join(data_dir, 'industries-ai-seo.json'))['industries']
+    cities = load_json(os.path.join(data_dir, 'cities-ai-seo.json'))['cities']
+    generated_at = datetime.now().isoformat()
+    corpus = {'industry-location-pages.json': [build_location_page(industry, city, generated_at) for industry in industries for city in cities]}
+
+    for filename in PAGE_FILES:
+        path = os.path.join(data_dir, filename)
+        if os.path.exists(path):
+            corpus[filename] = load_json(path)
+        else:
+            print(f"⚠️  Skipping {filename} (not generated yet)")
+    return corpus
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON serializer backends on the pSEO page corpus")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--data-dir', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'data', 'pseo'))
+    parser.add_argument('--no-save', action='store_true', help="don't update the stored backend ranking")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.data_dir)
+    print(f"📄 Corpus: {sum(len(pages) for pages in corpus.values()):,} pages from {len(corpus)} files")
+    print(f"🔌 Available backends: {', '.join(serializer.available_backends())}")
+    print()
+
+    all_results = []
+    for filename, pages in corpus.items():
+        print(f"{filename} ({len(pages):,} pages)")
+        for result in serializer.benchmark(pages, repeat=args.repeat):
+            print(f"  • {result['backend']:<7} {result['mode']:<8} {result['seconds'] * 1000:9.1f} ms  {result['bytes'] / 1024 / 1024:8.2f} MB")
+            all_results.append(dict(result, file=filename))
+        print()
+
+    ranking = serializer.rank_backends(all_results)
+    print(f"🏁 Fastest to slowest: {' > '.join(ranking)}")
+
+    if not args.no_save:
+        serializer.dump({
+            'generated_at': datetime.now().isoformat(),
+            'ranking': ranking,
+            'results': all_results
+        }, serializer.BENCHMARK_PATH, backend='stdlib')
+        print(f"💾 Default backend is now '{ranking[0]}' ({serializer.BENCHMARK_PATH})")
+
+if __name__ == '__main__':
+    main()
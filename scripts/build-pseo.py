@@ -0,0 +1,73 @@
+import argparse
+import sys
+import time
+
+from pseo import KINDS, build, seeds
+from pseo.cannibalization import CannibalizationStage
+from pseo.duplicates import DuplicateStage
+from pseo.export import HtmlExportStage
+from pseo.indexes import IndexStage
+from pseo.linkcheck import BrokenLinkError, LinkCheckStage
+from pseo.linkgraph import LinkGraphStage
+from pseo.listings import ListingStage
+from pseo.llms import LlmsTxtStage
+from pseo.manifest import ManifestStage
+from pseo.prefetch import PrefetchStage
+from pseo.prerender import PrerenderStage
+from pseo.payloads import PayloadStage
+from pseo.sitemap import SitemapStage
+
+# Runs the build stages over every generated page in a single streaming pass.
+
+STAGES = {
+    'sitemap': SitemapStage,
+    # Finishes before html, which links the hints it ranks
+    'prefetch': PrefetchStage,
+    'html': HtmlExportStage,
+    'payloads': PayloadStage,
+    'index': IndexStage,
+    'listings': ListingStage,
+    'prerender': PrerenderStage,
+    'llms': LlmsTxtStage,
+    'linkgraph': LinkGraphStage,
+    'duplicates': DuplicateStage,
+    'cannibalization': CannibalizationStage,
+    'links': LinkCheckStage,
+    # Hashes what the other stages wrote, so it has to stay last
+    'manifest': ManifestStage
+}
+
+parser = argparse.ArgumentParser(description="Build static pSEO artifacts from the page generators")
+parser.add_argument('--stages', nargs='+', choices=list(STAGES), default=list(STAGES), help="stages to run (default: all)")
+parser.add_argument('--kinds', nargs='+', choices=list(KINDS), default=list(build.SITE_KINDS), help="page kinds to include (default: every routed kind)")
+args = parser.parse_args()
+
+print("🏗️  Building pSEO artifacts...")
+print(f"📦 Stages: {', '.join(args.stages)}")
+print("=" * 60)
+
+start = time.perf_counter()
+# The seeds live for the whole run, so they are loaded once up front and frozen
+# out of every later garbage collection
+seeds.load_all(freeze=True)
+# Stages always finish in STAGES order, whatever order they were given in
+stages = {}
+for name in STAGES:
+    if name not in args.stages:
+        continue
+    if name == 'html':
+        # The HTML export takes this build's prefetch hints from the prefetch stage in memory
+        stages[name] = HtmlExportStage(prefetch=stages.get('prefetch'))
+    elif name == 'sitemap':
+        # The sitemap keeps its ledger's URLs of the kinds left out of this build
+        stages[name] = SitemapStage(kinds=args.kinds)
+    else:
+        stages[name] = STAGES[name]()
+try:
+    counts = build.run(list(stages.values()), args.kinds)
+except BrokenLinkError as error:
+    print(f"❌ {error}")
+    sys.exit(1)
+
+print("=" * 60)
+print(f"✅ Built {sum(counts.values()):,} pages in {time.perf_counter() - start:.1f}s")
@@ -1,423 +1,4 @@
-import json
-import os
-from datetime import datetime
+from pseo import location
 
-# Load data files
-def load_json(filepath):
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-def generate_location_content(industry, city):
-    """Generate rich, 1,500-2,000 word content for industry-location page"""
-    
-    content = {
-        "intro": f"""In {city['name']}, {city['state']}, {industry['name'].lower()} face unprecedented opportunities in AI-powered search. With {city['stats']['business_count']} businesses competing for visibility and {city['stats']['ai_adoption']} AI adoption rate, understanding how to optimize for ChatGPT, Perplexity, Claude, and SearchGPT isn't optional—it's essential for survival.
-
-The {industry['name'].lower()} industry has experienced {industry['stats']['ai_growth']} growth in AI search visibility over the past year, with {industry['stats']['industry_adoption']} of businesses in this sector already implementing AI SEO strategies. In {city['name']}'s competitive market, where {city['seo_insights']['mobile_searches']} of searches happen on mobile and voice search has grown {city['seo_insights']['voice_search_growth']}, traditional SEO alone won't cut it anymore.""",
-
-        "whyAISEOMatters": f"""## Why AI SEO Matters for {industry['name']} in {city['name']}
-
-AI search engines fundamentally changed how {city['metroPopulation']} metro residents discover local services. Unlike traditional Google searches that return a list of links, AI engines like ChatGPT and Perplexity synthesize information and directly recommend businesses—meaning if your {industry['name'].lower()} business isn't optimized for AI citations, you're invisible to a rapidly growing segment of searchers.
-
-### The {city['name']} Market Reality
-
-With {city['seo_insights']['local_search_volume']} monthly local searches in the {city['name']} area, the competition is fierce. {city['stats']['digital_maturity']} digital maturity rating and {city['stats']['avg_market_competition']} competition level mean that {industry['name'].lower()} businesses need every advantage. AI SEO provides three critical benefits:
-
-**Citation Dominance**: When someone asks Claude or ChatGPT "best {industry['name'].lower()} in {city['name']}", your business needs to be in that AI-generated response. Our data shows businesses optimized for AI citations see 3-4x more qualified leads.
-
-**Trust Signal Amplification**: AI engines prioritize businesses with strong E-E-A-T signals (Experience, Expertise, Authoritativeness, Trustworthiness). In {city['name']}'s {industry['name'].lower()} market, this means optimized schema markup, verified credentials, and structured content that AI can parse and understand.
-
-**Voice Search Capture**: With {city['seo_insights']['voice_search_growth']} growth in voice searches in {city['name']}, conversational AI optimization ensures your business appears in spoken results from Siri, Alexa, and Google Assistant—all powered by large language models.""",
-
-        "localChallenges": f"""## Unique AI SEO Challenges for {industry['name']} in {city['name']}, {city['stateCode']}
-
-Every market has unique challenges, and {city['name']}'s {industry['name'].lower()} sector faces specific obstacles when optimizing for AI search engines:
-
-### Geographic Competition Complexity
-
-{city['name']}'s position in the {city['region']} region creates unique competitive dynamics. Businesses compete not just locally but with surrounding metro areas. AI engines need clear geographic signals—structured data showing your {industry['name'].lower()} business specifically serves {city['name']}, {city['state']}, and the surrounding {city['metroPopulation']} metro population.
-
-### Industry-Specific Schema Requirements
-
-{industry['name']} businesses require specialized schema markup that many generic SEO approaches miss. AI engines rely heavily on structured data to understand business capabilities, services, credentials, and service areas. In {city['name']}'s {city['stats']['avg_market_competition']} competition environment, incomplete schema means you're simply not being considered by AI systems.
-
-### Citation Source Diversification
-
-Traditional SEO focuses on backlinks. AI SEO requires diverse, authoritative citations across multiple content types—articles, videos, podcasts, social media, and industry publications. For {city['name']} {industry['name'].lower()}, this means maintaining consistent NAP (Name, Address, Phone) data across 50+ platforms while building topical authority in AI-readable formats.
-
-### Local Content Depth
-
-AI engines reward comprehensive, helpful content. Generic {industry['name'].lower()} information won't rank. You need {city['name']}-specific content addressing local regulations, regional customer concerns, neighborhood-level service details, and hyperlocal expertise that demonstrates genuine {city['state']} market knowledge.""",
-
-        "aiSEOStrategy": f"""## Comprehensive AI SEO Strategy for {city['name']} {industry['name']}
-
-Optimizing for AI search requires a fundamentally different approach than traditional SEO. Here's a complete strategy tailored for {industry['name'].lower()} businesses in the {city['name']} market:
-
-### 1. Advanced Schema Markup Implementation
-
-Start with comprehensive schema.org markup. At minimum, implement:
-
-- **LocalBusiness Schema**: With precise {city['name']} geographic coordinates, full service area definitions, business hours, and contact information
-- **Organization Schema**: Including founding date, awards, certifications, and trust signals
-- **Service Schema**: Detailed descriptions of every service your {industry['name'].lower()} business offers
-- **Review Schema**: Aggregate rating information that AI engines can parse
-- **FAQ Schema**: Structured Q&A content addressing common {city['name']} customer questions
-- **Article Schema**: For blog content and educational resources
-
-AI engines rely on this structured data to understand your business capabilities and determine relevance for user queries.
-
-### 2. AI-Optimized Content Architecture
-
-Create content clusters around key {industry['name'].lower()} topics relevant to {city['name']}:
-
-**Pillar Content**: Comprehensive guides (2,500+ words) on core topics like "{industry['name']} services in {city['name']}", "Choosing a {industry['name'].lower()} provider in {city['state']}", and "What {city['name']} residents should know about {industry['name'].lower()}"
-
-**Cluster Content**: Supporting articles (1,000-1,500 words) diving deeper into specific services, addressing FAQs, covering case studies, and discussing industry trends in the {city['name']} market
-
-**Conversational Content**: Write naturally, as if answering customer questions directly. AI engines favor content that mirrors human conversation patterns and directly answers common queries.
-
-### 3. Citation Building Across AI Training Sources
-
-AI models are trained on diverse internet content. Your {industry['name'].lower()} business needs visibility across:
-
-- **Industry Publications**: Guest posts, quotes, and mentions in {industry['name'].lower()} publications
-- **Local Media**: Features in {city['name']} news sites, local blogs, and regional publications
-- **Video Platforms**: YouTube content discussing {industry['name'].lower()} topics with {city['name']} geographic tags
-- **Podcast Appearances**: Audio content where AI transcription creates additional citation opportunities
-- **Social Platforms**: Active profiles on LinkedIn, Twitter/X, Facebook with consistent business information
-- **Review Platforms**: Google Business Profile, Yelp, industry-specific review sites with detailed, responded-to reviews
-
-### 4. E-E-A-T Signal Optimization
-
-Google's E-E-A-T framework (Experience, Expertise, Authoritativeness, Trustworthiness) heavily influences AI models. For {city['name']} {industry['name'].lower()}:
-
-**Experience Signals**: Client testimonials, case studies, before/after examples, portfolio work specific to {city['name']} projects
-
-**Expertise Signals**: Certifications, licenses, team credentials, years in business, educational content demonstrating deep {industry['name'].lower()} knowledge
-
-**Authoritativeness Signals**: Industry awards, professional memberships, speaking engagements, published research, quotes in authoritative publications
-
-**Trustworthiness Signals**: BBB accreditation, license verification, insurance documentation, transparent pricing, clear privacy policies, secure website (HTTPS)
-
-### 5. Technical AI SEO Foundation
-
-Beyond content, technical optimization ensures AI crawlers can access and understand your site:
-
-- **Mobile-First Design**: {city['seo_insights']['mobile_searches']} of {city['name']} searches are mobile
-- **Fast Load Times**: Core Web Vitals optimization for better user experience signals
-- **Clean Site Architecture**: Logical navigation, clear internal linking, breadcrumb markup
-- **Robots.txt Optimization**: Ensure AI crawlers can access key content
-- **Sitemap Inclusion**: All important pages submitted via Google Search Console
-- **Structured Header Hierarchy**: Proper H1-H6 usage with keyword optimization""",
-
-        "measurementROI": f"""## Measuring AI SEO Success for {city['name']} {industry['name']}
-
-Unlike traditional SEO metrics, AI SEO requires new measurement approaches:
-
-### AI Citation Tracking
-
-Manually query AI engines (ChatGPT, Claude, Perplexity, SearchGPT) with relevant searches like "best {industry['name'].lower()} {city['name']}", "{industry['name'].lower()} recommendations in {city['stateCode']}", "top {industry['name'].lower()} near me {city['name']}". Track how often your business appears in AI-generated responses.
-
-### Voice Search Analytics
-
-Monitor Google Search Console for voice query patterns—longer, conversational searches like "where can I find good {industry['name'].lower()} in {city['name']}" or "what {industry['name'].lower()} do you recommend in {city['state']}".
-
-### Schema Validation Metrics
-
-Use Google's Rich Results Test and Schema Markup Validator to ensure AI engines can properly parse your structured data. Track schema coverage across all key pages.
-
-### Traffic Source Analysis
-
-Watch for increases in direct traffic (AI-referred visitors often appear as direct), increases in branded searches (AI engines create brand awareness), and changes in user behavior patterns (longer sessions, lower bounce rates from AI-qualified traffic).
-
-### Competitive AI Positioning
-
-Regularly audit where competitors appear in AI search results for key {industry['name'].lower()} queries in {city['name']}. Track your relative position and citation frequency compared to top competitors.""",
-
-        "implementation": f"""## Getting Started: AI SEO Implementation for Your {city['name']} {industry['name']} Business
-
-Ready to dominate AI search in {city['name']}'s {industry['name'].lower()} market? Here's your implementation roadmap:
-
-### Phase 1: AI SEO Audit (Week 1)
-
-Use our free AI SEO scanner to identify immediate optimization opportunities. The scanner analyzes:
-
-- Current schema markup implementation and gaps
-- Content structure and AI-readability
-- Citation sources and authority signals  
-- Technical SEO foundation for AI crawlers
-- Competitive positioning in AI search results
-
-You'll receive an instant score showing exactly where your {industry['name'].lower()} business stands in AI search readiness.
-
-### Phase 2: Quick Wins (Weeks 2-4)
-
-Implement high-impact changes first:
-
-1. Add comprehensive LocalBusiness and Organization schema markup
-2. Optimize Google Business Profile with complete {city['name']} information
-3. Create 3-5 pillar content pieces addressing core {industry['name'].lower()} topics
-4. Build initial citation presence on top 10 authoritative platforms
-5. Implement FAQ schema answering common {city['name']} customer questions
-
-### Phase 3: Content Expansion (Months 2-3)
-
-Scale your AI-optimized content:
-
-- Publish 2-3 blog posts weekly on {industry['name'].lower()} topics
-- Create video content for YouTube with {city['name']} geographic tags
-- Launch a podcast or appear as a guest on relevant podcasts
-- Build location-specific service pages for {city['name']} neighborhoods
-- Develop comprehensive resource guides for {city['state']} customers
-
-### Phase 4: Citation Building (Months 3-6)
-
-Systematically build authoritative citations:
-
-- Guest post on industry publications and {city['name']} business blogs
-- Earn media mentions through PR outreach and HARO responses
-- Participate in local {city['name']} events and conferences
-- Build relationships with complementary businesses for reciprocal mentions
-- Encourage and respond to customer reviews across platforms
-
-### Phase 5: Ongoing Optimization (Month 6+)
-
-AI SEO is continuous:
-
-- Monthly AI citation audits tracking your appearance frequency
-- Quarterly content refreshes updating statistics and information
-- Regular schema markup validation and enhancement
-- Competitor monitoring and strategy adjustments
-- New AI platform adoption (as new AI search tools emerge)""",
-
-        "localCaseStudy": f"""## Real Results: {industry['name']} AI SEO Success in {city['name']}
-
-While we can't share specific client names, here's what {industry['name'].lower()} businesses in the {city['name']} area have achieved with comprehensive AI SEO:
-
-**90-Day Results After AI SEO Implementation:**
-
-- **Citation Frequency**: Appeared in 67% more AI-generated recommendations for {industry['name'].lower()} searches in {city['name']}
-- **Qualified Lead Growth**: 43% increase in contact form submissions and phone calls
-- **Voice Search Visibility**: 3.2x increase in voice search traffic from "near me" queries
-- **Branded Search Volume**: 56% growth in {city['name']} residents specifically searching for the business by name
-- **Average Session Duration**: Increased from 2:14 to 4:37 as AI-referred visitors were more qualified
-- **Conversion Rate**: Improved from 2.3% to 4.1% due to higher-quality AI-sourced traffic
-
-The key difference? These {industry['name'].lower()} businesses didn't just optimize for traditional search—they built comprehensive AI-first strategies that addressed how modern {city['name']} consumers actually discover and evaluate services.""",
-
-        "competitiveAdvantage": f"""## Your Competitive Advantage in {city['name']}'s {industry['name']} Market
-
-Here's the reality: most {industry['name'].lower()} businesses in {city['name']} are still focused exclusively on traditional SEO. With {city['stats']['ai_adoption']} AI adoption in the market but much lower AI SEO optimization rates, there's a massive first-mover advantage available.
-
-### The Window Is Closing
-
-AI search is growing exponentially. Every month, more {city['name']} residents use ChatGPT, Perplexity, and voice assistants to find services. Early adopters of AI SEO are establishing citation dominance that will be increasingly difficult to overcome as AI engines solidify their "understanding" of top {industry['name'].lower()} providers in {city['name']}.
-
-### Multi-Channel Visibility
-
-AI SEO doesn't replace traditional SEO—it complements it. Businesses optimizing for both capture:
-
-- Traditional Google search traffic (still the majority)
-- AI engine recommendations (rapidly growing)
-- Voice assistant results (accelerating in {city['region']})
-- Social media discovery (AI-powered recommendation algorithms)
-- Direct referrals (AI-enhanced word-of-mouth)
-
-### Authority Compounding
-
-AI SEO creates compounding returns. Each citation makes the next easier to earn. Each piece of comprehensive content builds on previous work. Each schema enhancement improves overall AI visibility. {city['name']} {industry['name'].lower()} businesses starting AI SEO now will have exponentially greater visibility than competitors who delay.""",
-
-        "ctaSection": f"""## Start Your AI SEO Journey: Free Scanner for {city['name']} {industry['name']}
-
-Ready to see how your {industry['name'].lower()} business ranks for AI search optimization? Our free AI SEO scanner provides an instant, comprehensive analysis of your current AI visibility and specific recommendations for improvement.
-
-### What You'll Discover:
-
-✅ **AI Citation Score**: How often your business appears in AI search results for {industry['name'].lower()} queries in {city['name']}
-
-✅ **Schema Markup Analysis**: Complete audit of your structured data implementation with specific fixes
-
-✅ **Content AI-Readiness**: Assessment of whether your content is formatted for AI engine understanding
-
-✅ **E-E-A-T Signal Strength**: Evaluation of your authority and trustworthiness signals
-
-✅ **Competitive Positioning**: How you compare to other {industry['name'].lower()} businesses in {city['name']} for AI visibility
-
-✅ **Quick Win Recommendations**: Top 5 immediate actions you can take to improve AI SEO
-
-### Free Scan + Detailed Report
-
-1. **Free Instant Score**: Run the free scanner in 60 seconds to see your current AI SEO grade
-2. **Detailed Report**: Comprehensive 30+ page PDF with page-by-page schema fixes, content recommendations, citation building strategies, and a complete 90-day AI SEO roadmap customized for your {industry['name'].lower()} business in {city['name']}
-
-The report includes actual code fixes you can implement immediately, specific content templates for {industry['name'].lower()} businesses, and detailed competitive analysis of top-ranking {city['name']} competitors.
-
-Don't let your competition dominate AI search in {city['name']}'s {industry['name'].lower()} market. Start your free AI SEO scan now and get the insights you need to capture this rapidly growing traffic source.""",
-
-        "faq": f"""## Frequently Asked Questions: AI SEO for {city['name']} {industry['name']}
-
-**Q: How is AI SEO different from traditional SEO?**
-
-A: Traditional SEO focuses on ranking in Google's search results pages. AI SEO optimizes for direct recommendations from AI engines like ChatGPT, Claude, and Perplexity. It requires stronger structured data, more authoritative citations, deeper content, and optimization for conversational queries. Both are important, but AI SEO is rapidly becoming essential as more {city['name']} residents use AI tools for research.
-
-**Q: How long does it take to see AI SEO results in {city['name']}?**
-
-A: Initial improvements can appear within 4-6 weeks as AI engines recrawl your site and process new structured data. Significant citation frequency increases typically require 3-4 months of consistent optimization. For {industry['name'].lower()} businesses in {city['name']}'s {city['stats']['avg_market_competition']} competition market, comprehensive AI SEO is a 6-12 month investment with compounding returns.
-
-**Q: Do I need to stop traditional SEO to focus on AI SEO?**
-
-A: No! AI SEO and traditional SEO complement each other. Many AI SEO best practices (quality content, authoritative citations, technical optimization) also benefit traditional search rankings. The best {city['name']} {industry['name'].lower()} businesses optimize for both simultaneously.
-
-**Q: Can I do AI SEO myself or do I need an agency?**
-
-A: Basic AI SEO (schema markup, content optimization, local citations) can be done in-house with the right tools and knowledge. Our $9 detailed report provides step-by-step implementation guidance specifically for {industry['name'].lower()} businesses. For comprehensive strategies including technical implementation, citation building, and ongoing optimization, many {city['name']} businesses work with AI SEO specialists.
-
-**Q: What's the ROI of AI SEO for {industry['name']} in {city['name']}?**
-
-A: Businesses implementing comprehensive AI SEO typically see 30-50% increases in qualified leads within 6 months, with better lead quality and higher conversion rates. In {city['name']}'s market with {city['seo_insights']['local_search_volume']} monthly searches, capturing even 1-2% of AI-referred traffic represents significant revenue. The cost is typically 60-70% lower than paid advertising with better long-term compounding returns.
-
-**Q: Will AI search replace Google?**
-
-A: Unlikely in the near term, but AI search is capturing growing market share, especially for research and recommendation queries. {city['seo_insights']['voice_search_growth']} voice search growth in {city['name']} shows the trend. Smart {industry['name'].lower()} businesses optimize for both traditional and AI search to capture all potential traffic sources.
-
-**Q: How do I track if my business appears in AI search results?**
-
-A: Manually query AI engines with relevant searches and track appearances. Use tools like our AI SEO scanner to systematically monitor citation frequency. Track increases in direct traffic, branded searches, and longer session durations—all indicators of AI-referred visitors. Monitor voice search performance in Google Search Console for conversational query growth.
-
-**Q: What if my competitors aren't doing AI SEO?**
-
-A: Even better! First-mover advantage in AI SEO is significant. Establishing citation dominance while competitors ignore AI search makes it much harder for them to compete later. In {city['name']}'s {industry['name'].lower()} market, being among the first to optimize for AI search can capture market share that compounds over time.""",
-
-        "finalCTA": f"""## Take Action: Dominate AI Search for {industry['name']} in {city['name']} Today
-
-The businesses winning in {city['name']}'s {industry['name'].lower()} market aren't just working harder—they're optimizing smarter for how modern consumers actually search. With {city['stats']['ai_adoption']} AI adoption and growing AI search usage, the question isn't whether to optimize for AI search, but how quickly you can implement it.
-
-### Your Next Steps:
-
-**1. Run Your Free AI SEO Scan** → Get instant visibility into your current AI search optimization
-
-**2. Review Your Detailed Report** → For just $29, get a comprehensive roadmap with specific fixes for your {industry['name'].lower()} business
-
-**3. Implement Quick Wins** → Start with high-impact changes that improve AI visibility within weeks
-
-**4. Build Long-Term Strategy** → Use our recommendations to systematically build AI search dominance in {city['name']}
-
-Every day you delay is another day your competitors could be building AI citation advantage. Every AI search that doesn't mention your business is a lost opportunity to capture qualified {city['name']} customers actively looking for {industry['name'].lower()} services.
-
-Start your free scan now and join the {industry['name'].lower()} businesses already winning in AI search."""
-    }
-    
-    return content
-
-
-def generate_internal_links(industry, city):
-    """Generate internal linking structure for SEO"""
-    
-    links = [
-        {
-            "text": f"AI SEO for {industry['name']} Guide",
-            "url": f"/ai-seo-{industry['slug']}",
-            "type": "industry-guide"
-        },
-        {
-            "text": f"Common AI SEO Mistakes for {industry['name']}",
-            "url": f"/ai-seo-mistakes-{industry['slug']}",
-            "type": "industry-mistakes"
-        },
-        {
-            "text": f"AI SEO Checklist for {industry['name']}",
-            "url": f"/ai-seo-checklist-{industry['slug']}",
-            "type": "industry-checklist"
-        },
-        {
-            "text": "Free AI SEO Scanner",
-            "url": "/",
-            "type": "homepage-cta"
-        },
-        {
-            "text": "AI SEO Guides Hub",
-            "url": "/ai-seo-guides",
-            "type": "hub-page"
-        }
-    ]
-    
-    return links
-
-
-# Load industries and cities
-industries = load_json('src/data/pseo/industries-ai-seo.json')['industries']
-cities = load_json('src/data/pseo/cities-ai-seo.json')['cities']
-
-print(f"Loaded {len(industries)} industries and {len(cities)} cities")
-
-# Generate all location pages
-location_pages = []
-
-for industry in industries:
-    for city in cities:
-        # Create unique slug
-        slug = f"ai-seo-{industry['slug']}-{city['slug']}"
-        
-        # Generate rich content (1,500-2,000 words)
-        content = generate_location_content(industry, city)
-        
-        # Create page object
-        page = {
-            "slug": slug,
-            "type": "industry-location",
-            "industry": industry['slug'],
-            "industryName": industry['name'],
-            "city": city['slug'],
-            "cityName": city['name'],
-            "state": city['state'],
-            "stateCode": city['stateCode'],
-            "title": f"AI SEO for {industry['name']} in {city['name']}, {city['stateCode']} | Free Scanner & Report",
-            "metaDescription": f"Optimize your {industry['name'].lower()} business in {city['name']} for AI search engines like ChatGPT, Perplexity & SearchGPT. Get a free AI SEO score + $9 detailed report with fixes.",
-            "h1": f"AI SEO for {industry['name']} in {city['name']}, {city['stateCode']}",
-            "content": content,
-            "stats": {
-                "industry_ai_growth": industry['stats']['ai_growth'],
-                "industry_adoption": industry['stats']['industry_adoption'],
-                "city_businesses": city['stats']['business_count'],
-                "city_ai_adoption": city['stats']['ai_adoption'],
-                "local_search_volume": city['seo_insights']['local_search_volume'],
-                "mobile_searches": city['seo_insights']['mobile_searches']
-            },
-            "internalLinks": generate_internal_links(industry, city),
-            "canonicalUrl": f"https://aiseoscan.dev/{slug}",
-            "lastModified": datetime.now().isoformat()
-        }
-        
-        location_pages.append(page)
-
-print(f"Generated {len(location_pages)} location pages")
-
-# Save to JSON file
-output_path = 'src/data/pseo/industry-location-pages.json'
-with open(output_path, 'w', encoding='utf-8') as f:
-    json.dump(location_pages, f, indent=2, ensure_ascii=False)
-
-print(f"Saved to {output_path}")
-
-# Generate summary
-summary = {
-    "generated_at": datetime.now().isoformat(),
-    "total_pages": len(location_pages),
-    "industries_count": len(industries),
-    "cities_count": len(cities),
-    "pages_per_industry": len(cities),
-    "pages_per_city": len(industries),
-    "url_pattern": "ai-seo-{industry}-{city}",
-    "example_urls": [
-        location_pages[0]['slug'],
-        location_pages[50]['slug'],
-        location_pages[100]['slug']
-    ]
-}
-
-summary_path = 'src/data/pseo/location-summary.json'
-with open(summary_path, 'w', encoding='utf-8') as f:
-    json.dump(summary, f, indent=2)
-
-print(f"Summary saved to {summary_path}")
-print("✅ Generation complete!")
\ No newline at end of file
+if __name__ == '__main__':
+    location.main()
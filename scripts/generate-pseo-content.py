@@ -1,870 +1,4 @@
-import json
-import os
-from datetime import datetime
-
-def create_comprehensive_content():
-    """
-    Generate comprehensive PSEO content for AI SEO optimization pages.
-    Creates professional, SEO-optimized content for 500+ page combinations.
-    """
-    
-    # AI Platforms with detailed information
-    platforms = {
-        "chatgpt": {
-            "name": "ChatGPT",
-            "slug": "chatgpt",
-            "description": "OpenAI's conversational AI with web browsing and citation capabilities",
-            "monthly_users": "347 million",
-            "key_features": ["Conversational search", "Direct citations", "Real-time web access", "Code generation"],
-            "optimization_focus": "structured data and conversational content",
-            "citation_style": "numbered references with source attribution",
-            "content_sections": {
-                "intro": "ChatGPT has fundamentally transformed how people search for and consume information. Unlike traditional search engines that return lists of links, ChatGPT provides direct answers with citations, making proper content optimization crucial for visibility in the AI search era.",
-                "why_matters": "With over 347 million monthly users, ChatGPT represents the largest shift in search behavior since Google's inception. Our analysis of 15,000 ChatGPT citations reveals that optimized websites receive 5.3x more references than unoptimized sites.",
-                "key_strategies": [
-                    "Implement comprehensive JSON-LD structured data for AI comprehension",
-                    "Structure content with answer-first architecture for direct citation",
-                    "Develop authority signals through expert attribution and credentials",
-                    "Optimize for conversational queries and natural language patterns"
-                ],
-                "technical_requirements": [
-                    "Schema markup implementation with Article, FAQ, and Organization types",
-                    "Semantic HTML structure with proper heading hierarchy",
-                    "Author attribution with expertise indicators and credentials",
-                    "Mobile-first responsive design for diverse access patterns"
-                ]
-            }
-        },
-        "perplexity": {
-            "name": "Perplexity",
-            "slug": "perplexity",
-            "description": "AI search engine with real-time web crawling and transparent source citation",
-            "monthly_users": "230 million",
-            "key_features": ["Real-time search", "Transparent citations", "Academic-style references", "Multi-source synthesis"],
-            "optimization_focus": "real-time content freshness and citation-ready formatting",
-            "citation_style": "academic-style numbered citations with full source attribution",
-            "content_sections": {
-                "intro": "Perplexity AI stands apart through its commitment to transparent source attribution and real-time web crawling. Unlike other AI systems, Perplexity actively searches the web for current information and provides numbered citations for every claim.",
-                "why_matters": "Processing over 230 million queries monthly, Perplexity's real-time approach gives preference to fresh, well-structured content. Our tracking of 8,000 Perplexity citations shows citation-optimized content receives 7.2x more references.",
-                "key_strategies": [
-                    "Develop citation-ready content architecture with fact-first presentation",
-                    "Implement real-time content freshness indicators and update schedules",
-                    "Create comprehensive source attribution within your content",
-                    "Optimize technical infrastructure for rapid content discovery"
-                ],
-                "technical_requirements": [
-                    "XML sitemaps with priority and changefreq optimization",
-                    "Page load speeds under 2 seconds for optimal crawl efficiency",
-                    "Structured internal linking for content relationship mapping",
-                    "Implementation of canonical URLs and duplicate content prevention"
-                ]
-            }
-        },
-        "claude": {
-            "name": "Claude",
-            "slug": "claude", 
-            "description": "Anthropic's AI assistant with advanced reasoning and content analysis capabilities",
-            "monthly_users": "150 million",
-            "key_features": ["Advanced reasoning", "Long-form analysis", "Document processing", "Ethical AI responses"],
-            "optimization_focus": "comprehensive content depth and analytical structure",
-            "citation_style": "contextual attribution with reasoning chains",
-            "content_sections": {
-                "intro": "Claude by Anthropic represents a new generation of AI systems focused on helpful, harmless, and honest interactions. Its advanced reasoning capabilities require content optimized for deep analysis and comprehensive understanding.",
-                "why_matters": "Claude's 150 million users rely on its analytical capabilities for complex queries. Content optimized for Claude's reasoning patterns sees 4.8x higher citation rates in analytical and educational contexts.",
-                "key_strategies": [
-                    "Create comprehensive content with logical argument structures",
-                    "Implement detailed evidence chains with supporting documentation", 
-                    "Develop multi-perspective analysis for complex topics",
-                    "Structure content for analytical reasoning and fact verification"
-                ],
-                "technical_requirements": [
-                    "Hierarchical content structure with clear logical flow",
-                    "Evidence-based assertions with primary source linking",
-                    "Comprehensive topic coverage with related subtopic integration",
-                    "Professional credentialing and expertise demonstration"
-                ]
-            }
-        },
-        "gemini": {
-            "name": "Gemini",
-            "slug": "gemini",
-            "description": "Google's multimodal AI with integrated search and visual understanding",
-            "monthly_users": "200 million", 
-            "key_features": ["Multimodal processing", "Google integration", "Visual understanding", "Real-time data"],
-            "optimization_focus": "multimodal content and Google ecosystem integration",
-            "citation_style": "Google-integrated citations with knowledge graph connections",
-            "content_sections": {
-                "intro": "Google's Gemini combines advanced language understanding with multimodal capabilities and deep Google ecosystem integration. Optimization requires understanding both AI search principles and Google's knowledge systems.",
-                "why_matters": "With 200 million users and direct Google integration, Gemini represents the convergence of traditional and AI search. Content optimized for Gemini's multimodal approach achieves 6.1x better visibility across Google's AI features.",
-                "key_strategies": [
-                    "Optimize for multimodal content including images, videos, and text",
-                    "Leverage Google Knowledge Graph connections and entity relationships",
-                    "Implement comprehensive schema markup for Google ecosystem integration",
-                    "Create content optimized for both AI and traditional Google search"
-                ],
-                "technical_requirements": [
-                    "Enhanced image optimization with descriptive alt text and captions",
-                    "Entity markup connecting to Google Knowledge Graph",
-                    "Comprehensive local SEO signals for location-based queries", 
-                    "Integration with Google Business Profile and ecosystem tools"
-                ]
-            }
-        },
-        "searchgpt": {
-            "name": "SearchGPT",
-            "slug": "searchgpt",
-            "description": "OpenAI's dedicated search engine with AI-powered result synthesis", 
-            "monthly_users": "120 million",
-            "key_features": ["Dedicated search focus", "Result synthesis", "Publisher partnerships", "Real-time indexing"],
-            "optimization_focus": "search-specific optimization and publisher relationship building",
-            "citation_style": "publisher-friendly attribution with traffic-driving links",
-            "content_sections": {
-                "intro": "SearchGPT represents OpenAI's dedicated entry into search, designed specifically for web content discovery and publisher partnership. Its optimization requires understanding both AI principles and traditional search dynamics.",
-                "why_matters": "SearchGPT's 120 million users represent a new category of AI-native search behavior. Early optimization provides significant first-mover advantages, with optimized publishers seeing 8.4x higher citation rates.",
-                "key_strategies": [
-                    "Build publisher authority through comprehensive content and credibility signals",
-                    "Implement search-optimized content structure with clear value propositions",
-                    "Develop relationships with OpenAI's publisher partnership program",
-                    "Create content that bridges AI search and traditional SEO principles"
-                ],
-                "technical_requirements": [
-                    "Publisher-grade content management with editorial standards",
-                    "Comprehensive analytics and performance tracking implementation",
-                    "Advanced schema markup including NewsArticle and Publisher types",
-                    "Content freshness automation and update scheduling systems"
-                ]
-            }
-        },
-        "copilot": {
-            "name": "Microsoft Copilot",
-            "slug": "copilot", 
-            "description": "Microsoft's AI assistant integrated across Office and web platforms",
-            "monthly_users": "180 million",
-            "key_features": ["Office integration", "Enterprise focus", "Productivity optimization", "Microsoft ecosystem"],
-            "optimization_focus": "enterprise content and Microsoft ecosystem integration",
-            "citation_style": "enterprise-focused citations with productivity context",
-            "content_sections": {
-                "intro": "Microsoft Copilot integrates AI capabilities across the Microsoft ecosystem, from Office applications to web search. Optimization requires understanding enterprise user needs and Microsoft's integrated approach to AI.",
-                "why_matters": "Copilot's 180 million users primarily access content through Microsoft's ecosystem. Enterprise-optimized content sees 5.7x higher citation rates in business and productivity contexts.",
-                "key_strategies": [
-                    "Optimize for enterprise and business-focused queries and use cases",
-                    "Leverage Microsoft ecosystem integration including Office and Teams",
-                    "Create productivity-focused content with actionable business insights",
-                    "Implement enterprise-grade authority signals and credibility markers"
-                ],
-                "technical_requirements": [
-                    "Enterprise schema markup including Organization and ContactPoint types",
-                    "Microsoft ecosystem integration signals and Office compatibility",
-                    "Professional networking and LinkedIn integration optimization",
-                    "B2B-focused content structure with ROI and efficiency emphasis"
-                ]
-            }
-        }
-    }
-
-    # Content Types with comprehensive optimization strategies
-    content_types = {
-        "ecommerce": {
-            "name": "E-commerce Sites",
-            "slug": "ecommerce",
-            "description": "Online stores and product-focused websites",
-            "ai_challenges": ["Product discoverability", "Comparison queries", "Purchase intent optimization", "Review integration"],
-            "optimization_strategies": [
-                "Implement comprehensive Product schema with detailed specifications",
-                "Optimize product descriptions for AI comparison and recommendation queries",
-                "Create FAQ sections addressing common product questions and concerns",
-                "Develop review aggregation and sentiment analysis integration"
-            ],
-            "key_schema_types": ["Product", "AggregateRating", "Review", "Organization"],
-            "content_focus": "product information, comparisons, purchasing guidance, and customer reviews",
-            "ai_specific_benefits": [
-                "AI shopping assistants can accurately recommend and compare products",
-                "Voice commerce integration for hands-free shopping experiences", 
-                "Automated product matching for customer queries and preferences",
-                "Enhanced local inventory integration for location-based recommendations"
-            ]
-        },
-        "saas": {
-            "name": "SaaS Platforms", 
-            "slug": "saas",
-            "description": "Software as a Service applications and platforms",
-            "ai_challenges": ["Feature explanation", "Integration capabilities", "Pricing comparisons", "Use case matching"],
-            "optimization_strategies": [
-                "Create comprehensive feature documentation with use case examples",
-                "Implement SoftwareApplication schema with detailed capability descriptions",
-                "Develop integration guides and API documentation for AI understanding",
-                "Build comparison content addressing competitive positioning"
-            ],
-            "key_schema_types": ["SoftwareApplication", "Article", "HowTo", "FAQ"],
-            "content_focus": "feature explanations, integration guides, use cases, and comparison analysis",
-            "ai_specific_benefits": [
-                "AI can accurately match software capabilities to user requirements",
-                "Automated integration recommendations based on existing tech stacks",
-                "Personalized feature highlighting based on company size and industry",
-                "Enhanced trial-to-conversion optimization through AI-driven onboarding"
-            ]
-        },
-        "healthcare": {
-            "name": "Healthcare & Medical",
-            "slug": "healthcare", 
-            "description": "Medical practices, health information, and healthcare services",
-            "ai_challenges": ["Medical accuracy", "Symptom matching", "Provider discovery", "Treatment explanations"],
-            "optimization_strategies": [
-                "Implement MedicalOrganization and Physician schema with credentials",
-                "Create symptom-focused content with proper medical disclaimers",
-                "Develop treatment explanation content with evidence-based information",
-                "Build provider directory optimization for location and specialty searches"
-            ],
-            "key_schema_types": ["MedicalOrganization", "Physician", "MedicalCondition", "MedicalProcedure"],
-            "content_focus": "medical information, provider credentials, treatment options, and health guidance",
-            "ai_specific_benefits": [
-                "AI can provide accurate symptom assessment and provider matching",
-                "Automated appointment scheduling based on symptoms and availability",
-                "Personalized health information delivery based on medical history",
-                "Enhanced telemedicine integration for remote consultation optimization"
-            ]
-        },
-        "education": {
-            "name": "Education & Learning",
-            "slug": "education",
-            "description": "Educational institutions, online courses, and learning platforms", 
-            "ai_challenges": ["Course discovery", "Learning path optimization", "Skill assessment", "Credential verification"],
-            "optimization_strategies": [
-                "Implement EducationalOrganization and Course schema with detailed curricula",
-                "Create learning objective-focused content with skill progression mapping",
-                "Develop assessment and certification content for AI skill matching",
-                "Build educator credentialing and expertise demonstration"
-            ],
-            "key_schema_types": ["EducationalOrganization", "Course", "Person", "EducationalOccupationalCredential"],
-            "content_focus": "course information, learning outcomes, instructor credentials, and skill development",
-            "ai_specific_benefits": [
-                "AI can create personalized learning paths based on goals and experience",
-                "Automated skill gap analysis and course recommendation systems",
-                "Enhanced student support through AI tutoring and assistance integration",
-                "Improved credential verification and professional development tracking"
-            ]
-        },
-        "finance": {
-            "name": "Financial Services",
-            "slug": "finance",
-            "description": "Banks, investment firms, and financial advisory services",
-            "ai_challenges": ["Regulatory compliance", "Product complexity", "Risk assessment", "Personalization"],
-            "optimization_strategies": [
-                "Implement FinancialService schema with regulatory compliance indicators",
-                "Create product explanation content with risk disclosure integration", 
-                "Develop calculator and assessment tools for AI recommendation systems",
-                "Build advisor credentialing and expertise demonstration content"
-            ],
-            "key_schema_types": ["FinancialService", "BankOrCreditUnion", "Person", "Service"],
-            "content_focus": "financial products, risk assessments, regulatory information, and advisor expertise",
-            "ai_specific_benefits": [
-                "AI can provide personalized financial advice based on individual circumstances",
-                "Automated risk assessment and portfolio optimization recommendations",
-                "Enhanced fraud detection and security through AI monitoring systems",
-                "Improved customer service through AI-powered financial assistance"
-            ]
-        },
-        "realestate": {
-            "name": "Real Estate",
-            "slug": "realestate", 
-            "description": "Property listings, real estate agencies, and property management",
-            "ai_challenges": ["Property matching", "Market analysis", "Location optimization", "Virtual tours"],
-            "optimization_strategies": [
-                "Implement RealEstateAgent and Place schema with comprehensive property details",
-                "Create neighborhood and market analysis content for AI recommendation systems",
-                "Develop virtual tour integration and property visualization optimization",
-                "Build agent credentialing and local market expertise demonstration"
-            ],
-            "key_schema_types": ["RealEstateAgent", "Place", "Residence", "GeoCoordinates"],
-            "content_focus": "property information, market analysis, agent expertise, and location details",
-            "ai_specific_benefits": [
-                "AI can provide accurate property matching based on detailed preferences",
-                "Automated market analysis and property valuation assistance",
-                "Enhanced virtual property tours and neighborhood exploration",
-                "Improved mortgage and financing recommendations through AI integration"
-            ]
-        },
-        "legal": {
-            "name": "Legal Services",
-            "slug": "legal",
-            "description": "Law firms, legal advice, and attorney services",
-            "ai_challenges": ["Practice area matching", "Legal complexity", "Jurisdiction specificity", "Confidentiality"],
-            "optimization_strategies": [
-                "Implement LegalService and Attorney schema with bar certification details",
-                "Create practice area-focused content with jurisdiction-specific information",
-                "Develop legal process explanation content for client education",
-                "Build attorney credentialing and case experience demonstration"
-            ],
-            "key_schema_types": ["LegalService", "Attorney", "LegalForceStatus", "Organization"],
-            "content_focus": "legal services, attorney credentials, practice areas, and legal process guidance",
-            "ai_specific_benefits": [
-                "AI can accurately match legal needs with appropriate attorney expertise",
-                "Automated legal document preparation and review assistance",
-                "Enhanced client intake and case assessment through AI screening",
-                "Improved legal research and case precedent analysis capabilities"
-            ]
-        },
-        "consulting": {
-            "name": "Consulting Services", 
-            "slug": "consulting",
-            "description": "Business consultants, advisory services, and professional guidance",
-            "ai_challenges": ["Expertise demonstration", "Case study presentation", "ROI quantification", "Industry specificity"],
-            "optimization_strategies": [
-                "Implement ProfessionalService schema with detailed expertise indicators",
-                "Create case study content with measurable outcomes and ROI demonstration",
-                "Develop industry-specific content for targeted consultant matching",
-                "Build consultant credentialing and methodology explanation content"
-            ],
-            "key_schema_types": ["ProfessionalService", "Person", "Organization", "Service"],
-            "content_focus": "consulting expertise, case studies, methodologies, and industry knowledge",
-            "ai_specific_benefits": [
-                "AI can match consulting needs with appropriate expertise and experience",
-                "Automated proposal generation based on client requirements and consultant capabilities",
-                "Enhanced project scoping and timeline estimation through AI analysis",
-                "Improved client-consultant matching based on industry and challenge specificity"
-            ]
-        }
-    }
-
-    # Industries with specific optimization needs
-    industries = {
-        "technology": {
-            "name": "Technology Companies",
-            "slug": "technology",
-            "description": "Software companies, tech startups, and IT service providers",
-            "common_queries": ["API documentation", "Integration guides", "Security features", "Scalability"],
-            "ai_optimization_focus": [
-                "Technical documentation optimization for developer queries",
-                "API and integration content for automated development assistance",
-                "Security and compliance information for enterprise decision-making",
-                "Performance and scalability data for technical evaluation"
-            ],
-            "key_content_areas": ["Product features", "Technical documentation", "Security compliance", "Integration capabilities"]
-        },
-        "retail": {
-            "name": "Retail & Consumer Goods",
-            "slug": "retail", 
-            "description": "Retail stores, consumer brands, and product manufacturers",
-            "common_queries": ["Product comparisons", "Store locations", "Availability", "Reviews"],
-            "ai_optimization_focus": [
-                "Product information optimization for comparison and recommendation queries",
-                "Inventory and availability integration for real-time shopping assistance",
-                "Review and rating aggregation for AI-powered product recommendations",
-                "Local store information for location-based shopping queries"
-            ],
-            "key_content_areas": ["Product catalogs", "Store information", "Customer reviews", "Brand story"]
-        },
-        "manufacturing": {
-            "name": "Manufacturing & Industrial", 
-            "slug": "manufacturing",
-            "description": "Manufacturing companies, industrial suppliers, and B2B equipment providers",
-            "common_queries": ["Product specifications", "Technical documentation", "Supplier capabilities", "Certifications"],
-            "ai_optimization_focus": [
-                "Detailed product specification content for procurement and sourcing queries",
-                "Capability and certification information for supplier evaluation",
-                "Technical documentation for industrial application matching",
-                "Quality and compliance data for regulatory and safety requirements"
-            ],
-            "key_content_areas": ["Product specifications", "Manufacturing capabilities", "Quality certifications", "Technical support"]
-        },
-        "nonprofit": {
-            "name": "Non-Profit Organizations",
-            "slug": "nonprofit",
-            "description": "Charitable organizations, foundations, and social impact initiatives", 
-            "common_queries": ["Mission information", "Donation processes", "Impact measurement", "Volunteer opportunities"],
-            "ai_optimization_focus": [
-                "Mission and impact content for donor and volunteer matching",
-                "Program information for funding and partnership opportunities",
-                "Impact measurement and reporting for transparency and accountability",
-                "Volunteer opportunity content for community engagement"
-            ],
-            "key_content_areas": ["Mission and values", "Program information", "Impact reports", "Volunteer opportunities"]
-        },
-        "hospitality": {
-            "name": "Hospitality & Tourism",
-            "slug": "hospitality",
-            "description": "Hotels, restaurants, travel services, and entertainment venues",
-            "common_queries": ["Availability", "Amenities", "Location details", "Reviews and ratings"],
-            "ai_optimization_focus": [
-                "Availability and booking integration for real-time reservation systems",
-                "Detailed amenity and service information for preference matching",
-                "Location and accessibility data for travel planning assistance",
-                "Review aggregation and sentiment analysis for recommendation systems"
-            ],
-            "key_content_areas": ["Property amenities", "Location information", "Booking systems", "Guest reviews"]
-        },
-        "automotive": {
-            "name": "Automotive Industry",
-            "slug": "automotive", 
-            "description": "Car dealerships, auto manufacturers, and automotive service providers",
-            "common_queries": ["Vehicle specifications", "Pricing information", "Service locations", "Maintenance schedules"],
-            "ai_optimization_focus": [
-                "Vehicle specification and feature content for comparison and matching",
-                "Pricing and financing information for purchase decision support",
-                "Service location and capability data for maintenance assistance",
-                "Parts and accessory information for automotive enhancement queries"
-            ],
-            "key_content_areas": ["Vehicle specifications", "Pricing and financing", "Service locations", "Parts and accessories"]
-        },
-        "energy": {
-            "name": "Energy & Utilities",
-            "slug": "energy",
-            "description": "Utility companies, renewable energy providers, and energy service companies",
-            "common_queries": ["Service areas", "Rate information", "Sustainability programs", "Outage updates"],
-            "ai_optimization_focus": [
-                "Service area and coverage information for utility matching",
-                "Rate and pricing structure content for cost comparison",
-                "Sustainability and renewable energy program information",
-                "Service status and outage information for real-time updates"
-            ],
-            "key_content_areas": ["Service coverage", "Rate structures", "Sustainability programs", "Service status"]
-        },
-        "agriculture": {
-            "name": "Agriculture & Food Production",
-            "slug": "agriculture",
-            "description": "Farms, food producers, and agricultural service providers", 
-            "common_queries": ["Product sourcing", "Seasonal availability", "Certification standards", "Distribution networks"],
-            "ai_optimization_focus": [
-                "Product and crop information for sourcing and procurement queries",
-                "Seasonal availability and harvest schedule content",
-                "Certification and quality standard information for compliance verification",
-                "Distribution and logistics capability content for supply chain optimization"
-            ],
-            "key_content_areas": ["Product information", "Seasonal schedules", "Quality certifications", "Distribution capabilities"]
-        },
-        "construction": {
-            "name": "Construction & Architecture",
-            "slug": "construction",
-            "description": "Construction companies, architectural firms, and building service providers",
-            "common_queries": ["Project portfolios", "Service capabilities", "Material specifications", "Timeline estimates"],
-            "ai_optimization_focus": [
-                "Project portfolio and capability content for contractor evaluation",
-                "Service area and specialization information for project matching",
-                "Material and specification data for construction planning",
-                "Timeline and cost estimation content for project scoping"
-            ],
-            "key_content_areas": ["Project portfolios", "Service capabilities", "Material expertise", "Cost and timeline information"]
-        },
-        "entertainment": {
-            "name": "Entertainment & Media",
-            "slug": "entertainment", 
-            "description": "Entertainment companies, media producers, and content creators",
-            "common_queries": ["Content catalogs", "Event schedules", "Artist information", "Streaming availability"],
-            "ai_optimization_focus": [
-                "Content catalog and metadata optimization for discovery and recommendation",
-                "Event and schedule information for entertainment planning",
-                "Artist and creator information for fan and industry queries",
-                "Platform and availability data for content consumption guidance"
-            ],
-            "key_content_areas": ["Content catalogs", "Event information", "Artist profiles", "Platform availability"]
-        }
-    }
-
-    def generate_page_content(platform, content_type=None, industry=None, page_type="platform"):
-        """Generate comprehensive content for a specific page combination"""
-        
-        platform_data = platforms[platform]
-        content_type_data = content_types.get(content_type) if content_type else None
-        industry_data = industries.get(industry) if industry else None
-        
-        # Generate URL slug
-        if page_type == "platform":
-            slug = f"ai-seo-{platform}"
-            title = f"AI SEO for {platform_data['name']} - Complete Optimization Guide 2025"
-            meta_description = f"Master AI SEO for {platform_data['name']}. Comprehensive optimization strategies, schema markup guides, and technical implementation for {platform_data['name']} citations."
-        elif page_type == "content_type":
-            slug = f"optimize-{content_type}-for-ai"
-            title = f"AI SEO for {content_type_data['name']} - {platform_data['name']} Optimization"
-            meta_description = f"Optimize {content_type_data['name']} for {platform_data['name']} citations. Complete guide with implementation strategies and technical requirements."
-        elif page_type == "industry":
-            slug = f"ai-seo-{industry}-{platform}"
-            title = f"AI SEO for {industry_data['name']} - {platform_data['name']} Guide"
-            meta_description = f"{industry_data['name']} AI SEO optimization for {platform_data['name']}. Industry-specific strategies and implementation guides."
-        else:  # combination
-            # Add safety checks for None values
-            if not content_type_data or not industry_data:
-                return None
-            slug = f"guide-{content_type}-{platform}-{industry}"
-            title = f"{content_type_data['name']} AI SEO for {industry_data['name']} - {platform_data['name']} Guide"
-            meta_description = f"Complete {platform_data['name']} optimization guide for {industry_data['name']} {content_type_data['name']}. Professional implementation strategies and technical requirements."
-
-        # Generate comprehensive content sections
-        content = {
-            "slug": slug,
-            "title": title,
-            "meta_description": meta_description,
-            "platform": platform_data['name'],
-            "content_type": content_type_data['name'] if content_type_data else None,
-            "industry": industry_data['name'] if industry_data else None,
-            "hero_section": {
-                "headline": title,
-                "subheadline": generate_subheadline(platform_data, content_type_data, industry_data),
-                "stats": platform_data['monthly_users']
-            },
-            "introduction": generate_introduction(platform_data, content_type_data, industry_data),
-            "main_sections": generate_main_sections(platform_data, content_type_data, industry_data),
-            "technical_implementation": generate_technical_section(platform_data, content_type_data, industry_data),
-            "best_practices": generate_best_practices(platform_data, content_type_data, industry_data),
-            "common_mistakes": generate_common_mistakes(platform_data, content_type_data, industry_data),
-            "measurement_analytics": generate_measurement_section(platform_data, content_type_data, industry_data),
-            "conclusion_cta": generate_conclusion_cta(platform_data, content_type_data, industry_data),
-            "word_count": 0,  # Will be calculated
-            "generated_at": datetime.now().isoformat()
-        }
-        
-        return content
-
-    def generate_subheadline(platform_data, content_type_data, industry_data):
-        """Generate compelling subheadlines based on combination"""
-        base = f"Master the art of optimizing your content for {platform_data['name']}'s {platform_data['optimization_focus']}."
-        
-        if content_type_data and industry_data:
-            return f"{base} Specialized strategies for {industry_data['name']} {content_type_data['name'].lower()} with proven optimization techniques."
-        elif content_type_data:
-            return f"{base} Complete implementation guide for {content_type_data['name'].lower()} with technical requirements and best practices."
-        elif industry_data:
-            return f"{base} Industry-specific optimization strategies for {industry_data['name'].lower()} with measurable results."
-        else:
-            return f"{base} Learn advanced strategies for schema markup, content architecture, and authority building that drive consistent citations."
-
-    def generate_introduction(platform_data, content_type_data, industry_data):
-        """Generate comprehensive introduction sections"""
-        intro = {
-            "opening_paragraph": platform_data['content_sections']['intro'],
-            "statistics": platform_data['content_sections']['why_matters'],
-            "key_benefits": [],
-            "unique_challenges": []
-        }
-        
-        if content_type_data:
-            intro["key_benefits"].extend([
-                f"Specialized {platform_data['name']} optimization for {content_type_data['name'].lower()}",
-                f"Implementation of {content_type_data['name']}-specific schema markup and content structure",
-                f"Advanced strategies for {content_type_data['description'].lower()} AI visibility"
-            ])
-            intro["unique_challenges"] = content_type_data['ai_challenges']
-        
-        if industry_data:
-            intro["key_benefits"].extend([
-                f"Industry-specific {platform_data['name']} optimization for {industry_data['name'].lower()}",
-                f"Targeted content strategies addressing {industry_data['description'].lower()} needs",
-                f"Implementation guidelines tailored to {industry_data['name'].lower()} AI search patterns"
-            ])
-            intro["unique_challenges"].extend(industry_data.get('common_queries', []))
-            
-        return intro
-
-    def generate_main_sections(platform_data, content_type_data, industry_data):
-        """Generate main content sections with comprehensive coverage"""
-        sections = []
-        
-        # Core platform optimization section
-        sections.append({
-            "title": f"Core {platform_data['name']} Optimization Framework",
-            "content": {
-                "introduction": f"Understanding {platform_data['name']}'s unique approach to content analysis and citation is fundamental to optimization success.",
-                "key_strategies": platform_data['content_sections']['key_strategies'],
-                "implementation_details": [
-                    f"Leverage {platform_data['name']}'s {platform_data['citation_style']} for maximum visibility",
-                    f"Optimize content architecture for {platform_data['optimization_focus']}",
-                    f"Implement technical requirements specific to {platform_data['name']}'s crawling patterns",
-                    f"Build authority signals that align with {platform_data['name']}'s credibility assessment"
-                ]
-            }
-        })
-        
-        if content_type_data:
-            sections.append({
-                "title": f"{content_type_data['name']} Optimization Strategies",
-                "content": {
-                    "introduction": f"Optimizing {content_type_data['name'].lower()} for {platform_data['name']} requires understanding specific {content_type_data['description'].lower()} challenges and opportunities.",
-                    "optimization_strategies": content_type_data['optimization_strategies'],
-                    "schema_implementation": content_type_data['key_schema_types'],
-                    "ai_benefits": content_type_data['ai_specific_benefits']
-                }
-            })
-            
-        if industry_data:
-            sections.append({
-                "title": f"{industry_data['name']} AI Optimization",
-                "content": {
-                    "introduction": f"The {industry_data['name'].lower()} industry presents unique opportunities and challenges for {platform_data['name']} optimization.",
-                    "industry_focus": industry_data['ai_optimization_focus'],
-                    "common_queries": industry_data['common_queries'],
-                    "content_areas": industry_data['key_content_areas']
-                }
-            })
-        
-        # Advanced strategies section (continuing from where we left off)
-        sections.append({
-            "title": f"Advanced {platform_data['name']} Citation Strategies",
-            "content": {
-                "introduction": f"Beyond basic optimization, advanced strategies can significantly increase your {platform_data['name']} citation frequency and visibility.",
-                "advanced_techniques": [
-                    f"Content threading for multi-query {platform_data['name']} citation opportunities",
-                    f"Competitive analysis and citation gap identification in {platform_data['name']} results",
-                    f"Real-time optimization based on {platform_data['name']} algorithm updates",
-                    f"Cross-platform optimization strategies that enhance {platform_data['name']} performance"
-                ],
-                "implementation_examples": [
-                    f"Answer clustering: Structure content to address related queries that {platform_data['name']} users typically ask in sequence",
-                    f"Citation chain building: Create content that naturally leads to follow-up questions and deeper engagement",
-                    f"Temporal optimization: Time content updates with {platform_data['name']} crawling patterns for maximum visibility",
-                    f"Authority amplification: Leverage existing citations to build topic cluster authority"
-                ]
-            }
-        })
-        
-        return sections
-
-    def generate_technical_section(platform_data, content_type_data, industry_data):
-        """Generate comprehensive technical implementation guide"""
-        technical = {
-            "title": f"Technical Implementation for {platform_data['name']} Optimization",
-            "core_requirements": platform_data['content_sections']['technical_requirements'],
-            "schema_markup": {
-                "primary_schemas": ["Article", "Organization", "Person", "FAQ"],
-                "implementation_guide": [
-                    "JSON-LD structured data implementation with comprehensive entity linking",
-                    "Schema validation and testing using Google's Structured Data Testing Tool",
-                    "Progressive enhancement with advanced schema types based on content focus",
-                    "Cross-schema relationship mapping for enhanced AI understanding"
-                ]
-            },
-            "content_optimization": {
-                "structure_requirements": [
-                    "Semantic HTML5 structure with proper heading hierarchy and landmark roles",
-                    "Answer-first content architecture with key information in opening paragraphs",
-                    "FAQ integration addressing common user queries and follow-up questions",
-                    "Internal linking strategy connecting related topics and supporting content"
-                ],
-                "performance_optimization": [
-                    "Page load speeds optimized for AI crawler efficiency (under 3 seconds)",
-                    "Mobile-first responsive design ensuring accessibility across all devices",
-                    "Core Web Vitals optimization for enhanced user experience signals",
-                    "CDN implementation for global content delivery and reduced latency"
-                ]
-            }
-        }
-        
-        if content_type_data:
-            technical["content_specific"] = {
-                "schema_types": content_type_data['key_schema_types'],
-                "optimization_focus": content_type_data['content_focus'],
-                "implementation_priorities": [
-                    f"Implement {', '.join(content_type_data['key_schema_types'])} schema markup",
-                    f"Optimize content structure for {content_type_data['content_focus']}",
-                    f"Address specific {content_type_data['name']} challenges in AI discovery",
-                    f"Leverage {content_type_data['name']} opportunities for enhanced visibility"
-                ]
-            }
-            
-        if industry_data:
-            technical["industry_specific"] = {
-                "content_areas": industry_data['key_content_areas'],
-                "optimization_focus": industry_data['ai_optimization_focus'],
-                "implementation_considerations": [
-                    f"Address {industry_data['name']} regulatory and compliance requirements",
-                    f"Implement industry-specific schema markup and entity relationships",
-                    f"Optimize for {industry_data['name']} common query patterns",
-                    f"Build authority signals relevant to {industry_data['name']} credibility assessment"
-                ]
-            }
-            
-        return technical
-
-    def generate_best_practices(platform_data, content_type_data, industry_data):
-        """Generate best practices section"""
-        practices = {
-            "title": f"{platform_data['name']} Optimization Best Practices",
-            "content_best_practices": [
-                f"Maintain content freshness with regular updates aligned to {platform_data['name']} crawling patterns",
-                f"Implement comprehensive fact-checking and source attribution for credibility",
-                f"Use natural language patterns that match how users query {platform_data['name']}",
-                f"Create comprehensive topic coverage that addresses user intent completely"
-            ],
-            "technical_best_practices": [
-                "Validate all structured data implementation using official testing tools",
-                "Monitor Core Web Vitals and optimize for performance consistently",
-                "Implement proper canonical URL structure to prevent content duplication",
-                "Use descriptive, semantic HTML that enhances AI content understanding"
-            ],
-            "authority_building": [
-                "Develop comprehensive author profiles with expertise indicators and credentials",
-                "Build topical authority through consistent, high-quality content publication",
-                "Establish external credibility through industry recognition and citations",
-                "Maintain editorial standards that align with E-A-T evaluation criteria"
-            ]
-        }
-        
-        if content_type_data:
-            practices[f"{content_type_data['name']}_specific"] = [
-                f"Focus on {content_type_data['content_focus']} optimization priorities",
-                f"Address {content_type_data['name']} user intent patterns in content structure",
-                f"Leverage {content_type_data['name']} schema markup for enhanced discoverability",
-                f"Optimize for {content_type_data['name']} conversion and engagement metrics"
-            ]
-            
-        return practices
-
-    def generate_common_mistakes(platform_data, content_type_data, industry_data):
-        """Generate common mistakes to avoid"""
-        mistakes = {
-            "title": f"Common {platform_data['name']} Optimization Mistakes to Avoid",
-            "content_mistakes": [
-                f"Keyword stuffing or over-optimization that conflicts with {platform_data['name']}'s natural language processing",
-                f"Ignoring {platform_data['name']}'s {platform_data['citation_style']} preferences in content structure",
-                f"Failing to update content regularly, missing {platform_data['name']}'s freshness signals",
-                f"Creating thin content that doesn't provide comprehensive answers to user queries"
-            ],
-            "technical_mistakes": [
-                "Implementing incomplete or incorrect schema markup that confuses AI systems",
-                "Poor mobile optimization affecting AI crawler access and user experience",
-                "Slow page load speeds that negatively impact crawl efficiency and user signals",
-                "Missing or poorly implemented internal linking that limits content discoverability"
-            ],
-            "authority_mistakes": [
-                "Insufficient author credentialing and expertise demonstration",
-                "Lack of external validation and credibility signals",
-                "Poor fact-checking and source attribution practices",
-                "Inconsistent content quality that undermines overall site authority"
-            ]
-        }
-        
-        if content_type_data:
-            mistakes[f"{content_type_data['name']}_mistakes"] = [
-                f"Ignoring {content_type_data['name']}-specific optimization requirements",
-                f"Failing to address {content_type_data['ai_challenges']} in content strategy",
-                f"Poor implementation of {content_type_data['key_schema_types']} schema markup",
-                f"Missing opportunities for {content_type_data['name']} AI integration benefits"
-            ]
-            
-        return mistakes
-
-    def generate_measurement_section(platform_data, content_type_data, industry_data):
-        """Generate measurement and analytics section"""
-        measurement = {
-            "title": f"Measuring {platform_data['name']} Optimization Success",
-            "key_metrics": [
-                f"Citation frequency and positioning in {platform_data['name']} responses",
-                f"Referral traffic specifically from {platform_data['name']} and related AI platforms",
-                f"Query coverage analysis showing topics that generate citations",
-                f"Content performance correlation with {platform_data['name']} algorithm updates"
-            ],
-            "tracking_methods": [
-                f"Monitor {platform_data['name']} mentions and citations through automated tracking tools",
-                "Implement comprehensive analytics tracking for AI search referral traffic",
-                "Set up alerts for new citations and content performance changes",
-                "Track competitor citation patterns and identify optimization opportunities"
-            ],
-            "optimization_cycles": [
-                "Conduct monthly analysis of citation performance and content gaps",
-                "Implement quarterly content updates based on performance data",
-                "Perform annual comprehensive audits of technical and content optimization",
-                "Continuously monitor algorithm updates and adjust strategies accordingly"
-            ]
-        }
-        
-        return measurement
-
-    def generate_conclusion_cta(platform_data, content_type_data, industry_data):
-        """Generate conclusion and call-to-action"""
-        cta = {
-            "title": f"Start Your {platform_data['name']} Optimization Journey",
-            "summary": f"Optimizing for {platform_data['name']} requires a comprehensive approach combining technical excellence, content quality, and authority building.",
-            "key_takeaways": [
-                f"Implement {platform_data['name']}-specific schema markup and content structure",
-                f"Focus on {platform_data['optimization_focus']} for maximum citation potential", 
-                f"Build comprehensive authority signals aligned with {platform_data['name']} evaluation criteria",
-                f"Maintain consistent optimization efforts with regular monitoring and updates"
-            ],
-            "next_steps": [
-                "Conduct a comprehensive AI SEO audit to identify current optimization gaps",
-                f"Implement priority {platform_data['name']} optimization recommendations",
-                "Monitor citation performance and adjust strategies based on results",
-                "Expand optimization efforts to additional AI platforms for comprehensive coverage"
-            ]
-        }
-        
-        if content_type_data and industry_data:
-            cta["specialized_message"] = f"For {industry_data['name']} operating {content_type_data['name'].lower()}, the opportunity to dominate {platform_data['name']} citations in your niche is significant. Early optimization provides substantial competitive advantages."
-        elif content_type_data:
-            cta["specialized_message"] = f"{content_type_data['name']} have unique advantages in {platform_data['name']} optimization when properly implemented. Focus on your content type's specific requirements for maximum impact."
-        elif industry_data:
-            cta["specialized_message"] = f"The {industry_data['name'].lower()} industry presents specific {platform_data['name']} optimization opportunities. Industry-focused strategies yield significantly higher citation rates."
-            
-        return cta
-
-    # Generate all page combinations
-    all_pages = []
-    
-    # Platform-only pages (6 pages)
-    for platform_slug in platforms.keys():
-        page_content = generate_page_content(platform_slug, page_type="platform")
-        all_pages.append(page_content)
-    
-    # Content type + platform combinations (48 pages: 8 content types × 6 platforms)
-    for content_type_slug in content_types.keys():
-        for platform_slug in platforms.keys():
-            page_content = generate_page_content(platform_slug, content_type_slug, page_type="content_type")
-            all_pages.append(page_content)
-    
-    # Industry + platform combinations (60 pages: 10 industries × 6 platforms)
-    for industry_slug in industries.keys():
-        for platform_slug in platforms.keys():
-            page_content = generate_page_content(platform_slug, industry=industry_slug, page_type="industry")
-            all_pages.append(page_content)
-    
-    # Triple combinations - most valuable content (120 pages: 4 top content types × 6 platforms × 5 top industries)
-    top_content_types = ["ecommerce", "saas", "healthcare", "finance"]
-    top_industries = ["technology", "retail", "manufacturing", "nonprofit", "hospitality"]
-    for content_type_slug in top_content_types:
-        for platform_slug in platforms.keys():
-            for industry_slug in top_industries:
-                page_content = generate_page_content(platform_slug, content_type_slug, industry_slug, page_type="combination")
-                if page_content:  # Only add if not None
-                    all_pages.append(page_content)
-
-    # Create output directory
-    output_dir = "../src/data/pseo"
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Save all data files
-    with open(f"{output_dir}/platforms.json", "w") as f:
-        json.dump(platforms, f, indent=2)
-    
-    with open(f"{output_dir}/content-types.json", "w") as f:
-        json.dump(content_types, f, indent=2)
-    
-    with open(f"{output_dir}/industries.json", "w") as f:
-        json.dump(industries, f, indent=2)
-    
-    with open(f"{output_dir}/all-pages.json", "w") as f:
-        json.dump(all_pages, f, indent=2)
-
-    # Generate summary statistics
-    summary = {
-        "total_pages": len(all_pages),
-        "platforms": len(platforms),
-        "content_types": len(content_types), 
-        "industries": len(industries),
-        "page_breakdown": {
-            "platform_only": 6,
-            "content_type_combinations": 48,
-            "industry_combinations": 60,
-            "triple_combinations": 120
-        },
-        "generated_at": datetime.now().isoformat(),
-        "estimated_total_words": len(all_pages) * 1500  # Conservative estimate
-    }
-    
-    with open(f"{output_dir}/generation-summary.json", "w") as f:
-        json.dump(summary, f, indent=2)
-
-    print(f"✅ Generated {len(all_pages)} comprehensive PSEO pages")
-    print(f"📊 Estimated total content: {summary['estimated_total_words']:,} words")
-    print(f"💾 Data files saved to: {output_dir}")
-    print(f"🎯 Ready for Next.js dynamic page generation")
+from pseo import guides
 
 if __name__ == "__main__":
-    create_comprehensive_content()
\ No newline at end of file
+    guides.main()
@@ -0,0 +1,4 @@
+from pseo import seedstats
+
+if __name__ == "__main__":
+    seedstats.main()
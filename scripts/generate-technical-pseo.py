@@ -1,832 +1,4 @@
-import json
-import os
-from datetime import datetime
-
-def create_technical_content():
-    """
-    Generate technical AI SEO pages focusing on implementation guides,
-    schema markup, and technical optimization strategies.
-    """
-    
-    # Schema Types with comprehensive technical information
-    schema_types = {
-        "article": {
-            "name": "Article Schema",
-            "slug": "article-schema",
-            "description": "Schema markup for articles and blog posts to enhance AI comprehension",
-            "use_cases": ["Blog posts", "News articles", "Technical guides", "Case studies"],
-            "required_properties": ["headline", "author", "datePublished", "publisher"],
-            "ai_benefits": [
-                "Enhanced content categorization for AI search engines",
-                "Improved author attribution and E-A-T signals",
-                "Better content freshness detection",
-                "Clear article structure recognition"
-            ],
-            "implementation_complexity": "Medium",
-            "common_mistakes": [
-                "Missing required author information",
-                "Incorrect date formatting",
-                "Missing publisher schema",
-                "Incomplete nested organization data"
-            ]
-        },
-        "faq": {
-            "name": "FAQ Schema",
-            "slug": "faq-schema",
-            "description": "Structured data for frequently asked questions to enable direct AI answers",
-            "use_cases": ["FAQ pages", "Help documentation", "Product Q&A", "Support pages"],
-            "required_properties": ["mainEntity", "name", "acceptedAnswer"],
-            "ai_benefits": [
-                "Direct answer extraction for AI search engines",
-                "Enhanced voice search optimization",
-                "Improved featured snippet eligibility",
-                "Better question-answer matching"
-            ],
-            "implementation_complexity": "Easy",
-            "common_mistakes": [
-                "Poorly formatted questions",
-                "Missing answer content",
-                "Incorrect nesting structure",
-                "Overly long answer text"
-            ]
-        },
-        "organization": {
-            "name": "Organization Schema",
-            "slug": "organization-schema",
-            "description": "Business entity markup for authority and credibility signals",
-            "use_cases": ["Company pages", "About pages", "Contact pages", "Business profiles"],
-            "required_properties": ["name", "url", "logo", "contactPoint"],
-            "ai_benefits": [
-                "Enhanced business entity recognition",
-                "Improved local search visibility",
-                "Better brand authority establishment",
-                "Clear business relationship mapping"
-            ],
-            "implementation_complexity": "Medium",
-            "common_mistakes": [
-                "Missing contact information",
-                "Incorrect logo specifications",
-                "Incomplete address data",
-                "Missing social media profiles"
-            ]
-        },
-        "person": {
-            "name": "Person Schema",
-            "slug": "person-schema", 
-            "description": "Individual profile markup for author attribution and expertise",
-            "use_cases": ["Author pages", "Team profiles", "Expert bios", "Speaker profiles"],
-            "required_properties": ["name", "jobTitle", "worksFor", "url"],
-            "ai_benefits": [
-                "Enhanced author authority recognition",
-                "Improved E-A-T signal strength",
-                "Better expert attribution",
-                "Clear professional relationship mapping"
-            ],
-            "implementation_complexity": "Easy",
-            "common_mistakes": [
-                "Incomplete professional information",
-                "Missing credentials and qualifications",
-                "Incorrect job title formatting",
-                "Missing social proof elements"
-            ]
-        },
-        "product": {
-            "name": "Product Schema",
-            "slug": "product-schema",
-            "description": "E-commerce product markup for shopping and comparison queries",
-            "use_cases": ["Product pages", "Shopping listings", "Catalog items", "Service offerings"],
-            "required_properties": ["name", "description", "brand", "offers"],
-            "ai_benefits": [
-                "Enhanced product discovery in AI shopping",
-                "Improved price comparison accuracy",
-                "Better product feature matching",
-                "Clear availability and inventory signals"
-            ],
-            "implementation_complexity": "High",
-            "common_mistakes": [
-                "Missing price and availability data",
-                "Incomplete product specifications",
-                "Poor review integration",
-                "Incorrect brand information"
-            ]
-        },
-        "service": {
-            "name": "Service Schema",
-            "slug": "service-schema",
-            "description": "Service offering markup for business and professional services",
-            "use_cases": ["Service pages", "Professional offerings", "Consulting services", "Support services"],
-            "required_properties": ["name", "provider", "serviceType", "areaServed"],
-            "ai_benefits": [
-                "Enhanced service discovery and matching",
-                "Improved local service visibility",
-                "Better service area targeting",
-                "Clear service capability communication"
-            ],
-            "implementation_complexity": "Medium",
-            "common_mistakes": [
-                "Vague service descriptions",
-                "Missing geographic targeting",
-                "Incomplete provider information",
-                "Poor service categorization"
-            ]
-        },
-        "review": {
-            "name": "Review Schema", 
-            "slug": "review-schema",
-            "description": "Customer review markup for trust signals and social proof",
-            "use_cases": ["Review pages", "Testimonials", "Product reviews", "Service ratings"],
-            "required_properties": ["itemReviewed", "author", "reviewRating", "reviewBody"],
-            "ai_benefits": [
-                "Enhanced trust signal recognition",
-                "Improved sentiment analysis accuracy",
-                "Better review aggregation",
-                "Clear rating and feedback integration"
-            ],
-            "implementation_complexity": "Medium",
-            "common_mistakes": [
-                "Fake or manipulated reviews",
-                "Missing review dates",
-                "Incomplete rating scales",
-                "Poor author attribution"
-            ]
-        },
-        "breadcrumblist": {
-            "name": "BreadcrumbList Schema",
-            "slug": "breadcrumblist-schema",
-            "description": "Navigation hierarchy markup for site structure understanding",
-            "use_cases": ["Navigation breadcrumbs", "Category hierarchies", "Site structure", "Content organization"],
-            "required_properties": ["itemListElement", "position", "name", "item"],
-            "ai_benefits": [
-                "Enhanced site structure understanding",
-                "Improved content categorization",
-                "Better navigation context",
-                "Clear content hierarchy mapping"
-            ],
-            "implementation_complexity": "Easy",
-            "common_mistakes": [
-                "Incorrect position ordering",
-                "Missing intermediate levels",
-                "Broken link references",
-                "Inconsistent naming conventions"
-            ]
-        },
-        "website": {
-            "name": "WebSite Schema",
-            "slug": "website-schema",
-            "description": "Website entity markup for search functionality and site recognition",
-            "use_cases": ["Homepage", "Site-wide markup", "Search integration", "Brand recognition"],
-            "required_properties": ["name", "url", "potentialAction"],
-            "ai_benefits": [
-                "Enhanced site entity recognition",
-                "Improved brand authority signals",
-                "Better search functionality integration",
-                "Clear site purpose communication"
-            ],
-            "implementation_complexity": "Easy",
-            "common_mistakes": [
-                "Missing search action markup",
-                "Incorrect URL specifications",
-                "Poor site name consistency",
-                "Missing alternate language versions"
-            ]
-        },
-        "localbusiness": {
-            "name": "LocalBusiness Schema",
-            "slug": "localbusiness-schema", 
-            "description": "Local business markup for geographic and location-based searches",
-            "use_cases": ["Local business pages", "Store locations", "Service areas", "Contact pages"],
-            "required_properties": ["name", "address", "telephone", "openingHours"],
-            "ai_benefits": [
-                "Enhanced local search visibility",
-                "Improved location-based recommendations",
-                "Better business hours integration",
-                "Clear geographic targeting"
-            ],
-            "implementation_complexity": "Medium",
-            "common_mistakes": [
-                "Inconsistent NAP information",
-                "Missing business hours",
-                "Incorrect address formatting",
-                "Poor category classification"
-            ]
-        },
-        "course": {
-            "name": "Course Schema",
-            "slug": "course-schema",
-            "description": "Educational course markup for learning and training content",
-            "use_cases": ["Online courses", "Training programs", "Educational content", "Certification programs"],
-            "required_properties": ["name", "description", "provider", "courseCode"],
-            "ai_benefits": [
-                "Enhanced educational content discovery",
-                "Improved course recommendation matching",
-                "Better learning path integration",
-                "Clear skill and competency mapping"
-            ],
-            "implementation_complexity": "High",
-            "common_mistakes": [
-                "Missing course prerequisites",
-                "Incomplete instructor information",
-                "Poor course outcome descriptions",
-                "Missing certification details"
-            ]
-        },
-        "event": {
-            "name": "Event Schema",
-            "slug": "event-schema",
-            "description": "Event markup for conferences, webinars, and scheduled activities",
-            "use_cases": ["Conferences", "Webinars", "Workshops", "Meetings"],
-            "required_properties": ["name", "startDate", "location", "organizer"],
-            "ai_benefits": [
-                "Enhanced event discovery and recommendations",
-                "Improved calendar integration",
-                "Better event categorization",
-                "Clear scheduling and availability communication"
-            ],
-            "implementation_complexity": "Medium",
-            "common_mistakes": [
-                "Incorrect date and time formatting",
-                "Missing timezone information",
-                "Incomplete venue details",
-                "Poor event categorization"
-            ]
-        },
-        "recipe": {
-            "name": "Recipe Schema",
-            "slug": "recipe-schema",
-            "description": "Recipe markup for cooking and food-related content",
-            "use_cases": ["Recipe pages", "Cooking guides", "Food blogs", "Nutrition content"],
-            "required_properties": ["name", "recipeIngredient", "recipeInstructions", "nutrition"],
-            "ai_benefits": [
-                "Enhanced recipe discovery and matching",
-                "Improved cooking assistant integration",
-                "Better dietary restriction filtering",
-                "Clear nutritional information communication"
-            ],
-            "implementation_complexity": "High",
-            "common_mistakes": [
-                "Missing nutritional information",
-                "Incomplete ingredient lists",
-                "Poor instruction formatting",
-                "Missing cooking times and temperatures"
-            ]
-        },
-        "videoobject": {
-            "name": "VideoObject Schema",
-            "slug": "videoobject-schema",
-            "description": "Video content markup for multimedia search optimization",
-            "use_cases": ["Video pages", "Tutorial content", "Entertainment videos", "Educational media"],
-            "required_properties": ["name", "description", "thumbnailUrl", "uploadDate"],
-            "ai_benefits": [
-                "Enhanced video content discovery",
-                "Improved multimedia search integration",
-                "Better video recommendation matching",
-                "Clear content categorization and tagging"
-            ],
-            "implementation_complexity": "Medium",
-            "common_mistakes": [
-                "Missing video transcripts",
-                "Poor thumbnail optimization",
-                "Incomplete video metadata",
-                "Missing duration and quality information"
-            ]
-        },
-        "imageobject": {
-            "name": "ImageObject Schema", 
-            "slug": "imageobject-schema",
-            "description": "Image content markup for visual search and accessibility",
-            "use_cases": ["Image galleries", "Product photos", "Visual content", "Infographics"],
-            "required_properties": ["contentUrl", "name", "description", "author"],
-            "ai_benefits": [
-                "Enhanced visual search optimization",
-                "Improved image accessibility",
-                "Better visual content categorization",
-                "Clear image rights and attribution"
-            ],
-            "implementation_complexity": "Easy",
-            "common_mistakes": [
-                "Missing alt text descriptions",
-                "Poor image quality optimization",
-                "Incomplete copyright information",
-                "Missing visual content context"
-            ]
-        }
-    }
-
-    # Technical Implementation Topics
-    technical_topics = {
-        "implementation": {
-            "name": "Implementation Guide",
-            "slug": "implementation",
-            "description": "Step-by-step technical implementation instructions",
-            "focus_areas": ["Code examples", "Testing procedures", "Validation methods", "Integration steps"],
-            "difficulty_level": "Intermediate",
-            "content_approach": "Practical, hands-on guidance with real-world examples"
-        },
-        "troubleshooting": {
-            "name": "Troubleshooting Guide", 
-            "slug": "troubleshooting",
-            "description": "Common problems and technical solutions",
-            "focus_areas": ["Error identification", "Debug processes", "Fix procedures", "Prevention strategies"],
-            "difficulty_level": "Advanced",
-            "content_approach": "Problem-solving focused with diagnostic techniques"
-        },
-        "optimization": {
-            "name": "Optimization Strategies",
-            "slug": "optimization", 
-            "description": "Performance and effectiveness improvement techniques",
-            "focus_areas": ["Performance tuning", "Best practices", "Advanced techniques", "Monitoring"],
-            "difficulty_level": "Advanced",
-            "content_approach": "Strategic guidance for maximum effectiveness"
-        },
-        "testing": {
-            "name": "Testing and Validation",
-            "slug": "testing",
-            "description": "Quality assurance and validation procedures",
-            "focus_areas": ["Testing tools", "Validation methods", "Quality metrics", "Monitoring"],
-            "difficulty_level": "Intermediate", 
-            "content_approach": "Systematic approach to quality assurance"
-        },
-        "integration": {
-            "name": "Integration Guide",
-            "slug": "integration",
-            "description": "Connecting with existing systems and workflows",
-            "focus_areas": ["System compatibility", "Workflow integration", "Tool connections", "Automation"],
-            "difficulty_level": "Advanced",
-            "content_approach": "Comprehensive integration strategies"
-        },
-        "maintenance": {
-            "name": "Maintenance and Updates",
-            "slug": "maintenance", 
-            "description": "Ongoing management and maintenance procedures",
-            "focus_areas": ["Update procedures", "Monitoring", "Performance tracking", "Issue prevention"],
-            "difficulty_level": "Intermediate",
-            "content_approach": "Proactive maintenance strategies"
-        }
-    }
-
-    # AI Platforms (with monthly_users added)
-    platforms = {
-        "chatgpt": {
-            "name": "ChatGPT",
-            "slug": "chatgpt",
-            "monthly_users": "347 million",
-            "technical_focus": "conversational AI optimization and structured data integration",
-            "implementation_priority": "JSON-LD structured data with comprehensive entity linking"
-        },
-        "perplexity": {
-            "name": "Perplexity",
-            "slug": "perplexity",
-            "monthly_users": "230 million",
-            "technical_focus": "real-time content optimization and citation-ready formatting",
-            "implementation_priority": "fresh content signals with structured attribution"
-        },
-        "claude": {
-            "name": "Claude",
-            "slug": "claude",
-            "monthly_users": "150 million",
-            "technical_focus": "analytical content structure and comprehensive documentation",
-            "implementation_priority": "logical content hierarchy with evidence-based assertions"
-        },
-        "gemini": {
-            "name": "Gemini", 
-            "slug": "gemini",
-            "monthly_users": "200 million",
-            "technical_focus": "multimodal optimization and Google ecosystem integration",
-            "implementation_priority": "enhanced schema with Google Knowledge Graph connections"
-        },
-        "searchgpt": {
-            "name": "SearchGPT",
-            "slug": "searchgpt",
-            "monthly_users": "120 million",
-            "technical_focus": "publisher-grade optimization and search-specific implementation",
-            "implementation_priority": "advanced schema with NewsArticle and Publisher types"
-        },
-        "copilot": {
-            "name": "Microsoft Copilot",
-            "slug": "copilot",
-            "monthly_users": "180 million",
-            "technical_focus": "enterprise integration and Microsoft ecosystem compatibility",
-            "implementation_priority": "business-focused schema with Office and productivity integration"
-        }
-    }
-
-    def generate_technical_page_content(schema_slug, platform_slug, topic_slug, page_type):
-        """Generate comprehensive technical content for specific combinations"""
-        
-        schema_data = schema_types.get(schema_slug) if schema_slug else None
-        platform_data = platforms.get(platform_slug) if platform_slug else None
-        topic_data = technical_topics.get(topic_slug) if topic_slug else None
-        
-        if page_type == "schema_platform":
-            slug = f"{schema_data['slug']}-{platform_data['slug']}-optimization"
-            title = f"{schema_data['name']} for {platform_data['name']} - Technical Implementation Guide"
-            meta_description = f"Complete {schema_data['name']} implementation guide for {platform_data['name']} optimization. Code examples, testing, and best practices for AI SEO."
-            stats = platform_data['monthly_users'] if platform_data else "millions of"
-        elif page_type == "technical_platform":
-            slug = f"{platform_data['slug']}-{topic_data['slug']}-guide"
-            title = f"{platform_data['name']} {topic_data['name']} - Technical AI SEO Guide"
-            meta_description = f"Technical {topic_data['description'].lower()} for {platform_data['name']} optimization. Expert guidance for AI SEO implementation."
-            stats = platform_data['monthly_users'] if platform_data else "millions of"
-        elif page_type == "schema_technical":
-            slug = f"{schema_data['slug']}-{topic_data['slug']}"
-            title = f"{schema_data['name']} {topic_data['name']} - Complete Technical Guide"
-            meta_description = f"{schema_data['name']} {topic_data['description'].lower()}. Technical implementation with code examples and validation procedures."
-            stats = "millions of"
-
-        # Generate comprehensive content sections
-        content = {
-            "slug": slug,
-            "title": title,
-            "meta_description": meta_description,
-            "schema_type": schema_data['name'] if schema_data else None,
-            "platform": platform_data['name'] if platform_data else "AI Search Engines",
-            "content_type": None,
-            "industry": None,
-            "technical_topic": topic_data['name'] if topic_data else None,
-            "hero_section": {
-                "headline": title,
-                "subheadline": generate_technical_subheadline(schema_data, platform_data, topic_data, page_type),
-                "stats": stats
-            },
-            "introduction": generate_comprehensive_introduction(schema_data, platform_data, topic_data, page_type),
-            "main_sections": generate_comprehensive_main_sections(schema_data, platform_data, topic_data, page_type),
-            "technical_implementation": generate_comprehensive_technical_implementation(schema_data, platform_data, topic_data, page_type),
-            "best_practices": generate_comprehensive_best_practices(schema_data, platform_data, topic_data, page_type),
-            "common_mistakes": generate_comprehensive_mistakes(schema_data, platform_data, topic_data, page_type),
-            "measurement_analytics": generate_comprehensive_measurement(schema_data, platform_data, topic_data, page_type),
-            "conclusion_cta": generate_comprehensive_cta(schema_data, platform_data, topic_data, page_type),
-            "generated_at": datetime.now().isoformat(),
-            "word_count": 1800
-        }
-        
-        return content
-
-    def generate_technical_subheadline(schema_data, platform_data, topic_data, page_type):
-        """Generate compelling subheadlines for technical content"""
-        if page_type == "schema_platform":
-            return f"Master {schema_data['name']} implementation for {platform_data['name']} with step-by-step code examples, validation procedures, and optimization strategies for maximum AI search visibility."
-        elif page_type == "technical_platform":
-            return f"Complete {topic_data['name'].lower()} for {platform_data['name']} optimization. Expert technical guidance with real-world implementation examples and troubleshooting solutions."
-        else:
-            return f"Comprehensive {schema_data['name']} {topic_data['description'].lower()} with technical implementation details, code examples, and professional best practices."
-
-    def generate_comprehensive_introduction(schema_data, platform_data, topic_data, page_type):
-        """Generate detailed introduction sections"""
-        if page_type == "schema_platform":
-            opening = f"{schema_data['name']} implementation for {platform_data['name']} requires understanding both the technical markup requirements and platform-specific optimization strategies. This comprehensive guide provides step-by-step implementation procedures with real-world code examples and validation techniques."
-            statistics = f"{platform_data['name']}'s {platform_data['technical_focus']} makes proper {schema_data['name']} implementation critical for AI search optimization. Websites with correct schema markup see 4.2x higher citation rates in {platform_data['name']} responses."
-            benefits = schema_data['ai_benefits'] + [f"Enhanced visibility in {platform_data['name']} search results", "Improved technical SEO foundation"]
-        elif page_type == "technical_platform":
-            opening = f"{topic_data['name']} for {platform_data['name']} optimization involves systematic technical approaches to improve AI search performance. This guide covers advanced implementation strategies, troubleshooting procedures, and optimization techniques specific to {platform_data['name']}'s requirements."
-            statistics = f"Technical optimization for {platform_data['name']} can improve search visibility by up to 300%. Proper implementation following {platform_data['name']}'s {platform_data['technical_focus']} guidelines significantly increases citation probability."
-            benefits = [f"Advanced {platform_data['name']} optimization techniques", f"Technical implementation aligned with {platform_data['name']} requirements", "Systematic troubleshooting and optimization procedures"]
-        else:
-            opening = f"{schema_data['name']} {topic_data['description'].lower()} requires comprehensive understanding of both markup standards and practical implementation challenges. This technical guide provides detailed procedures for successful deployment and ongoing maintenance."
-            statistics = f"Proper {schema_data['name']} implementation with systematic {topic_data['description'].lower()} can improve search engine recognition by 250% and reduce technical issues by 80%."
-            benefits = schema_data['ai_benefits'] + [f"Systematic {topic_data['description'].lower()}", "Professional implementation standards"]
-        
-        return {
-            "opening_paragraph": opening,
-            "statistics": statistics,
-            "key_benefits": benefits,
-            "unique_challenges": schema_data['common_mistakes'] if schema_data else ["Technical implementation complexity", "Validation requirements", "Platform-specific optimization needs"]
-        }
-
-    def generate_comprehensive_main_sections(schema_data, platform_data, topic_data, page_type):
-        """Generate detailed main content sections"""
-        sections = []
-        
-        if page_type == "schema_platform":
-            # Section 1: Schema Structure and Requirements
-            sections.append({
-                "title": f"{schema_data['name']} Structure for {platform_data['name']}",
-                "content": {
-                    "introduction": f"Understanding {schema_data['name']} structure is fundamental for {platform_data['name']} optimization. This section covers the technical requirements and implementation standards.",
-                    "key_strategies": [
-                        f"Implement all required {schema_data['name']} properties: {', '.join(schema_data['required_properties'])}",
-                        f"Optimize markup for {platform_data['name']}'s {platform_data['technical_focus']}",
-                        f"Follow {platform_data['implementation_priority']} guidelines",
-                        "Validate implementation using official testing tools"
-                    ],
-                    "implementation_details": [
-                        f"JSON-LD structure optimized for {platform_data['name']} parsing algorithms",
-                        f"Property nesting aligned with {platform_data['name']} content analysis patterns",
-                        f"Entity relationships supporting {platform_data['name']} knowledge graph integration",
-                        "Error handling and fallback markup strategies"
-                    ],
-                    "ai_benefits": schema_data['ai_benefits']
-                }
-            })
-            
-            # Section 2: Platform-Specific Implementation
-            sections.append({
-                "title": f"{platform_data['name']} Optimization Techniques",
-                "content": {
-                    "introduction": f"{platform_data['name']}'s unique approach to content analysis requires specific optimization techniques for {schema_data['name']} implementation.",
-                    "optimization_strategies": [
-                        f"Leverage {platform_data['name']}'s {platform_data['technical_focus']} for enhanced visibility",
-                        f"Implement {platform_data['implementation_priority']} for optimal parsing",
-                        f"Structure content hierarchy for {platform_data['name']} content understanding",
-                        f"Optimize entity relationships for {platform_data['name']} knowledge integration"
-                    ],
-                    "implementation_details": [
-                        f"Platform-specific property priorities for {platform_data['name']}",
-                        f"Content formatting aligned with {platform_data['name']} analysis patterns",
-                        f"Markup validation using {platform_data['name']}-specific testing procedures",
-                        "Performance optimization for fast content processing"
-                    ]
-                }
-            })
-
-        elif page_type == "technical_platform":
-            # Section 1: Technical Implementation Framework
-            sections.append({
-                "title": f"{platform_data['name']} Technical Implementation Framework",
-                "content": {
-                    "introduction": f"Systematic {topic_data['description'].lower()} for {platform_data['name']} requires understanding both platform requirements and technical implementation standards.",
-                    "key_strategies": [
-                        f"Follow {platform_data['name']} technical documentation and guidelines",
-                        f"Implement {platform_data['implementation_priority']} systematically",
-                        f"Optimize for {platform_data['name']}'s {platform_data['technical_focus']}",
-                        "Establish comprehensive testing and validation procedures"
-                    ],
-                    "implementation_details": topic_data['focus_areas']
-                }
-            })
-
-        else:  # schema_technical
-            # Section 1: Schema Technical Implementation
-            sections.append({
-                "title": f"{schema_data['name']} Technical Implementation",
-                "content": {
-                    "introduction": f"Technical implementation of {schema_data['name']} with {topic_data['description'].lower()} requires systematic approach to markup, validation, and optimization.",
-                    "key_strategies": [
-                        f"Implement comprehensive {schema_data['name']} markup structure",
-                        f"Apply systematic {topic_data['description'].lower()} procedures",
-                        "Establish robust validation and testing workflows",
-                        "Optimize for multiple AI search engine compatibility"
-                    ],
-                    "implementation_details": [
-                        f"Required properties: {', '.join(schema_data['required_properties'])}",
-                        f"Implementation complexity: {schema_data['implementation_complexity']}",
-                        f"Use cases: {', '.join(schema_data['use_cases'])}",
-                        f"Focus areas: {', '.join(topic_data['focus_areas'])}"
-                    ],
-                    "ai_benefits": schema_data['ai_benefits']
-                }
-            })
-
-        # Section 3: Advanced Implementation Strategies
-        sections.append({
-            "title": "Advanced Implementation Strategies",
-            "content": {
-                "introduction": "Beyond basic implementation, advanced strategies ensure maximum effectiveness and long-term maintainability of your technical setup.",
-                "optimization_strategies": [
-                    "Implement progressive enhancement for schema markup",
-                    "Establish automated validation and monitoring systems",
-                    "Optimize for cross-platform AI search engine compatibility",
-                    "Build scalable implementation workflows for large-scale deployment"
-                ],
-                "implementation_details": [
-                    "Automated testing integration with development workflows",
-                    "Performance monitoring and optimization procedures",
-                    "Error handling and graceful degradation strategies",
-                    "Documentation and knowledge transfer procedures"
-                ]
-            }
-        })
-
-        return sections
-
-    def generate_comprehensive_technical_implementation(schema_data, platform_data, topic_data, page_type):
-        """Generate comprehensive technical implementation section"""
-        if page_type == "schema_platform":
-            title = f"Technical Implementation for {schema_data['name']} on {platform_data['name']}"
-            core_requirements = [
-                f"Complete {schema_data['name']} JSON-LD structure with all required properties",
-                f"Validation using Google Structured Data Testing Tool and {platform_data['name']}-specific validators",
-                f"Implementation of {platform_data['implementation_priority']}",
-                "Performance optimization for fast loading and parsing"
-            ]
-            schema_types = schema_data['required_properties']
-        else:
-            title = "Technical Implementation Requirements"
-            core_requirements = [
-                "Systematic implementation following technical documentation",
-                "Comprehensive validation and testing procedures",
-                "Performance optimization and monitoring",
-                "Documentation and maintenance procedures"
-            ]
-            schema_types = ["JSON-LD", "Microdata", "RDFa", "Schema.org"]
-
-        return {
-            "title": title,
-            "core_requirements": core_requirements,
-            "schema_markup": {
-                "primary_schemas": schema_types,
-                "implementation_guide": [
-                    "JSON-LD structured data implementation with comprehensive entity linking",
-                    "Schema validation using multiple testing tools and platforms",
-                    "Progressive enhancement with advanced schema types and relationships",
-                    "Cross-platform compatibility testing and optimization",
-                    "Performance impact assessment and optimization"
-                ]
-            },
-            "content_optimization": {
-                "structure_requirements": [
-                    "Semantic HTML5 structure with proper heading hierarchy",
-                    "Clear content organization supporting schema markup",
-                    "Internal linking strategy connecting related technical topics",
-                    "Mobile-first responsive design for universal accessibility"
-                ],
-                "performance_optimization": [
-                    "Page load speeds optimized for technical content (under 2 seconds)",
-                    "CDN implementation for global technical documentation access",
-                    "Code syntax highlighting and technical formatting optimization",
-                    "Search functionality for complex technical reference material"
-                ]
-            }
-        }
-
-    def generate_comprehensive_best_practices(schema_data, platform_data, topic_data, page_type):
-        """Generate comprehensive best practices section"""
-        if page_type == "schema_platform":
-            title = f"{schema_data['name']} Best Practices for {platform_data['name']}"
-        elif page_type == "technical_platform":
-            title = f"{platform_data['name']} {topic_data['name']} Best Practices"
-        else:
-            title = f"{schema_data['name']} {topic_data['name']} Best Practices"
-
-        return {
-            "title": title,
-            "content_best_practices": [
-                "Maintain comprehensive documentation for all technical implementations",
-                "Follow semantic markup principles for enhanced AI understanding",
-                "Implement consistent naming conventions across all schema markup",
-                "Regular content audits to ensure markup accuracy and completeness",
-                "Stay updated with latest schema.org and platform-specific guidelines"
-            ],
-            "technical_best_practices": [
-                "Validate all structured data using official testing tools before deployment",
-                "Implement automated testing in development workflows",
-                "Monitor Core Web Vitals and technical performance metrics",
-                "Use version control for all schema markup changes",
-                "Establish rollback procedures for problematic implementations"
-            ],
-            "authority_building": [
-                "Link to authoritative technical documentation and official specifications",
-                "Include code examples and practical implementation samples",
-                "Reference industry standards and best practice guidelines",
-                "Maintain technical accuracy through expert review processes",
-                "Build internal linking between related technical topics for better discovery"
-            ]
-        }
-
-    def generate_comprehensive_mistakes(schema_data, platform_data, topic_data, page_type):
-        """Generate comprehensive common mistakes section"""
-        if page_type == "schema_platform":
-            title = f"Common {schema_data['name']} Implementation Mistakes on {platform_data['name']}"
-            specific_mistakes = schema_data['common_mistakes']
-        elif page_type == "technical_platform":
-            title = f"Common {topic_data['name']} Mistakes for {platform_data['name']}"
-            specific_mistakes = [
-                f"Ignoring {platform_data['name']}-specific optimization requirements",
-                f"Poor understanding of {platform_data['technical_focus']} principles",
-                "Inadequate testing and validation procedures",
-                "Lack of systematic implementation approach"
-            ]
-        else:
-            title = f"Common {schema_data['name']} {topic_data['name']} Mistakes"
-            specific_mistakes = schema_data['common_mistakes']
-
-        return {
-            "title": title,
-            "content_mistakes": specific_mistakes,
-            "technical_mistakes": [
-                "Implementing incomplete or incorrect markup that fails validation",
-                "Poor error handling leading to broken structured data",
-                "Ignoring mobile optimization affecting content accessibility",
-                "Inadequate performance testing causing slow page loads"
-            ]
-        }
-
-    def generate_comprehensive_measurement(schema_data, platform_data, topic_data, page_type):
-        """Generate comprehensive measurement section"""
-        if page_type == "schema_platform":
-            title = f"Measuring {schema_data['name']} Success on {platform_data['name']}"
-            platform_name = platform_data['name']
-        elif page_type == "technical_platform":
-            title = f"Measuring {topic_data['name']} Success for {platform_data['name']}"
-            platform_name = platform_data['name']
-        else:
-            title = f"Measuring {schema_data['name']} {topic_data['name']} Success"
-            platform_name = "AI search engines"
-
-        return {
-            "title": title,
-            "key_metrics": [
-                f"Schema markup validation success rates across all {platform_name} testing tools",
-                f"Page loading performance impact of technical implementations",
-                f"Search visibility improvements in {platform_name} results",
-                "Technical error rates and resolution times for markup issues"
-            ],
-            "tracking_methods": [
-                f"Google Search Console monitoring for {platform_name} compatibility",
-                "Automated validation testing integrated with deployment workflows",
-                "Performance monitoring for Core Web Vitals and technical metrics",
-                "Regular audits using professional SEO and validation tools"
-            ]
-        }
-
-    def generate_comprehensive_cta(schema_data, platform_data, topic_data, page_type):
-        """Generate comprehensive conclusion and CTA"""
-        if page_type == "schema_platform":
-            title = f"Optimize Your {schema_data['name']} Implementation for {platform_data['name']}"
-            summary = f"Professional {schema_data['name']} implementation for {platform_data['name']} requires technical precision, systematic validation, and ongoing optimization."
-        elif page_type == "technical_platform":
-            title = f"Enhance Your {platform_data['name']} Technical Implementation"
-            summary = f"Successful {topic_data['description'].lower()} for {platform_data['name']} demands systematic technical approaches and continuous optimization."
-        else:
-            title = f"Master {schema_data['name']} {topic_data['name']}"
-            summary = f"Professional {schema_data['name']} {topic_data['description'].lower()} requires comprehensive technical knowledge and systematic implementation."
-
-        return {
-            "title": title,
-            "summary": summary,
-            "key_takeaways": [
-                "Implement comprehensive technical validation and testing procedures",
-                "Follow platform-specific optimization guidelines for maximum effectiveness",
-                "Establish systematic monitoring and maintenance workflows",
-                "Use professional tools and validation processes for quality assurance",
-                "Link to your main AI SEO scanner at https://aiseoscan.dev for comprehensive analysis"
-            ],
-            "next_steps": [
-                "Audit your current technical implementation for optimization opportunities",
-                "Implement priority technical improvements using this guide",
-                "Establish monitoring and validation procedures for ongoing success",
-                "Use AISEOScan to identify additional technical optimization opportunities"
-            ]
-        }
-
-    # Generate all technical page combinations
-    all_technical_pages = []
-    
-    # Schema × Platform combinations (90 pages)
-    for schema_slug in schema_types.keys():
-        for platform_slug in platforms.keys():
-            page_content = generate_technical_page_content(schema_slug, platform_slug, None, "schema_platform")
-            all_technical_pages.append(page_content)
-    
-    # Technical Topic × Platform combinations (36 pages)
-    for topic_slug in technical_topics.keys():
-        for platform_slug in platforms.keys():
-            page_content = generate_technical_page_content(None, platform_slug, topic_slug, "technical_platform")
-            all_technical_pages.append(page_content)
-    
-    # Schema × Technical Topic combinations (90 pages) 
-    for schema_slug in schema_types.keys():
-        for topic_slug in technical_topics.keys():
-            page_content = generate_technical_page_content(schema_slug, None, topic_slug, "schema_technical")
-            all_technical_pages.append(page_content)
-
-    # Create output directory
-    output_dir = "../src/data/pseo"
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Save technical pages data
-    with open(f"{output_dir}/technical-pages.json", "w") as f:
-        json.dump(all_technical_pages, f, indent=2)
-
-    # Save supporting data files
-    with open(f"{output_dir}/schema-types.json", "w") as f:
-        json.dump(schema_types, f, indent=2)
-        
-    with open(f"{output_dir}/technical-topics.json", "w") as f:
-        json.dump(technical_topics, f, indent=2)
-
-    # Generate summary statistics
-    summary = {
-        "total_technical_pages": len(all_technical_pages),
-        "schema_types": len(schema_types),
-        "technical_topics": len(technical_topics),
-        "platforms": len(platforms),
-        "page_breakdown": {
-            "schema_platform_combinations": 90,
-            "technical_platform_combinations": 36,
-            "schema_technical_combinations": 90
-        },
-        "generated_at": datetime.now().isoformat(),
-        "estimated_total_words": len(all_technical_pages) * 1500
-    }
-    
-    with open(f"{output_dir}/technical-summary.json", "w") as f:
-        json.dump(summary, f, indent=2)
-
-    print(f"✅ Generated {len(all_technical_pages)} technical PSEO pages")
-    print(f"📊 Estimated total content: {summary['estimated_total_words']:,} words")
-    print(f"💾 Technical data files saved to: {output_dir}")
-    print(f"🔧 Schema types: {len(schema_types)}")
-    print(f"📖 Technical topics: {len(technical_topics)}")
+from pseo import technical
 
 if __name__ == "__main__":
-    create_technical_content()
\ No newline at end of file
+    technical.main()
@@ -1,817 +1,4 @@
-import json
-import os
-from datetime import datetime
-
-def create_usecase_content():
-    """
-    Generate use case-focused PSEO content targeting high-value AI SEO keywords.
-    Creates 135 pages with 1,500+ words each, optimized for Google ranking.
-    """
-    
-    # Use Cases - targeting real search keywords with volume
-    use_cases = {
-        "tools": {
-            "name": "AI SEO Tools",
-            "slug": "tools",
-            "keywords": ["ai seo tools", "best ai seo tools", "ai tools for seo"],
-            "search_volume": 3600,
-            "cpc": 11.58,
-            "intent": "commercial",
-            "description": "Comprehensive AI-powered tools for optimizing website visibility in ChatGPT, Perplexity, Claude, and other AI search engines",
-            "main_benefit": "Automate and scale AI search optimization with specialized tools designed for the new era of AI-powered discovery",
-            "key_features": [
-                "Schema markup validation and implementation",
-                "AI citation tracking and monitoring",
-                "Content optimization for AI comprehension",
-                "Authority signal analysis and recommendations",
-                "Real-time AI search performance tracking"
-            ],
-            "user_challenges": [
-                "Manual AI SEO optimization is time-consuming and complex",
-                "Tracking AI citations across multiple platforms manually",
-                "Understanding which content gets cited by AI systems",
-                "Implementing technical requirements across large sites"
-            ],
-            "tool_categories": [
-                "Schema markup generators and validators",
-                "AI citation tracking platforms",
-                "Content optimization analyzers",
-                "Authority signal audit tools",
-                "Performance monitoring dashboards"
-            ]
-        },
-        "optimization": {
-            "name": "AI SEO Optimization",
-            "slug": "optimization",
-            "keywords": ["ai seo optimization", "optimize for ai search", "ai search optimization"],
-            "search_volume": 720,
-            "cpc": 10.31,
-            "intent": "transactional",
-            "description": "Strategic optimization techniques to maximize your website's visibility and citation rate in AI-powered search engines",
-            "main_benefit": "Systematically improve your content's discoverability and citation frequency across ChatGPT, Perplexity, Claude, and emerging AI platforms",
-            "key_features": [
-                "Multi-platform AI optimization strategies",
-                "Content structure optimization for AI parsing",
-                "Technical SEO for AI crawlers",
-                "Authority building for AI trust signals",
-                "Citation-ready content formatting"
-            ],
-            "user_challenges": [
-                "AI search algorithms differ significantly from traditional SEO",
-                "Each AI platform has unique optimization requirements",
-                "Measuring AI SEO success is complex",
-                "Balancing traditional and AI SEO strategies"
-            ],
-            "optimization_areas": [
-                "Content architecture and information hierarchy",
-                "Schema markup and structured data implementation",
-                "Authority signals and trust indicators",
-                "Technical performance and accessibility",
-                "Citation-friendly content formatting"
-            ]
-        },
-        "content-generator": {
-            "name": "AI SEO Content Generator",
-            "slug": "content-generator",
-            "keywords": ["ai seo content generator", "ai seo content writer", "ai content for seo"],
-            "search_volume": 420,
-            "cpc": 9.10,
-            "intent": "transactional",
-            "description": "AI-powered content generation tools optimized specifically for AI search engine visibility and citation",
-            "main_benefit": "Create content that AI systems understand, trust, and cite using specialized generation tools built for the AI search era",
-            "key_features": [
-                "AI-optimized content templates",
-                "Citation-ready formatting automation",
-                "Schema markup integration",
-                "Authority signal embedding",
-                "Multi-platform optimization profiles"
-            ],
-            "user_challenges": [
-                "Generic AI content generators don't optimize for AI citations",
-                "Maintaining quality while scaling content production",
-                "Ensuring AI-generated content gets cited by AI systems",
-                "Balancing automation with authenticity"
-            ],
-            "generator_types": [
-                "Blog post generators with AI SEO optimization",
-                "Product description generators for e-commerce",
-                "FAQ generators with schema integration",
-                "Technical documentation generators",
-                "Landing page generators with authority signals"
-            ]
-        },
-        "analyzer": {
-            "name": "AI SEO Analyzer",
-            "slug": "analyzer",
-            "keywords": ["ai seo analyzer", "ai seo analysis", "ai seo audit"],
-            "search_volume": 180,
-            "cpc": 14.60,
-            "intent": "transactional",
-            "description": "Comprehensive analysis tools that evaluate and score your website's optimization for AI search engines",
-            "main_benefit": "Get actionable insights into your AI search performance with detailed analysis of schema markup, content quality, and authority signals",
-            "key_features": [
-                "Multi-dimensional AI SEO scoring",
-                "Schema markup validation",
-                "Content quality assessment",
-                "Authority signal evaluation",
-                "Competitive AI visibility analysis"
-            ],
-            "user_challenges": [
-                "Understanding AI SEO performance without proper analytics",
-                "Identifying specific optimization opportunities",
-                "Comparing AI visibility against competitors",
-                "Tracking improvement over time"
-            ],
-            "analysis_categories": [
-                "Technical AI SEO audit (schema, structure, performance)",
-                "Content quality assessment for AI comprehension",
-                "Authority and trust signal evaluation",
-                "Citation tracking across AI platforms",
-                "Competitive positioning analysis"
-            ]
-        },
-        "keyword-research": {
-            "name": "AI SEO Keyword Research",
-            "slug": "keyword-research",
-            "keywords": ["ai seo keyword research", "ai seo keyword generator", "keywords for ai search"],
-            "search_volume": 240,
-            "cpc": 8.03,
-            "intent": "commercial",
-            "description": "Specialized keyword research for AI search optimization, focusing on conversational queries and citation opportunities",
-            "main_benefit": "Discover keywords and topics that AI systems actively search for and cite, rather than traditional search engine optimization",
-            "key_features": [
-                "Conversational query analysis",
-                "AI citation opportunity identification",
-                "Question-based keyword mapping",
-                "Topic cluster recommendations",
-                "Multi-platform keyword targeting"
-            ],
-            "user_challenges": [
-                "AI search behavior differs from traditional search",
-                "Conversational queries are harder to predict",
-                "Traditional keyword tools don't track AI citations",
-                "Understanding intent behind AI queries"
-            ],
-            "research_approaches": [
-                "Conversational query pattern analysis",
-                "AI citation reverse engineering",
-                "Question-answer mapping",
-                "Topic authority gap analysis",
-                "Semantic relationship mapping"
-            ]
-        },
-        "services": {
-            "name": "AI SEO Services",
-            "slug": "services",
-            "keywords": ["ai seo services", "ai seo agency", "ai seo company", "ai seo consultant"],
-            "search_volume": 1330,
-            "cpc": 11.46,
-            "intent": "commercial",
-            "description": "Professional AI SEO services and consulting to optimize your website for ChatGPT, Perplexity, Claude, and emerging AI platforms",
-            "main_benefit": "Partner with AI SEO experts who understand the technical and strategic requirements for maximizing visibility in AI-powered search",
-            "key_features": [
-                "Comprehensive AI SEO audits",
-                "Multi-platform optimization strategies",
-                "Technical implementation support",
-                "Content optimization services",
-                "Ongoing performance monitoring"
-            ],
-            "user_challenges": [
-                "Internal teams lack AI SEO expertise",
-                "Complex technical requirements",
-                "Keeping up with rapidly evolving AI platforms",
-                "Measuring and proving ROI"
-            ],
-            "service_types": [
-                "AI SEO audits and assessments",
-                "Schema markup implementation",
-                "Content optimization and creation",
-                "Technical AI SEO consulting",
-                "Ongoing optimization management"
-            ]
-        },
-        "software": {
-            "name": "AI SEO Software",
-            "slug": "software",
-            "keywords": ["ai seo software", "ai seo platform", "generative ai seo software"],
-            "search_volume": 690,
-            "cpc": 12.65,
-            "intent": "commercial",
-            "description": "Enterprise-grade software platforms for managing and optimizing AI search visibility at scale",
-            "main_benefit": "Centralized platform for managing AI SEO across your entire web presence with automation, analytics, and team collaboration",
-            "key_features": [
-                "Centralized AI SEO management",
-                "Automated optimization workflows",
-                "Multi-site management capabilities",
-                "Team collaboration tools",
-                "Enterprise-grade analytics"
-            ],
-            "user_challenges": [
-                "Managing AI SEO across multiple properties",
-                "Coordinating team efforts on AI optimization",
-                "Scaling optimization efforts efficiently",
-                "Integrating with existing tech stacks"
-            ],
-            "software_categories": [
-                "All-in-one AI SEO platforms",
-                "Schema management systems",
-                "AI citation tracking software",
-                "Content optimization platforms",
-                "Performance monitoring dashboards"
-            ]
-        },
-        "small-business": {
-            "name": "AI SEO for Small Business",
-            "slug": "small-business",
-            "keywords": ["ai seo tools for small business", "ai seo small business", "affordable ai seo"],
-            "search_volume": 390,
-            "cpc": 14.62,
-            "intent": "commercial",
-            "description": "Affordable and effective AI SEO solutions designed specifically for small businesses with limited resources",
-            "main_benefit": "Compete with larger competitors in AI search results using cost-effective strategies and tools tailored for small business budgets",
-            "key_features": [
-                "Budget-friendly AI SEO tools",
-                "Simplified optimization workflows",
-                "DIY implementation guides",
-                "Small business-focused strategies",
-                "High-ROI quick wins"
-            ],
-            "user_challenges": [
-                "Limited budgets for expensive enterprise tools",
-                "Small teams with multiple responsibilities",
-                "Lack of technical expertise in-house",
-                "Need for quick, measurable results"
-            ],
-            "small_business_approaches": [
-                "Free and low-cost AI SEO tools",
-                "Priority optimization areas for quick wins",
-                "DIY implementation strategies",
-                "Local business AI optimization",
-                "Affordable service provider options"
-            ]
-        },
-        "shopify": {
-            "name": "AI SEO for Shopify",
-            "slug": "shopify",
-            "keywords": ["ai seo for shopify", "shopify ai seo", "optimize shopify for ai search"],
-            "search_volume": 110,
-            "cpc": 8.74,
-            "intent": "commercial",
-            "description": "Specialized AI SEO strategies and tools for Shopify stores to maximize product discoverability in AI search",
-            "main_benefit": "Optimize your Shopify store for AI-powered shopping assistants and product search across ChatGPT, Perplexity, and emerging AI platforms",
-            "key_features": [
-                "Shopify-specific schema implementation",
-                "Product page optimization for AI",
-                "E-commerce citation strategies",
-                "Shopify app integrations",
-                "Product feed optimization"
-            ],
-            "user_challenges": [
-                "Shopify's limitations for advanced SEO",
-                "Product page template restrictions",
-                "Scaling optimization across large catalogs",
-                "Competing in AI shopping results"
-            ],
-            "shopify_strategies": [
-                "Product schema markup for Shopify",
-                "Collection page optimization",
-                "Review and rating optimization",
-                "Product description AI formatting",
-                "Shopify app recommendations for AI SEO"
-            ]
-        }
-    }
-    
-    # AI Platforms (reusing from existing system)
-    platforms = {
-        "chatgpt": {
-            "name": "ChatGPT",
-            "slug": "chatgpt",
-            "monthly_users": "347 million"
-        },
-        "perplexity": {
-            "name": "Perplexity",
-            "slug": "perplexity",
-            "monthly_users": "230 million"
-        },
-        "claude": {
-            "name": "Claude",
-            "slug": "claude",
-            "monthly_users": "150 million"
-        },
-        "gemini": {
-            "name": "Gemini",
-            "slug": "gemini",
-            "monthly_users": "200 million"
-        },
-        "searchgpt": {
-            "name": "SearchGPT",
-            "slug": "searchgpt",
-            "monthly_users": "120 million"
-        },
-        "copilot": {
-            "name": "Microsoft Copilot",
-            "slug": "copilot",
-            "monthly_users": "180 million"
-        }
-    }
-    
-    # Content Types (reusing from existing)
-    content_types = {
-        "ecommerce": {"name": "E-commerce Sites", "slug": "ecommerce"},
-        "saas": {"name": "SaaS Platforms", "slug": "saas"},
-        "healthcare": {"name": "Healthcare Websites", "slug": "healthcare"},
-        "finance": {"name": "Financial Services", "slug": "finance"},
-        "education": {"name": "Educational Platforms", "slug": "education"},
-        "news": {"name": "News Publications", "slug": "news"},
-        "blog": {"name": "Blog Websites", "slug": "blog"},
-        "portfolio": {"name": "Portfolio Sites", "slug": "portfolio"}
-    }
-
-    def generate_slug(use_case_slug, platform_slug=None, content_type_slug=None):
-        """Generate SEO-friendly URL slug"""
-        parts = ["ai-seo", use_case_slug]
-        if platform_slug:
-            parts.append(platform_slug)
-        if content_type_slug:
-            parts.append(content_type_slug)
-        return "-".join(parts)
-
-    def generate_title(use_case_data, platform_data=None, content_type_data=None):
-        """Generate SEO-optimized page title"""
-        base = f"{use_case_data['name']}"
-        
-        if platform_data and content_type_data:
-            return f"{base} for {content_type_data['name']} - {platform_data['name']} Optimization Guide"
-        elif platform_data:
-            return f"{base} for {platform_data['name']} - Complete Optimization Guide"
-        elif content_type_data:
-            return f"{base} for {content_type_data['name']} - Implementation Guide"
-        else:
-            return f"{base} - Complete Guide to AI Search Optimization"
-
-    def generate_meta_description(use_case_data, platform_data=None, content_type_data=None):
-        """Generate compelling meta description under 160 characters"""
-        if platform_data and content_type_data:
-            return f"Optimize {content_type_data['name'].lower()} for {platform_data['name']} with {use_case_data['name'].lower()}. Get cited more, drive traffic, and dominate AI search."
-        elif platform_data:
-            return f"{use_case_data['name']} for {platform_data['name']} optimization. Increase citations, improve visibility, and maximize AI search traffic."
-        elif content_type_data:
-            return f"{use_case_data['name']} specialized for {content_type_data['name'].lower()}. Comprehensive strategies, tools, and implementation guides."
-        else:
-            return f"{use_case_data['name']} - Comprehensive guide to optimizing for ChatGPT, Perplexity, Claude, and all AI search engines."
-
-    def generate_hero_section(use_case_data, platform_data=None):
-        """Generate compelling hero section"""
-        if platform_data:
-            headline = f"{use_case_data['name']} for {platform_data['name']} Success"
-            subheadline = f"Maximize your visibility and citation rate in {platform_data['name']}'s {platform_data['monthly_users']} monthly searches with specialized {use_case_data['name'].lower()}"
-            stats = platform_data['monthly_users']
-        else:
-            headline = f"The Complete Guide to {use_case_data['name']}"
-            subheadline = f"Master AI search optimization with comprehensive {use_case_data['name'].lower()} designed for ChatGPT, Perplexity, Claude, and all major AI platforms"
-            stats = "1.2+ billion AI search queries"
-        
-        return {
-            "headline": headline,
-            "subheadline": subheadline,
-            "stats": stats
-        }
-
-    def generate_introduction(use_case_data, platform_data=None, content_type_data=None):
-        """Generate comprehensive introduction section"""
-        
-        if platform_data and content_type_data:
-            opening = f"{use_case_data['name']} for {content_type_data['name'].lower()} requires a specialized approach when optimizing for {platform_data['name']}. With {platform_data['monthly_users']} monthly users searching for information across diverse topics, {content_type_data['name'].lower()} have unique opportunities to capture attention and drive qualified traffic through strategic {use_case_data['name'].lower()}."
-            
-            statistics = f"Our analysis of over 50,000 AI citations reveals that {content_type_data['name'].lower()} using specialized {use_case_data['name'].lower()} receive 6.8x more {platform_data['name']} citations compared to generic optimization approaches. The key lies in understanding both the technical requirements of {platform_data['name']}'s systems and the specific content patterns that work for {content_type_data['name'].lower()}."
-        
-        elif platform_data:
-            opening = f"{use_case_data['name']} specifically designed for {platform_data['name']} optimization represents one of the most effective strategies for increasing your website's visibility in AI-powered search. {platform_data['name']}, with its {platform_data['monthly_users']} monthly active users, has fundamentally changed how people discover and consume information online."
-            
-            statistics = f"Research analyzing 100,000+ {platform_data['name']} citations shows that websites using dedicated {use_case_data['name'].lower()} achieve 5.4x higher citation rates and 3.2x more referral traffic compared to sites relying on traditional SEO approaches alone."
-        
-        elif content_type_data:
-            opening = f"{use_case_data['name']} for {content_type_data['name'].lower()} requires understanding the unique challenges and opportunities of your content type. {content_type_data['name']} face specific AI search optimization challenges that generic tools and strategies often fail to address effectively."
-            
-            statistics = f"Analysis of {content_type_data['name'].lower()} performing well in AI search reveals that specialized {use_case_data['name'].lower()} improve citation rates by 4.7x and significantly increase qualified traffic from AI-powered discovery."
-        
-        else:
-            opening = f"{use_case_data['name']} have emerged as essential components of modern digital strategy. With over 1.2 billion monthly queries across ChatGPT, Perplexity, Claude, Gemini, and other AI platforms, optimizing for AI search visibility is no longer optional—it's critical for online success. {use_case_data['description']}"
-            
-            statistics = f"Organizations implementing comprehensive {use_case_data['name'].lower()} report an average 8.3x increase in AI search citations within 6 months, along with substantial improvements in referral traffic quality and conversion rates."
-        
-        key_benefits = use_case_data['key_features']
-        
-        return {
-            "opening_paragraph": opening,
-            "statistics": statistics,
-            "key_benefits": key_benefits
-        }
-
-    def generate_main_sections(use_case_data, platform_data=None, content_type_data=None):
-        """Generate 4 comprehensive main content sections"""
-        sections = []
-        
-        # Section 1: Understanding the Landscape
-        section1_title = f"Understanding {use_case_data['name']}"
-        if platform_data:
-            section1_title += f" for {platform_data['name']}"
-        if content_type_data:
-            section1_title += f" in {content_type_data['name']}"
-        
-        section1_intro = f"{use_case_data['main_benefit']} The landscape of AI search optimization continues to evolve rapidly, and {use_case_data['name'].lower()} represent a critical component of any comprehensive digital strategy."
-        
-        sections.append({
-            "title": section1_title,
-            "content": {
-                "introduction": section1_intro,
-                "key_strategies": use_case_data['key_features'],
-                "ai_benefits": [
-                    f"Systematic approach to {use_case_data['name'].lower()} reduces guesswork and improves results",
-                    "Data-driven optimization based on actual AI citation patterns",
-                    "Scalable implementation across your entire web presence",
-                    "Measurable improvements in AI visibility and referral traffic"
-                ]
-            }
-        })
-        
-        # Section 2: Core Challenges and Solutions
-        section2_title = f"Overcoming {use_case_data['name']} Challenges"
-        section2_intro = f"Organizations implementing {use_case_data['name'].lower()} face several common challenges. Understanding these obstacles and their solutions is crucial for successful AI search optimization."
-        
-        sections.append({
-            "title": section2_title,
-            "content": {
-                "introduction": section2_intro,
-                "key_strategies": use_case_data['user_challenges'],
-                "optimization_strategies": [
-                    f"Develop a phased implementation approach for {use_case_data['name'].lower()}",
-                    "Start with high-impact, quick-win optimizations to build momentum",
-                    "Invest in team training and capability building for long-term success",
-                    "Establish clear KPIs and measurement frameworks from the start",
-                    "Build cross-functional alignment between technical, content, and marketing teams"
-                ]
-            }
-        })
-        
-        # Section 3: Implementation Strategy
-        section3_title = f"Implementing {use_case_data['name']} Successfully"
-        if platform_data:
-            section3_intro = f"Successfully implementing {use_case_data['name'].lower()} for {platform_data['name']} requires careful planning and execution. This section provides a comprehensive roadmap for organizations at any stage of AI SEO maturity."
-        else:
-            section3_intro = f"A structured implementation approach ensures {use_case_data['name'].lower()} deliver maximum value. Follow this proven framework to avoid common pitfalls and accelerate results."
-        
-        implementation_steps = []
-        if 'tool_categories' in use_case_data:
-            implementation_steps = [f"Evaluate and select appropriate {cat}" for cat in use_case_data['tool_categories'][:5]]
-        elif 'optimization_areas' in use_case_data:
-            implementation_steps = [f"Optimize {area}" for area in use_case_data['optimization_areas'][:5]]
-        elif 'service_types' in use_case_data:
-            implementation_steps = [f"Implement {service}" for service in use_case_data['service_types'][:5]]
-        else:
-            implementation_steps = use_case_data['key_features']
-        
-        sections.append({
-            "title": section3_title,
-            "content": {
-                "introduction": section3_intro,
-                "implementation_details": implementation_steps,
-                "key_strategies": [
-                    "Begin with comprehensive audit of current AI search performance",
-                    "Prioritize optimizations based on potential impact and implementation effort",
-                    "Implement changes in controlled phases with proper testing",
-                    "Monitor results closely and iterate based on performance data",
-                    "Scale successful approaches across your entire web presence"
-                ]
-            }
-        })
-        
-        # Section 4: Advanced Strategies
-        section4_title = f"Advanced {use_case_data['name']} Techniques"
-        section4_intro = f"Once foundational {use_case_data['name'].lower()} are in place, advanced techniques can further amplify results and competitive advantages. These strategies separate industry leaders from followers in AI search visibility."
-        
-        sections.append({
-            "title": section4_title,
-            "content": {
-                "introduction": section4_intro,
-                "optimization_strategies": [
-                    "Implement multi-platform optimization strategies for comprehensive AI coverage",
-                    "Develop proprietary data and insights that AI systems will want to cite",
-                    "Build strategic partnerships and collaborations to enhance authority signals",
-                    "Create comprehensive topic clusters that establish topical authority",
-                    "Leverage emerging AI platforms early to gain first-mover advantages"
-                ],
-                "ai_benefits": [
-                    "Compound growth effects from systematic optimization",
-                    "Stronger competitive moats through comprehensive AI presence",
-                    "Higher citation rates across all major AI platforms",
-                    "Improved brand recognition as AI systems learn to trust your content"
-                ]
-            }
-        })
-        
-        return sections
-
-    def generate_technical_implementation(use_case_data, platform_data=None):
-        """Generate technical implementation guide"""
-        
-        if platform_data:
-            intro = f"Technical implementation of {use_case_data['name'].lower()} for {platform_data['name']} requires attention to specific technical requirements that influence how {platform_data['name']}'s systems discover, analyze, and cite your content."
-        else:
-            intro = f"Technical excellence forms the foundation of successful {use_case_data['name'].lower()}. This section covers essential technical requirements that apply across all AI platforms."
-        
-        return {
-            "title": "Technical Implementation Requirements",
-            "introduction": intro,
-            "content_structure": {
-                "title": "Content Structure and Architecture",
-                "requirements": [
-                    "Implement semantic HTML5 with proper heading hierarchy (H1 → H2 → H3)",
-                    "Structure content with clear topic introduction, body, and conclusion",
-                    "Use descriptive, keyword-rich headings that signal content topics",
-                    "Break complex information into scannable sections with subheadings",
-                    "Implement proper internal linking with descriptive anchor text"
-                ]
-            },
-            "schema_markup": {
-                "title": "Schema Markup and Structured Data",
-                "importance": "Schema markup provides explicit signals about your content's meaning and context, dramatically improving AI comprehension and citation rates.",
-                "implementation_guide": [
-                    "Implement JSON-LD schema markup (preferred by most AI systems)",
-                    "Use Article schema for blog posts and content pages",
-                    "Implement Organization schema with complete business information",
-                    "Add FAQPage schema for question-answer content",
-                    "Include Person schema for author attribution and expertise signals",
-                    "Implement Product schema for e-commerce content",
-                    "Use BreadcrumbList schema for site navigation clarity"
-                ],
-                "primary_schemas": [
-                    "Article",
-                    "Organization",
-                    "Person",
-                    "FAQPage",
-                    "HowTo",
-                    "Product",
-                    "BreadcrumbList"
-                ]
-            },
-            "performance_requirements": {
-                "title": "Performance and Accessibility",
-                "requirements": [
-                    "Achieve Core Web Vitals thresholds (LCP < 2.5s, FID < 100ms, CLS < 0.1)",
-                    "Implement mobile-first responsive design",
-                    "Ensure accessibility compliance (WCAG 2.1 AA minimum)",
-                    "Optimize images with proper alt text and modern formats (WebP)",
-                    "Implement proper caching and CDN distribution"
-                ]
-            }
-        }
-
-    def generate_best_practices(use_case_data):
-        """Generate best practices section"""
-        return {
-            "title": f"Best Practices for {use_case_data['name']}",
-            "content_best_practices": [
-                "Create comprehensive, authoritative content that answers questions completely",
-                "Use clear, concise language that both humans and AI systems can easily understand",
-                "Include relevant statistics, data, and citations to support claims",
-                "Update content regularly to maintain freshness and relevance",
-                "Structure information in logical, scannable formats",
-                "Provide explicit context and background for complex topics",
-                "Use descriptive headings that clearly indicate content topics"
-            ],
-            "technical_best_practices": [
-                "Implement comprehensive schema markup across all content types",
-                "Maintain fast page load speeds (under 3 seconds)",
-                "Ensure mobile responsiveness across all devices",
-                "Use semantic HTML5 markup consistently",
-                "Implement proper XML sitemaps with priority indicators",
-                "Maintain clean URL structures that indicate content hierarchy",
-                "Optimize images with descriptive filenames and alt text"
-            ],
-            "authority_building": [
-                "Clearly attribute content to qualified authors with visible credentials",
-                "Include author bios with expertise indicators and professional backgrounds",
-                "Link to authoritative external sources to support claims",
-                "Earn high-quality backlinks from respected industry sources",
-                "Build topical authority through comprehensive coverage of subject areas",
-                "Maintain consistency in facts, data, and recommendations across content",
-                "Display trust signals like security certificates, privacy policies, and contact information"
-            ]
-        }
-
-    def generate_common_mistakes(use_case_data):
-        """Generate common mistakes to avoid"""
-        return {
-            "title": f"Common {use_case_data['name']} Mistakes to Avoid",
-            "content_mistakes": [
-                f"Treating {use_case_data['name'].lower()} as identical to traditional SEO without understanding key differences",
-                "Focusing solely on keywords without considering conversational query patterns",
-                "Creating thin, low-value content that AI systems won't cite",
-                "Failing to update content regularly, leading to outdated information being cited",
-                "Ignoring mobile optimization despite majority of AI queries coming from mobile devices",
-                "Using overly promotional language that reduces trustworthiness"
-            ],
-            "technical_mistakes": [
-                "Implementing incomplete or incorrect schema markup",
-                "Neglecting page speed optimization, harming crawl efficiency",
-                "Creating broken internal link structures that confuse AI crawlers",
-                "Failing to implement proper heading hierarchy",
-                "Ignoring accessibility requirements that also benefit AI parsing",
-                "Using duplicate content across pages without proper canonicalization"
-            ]
-        }
-
-    def generate_measurement_analytics(use_case_data, platform_data=None):
-        """Generate measurement and analytics section"""
-        
-        if platform_data:
-            title = f"Measuring {use_case_data['name']} Success in {platform_data['name']}"
-            intro = f"Tracking and measuring {use_case_data['name'].lower()} performance in {platform_data['name']} requires specific metrics and tools. This section outlines key performance indicators and measurement approaches."
-        else:
-            title = f"Measuring {use_case_data['name']} Performance"
-            intro = f"Effective measurement is crucial for optimizing {use_case_data['name'].lower()} performance over time. Track these key metrics to understand impact and guide optimization efforts."
-        
-        return {
-            "title": title,
-            "introduction": intro,
-            "key_metrics": [
-                "AI citation frequency and positioning in responses",
-                "Referral traffic volume from AI platforms",
-                "Citation quality score (how prominently and positively content is referenced)",
-                "Query coverage (percentage of relevant queries that generate citations)",
-                "Conversion rate of AI-referred traffic",
-                "Brand mention frequency in AI responses",
-                "Competitive citation share within your industry"
-            ],
-            "tracking_methods": [
-                "Implement comprehensive analytics tracking for AI referral sources",
-                "Set up automated monitoring for brand and content mentions",
-                "Track schema markup validation scores regularly",
-                "Monitor Core Web Vitals and technical performance metrics",
-                "Conduct regular competitive analysis of AI citation patterns",
-                "Survey customers about their AI-assisted discovery journey",
-                "Use specialized AI SEO tools for citation tracking"
-            ]
-        }
-
-    def generate_conclusion_cta(use_case_data, platform_data=None, content_type_data=None):
-        """Generate conclusion and call-to-action"""
-        
-        if platform_data and content_type_data:
-            title = f"Start Optimizing Your {content_type_data['name']} for {platform_data['name']}"
-            summary = f"Implementing {use_case_data['name'].lower()} specifically for {content_type_data['name'].lower()} and {platform_data['name']} creates sustainable competitive advantages in AI search visibility. The organizations that optimize now will dominate citations and traffic for years to come."
-            specialized_msg = f"For {content_type_data['name'].lower()} targeting {platform_data['name']}'s {platform_data['monthly_users']} monthly users, specialized {use_case_data['name'].lower()} are essential for maximum visibility and growth."
-        elif platform_data:
-            title = f"Begin Your {platform_data['name']} Optimization Journey"
-            summary = f"Success with {use_case_data['name'].lower()} in {platform_data['name']} requires combining technical excellence, content quality, and strategic implementation. Start with foundational optimizations and build toward advanced techniques."
-            specialized_msg = f"With {platform_data['monthly_users']} monthly queries, {platform_data['name']} represents a massive opportunity for visibility and growth through strategic {use_case_data['name'].lower()}."
-        elif content_type_data:
-            title = f"Optimize Your {content_type_data['name']} for AI Search"
-            summary = f"Implementing {use_case_data['name'].lower()} tailored to {content_type_data['name'].lower()} unlocks new growth channels and competitive advantages in the AI search era."
-            specialized_msg = f"{content_type_data['name']} have unique opportunities and requirements in AI search optimization—leverage specialized {use_case_data['name'].lower()} for best results."
-        else:
-            title = f"Start Your {use_case_data['name']} Journey Today"
-            summary = f"{use_case_data['name']} represent essential infrastructure for modern digital presence. Organizations that implement comprehensive strategies now will benefit from compounding advantages as AI search continues to grow."
-            specialized_msg = None
-        
-        return {
-            "title": title,
-            "summary": summary,
-            "specialized_message": specialized_msg,
-            "key_takeaways": [
-                f"{use_case_data['name']} are essential for AI search visibility",
-                "Technical implementation must be comprehensive and correct",
-                "Content quality and authority signals directly impact citation rates",
-                "Measurement and iteration drive continuous improvement",
-                "Early optimization creates lasting competitive advantages"
-            ]
-        }
-
-    def generate_page_content(use_case_slug, platform_slug=None, content_type_slug=None):
-        """Generate complete page content for a specific combination"""
-        
-        use_case_data = use_cases[use_case_slug]
-        platform_data = platforms.get(platform_slug) if platform_slug else None
-        content_type_data = content_types.get(content_type_slug) if content_type_slug else None
-        
-        # Determine page type
-        if platform_slug and content_type_slug:
-            page_type = "combination"
-        elif platform_slug:
-            page_type = "platform"
-        elif content_type_slug:
-            page_type = "content_type"
-        else:
-            page_type = "usecase"
-        
-        return {
-            "slug": generate_slug(use_case_slug, platform_slug, content_type_slug),
-            "title": generate_title(use_case_data, platform_data, content_type_data),
-            "meta_description": generate_meta_description(use_case_data, platform_data, content_type_data),
-            "keywords": use_case_data['keywords'],
-            "search_volume": use_case_data['search_volume'],
-            "page_type": page_type,
-            "use_case": use_case_data['name'],
-            "platform": platform_data['name'] if platform_data else None,
-            "content_type": content_type_data['name'] if content_type_data else None,
-            "hero_section": generate_hero_section(use_case_data, platform_data),
-            "introduction": generate_introduction(use_case_data, platform_data, content_type_data),
-            "main_sections": generate_main_sections(use_case_data, platform_data, content_type_data),
-            "technical_implementation": generate_technical_implementation(use_case_data, platform_data),
-            "best_practices": generate_best_practices(use_case_data),
-            "common_mistakes": generate_common_mistakes(use_case_data),
-            "measurement_analytics": generate_measurement_analytics(use_case_data, platform_data),
-            "conclusion_cta": generate_conclusion_cta(use_case_data, platform_data, content_type_data)
-        }
-
-    # Generate all page combinations
-    all_pages = []
-    
-    print("🚀 Starting use case pSEO content generation...")
-    print(f"📊 Generating pages for {len(use_cases)} use cases × {len(platforms)} platforms × {len(content_types)} content types")
-    
-    # Use case only pages (9 pages)
-    print("\n📝 Generating use case-only pages...")
-    for use_case_slug in use_cases.keys():
-        page = generate_page_content(use_case_slug)
-        all_pages.append(page)
-        print(f"   ✓ Generated: /{page['slug']}")
-    
-    # Use case + platform combinations (54 pages: 9 use cases × 6 platforms)
-    print("\n📝 Generating use case + platform combinations...")
-    for use_case_slug in use_cases.keys():
-        for platform_slug in platforms.keys():
-            page = generate_page_content(use_case_slug, platform_slug)
-            all_pages.append(page)
-            print(f"   ✓ Generated: /{page['slug']}")
-    
-    # Use case + content type combinations (72 pages: 9 use cases × 8 content types)
-    print("\n📝 Generating use case + content type combinations...")
-    for use_case_slug in use_cases.keys():
-        for content_type_slug in content_types.keys():
-            page = generate_page_content(use_case_slug, content_type_slug=content_type_slug)
-            all_pages.append(page)
-            print(f"   ✓ Generated: /{page['slug']}")
-    
-    # Save all files
-    print("\n💾 Saving generated content...")
-    
-    # Save use cases definition
-    with open("use-cases.json", "w") as f:
-        json.dump(use_cases, f, indent=2)
-    print("   ✓ Saved: use-cases.json")
-    
-    # Save all pages
-    with open("usecase-pages.json", "w") as f:
-        json.dump(all_pages, f, indent=2)
-    print("   ✓ Saved: usecase-pages.json")
-    
-    # Generate summary
-    summary = {
-        "total_pages": len(all_pages),
-        "use_cases": len(use_cases),
-        "platforms": len(platforms),
-        "content_types": len(content_types),
-        "page_breakdown": {
-            "usecase_only": 9,
-            "usecase_platform": 54,
-            "usecase_content_type": 72
-        },
-        "target_keywords": [kw for uc in use_cases.values() for kw in uc['keywords']],
-        "total_search_volume": sum(uc['search_volume'] for uc in use_cases.values()),
-        "generated_at": datetime.now().isoformat(),
-        "estimated_total_words": len(all_pages) * 1800
-    }
-    
-    with open("usecase-summary.json", "w") as f:
-        json.dump(summary, f, indent=2)
-    print("   ✓ Saved: usecase-summary.json")
-    
-    # Print summary
-    print("\n" + "="*60)
-    print("✅ GENERATION COMPLETE!")
-    print("="*60)
-    print(f"📄 Total pages generated: {len(all_pages)}")
-    print(f"🎯 Use case only pages: 9")
-    print(f"🎯 Use case + platform pages: 54")
-    print(f"🎯 Use case + content type pages: 72")
-    print(f"📝 Estimated total words: {summary['estimated_total_words']:,}")
-    print(f"🔍 Total search volume targeted: {summary['total_search_volume']:,}/month")
-    print(f"\n💰 High-value keywords targeted:")
-    for use_case in use_cases.values():
-        print(f"   • {use_case['keywords'][0]} ({use_case['search_volume']} vol, ${use_case['cpc']} CPC)")
-    print("\n📁 Files created:")
-    print("   • usecase-pages.json (main content file)")
-    print("   • use-cases.json (use case definitions)")
-    print("   • usecase-summary.json (generation statistics)")
-    print("\n🚀 Next steps:")
-    print("   1. Move these files to /src/data/pseo/")
-    print("   2. Update /src/pages/[slug].js to read from both JSON files")
-    print("   3. Test locally: npm run dev")
-    print("   4. Push to GitHub → Vercel auto-deploy")
-    print("="*60)
+from pseo import usecase
 
 if __name__ == "__main__":
-    create_usecase_content()
\ No newline at end of file
+    usecase.main()
@@ -0,0 +1,34 @@
+import argparse
+
+from pseo import planner, seeds
+
+# Shows what the page plan (pseo.planner) keeps of every cross-product, using
+# the seed directory's page-plan.json or a draft rules file, before anything
+# is generated.
+
+parser = argparse.ArgumentParser(description="Show which industry x city / platform pages the page plan keeps")
+parser.add_argument('--rules', help="plan rules file to try (default: page-plan.json in the seed directory)")
+parser.add_argument('--top', type=int, default=5, help="highest- and lowest-scoring kept pages to list per kind")
+args = parser.parse_args()
+
+rules = planner.load_rules(args.rules)
+print(f"🗺️  Page plan from {args.rules or planner.PLAN_PATH}" + ("" if rules else " (no rules, every pair is kept)"))
+print("=" * 60)
+
+for kind, ((row_dimension, row_seed), (column_dimension, column_seed)) in planner.PRODUCTS.items():
+    report = planner.report(kind, rules)
+    print(f"📄 {kind}: {report['planned']:,} of {report['candidates']:,} pages")
+    if not report['pruned']:
+        continue
+    print(f"   {report[f'{row_dimension}_values_kept']} {row_seed} and {report[f'{column_dimension}_values_kept']} {column_seed} keep at least one page")
+    print(f"   lowest kept score {report['lowest_kept_score']}, highest dropped {report['highest_dropped_score']}")
+
+    result = planner.plan(kind, rules)
+    rows = seeds.load(row_seed)
+    columns = seeds.load(column_seed)
+    kept = sorted(
+        ((float(result['scores'][i, j]), row['slug'], columns[j]['slug']) for i, row in enumerate(rows) for j in result['keep'][i].nonzero()[0].tolist()),
+        reverse=True
+    )
+    for label, entries in (("top", kept[:args.top]), ("bottom", kept[-args.top:])):
+        print(f"   {label}: " + ", ".join(f"{row}-{column} ({score:.3f})" for score, row, column in entries))
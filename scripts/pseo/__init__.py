@@ -0,0 +1,2 @@
+"""Shared building blocks for the pSEO generator scripts."""
+from .pages import KINDS, iter_pages, render_page
@@ -0,0 +1,94 @@
+import os
+import time
+
+from . import seeds
+from .metrics import attach
+from .pages import iter_pages
+
+# Single-pass build over every generated page.
+#
+# Build stages are "sinks": objects with add(kind, page), called once for every
+# page as it streams out of iter_pages, and finish(), called once afterwards
+# and returning a short report line. All stages share one generation pass, so
+# adding a stage never means rendering the corpus again. Content metrics
+# (pseo.metrics) cost about twice the rendering itself, so pages only get them
+# when one of the stages sets `needs_metrics = True`.
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PUBLIC_DIR = os.path.join(ROOT_DIR, 'public')
+# Build state kept between runs (lastmod ledgers, manifests, indexes)
+BUILD_DIR = os.path.join(seeds.DATA_DIR, 'build')
+
+SITE_URL = os.environ.get('NEXT_PUBLIC_BASE_URL', 'https://www.aiseoscan.dev').rstrip('/')
+
+# Page kinds served by src/pages/[slug].js. The guide pages (all-pages.json) are
+# generated but not routed, and several of their slugs belong to static pages.
+SITE_KINDS = ('industry', 'industry-platform', 'location', 'technical', 'usecase')
+
+# Hand-written pages under src/pages: (slug, priority, changefreq). '' is the home page.
+STATIC_PAGES = [
+    ('', '1.0', 'daily'),
+    ('ai-seo', '0.9', 'weekly'),
+    ('what-is-ai-seo', '0.8', 'weekly'),
+    ('how-to-use-ai-for-seo', '0.9', 'weekly'),
+    ('ai-seo-platforms', '0.9', 'weekly'),
+    ('can-ai-do-seo', '0.8', 'weekly'),
+    ('will-ai-replace-seo', '0.8', 'weekly'),
+    ('is-ai-content-good-for-seo', '0.8', 'weekly'),
+    ('ai-seo-content-writer', '0.9', 'weekly'),
+    ('ai-seo-blog-writer', '0.9', 'weekly'),
+    ('ai-seo-marketing', '0.9', 'weekly'),
+    ('ai-seo-generator', '0.9', 'weekly'),
+    ('ai-seo-agency', '1.0', 'daily'),
+    ('best-ai-seo-tools-2026', '0.9', 'weekly'),
+    ('ai-seo-by-industry', '0.9', 'weekly'),
+    ('ai-seo-guides', '0.9', 'weekly'),
+    # Platform-specific AI SEO pages (6 pages)
+    ('ai-seo-chatgpt', '0.9', 'weekly'),
+    ('ai-seo-perplexity', '0.9', 'weekly'),
+    ('ai-seo-gemini', '0.9', 'weekly'),
+    ('ai-seo-copilot', '0.9', 'weekly'),
+    ('ai-seo-claude', '0.9', 'weekly'),
+    ('ai-seo-searchgpt', '0.9', 'weekly'),
+    # AI SEO Tools hub and tool pages (10 pages)
+    ('ai-seo-tools', '0.9', 'weekly'),
+    ('copilot-seo-tool', '0.8', 'weekly'),
+    ('perplexity-seo-checking-tools', '0.8', 'weekly'),
+    ('perplexity-seo-tracking-tools', '0.8', 'weekly'),
+    ('perplexity-seo-checking-software', '0.8', 'weekly'),
+    ('copilot-seo-analysis-tool', '0.8', 'weekly'),
+    ('best-perplexity-seo-tracking-tools', '0.8', 'weekly'),
+    ('copilot-seo-checking-tool', '0.8', 'weekly'),
+    ('copilot-seo-analysis-software', '0.8', 'weekly'),
+    ('copilot-seo-checker', '0.8', 'weekly')
+]
+
+# Generated pages with these slugs (e.g. the ai-seo-tools use case page) are
+# shadowed by the hand-written page owning the route, so stages skip them
+STATIC_SLUGS = frozenset(slug for slug, _, _ in STATIC_PAGES)
+
+
+def run(stages, kinds=SITE_KINDS, log=print):
+    """Stream every page of `kinds` through all stages and finish them.
+
+    Returns a dict of per-kind page counts.
+    """
+    counts = {}
+    metrics = any(getattr(stage, 'needs_metrics', False) for stage in stages)
+    for kind in kinds:
+        start = time.perf_counter()
+        count = 0
+        for page in iter_pages(kind):
+            if metrics:
+                attach(page)
+            for stage in stages:
+                stage.add(kind, page)
+            count += 1
+        counts[kind] = count
+        log(f"  ✓ {kind}: {count:,} pages ({time.perf_counter() - start:.1f}s)")
+
+    for stage in stages:
+        report = stage.finish()
+        if report:
+            log(f"  ✓ {report}")
+    return counts
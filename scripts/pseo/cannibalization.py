@@ -0,0 +1,175 @@
+import math
+import os
+import re
+
+from . import serializer
+from .build import BUILD_DIR, STATIC_SLUGS
+
+# Keyword cannibalization report.
+#
+# Each page's targets are its explicit keywords (use case pages) and the word
+# 1-3-grams of its title's head (before " | "), lowercased, with stopwords and
+# boilerplate ("complete guide", "2026", ...) dropped. An inverted index maps
+# every target to the pages aiming at it. Candidate pairs only come from the
+# posting lists of specific targets (MAX_POSTING pages or fewer; "ai seo" is
+# shared by everything and says nothing), and each candidate pair's overlap is
+# then the idf-weighted Jaccard similarity of the two pages' full target sets,
+# common targets included. Pairs at or above THRESHOLD are grouped
+# (union-find) into pages competing for the same query, and groups are ranked
+# by size and overlap into build/cannibalization.json.
+#
+# The stage sees the kinds the build runs over, by default the routed
+# build.SITE_KINDS. Guide pages (all-pages.json) are not served, so they can't
+# compete in search; `--kinds ... guide` includes them (their per-platform
+# variants of the same content type then show up as groups).
+
+CANNIBALIZATION_PATH = os.path.join(BUILD_DIR, 'cannibalization.json')
+
+THRESHOLD = 0.6
+MAX_POSTING = 50
+MAX_NGRAM = 3
+# Groups kept in the report
+MAX_GROUPS = 500
+
+TOKEN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset("a an and at by for from in into of on or the to with your".split())
+BOILERPLATE = frozenset(
+    "best complete errors expert free guide guides how improve report scanner step these avoid websites website 2024 2025 2026".split()
+)
+
+
+def normalize(text):
+    """Lowercased words of a query without stopwords and title boilerplate"""
+    return [token for token in TOKEN.findall(text.lower()) if token not in STOPWORDS and token not in BOILERPLATE]
+
+
+def targets(page):
+    """The normalized keywords and title n-grams a page competes for"""
+    found = set()
+    for keyword in page.get('keywords') or ():
+        if isinstance(keyword, str):
+            words = normalize(keyword)
+            if words:
+                found.add('keyword:' + ' '.join(words))
+    head = normalize(page['title'].split(' | ')[0])
+    for size in range(1, MAX_NGRAM + 1):
+        for start in range(len(head) - size + 1):
+            found.add('title:' + ' '.join(head[start:start + size]))
+    return found
+
+
+class _Groups:
+    """Union-find over page ids"""
+
+    def __init__(self):
+        self.parent = {}
+
+    def find(self, node):
+        root = node
+        while self.parent.get(root, root) != root:
+            root = self.parent[root]
+        while node != root:
+            self.parent[node], node = root, self.parent.get(node, node)
+        return root
+
+    def union(self, a, b):
+        a = self.find(a)
+        b = self.find(b)
+        if a != b:
+            self.parent[max(a, b)] = min(a, b)
+
+
+class CannibalizationStage:
+    """Build stage grouping pages that compete for the same query"""
+
+    def __init__(self, path=CANNIBALIZATION_PATH, threshold=THRESHOLD, max_posting=MAX_POSTING):
+        self.path = path
+        self.threshold = threshold
+        self.max_posting = max_posting
+        # target -> id, id -> [page ids]
+        self.target_ids = {}
+        self.postings = []
+        self.targets = []
+        # page id -> target ids, slug, kind
+        self.pages = []
+        self.slugs = []
+        self.kinds = []
+        self.seen = set(STATIC_SLUGS)
+
+    def add(self, kind, page):
+        if page['slug'] in self.seen:
+            return
+        self.seen.add(page['slug'])
+        page_id = len(self.pages)
+        ids = []
+        for target in targets(page):
+            target_id = self.target_ids.get(target)
+            if target_id is None:
+                target_id = self.target_ids[target] = len(self.postings)
+                self.postings.append([])
+                self.targets.append(target)
+            self.postings[target_id].append(page_id)
+            ids.append(target_id)
+        self.pages.append(frozenset(ids))
+        self.slugs.append(page['slug'])
+        self.kinds.append(kind)
+
+    def finish(self):
+        count = len(self.pages)
+        idf = [math.log((1 + count) / (1 + len(posting))) + 1 for posting in self.postings]
+        weights = [sum(idf[target] for target in ids) for ids in self.pages]
+
+        # Candidate pairs from the specific targets' posting lists only
+        candidates = set()
+        for posting in self.postings:
+            if 2 <= len(posting) <= self.max_posting:
+                for i, a in enumerate(posting):
+                    candidates.update((a, b) for b in posting[i + 1:])
+
+        # Exact weighted Jaccard over the pair's full target sets
+        groups = _Groups()
+        overlaps = {}
+        for a, b in candidates:
+            weight = sum(idf[target] for target in self.pages[a] & self.pages[b])
+            overlap = weight / (weights[a] + weights[b] - weight)
+            if overlap >= self.threshold:
+                groups.union(a, b)
+                overlaps[(a, b)] = overlap
+
+        members = {}
+        for a, b in overlaps:
+            root = groups.find(a)
+            members.setdefault(root, set()).update((a, b))
+        scores = {}
+        for (a, b), overlap in overlaps.items():
+            score = scores.setdefault(groups.find(a), [0, 0])
+            score[0] += overlap
+            score[1] += 1
+
+        report = []
+        for root, nodes in members.items():
+            nodes = sorted(nodes)
+            common = set(self.pages[nodes[0]]).intersection(*(self.pages[node] for node in nodes[1:]))
+            query = max(common, key=lambda target: (idf[target], self.targets[target]), default=None)
+            report.append({
+                'query': self.targets[query].split(':', 1)[1] if query is not None else None,
+                'pages': len(nodes),
+                'overlap': round(scores[root][0] / scores[root][1], 3),
+                'kinds': sorted({self.kinds[node] for node in nodes}),
+                'slugs': [self.slugs[node] for node in nodes]
+            })
+        report.sort(key=lambda group: (-group['pages'] * group['overlap'], group['slugs'][0]))
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        serializer.dump({
+            'threshold': self.threshold,
+            'maxPosting': self.max_posting,
+            'groups': report[:MAX_GROUPS]
+        }, self.path)
+
+        affected = sum(group['pages'] for group in report)
+        line = f"cannibalization: {len(report):,} competing groups across {affected:,} of {count:,} pages ({len(candidates):,} candidate pairs)"
+        if report:
+            top = report[0]
+            line += f", largest: {top['pages']} pages on \"{top['query']}\""
+        return line
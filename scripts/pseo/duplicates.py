@@ -0,0 +1,230 @@
+import os
+import re
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from . import serializer, similarity
+from .build import BUILD_DIR, STATIC_SLUGS
+from .text import body_text
+
+# Near-duplicate detection with MinHash and locality-sensitive hashing.
+#
+# Every page body is cut into overlapping SHINGLE_WORDS-word shingles and
+# summarised by a NUM_PERM-value MinHash signature; the share of equal values
+# between two signatures estimates the Jaccard similarity of their shingle
+# sets. Signatures are computed in a process pool. LSH splits each signature
+# into BANDS bands, and pages whose band values collide land in the same bucket
+# (likely above ~(1/BANDS)^(1/rows) similarity), so candidates come from sorting
+# band hashes instead of comparing every pair.
+#
+# Within each band bucket every page is compared with its neighbour in the
+# bucket; pairs at or above THRESHOLD are joined into clusters (union-find), and
+# a page's uniqueness is 1 - its highest estimated similarity to any candidate.
+# That is O(pages x bands) work after signing, so 500k pages fit on one machine
+# (signatures are 4 bytes x NUM_PERM per page). Results go to
+# build/near-duplicates.json: uniqueness per page and the largest clusters per
+# page kind. Needs numpy.
+
+DUPLICATES_PATH = os.path.join(BUILD_DIR, 'near-duplicates.json')
+
+SHINGLE_WORDS = 5
+NUM_PERM = 128
+BANDS = 16
+THRESHOLD = 0.8
+SEED = 2026
+# Clusters reported per page kind
+WORST_CLUSTERS = 10
+BATCH_SIZE = 200
+
+TOKEN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+# Token -> crc32 memo per worker process (template text repeats the same words)
+_token_hashes = {}
+_permutations = None
+
+
+def _hash_token(token):
+    value = _token_hashes.get(token)
+    if value is None:
+        value = _token_hashes[token] = zlib.crc32(token.encode('utf-8'))
+    return value
+
+
+def permutations():
+    """(a, b) coefficients of the NUM_PERM multiply-shift hash functions, identical in every process"""
+    global _permutations
+    if _permutations is None:
+        import numpy as np
+        rng = np.random.default_rng(SEED)
+        _permutations = (
+            rng.integers(0, 1 << 63, NUM_PERM, dtype=np.uint64) | np.uint64(1),
+            rng.integers(0, 1 << 63, NUM_PERM, dtype=np.uint64)
+        )
+    return _permutations
+
+
+def signature(text):
+    """MinHash signature (NUM_PERM uint32 values) of a text's word shingles"""
+    import numpy as np
+
+    tokens = np.fromiter((_hash_token(token) for token in TOKEN.findall(text.lower())), dtype=np.uint64)
+    if len(tokens) < SHINGLE_WORDS:
+        tokens = np.concatenate([tokens, np.zeros(SHINGLE_WORDS - len(tokens), dtype=np.uint64)])
+    # Rolling combination of SHINGLE_WORDS token hashes, kept to 32 bits
+    shingles = np.zeros(len(tokens) - SHINGLE_WORDS + 1, dtype=np.uint64)
+    for offset in range(SHINGLE_WORDS):
+        shingles = (shingles * np.uint64(1000003) + tokens[offset:offset + len(shingles)]) & np.uint64(0xFFFFFFFF)
+    shingles = np.unique(shingles)
+
+    a, b = permutations()
+    # Multiply-shift hashing: the high 32 bits of (a * x + b) mod 2^64, with odd a
+    hashed = (np.outer(shingles, a) + b) >> np.uint64(32)
+    return hashed.min(axis=0).astype(np.uint32)
+
+
+def sign_batch(texts):
+    """Signatures of a batch of texts as one (len(texts), NUM_PERM) array"""
+    import numpy as np
+    return np.stack([signature(text) for text in texts])
+
+
+class _Clusters:
+    """Union-find over page ids"""
+
+    def __init__(self, size):
+        import numpy as np
+        self.parent = np.arange(size)
+
+    def find(self, node):
+        parent = self.parent
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    def union(self, a, b):
+        a = self.find(a)
+        b = self.find(b)
+        if a != b:
+            self.parent[max(a, b)] = min(a, b)
+
+
+class DuplicateStage:
+    """Build stage finding near-duplicate page clusters with MinHash LSH"""
+
+    def __init__(self, path=DUPLICATES_PATH, workers=None, batch_size=BATCH_SIZE, threshold=THRESHOLD):
+        self.path = path
+        self.threshold = threshold
+        self.batch_size = batch_size
+        self.enabled = similarity.available()
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(self.workers) if self.enabled else None
+        # Futures in flight (tagged with their batch number) and finished signature blocks by batch number
+        self.pending = set()
+        self.blocks = {}
+        self.submitted = 0
+        self.batch = []
+        self.slugs = []
+        self.kinds = []
+        self.seen = set(STATIC_SLUGS)
+
+    def add(self, kind, page):
+        if not self.enabled or page['slug'] in self.seen:
+            return
+        self.seen.add(page['slug'])
+        self.slugs.append(page['slug'])
+        self.kinds.append(kind)
+        self.batch.append(body_text(page))
+        if len(self.batch) >= self.batch_size:
+            self._submit()
+
+    def _submit(self):
+        if len(self.pending) >= self.workers * 2:
+            done, self.pending = wait(self.pending, return_when=FIRST_COMPLETED)
+            self._collect(done)
+        future = self.pool.submit(sign_batch, self.batch)
+        future.number = self.submitted
+        self.submitted += 1
+        self.pending.add(future)
+        self.batch = []
+
+    def _collect(self, futures):
+        for future in futures:
+            self.blocks[future.number] = future.result()
+
+    def finish(self):
+        if not self.enabled:
+            return "near-duplicates: skipped (needs numpy)"
+        import numpy as np
+
+        if self.batch:
+            self._submit()
+        self._collect(wait(self.pending).done)
+        self.pending = set()
+        self.pool.shutdown()
+        if not self.slugs:
+            return "near-duplicates: no pages"
+
+        signatures = np.concatenate([self.blocks.pop(number) for number in sorted(self.blocks)])
+        n = len(signatures)
+        rows = NUM_PERM // BANDS
+        best = np.zeros(n)
+        clusters = _Clusters(n)
+        multipliers = np.random.default_rng(SEED + 1).integers(1, 1 << 62, rows, dtype=np.uint64) | np.uint64(1)
+
+        for band in range(BANDS):
+            # One 64-bit bucket key per page (wrapping multiply-add is fine for hashing)
+            keys = signatures[:, band * rows:(band + 1) * rows].astype(np.uint64) @ multipliers
+            order = np.argsort(keys, kind='stable')
+            same = keys[order[1:]] == keys[order[:-1]]
+            left = order[:-1][same]
+            right = order[1:][same]
+            if not len(left):
+                continue
+            estimate = (signatures[left] == signatures[right]).mean(axis=1)
+            np.maximum.at(best, left, estimate)
+            np.maximum.at(best, right, estimate)
+            for a, b in zip(left[estimate >= self.threshold].tolist(), right[estimate >= self.threshold].tolist()):
+                clusters.union(a, b)
+
+        roots = np.array([clusters.find(node) for node in range(n)])
+        members = {}
+        for node, root in enumerate(roots.tolist()):
+            members.setdefault(root, []).append(node)
+
+        worst = {}
+        for root, nodes in members.items():
+            if len(nodes) < 2:
+                continue
+            kind = self.kinds[root]
+            worst.setdefault(kind, []).append({
+                'size': len(nodes),
+                'similarity': round(float(best[nodes].mean()), 3),
+                'slugs': [self.slugs[node] for node in nodes[:10]]
+            })
+        for kind, entries in worst.items():
+            entries.sort(key=lambda entry: (-entry['size'], -entry['similarity'], entry['slugs'][0]))
+            del entries[WORST_CLUSTERS:]
+
+        uniqueness = 1 - best
+        duplicated = int((uniqueness <= 1 - self.threshold).sum())
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        serializer.dump({
+            'threshold': self.threshold,
+            'shingleWords': SHINGLE_WORDS,
+            'permutations': NUM_PERM,
+            'bands': BANDS,
+            'clusters': worst,
+            'uniqueness': {slug: round(float(score), 3) for slug, score in zip(self.slugs, uniqueness)}
+        }, self.path, pretty=False)
+
+        by_kind = {}
+        for kind, score in zip(self.kinds, uniqueness.tolist()):
+            by_kind.setdefault(kind, []).append(score)
+        line = f"near-duplicates: {duplicated:,} of {n:,} pages at >= {self.threshold:.0%} estimated similarity"
+        for kind, scores in by_kind.items():
+            clustered = sum(entry['size'] for entry in worst.get(kind, ()))
+            line += f"\n    {kind}: median uniqueness {sorted(scores)[len(scores) // 2]:.2f}, largest clusters hold {clustered:,} pages"
+        return line
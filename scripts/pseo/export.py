@@ -0,0 +1,162 @@
+import os
+import subprocess
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .build import ROOT_DIR, STATIC_SLUGS
+from .html import STYLESHEET, build_year, fill_prefetch, render_html
+from .prefetch import PrefetchStage
+from .records import to_json
+
+# Static HTML export of the generated pages.
+#
+# Every page is rendered to out/<slug>/index.html with pseo.html, the Python
+# mirror of the pSEO templates, so a static host or CDN can serve the long tail
+# directly instead of [slug].js rendering each page on its first request.
+# Rendering is spread over a process pool in batches; at most a few batches
+# per worker are in flight so memory stays flat however many pages stream in.
+#
+# Prefetch hints rank a page's links against the whole link graph, so they are
+# only known once every page has streamed past. Pages are rendered with a
+# placeholder for them, and finish() fills in the hints of this build, from
+# the prefetch stage when it runs (it finishes first) or from a private one.
+#
+# The export is self-contained: the site's Tailwind stylesheet is compiled
+# into it (out/pseo.css, with the Tailwind CLI from node_modules) and the
+# footer year is fixed once per build, so out/ can be uploaded to a static
+# host as is.
+
+EXPORT_DIR = os.path.join(ROOT_DIR, 'out')
+BATCH_SIZE = 200
+
+TAILWIND_CLI = os.path.join(ROOT_DIR, 'node_modules', '.bin', 'tailwindcss')
+TAILWIND_CONFIG = os.path.join(ROOT_DIR, 'tailwind.config.js')
+TAILWIND_INPUT = os.path.join(ROOT_DIR, 'src', 'styles', 'globals.css')
+
+
+def stylesheet_path(out_dir):
+    """Where STYLESHEET lives in the export (None when it is hosted elsewhere)"""
+    if not STYLESHEET.startswith('/') or STYLESHEET.startswith('//'):
+        return None
+    return os.path.join(out_dir, STYLESHEET.lstrip('/'))
+
+
+def build_stylesheet(out_dir):
+    """Compile the Tailwind stylesheet the pages link to into the export.
+
+    pseo.html mirrors the components class for class, so the site's Tailwind
+    content globs cover every class the pages use. Returns False when the
+    stylesheet belongs in the export but the CLI isn't installed.
+    """
+    path = stylesheet_path(out_dir)
+    if path is None:
+        return True
+    if not os.path.exists(TAILWIND_CLI):
+        return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    subprocess.run(
+        [TAILWIND_CLI, '-c', TAILWIND_CONFIG, '-i', TAILWIND_INPUT, '-o', path, '--minify'],
+        cwd=ROOT_DIR, check=True, capture_output=True
+    )
+    return True
+
+
+def render_batch(pages, out_dir, year):
+    """Render and write one batch of pages without their prefetch links"""
+    for page in pages:
+        page_dir = os.path.join(out_dir, page['slug'])
+        os.makedirs(page_dir, exist_ok=True)
+        with open(os.path.join(page_dir, 'index.html'), 'w', encoding='utf-8') as f:
+            f.write(render_html(page, None, year))
+
+
+def prefetch_batch(pages, out_dir, year):
+    """Fill in the prefetch links of one batch of (slug, urls); returns the bytes written"""
+    written = 0
+    for slug, urls in pages:
+        path = os.path.join(out_dir, slug, 'index.html')
+        with open(path, 'r', encoding='utf-8') as f:
+            data = fill_prefetch(f.read(), urls).encode('utf-8')
+        with open(path, 'wb') as f:
+            f.write(data)
+        written += len(data)
+    return written
+
+
+class HtmlExportStage:
+    """Build stage rendering every page to a static HTML file"""
+
+    def __init__(self, out_dir=EXPORT_DIR, workers=None, batch_size=BATCH_SIZE, prefetch=None):
+        self.out_dir = out_dir
+        self.batch_size = batch_size
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(self.workers)
+        self.pending = set()
+        self.batch = []
+        # Slugs served by hand-written pages are never overwritten
+        self.seen = set(STATIC_SLUGS)
+        self.slugs = []
+        self.skipped = 0
+        self.bytes = 0
+        # The build's prefetch stage, else one fed by this stage
+        self.prefetch = prefetch
+        self.own_prefetch = prefetch is None
+        if self.own_prefetch:
+            self.prefetch = PrefetchStage()
+        # One year for the whole build, even one running over New Year
+        self.year = build_year()
+        self.start = time.perf_counter()
+        os.makedirs(out_dir, exist_ok=True)
+
+    def add(self, kind, page):
+        if self.own_prefetch:
+            self.prefetch.add(kind, page)
+        if page['slug'] in self.seen:
+            self.skipped += 1
+            return
+        self.seen.add(page['slug'])
+        self.slugs.append(page['slug'])
+        self.batch.append(to_json(page))
+        if len(self.batch) >= self.batch_size:
+            self._submit(render_batch)
+
+    def _submit(self, task):
+        if len(self.pending) >= self.workers * 2:
+            done, self.pending = wait(self.pending, return_when=FIRST_COMPLETED)
+            self._collect(done)
+        self.pending.add(self.pool.submit(task, self.batch, self.out_dir, self.year))
+        self.batch = []
+
+    def _collect(self, futures):
+        for future in futures:
+            self.bytes += future.result() or 0
+
+    def finish(self):
+        if self.batch:
+            self._submit(render_batch)
+        self._collect(wait(self.pending).done)
+        self.pending = set()
+
+        hints = self.prefetch.hints if self.prefetch.hints is not None else self.prefetch.rank()
+        for slug in self.slugs:
+            self.batch.append((slug, hints.get(slug, ())))
+            if len(self.batch) >= self.batch_size:
+                self._submit(prefetch_batch)
+        if self.batch:
+            self._submit(prefetch_batch)
+        self._collect(wait(self.pending).done)
+        self.pending = set()
+        self.pool.shutdown()
+        stylesheet = build_stylesheet(self.out_dir)
+
+        pages = len(self.slugs)
+        elapsed = time.perf_counter() - self.start
+        report = (
+            f"html: {pages:,} pages, {self.bytes / 1024 / 1024:.1f} MB in {elapsed:.1f}s "
+            f"({pages / elapsed:,.0f} pages/s, {self.bytes / 1024 / 1024 / elapsed:.1f} MB/s, {self.workers} workers)"
+        )
+        if self.skipped:
+            report += f", {self.skipped} duplicate or static slug(s) skipped"
+        if not stylesheet:
+            report += f"\n    ⚠️  {STYLESHEET} not built (npm install for the Tailwind CLI)"
+        return report
@@ -0,0 +1,17 @@
+# Shared filter matching for the iter_pages(**filters) functions.
+
+def matches(value, wanted):
+    """True when `wanted` is None, equals `value`, or is a collection containing it"""
+    if wanted is None:
+        return True
+    if isinstance(wanted, str):
+        return value == wanted
+    return value in wanted
+
+
+def find(items, value, field='slug'):
+    """Look up a seed entry by `field`, raising KeyError for unknown values"""
+    for item in items:
+        if item[field] == value:
+            return item
+    raise KeyError(value)
@@ -0,0 +1,90 @@
+import heapq
+import math
+
+# Nearest-city lookups over seed coordinates.
+#
+# Latitude/longitude pairs are projected onto the unit sphere, where straight
+# line (chord) distance orders points exactly like great-circle distance, and
+# stored in a 3-d k-d tree. Building the tree is O(n log^2 n) and a k-nearest
+# query visits O(k + log n) nodes on average, so linking every location page to
+# its neighbours stays cheap from 50 cities to every US city. Trees are built
+# once per cities list.
+
+EARTH_RADIUS_MILES = 3958.8
+
+# (cities list id) -> (cities, KDTree)
+_indexes = {}
+
+
+def unit_vector(latitude, longitude):
+    lat = math.radians(latitude)
+    lon = math.radians(longitude)
+    return (math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon), math.sin(lat))
+
+
+def chord_to_miles(chord):
+    """Great-circle distance in miles for a chord length on the unit sphere"""
+    return 2 * EARTH_RADIUS_MILES * math.asin(min(1.0, chord / 2))
+
+
+class KDTree:
+    """k-d tree over (point, item) pairs; nodes are (point, item, axis, left, right) tuples"""
+
+    def __init__(self, entries):
+        self.size = len(entries)
+        self.root = self._build(list(entries), 0)
+
+    def _build(self, entries, depth):
+        if not entries:
+            return None
+        axis = depth % 3
+        entries.sort(key=lambda entry: entry[0][axis])
+        middle = len(entries) // 2
+        point, item = entries[middle]
+        return (point, item, axis, self._build(entries[:middle], depth + 1), self._build(entries[middle + 1:], depth + 1))
+
+    def nearest(self, point, k, exclude=lambda item: False):
+        """The k (squared distance, item) pairs closest to `point`, closest first"""
+        # Max-heap of the best k so far as (-squared distance, counter, item)
+        best = []
+        counter = 0
+        # (node, squared distance from the query to the plane bounding that subtree)
+        stack = [(self.root, 0.0)]
+        while stack:
+            node, plane = stack.pop()
+            # Skip subtrees that can't hold anything closer than the k-th best
+            if node is None or (len(best) == k and plane >= -best[0][0]):
+                continue
+            node_point, item, axis, left, right = node
+            if not exclude(item):
+                distance = sum((a - b) ** 2 for a, b in zip(point, node_point))
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, counter, item))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, counter, item))
+                counter += 1
+
+            offset = point[axis] - node_point[axis]
+            near, far = (left, right) if offset < 0 else (right, left)
+            # Near side first (popped next), far side only once the plane is within reach
+            stack.append((far, offset * offset))
+            stack.append((near, plane))
+        return [(-distance, item) for distance, _, item in sorted(best, reverse=True)]
+
+
+def city_index(cities):
+    """k-d tree over the cities' coordinates, built once per cities list"""
+    key = id(cities)
+    if key not in _indexes:
+        entries = [(unit_vector(city['latitude'], city['longitude']), city) for city in cities]
+        # Holding the list keeps its id from being reused while cached
+        _indexes[key] = (cities, KDTree(entries))
+    return _indexes[key][1]
+
+
+def nearest_cities(city, cities, count):
+    """The `count` cities closest to `city` as (miles, city) pairs, closest first"""
+    point = unit_vector(city['latitude'], city['longitude'])
+    slug = city['slug']
+    found = city_index(cities).nearest(point, count, exclude=lambda other: other['slug'] == slug)
+    return [(chord_to_miles(math.sqrt(distance)), other) for distance, other in found]
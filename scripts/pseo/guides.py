@@ -0,0 +1,448 @@
+import os
+from datetime import datetime
+
+from . import seeds, serializer
+from .filters import matches
+from .metrics import ContentMetrics
+
+# Content types and industries combined into the triple "guide-*" pages
+TOP_CONTENT_TYPES = ["ecommerce", "saas", "healthcare", "finance"]
+TOP_INDUSTRIES = ["technology", "retail", "manufacturing", "nonprofit", "hospitality"]
+
+
+def generate_page_content(platform, content_type=None, industry=None, page_type="platform"):
+    """Generate comprehensive content for a specific page combination"""
+    
+    platform_data = seeds.load('ai_platforms')[platform]
+    content_type_data = seeds.load('content_types').get(content_type) if content_type else None
+    industry_data = seeds.load('verticals').get(industry) if industry else None
+    
+    # Generate URL slug
+    if page_type == "platform":
+        slug = f"ai-seo-{platform}"
+        title = f"AI SEO for {platform_data['name']} - Complete Optimization Guide 2025"
+        meta_description = f"Master AI SEO for {platform_data['name']}. Comprehensive optimization strategies, schema markup guides, and technical implementation for {platform_data['name']} citations."
+    elif page_type == "content_type":
+        slug = f"optimize-{content_type}-for-ai"
+        title = f"AI SEO for {content_type_data['name']} - {platform_data['name']} Optimization"
+        meta_description = f"Optimize {content_type_data['name']} for {platform_data['name']} citations. Complete guide with implementation strategies and technical requirements."
+    elif page_type == "industry":
+        slug = f"ai-seo-{industry}-{platform}"
+        title = f"AI SEO for {industry_data['name']} - {platform_data['name']} Guide"
+        meta_description = f"{industry_data['name']} AI SEO optimization for {platform_data['name']}. Industry-specific strategies and implementation guides."
+    else:  # combination
+        # Add safety checks for None values
+        if not content_type_data or not industry_data:
+            return None
+        slug = f"guide-{content_type}-{platform}-{industry}"
+        title = f"{content_type_data['name']} AI SEO for {industry_data['name']} - {platform_data['name']} Guide"
+        meta_description = f"Complete {platform_data['name']} optimization guide for {industry_data['name']} {content_type_data['name']}. Professional implementation strategies and technical requirements."
+
+    # Generate comprehensive content sections
+    content = {
+        "slug": slug,
+        "title": title,
+        "meta_description": meta_description,
+        "platform": platform_data['name'],
+        "content_type": content_type_data['name'] if content_type_data else None,
+        "industry": industry_data['name'] if industry_data else None,
+        "hero_section": {
+            "headline": title,
+            "subheadline": generate_subheadline(platform_data, content_type_data, industry_data),
+            "stats": platform_data['monthly_users']
+        },
+        "introduction": generate_introduction(platform_data, content_type_data, industry_data),
+        "main_sections": generate_main_sections(platform_data, content_type_data, industry_data),
+        "technical_implementation": generate_technical_section(platform_data, content_type_data, industry_data),
+        "best_practices": generate_best_practices(platform_data, content_type_data, industry_data),
+        "common_mistakes": generate_common_mistakes(platform_data, content_type_data, industry_data),
+        "measurement_analytics": generate_measurement_section(platform_data, content_type_data, industry_data),
+        "conclusion_cta": generate_conclusion_cta(platform_data, content_type_data, industry_data),
+        "word_count": 0,  # Filled in by pseo.metrics when the page is written
+        "generated_at": datetime.now().isoformat()
+    }
+    
+    return content
+
+def generate_subheadline(platform_data, content_type_data, industry_data):
+    """Generate compelling subheadlines based on combination"""
+    base = f"Master the art of optimizing your content for {platform_data['name']}'s {platform_data['optimization_focus']}."
+    
+    if content_type_data and industry_data:
+        return f"{base} Specialized strategies for {industry_data['name']} {content_type_data['name'].lower()} with proven optimization techniques."
+    elif content_type_data:
+        return f"{base} Complete implementation guide for {content_type_data['name'].lower()} with technical requirements and best practices."
+    elif industry_data:
+        return f"{base} Industry-specific optimization strategies for {industry_data['name'].lower()} with measurable results."
+    else:
+        return f"{base} Learn advanced strategies for schema markup, content architecture, and authority building that drive consistent citations."
+
+def generate_introduction(platform_data, content_type_data, industry_data):
+    """Generate comprehensive introduction sections"""
+    intro = {
+        "opening_paragraph": platform_data['content_sections']['intro'],
+        "statistics": platform_data['content_sections']['why_matters'],
+        "key_benefits": [],
+        "unique_challenges": []
+    }
+    
+    if content_type_data:
+        intro["key_benefits"].extend([
+            f"Specialized {platform_data['name']} optimization for {content_type_data['name'].lower()}",
+            f"Implementation of {content_type_data['name']}-specific schema markup and content structure",
+            f"Advanced strategies for {content_type_data['description'].lower()} AI visibility"
+        ])
+        intro["unique_challenges"] = list(content_type_data['ai_challenges'])
+    
+    if industry_data:
+        intro["key_benefits"].extend([
+            f"Industry-specific {platform_data['name']} optimization for {industry_data['name'].lower()}",
+            f"Targeted content strategies addressing {industry_data['description'].lower()} needs",
+            f"Implementation guidelines tailored to {industry_data['name'].lower()} AI search patterns"
+        ])
+        intro["unique_challenges"].extend(industry_data.get('common_queries', []))
+        
+    return intro
+
+def generate_main_sections(platform_data, content_type_data, industry_data):
+    """Generate main content sections with comprehensive coverage"""
+    sections = []
+    
+    # Core platform optimization section
+    sections.append({
+        "title": f"Core {platform_data['name']} Optimization Framework",
+        "content": {
+            "introduction": f"Understanding {platform_data['name']}'s unique approach to content analysis and citation is fundamental to optimization success.",
+            "key_strategies": platform_data['content_sections']['key_strategies'],
+            "implementation_details": [
+                f"Leverage {platform_data['name']}'s {platform_data['citation_style']} for maximum visibility",
+                f"Optimize content architecture for {platform_data['optimization_focus']}",
+                f"Implement technical requirements specific to {platform_data['name']}'s crawling patterns",
+                f"Build authority signals that align with {platform_data['name']}'s credibility assessment"
+            ]
+        }
+    })
+    
+    if content_type_data:
+        sections.append({
+            "title": f"{content_type_data['name']} Optimization Strategies",
+            "content": {
+                "introduction": f"Optimizing {content_type_data['name'].lower()} for {platform_data['name']} requires understanding specific {content_type_data['description'].lower()} challenges and opportunities.",
+                "optimization_strategies": content_type_data['optimization_strategies'],
+                "schema_implementation": content_type_data['key_schema_types'],
+                "ai_benefits": content_type_data['ai_specific_benefits']
+            }
+        })
+        
+    if industry_data:
+        sections.append({
+            "title": f"{industry_data['name']} AI Optimization",
+            "content": {
+                "introduction": f"The {industry_data['name'].lower()} industry presents unique opportunities and challenges for {platform_data['name']} optimization.",
+                "industry_focus": industry_data['ai_optimization_focus'],
+                "common_queries": industry_data['common_queries'],
+                "content_areas": industry_data['key_content_areas']
+            }
+        })
+    
+    # Advanced strategies section (continuing from where we left off)
+    sections.append({
+        "title": f"Advanced {platform_data['name']} Citation Strategies",
+        "content": {
+            "introduction": f"Beyond basic optimization, advanced strategies can significantly increase your {platform_data['name']} citation frequency and visibility.",
+            "advanced_techniques": [
+                f"Content threading for multi-query {platform_data['name']} citation opportunities",
+                f"Competitive analysis and citation gap identification in {platform_data['name']} results",
+                f"Real-time optimization based on {platform_data['name']} algorithm updates",
+                f"Cross-platform optimization strategies that enhance {platform_data['name']} performance"
+            ],
+            "implementation_examples": [
+                f"Answer clustering: Structure content to address related queries that {platform_data['name']} users typically ask in sequence",
+                f"Citation chain building: Create content that naturally leads to follow-up questions and deeper engagement",
+                f"Temporal optimization: Time content updates with {platform_data['name']} crawling patterns for maximum visibility",
+                f"Authority amplification: Leverage existing citations to build topic cluster authority"
+            ]
+        }
+    })
+    
+    return sections
+
+def generate_technical_section(platform_data, content_type_data, industry_data):
+    """Generate comprehensive technical implementation guide"""
+    technical = {
+        "title": f"Technical Implementation for {platform_data['name']} Optimization",
+        "core_requirements": platform_data['content_sections']['technical_requirements'],
+        "schema_markup": {
+            "primary_schemas": ["Article", "Organization", "Person", "FAQ"],
+            "implementation_guide": [
+                "JSON-LD structured data implementation with comprehensive entity linking",
+                "Schema validation and testing using Google's Structured Data Testing Tool",
+                "Progressive enhancement with advanced schema types based on content focus",
+                "Cross-schema relationship mapping for enhanced AI understanding"
+            ]
+        },
+        "content_optimization": {
+            "structure_requirements": [
+                "Semantic HTML5 structure with proper heading hierarchy and landmark roles",
+                "Answer-first content architecture with key information in opening paragraphs",
+                "FAQ integration addressing common user queries and follow-up questions",
+                "Internal linking strategy connecting related topics and supporting content"
+            ],
+            "performance_optimization": [
+                "Page load speeds optimized for AI crawler efficiency (under 3 seconds)",
+                "Mobile-first responsive design ensuring accessibility across all devices",
+                "Core Web Vitals optimization for enhanced user experience signals",
+                "CDN implementation for global content delivery and reduced latency"
+            ]
+        }
+    }
+    
+    if content_type_data:
+        technical["content_specific"] = {
+            "schema_types": content_type_data['key_schema_types'],
+            "optimization_focus": content_type_data['content_focus'],
+            "implementation_priorities": [
+                f"Implement {', '.join(content_type_data['key_schema_types'])} schema markup",
+                f"Optimize content structure for {content_type_data['content_focus']}",
+                f"Address specific {content_type_data['name']} challenges in AI discovery",
+                f"Leverage {content_type_data['name']} opportunities for enhanced visibility"
+            ]
+        }
+        
+    if industry_data:
+        technical["industry_specific"] = {
+            "content_areas": industry_data['key_content_areas'],
+            "optimization_focus": industry_data['ai_optimization_focus'],
+            "implementation_considerations": [
+                f"Address {industry_data['name']} regulatory and compliance requirements",
+                f"Implement industry-specific schema markup and entity relationships",
+                f"Optimize for {industry_data['name']} common query patterns",
+                f"Build authority signals relevant to {industry_data['name']} credibility assessment"
+            ]
+        }
+        
+    return technical
+
+def generate_best_practices(platform_data, content_type_data, industry_data):
+    """Generate best practices section"""
+    practices = {
+        "title": f"{platform_data['name']} Optimization Best Practices",
+        "content_best_practices": [
+            f"Maintain content freshness with regular updates aligned to {platform_data['name']} crawling patterns",
+            f"Implement comprehensive fact-checking and source attribution for credibility",
+            f"Use natural language patterns that match how users query {platform_data['name']}",
+            f"Create comprehensive topic coverage that addresses user intent completely"
+        ],
+        "technical_best_practices": [
+            "Validate all structured data implementation using official testing tools",
+            "Monitor Core Web Vitals and optimize for performance consistently",
+            "Implement proper canonical URL structure to prevent content duplication",
+            "Use descriptive, semantic HTML that enhances AI content understanding"
+        ],
+        "authority_building": [
+            "Develop comprehensive author profiles with expertise indicators and credentials",
+            "Build topical authority through consistent, high-quality content publication",
+            "Establish external credibility through industry recognition and citations",
+            "Maintain editorial standards that align with E-A-T evaluation criteria"
+        ]
+    }
+    
+    if content_type_data:
+        practices[f"{content_type_data['name']}_specific"] = [
+            f"Focus on {content_type_data['content_focus']} optimization priorities",
+            f"Address {content_type_data['name']} user intent patterns in content structure",
+            f"Leverage {content_type_data['name']} schema markup for enhanced discoverability",
+            f"Optimize for {content_type_data['name']} conversion and engagement metrics"
+        ]
+        
+    return practices
+
+def generate_common_mistakes(platform_data, content_type_data, industry_data):
+    """Generate common mistakes to avoid"""
+    mistakes = {
+        "title": f"Common {platform_data['name']} Optimization Mistakes to Avoid",
+        "content_mistakes": [
+            f"Keyword stuffing or over-optimization that conflicts with {platform_data['name']}'s natural language processing",
+            f"Ignoring {platform_data['name']}'s {platform_data['citation_style']} preferences in content structure",
+            f"Failing to update content regularly, missing {platform_data['name']}'s freshness signals",
+            f"Creating thin content that doesn't provide comprehensive answers to user queries"
+        ],
+        "technical_mistakes": [
+            "Implementing incomplete or incorrect schema markup that confuses AI systems",
+            "Poor mobile optimization affecting AI crawler access and user experience",
+            "Slow page load speeds that negatively impact crawl efficiency and user signals",
+            "Missing or poorly implemented internal linking that limits content discoverability"
+        ],
+        "authority_mistakes": [
+            "Insufficient author credentialing and expertise demonstration",
+            "Lack of external validation and credibility signals",
+            "Poor fact-checking and source attribution practices",
+            "Inconsistent content quality that undermines overall site authority"
+        ]
+    }
+    
+    if content_type_data:
+        mistakes[f"{content_type_data['name']}_mistakes"] = [
+            f"Ignoring {content_type_data['name']}-specific optimization requirements",
+            f"Failing to address {content_type_data['ai_challenges']} in content strategy",
+            f"Poor implementation of {content_type_data['key_schema_types']} schema markup",
+            f"Missing opportunities for {content_type_data['name']} AI integration benefits"
+        ]
+        
+    return mistakes
+
+def generate_measurement_section(platform_data, content_type_data, industry_data):
+    """Generate measurement and analytics section"""
+    measurement = {
+        "title": f"Measuring {platform_data['name']} Optimization Success",
+        "key_metrics": [
+            f"Citation frequency and positioning in {platform_data['name']} responses",
+            f"Referral traffic specifically from {platform_data['name']} and related AI platforms",
+            f"Query coverage analysis showing topics that generate citations",
+            f"Content performance correlation with {platform_data['name']} algorithm updates"
+        ],
+        "tracking_methods": [
+            f"Monitor {platform_data['name']} mentions and citations through automated tracking tools",
+            "Implement comprehensive analytics tracking for AI search referral traffic",
+            "Set up alerts for new citations and content performance changes",
+            "Track competitor citation patterns and identify optimization opportunities"
+        ],
+        "optimization_cycles": [
+            "Conduct monthly analysis of citation performance and content gaps",
+            "Implement quarterly content updates based on performance data",
+            "Perform annual comprehensive audits of technical and content optimization",
+            "Continuously monitor algorithm updates and adjust strategies accordingly"
+        ]
+    }
+    
+    return measurement
+
+def generate_conclusion_cta(platform_data, content_type_data, industry_data):
+    """Generate conclusion and call-to-action"""
+    cta = {
+        "title": f"Start Your {platform_data['name']} Optimization Journey",
+        "summary": f"Optimizing for {platform_data['name']} requires a comprehensive approach combining technical excellence, content quality, and authority building.",
+        "key_takeaways": [
+            f"Implement {platform_data['name']}-specific schema markup and content structure",
+            f"Focus on {platform_data['optimization_focus']} for maximum citation potential", 
+            f"Build comprehensive authority signals aligned with {platform_data['name']} evaluation criteria",
+            f"Maintain consistent optimization efforts with regular monitoring and updates"
+        ],
+        "next_steps": [
+            "Conduct a comprehensive AI SEO audit to identify current optimization gaps",
+            f"Implement priority {platform_data['name']} optimization recommendations",
+            "Monitor citation performance and adjust strategies based on results",
+            "Expand optimization efforts to additional AI platforms for comprehensive coverage"
+        ]
+    }
+    
+    if content_type_data and industry_data:
+        cta["specialized_message"] = f"For {industry_data['name']} operating {content_type_data['name'].lower()}, the opportunity to dominate {platform_data['name']} citations in your niche is significant. Early optimization provides substantial competitive advantages."
+    elif content_type_data:
+        cta["specialized_message"] = f"{content_type_data['name']} have unique advantages in {platform_data['name']} optimization when properly implemented. Focus on your content type's specific requirements for maximum impact."
+    elif industry_data:
+        cta["specialized_message"] = f"The {industry_data['name'].lower()} industry presents specific {platform_data['name']} optimization opportunities. Industry-focused strategies yield significantly higher citation rates."
+        
+    return cta
+
+def iter_pages(platform=None, content_type=None, industry=None, page_type=None):
+    """Yield guide pages in generation order, optionally filtered by platform,
+    content type, industry or page type ("platform", "content_type", "industry", "combination")"""
+    platforms = seeds.load('ai_platforms')
+    content_types = seeds.load('content_types')
+    industries = seeds.load('verticals')
+    
+    # Platform-only pages (6 pages)
+    if matches("platform", page_type) and content_type is None and industry is None:
+        for platform_slug in platforms.keys():
+            if matches(platform_slug, platform):
+                yield generate_page_content(platform_slug, page_type="platform")
+    
+    # Content type + platform combinations (48 pages: 8 content types × 6 platforms)
+    if matches("content_type", page_type) and industry is None:
+        for content_type_slug in content_types.keys():
+            if not matches(content_type_slug, content_type):
+                continue
+            for platform_slug in platforms.keys():
+                if matches(platform_slug, platform):
+                    yield generate_page_content(platform_slug, content_type_slug, page_type="content_type")
+    
+    # Industry + platform combinations (60 pages: 10 industries × 6 platforms)
+    if matches("industry", page_type) and content_type is None:
+        for industry_slug in industries.keys():
+            if not matches(industry_slug, industry):
+                continue
+            for platform_slug in platforms.keys():
+                if matches(platform_slug, platform):
+                    yield generate_page_content(platform_slug, industry=industry_slug, page_type="industry")
+    
+    # Triple combinations - most valuable content (120 pages: 4 top content types × 6 platforms × 5 top industries)
+    if matches("combination", page_type):
+        for content_type_slug in TOP_CONTENT_TYPES:
+            if not matches(content_type_slug, content_type):
+                continue
+            for platform_slug in platforms.keys():
+                if not matches(platform_slug, platform):
+                    continue
+                for industry_slug in TOP_INDUSTRIES:
+                    if matches(industry_slug, industry):
+                        page_content = generate_page_content(platform_slug, content_type_slug, industry_slug, page_type="combination")
+                        if page_content:  # Only add if not None
+                            yield page_content
+
+def render_page(platform, content_type=None, industry=None):
+    """Render a single guide page; the page type follows from which dimensions are given"""
+    if content_type is not None and content_type not in seeds.load('content_types'):
+        raise KeyError(content_type)
+    if industry is not None and industry not in seeds.load('verticals'):
+        raise KeyError(industry)
+    
+    if content_type and industry:
+        page_type = "combination"
+    elif content_type:
+        page_type = "content_type"
+    elif industry:
+        page_type = "industry"
+    else:
+        page_type = "platform"
+    return generate_page_content(platform, content_type, industry, page_type)
+
+def main():
+    """
+    Generate comprehensive PSEO content for AI SEO optimization pages.
+    Creates professional, SEO-optimized content for 500+ page combinations.
+    """
+    platforms = seeds.load('ai_platforms')
+    content_types = seeds.load('content_types')
+    industries = seeds.load('verticals')
+    
+    # Create output directory
+    output_dir = seeds.DATA_DIR
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Stream generated pages (seed files are maintained by hand in the same directory)
+    metrics = ContentMetrics()
+    total_pages = serializer.dump_iter(metrics.annotate(iter_pages()), os.path.join(output_dir, "all-pages.json"))
+
+    # Generate summary statistics
+    summary = {
+        "total_pages": total_pages,
+        "platforms": len(platforms),
+        "content_types": len(content_types), 
+        "industries": len(industries),
+        "page_breakdown": {
+            "platform_only": 6,
+            "content_type_combinations": 48,
+            "industry_combinations": 60,
+            "triple_combinations": 120
+        },
+        "generated_at": datetime.now().isoformat(),
+        "content_metrics": metrics.summary()
+    }
+    
+    serializer.dump(summary, os.path.join(output_dir, "generation-summary.json"))
+
+    print(f"✅ Generated {total_pages} comprehensive PSEO pages")
+    print(f"📊 Total content: {summary['content_metrics']['total_words']:,} words")
+    print(f"💾 Data files saved to: {output_dir}")
+    print(f"🎯 Ready for Next.js dynamic page generation")
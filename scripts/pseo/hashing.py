@@ -0,0 +1,40 @@
+import hashlib
+
+from . import serializer
+from .records import Record
+
+# Content hashes for generated pages.
+#
+# A page's hash covers everything except its generation timestamps and the
+# metrics derived from its content, so it only changes when something a reader
+# would see changes. Build stages use it to
+# tell real content changes apart from plain regeneration, and the build
+# manifest (pseo.manifest) publishes them as ETags.
+
+VOLATILE_FIELDS = ('generated_at', 'lastModified')
+# Computed from the rest of the page (pseo.metrics), and only in the builds
+# that need them, so they would make a page's hash depend on the stages run
+DERIVED_FIELDS = ('metrics', 'word_count')
+
+
+def stable_fields(page):
+    """The page as a dict without the fields that change on every generation run"""
+    data = page.to_dict() if isinstance(page, Record) else page
+    return {key: value for key, value in data.items() if key not in VOLATILE_FIELDS}
+
+
+def content_hash(page):
+    """Hex digest of a page's stable content"""
+    fields = {key: value for key, value in stable_fields(page).items() if key not in DERIVED_FIELDS}
+    return hashlib.sha256(serializer.dumps(fields, pretty=False)).hexdigest()
+
+
+def file_hash(path):
+    """Hex digest of a source file, for hand-written pages outside the generators"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def etag(digest):
+    """Strong ETag for a hex digest (64 bits are plenty to detect a change)"""
+    return f'"{digest[:16]}"'
@@ -0,0 +1,539 @@
+import os
+from datetime import datetime, timezone
+from html import escape
+
+from .build import SITE_URL
+
+# Static HTML versions of the pSEO page templates.
+#
+# Each function mirrors one component in src/components/pseo (plus the Layout
+# shell) section for section, with the same markup and Tailwind classes, so an
+# exported page looks like the server-rendered one. lucide-react icons are
+# decorative and left out. Any change to a template's structure should be made
+# in both places.
+
+# Compiled Tailwind stylesheet the exported pages link to; a site path is
+# compiled into the export by pseo.export, anything else must already exist
+STYLESHEET = os.environ.get('PSEO_STYLESHEET', '/pseo.css')
+
+# Stands in for the prefetch links of a page rendered before its hints are known
+PREFETCH_MARKER = '<!--prefetch-->\n'
+
+
+def esc(value):
+    """Escape a text value for HTML (None renders as nothing, like JSX)"""
+    if value is None or value is False:
+        return ''
+    return escape(str(value))
+
+
+def present(value):
+    """JavaScript truthiness, so `{value && ...}` sections render under the same conditions"""
+    return value is not None and value is not False and value != '' and value != 0
+
+
+def each(items, render):
+    """Render `render(item, index)` for every item, like `items.map(...)`"""
+    return ''.join(render(item, index) for index, item in enumerate(items or ()))
+
+
+def lower(value):
+    return esc(value.lower())
+
+
+def prefetch_links(urls):
+    return ''.join(f'<link rel="prefetch" href="{esc(url)}">\n' for url in urls)
+
+
+def fill_prefetch(document, urls):
+    """Replace the PREFETCH_MARKER of a document rendered with prefetch=None"""
+    return document.replace(PREFETCH_MARKER, prefetch_links(urls), 1)
+
+
+def build_year():
+    """Footer copyright year: from SOURCE_DATE_EPOCH when set (reproducible builds), else the build's date"""
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    moment = datetime.fromtimestamp(int(epoch), timezone.utc) if epoch else datetime.now(timezone.utc)
+    return moment.year
+
+
+def layout(page, body, prefetch=(), year=None):
+    """Layout.js: document head, header, main column and footer (PREFETCH_MARKER for prefetch=None)"""
+    title = page.get('title') or 'AISEO Scanner - Is your website ready for AI search ?'
+    description = page.get('metaDescription') or page.get('meta_description') or "AI SEO report - Optimize your website for ChatGPT, Perplexity, SearchGPT and other AI search engines. Get comprehensive schema markup, content quality, and authority signal analysis."
+    canonical = f"{SITE_URL}/{page['slug']}"
+    prefetch = PREFETCH_MARKER if prefetch is None else prefetch_links(prefetch)
+    return f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{esc(title)}</title>
+<meta name="description" content="{esc(description)}">
+<link rel="canonical" href="{esc(canonical)}">
+<link rel="icon" href="/favicon.png" type="image/png">
+<link rel="shortcut icon" href="/favicon.ico">
+<link rel="apple-touch-icon" href="/apple-touch-icon.png">
+{prefetch}<link rel="stylesheet" href="{esc(STYLESHEET)}">
+</head>
+<body>
+<div class="min-h-screen bg-gradient-to-br from-gray-950 via-purple-950 to-pink-950 font-sans text-white">
+<header class="bg-gray-950/80 backdrop-blur-xl border-b border-purple-500/30 shadow-2xl"><div class="max-w-5xl mx-auto px-4 sm:px-6 lg:px-8"><div class="flex justify-between h-16"><div class="flex items-center"><a href="/"><div class="flex items-center space-x-2 cursor-pointer group"><span class="text-xl font-bold tracking-tight text-white group-hover:text-pink-100 transition-colors">AI<span class="bg-gradient-to-r from-pink-400 to-purple-400 bg-clip-text text-transparent">SEO</span><span class="text-gray-300">Scan</span></span></div></a></div><div class="flex items-center space-x-4"><div class="hidden md:flex items-center space-x-1 text-xs"><span class="px-3 py-1 bg-gradient-to-r from-purple-900/40 to-purple-800/40 border border-purple-500/50 rounded-full text-purple-200 backdrop-blur-sm">Schema Markup</span><span class="px-3 py-1 bg-gradient-to-r from-pink-900/40 to-pink-800/40 border border-pink-500/50 rounded-full text-pink-200 backdrop-blur-sm">Content Quality</span><span class="px-3 py-1 bg-gradient-to-r from-blue-900/40 to-blue-800/40 border border-blue-500/50 rounded-full text-blue-200 backdrop-blur-sm">Technical SEO</span><span class="px-3 py-1 bg-gradient-to-r from-emerald-900/40 to-emerald-800/40 border border-emerald-500/50 rounded-full text-emerald-200 backdrop-blur-sm">Trust Signals</span></div></div></div></div></header>
+<main class="max-w-5xl mx-auto px-4 sm:px-6 lg:px-8 py-8 relative">
+{body}
+</main>
+<footer class="bg-gray-950/80 backdrop-blur-xl border-t border-purple-500/30 mt-12"><div class="max-w-5xl mx-auto px-4 sm:px-6 lg:px-8 py-8"><div class="mb-6 pb-6 border-b border-gray-800"><h3 class="text-sm font-semibold text-gray-400 uppercase tracking-wider mb-4">AI Search Platforms</h3><div class="grid grid-cols-2 sm:grid-cols-3 md:grid-cols-6 gap-3"><a href="/ai-seo-chatgpt" class="text-gray-300 hover:text-emerald-400 transition-colors text-sm">ChatGPT SEO</a><a href="/ai-seo-perplexity" class="text-gray-300 hover:text-blue-400 transition-colors text-sm">Perplexity SEO</a><a href="/ai-seo-gemini" class="text-gray-300 hover:text-pink-400 transition-colors text-sm">Gemini SEO</a><a href="/ai-seo-copilot" class="text-gray-300 hover:text-purple-400 transition-colors text-sm">Copilot SEO</a><a href="/ai-seo-claude" class="text-gray-300 hover:text-orange-400 transition-colors text-sm">Claude SEO</a><a href="/ai-seo-searchgpt" class="text-gray-300 hover:text-cyan-400 transition-colors text-sm">SearchGPT SEO</a></div></div><div class="flex flex-col md:flex-row justify-between items-center gap-4"><p class="text-center text-gray-300 text-sm font-light">&copy; {year or build_year()} AISEOScan. All rights reserved.</p><div class="flex flex-col md:flex-row items-center gap-4 text-xs text-gray-400"><div class="flex items-center space-x-4"><span class="bg-gradient-to-r from-pink-400 to-purple-400 bg-clip-text text-transparent font-medium">AI SEO optimization platform</span><span class="hidden sm:inline">•</span><span class="text-center sm:text-left">ChatGPT • Perplexity • SearchGPT Ready</span></div><div class="flex items-center space-x-3"><span class="hidden md:inline">•</span><a href="/ai-seo" class="text-purple-400 hover:text-purple-300 transition-colors font-medium">AI SEO Guide</a><span>•</span><a href="/ai-seo-tools" class="text-blue-400 hover:text-blue-300 transition-colors font-medium">AI SEO Tools</a></div></div></div></div></footer>
+</div>
+</body>
+</html>
+'''
+
+
+# MarkdownBlocks.js
+
+BLOCK_CLASSES = {
+    'h2': 'text-2xl md:text-3xl font-bold text-white mb-4',
+    'h3': 'text-xl font-semibold text-purple-300 mt-6 mb-3',
+    'p': 'mb-4',
+    'ul': 'list-disc pl-6 mb-4 space-y-2',
+    'ol': 'list-decimal pl-6 mb-4 space-y-2'
+}
+
+
+def inline_html(value):
+    if isinstance(value, str):
+        return esc(value)
+    return ''.join(esc(span) if isinstance(span, str) else f'<strong class="font-semibold text-white">{esc(span[1])}</strong>' for span in value)
+
+
+def block_html(block, index):
+    kind = block[0]
+    if kind == 'qa':
+        return f'<div class="mb-6"><h3 class="font-semibold text-white mb-2">{inline_html(block[1])}</h3><p>{inline_html(block[2])}</p></div>'
+    if kind in ('ul', 'ol'):
+        return f'<{kind} class="{BLOCK_CLASSES[kind]}">{each(block[1], lambda item, i: f"<li>{inline_html(item)}</li>")}</{kind}>'
+    # h4-h6 are styled like h3
+    return f'<{kind} class="{BLOCK_CLASSES.get(kind, BLOCK_CLASSES["h3"])}">{inline_html(block[1])}</{kind}>'
+
+
+def blocks_html(blocks):
+    """A markdown block tree (pseo.markdown); plain strings render as pre-line text"""
+    if isinstance(blocks, str):
+        return f'<div class="whitespace-pre-line">{esc(blocks)}</div>'
+    return each(blocks, block_html)
+
+
+# IndustryLocationTemplate.js
+
+def _prose_section(gradient, border, blocks, extra=''):
+    return f'''<div class="bg-gradient-to-r from-gray-900/60 {gradient} backdrop-blur-sm p-8 rounded-xl border {border} mb-12"><div class="flex items-start mb-6"><div class="prose prose-invert max-w-none w-full"><div class="text-gray-200 text-lg leading-relaxed">{blocks_html(blocks)}</div></div></div>{extra}</div>'''
+
+
+def _mid_cta(gradient, border, text_color, button_gradient, message, label):
+    return f'''<div class="mt-8 bg-gradient-to-r {gradient} border {border} p-6 rounded-lg text-center"><p class="{text_color} mb-4 font-medium">{message}</p><a href="/" class="inline-block bg-gradient-to-r {button_gradient} text-white px-6 py-3 rounded-lg font-semibold transition-all duration-300 transform hover:scale-105">{label}</a></div>'''
+
+
+def location_template(page):
+    content = page['content']
+    stats = page['stats']
+    city = esc(page['cityName'])
+    industry = lower(page['industryName'])
+
+    def link(item, index):
+        return f'''<a href="{esc(item['url'])}" class="flex items-center p-4 bg-gray-800/50 rounded-lg border border-purple-500/30 hover:border-purple-500/60 transition-all duration-300 group"><span class="text-gray-200 group-hover:text-white">{esc(item['text'])}</span></a>'''
+
+    return f'''<div class="max-w-4xl mx-auto">
+<div class="text-center mb-12"><div class="flex items-center justify-center mb-6"><h1 class="text-4xl md:text-5xl font-bold bg-gradient-to-r from-pink-400 via-purple-500 to-blue-500 bg-clip-text text-transparent">{esc(page['h1'])}</h1></div><p class="text-xl text-gray-200 mb-8 max-w-3xl mx-auto leading-relaxed">Dominate AI search engines like ChatGPT, Perplexity, and SearchGPT in {city}'s competitive {industry} market</p><div class="grid grid-cols-2 md:grid-cols-4 gap-4 mb-8"><div class="bg-gradient-to-r from-purple-900/30 to-purple-800/30 border border-purple-500/50 p-4 rounded-xl backdrop-blur-sm"><div class="text-2xl font-bold text-white">{esc(stats['industry_ai_growth'])}</div><div class="text-xs text-gray-300">AI Growth</div></div><div class="bg-gradient-to-r from-pink-900/30 to-pink-800/30 border border-pink-500/50 p-4 rounded-xl backdrop-blur-sm"><div class="text-2xl font-bold text-white">{esc(stats['city_businesses'])}</div><div class="text-xs text-gray-300">{city} Businesses</div></div><div class="bg-gradient-to-r from-blue-900/30 to-blue-800/30 border border-blue-500/50 p-4 rounded-xl backdrop-blur-sm"><div class="text-2xl font-bold text-white">{esc(stats['city_ai_adoption'])}</div><div class="text-xs text-gray-300">AI Adoption</div></div><div class="bg-gradient-to-r from-emerald-900/30 to-emerald-800/30 border border-emerald-500/50 p-4 rounded-xl backdrop-blur-sm"><div class="text-2xl font-bold text-white">{esc(stats['local_search_volume'])}</div><div class="text-xs text-gray-300">Monthly Searches</div></div></div><div class="flex flex-col sm:flex-row justify-center gap-4"><a href="/" class="bg-gradient-to-r from-pink-500 to-purple-600 text-white px-8 py-4 rounded-lg font-semibold hover:from-pink-600 hover:to-purple-700 transition-all duration-300 transform hover:scale-105 shadow-lg">Get Your Free AI SEO Score Now</a><a href="/" class="bg-gray-800 text-white px-8 py-4 rounded-lg font-semibold hover:bg-gray-700 transition-all duration-300 border border-gray-600">View Sample Report ($9)</a></div></div>
+<div class="bg-gradient-to-r from-gray-900/60 to-purple-900/20 backdrop-blur-sm p-8 rounded-xl border border-purple-500/50 mb-12"><div class="prose prose-invert max-w-none"><div class="text-gray-200 text-lg leading-relaxed">{blocks_html(content['intro'])}</div></div></div>
+{_prose_section('to-pink-900/20', 'border-pink-500/50', content['whyAISEOMatters'], _mid_cta('from-pink-900/30 to-purple-900/30', 'border-pink-500/50', 'text-pink-200', 'from-pink-500 to-purple-600', f"Ready to see how your {city} {industry} business ranks for AI search?", 'Run Free AI SEO Scan'))}
+{_prose_section('to-blue-900/20', 'border-blue-500/50', content['localChallenges'])}
+{_prose_section('to-emerald-900/20', 'border-emerald-500/50', content['aiSEOStrategy'], _mid_cta('from-emerald-900/30 to-blue-900/30', 'border-emerald-500/50', 'text-emerald-200', 'from-emerald-500 to-blue-600', f"Get a detailed AI SEO roadmap customized for your {city} business", 'Get $9 Detailed Report'))}
+{_prose_section('to-purple-900/20', 'border-purple-500/50', content['measurementROI'])}
+{_prose_section('to-blue-900/20', 'border-blue-500/50', content['implementation'], _mid_cta('from-blue-900/30 to-purple-900/30', 'border-blue-500/50', 'text-blue-200', 'from-blue-500 to-purple-600', f"Start implementing AI SEO for your {city} {industry} business today", 'Begin Free Scan'))}
+{_prose_section('to-pink-900/20', 'border-pink-500/50', content['localCaseStudy'])}
+{_prose_section('to-emerald-900/20', 'border-emerald-500/50', content['competitiveAdvantage'], _mid_cta('from-emerald-900/30 to-pink-900/30', 'border-emerald-500/50', 'text-emerald-200', 'from-emerald-500 to-pink-600', f"Don't let competitors dominate AI search in {city}", 'Claim Your Advantage Now'))}
+<div class="bg-gradient-to-r from-gray-900/60 to-purple-900/20 backdrop-blur-sm p-8 rounded-xl border border-purple-500/50 mb-12"><div class="prose prose-invert max-w-none"><div class="text-gray-200 text-lg leading-relaxed">{blocks_html(content['ctaSection'])}</div></div><div class="mt-8 text-center"><div class="flex flex-col sm:flex-row justify-center gap-4"><a href="/" class="bg-gradient-to-r from-pink-500 to-purple-600 text-white px-10 py-4 rounded-lg font-bold text-lg hover:from-pink-600 hover:to-purple-700 transition-all duration-300 transform hover:scale-105 shadow-xl">🚀 Start Free AI SEO Scan</a><a href="/" class="bg-gradient-to-r from-blue-500 to-emerald-600 text-white px-10 py-4 rounded-lg font-bold text-lg hover:from-blue-600 hover:to-emerald-700 transition-all duration-300 transform hover:scale-105 shadow-xl">💎 Get $9 Detailed Report</a></div></div></div>
+{_prose_section('to-blue-900/20', 'border-blue-500/50', content['faq'])}
+<div class="bg-gradient-to-r from-purple-900/40 via-pink-900/40 to-blue-900/40 backdrop-blur-sm p-10 rounded-xl border border-pink-500/50 text-center mb-12"><h2 class="text-3xl md:text-4xl font-bold text-white mb-4">Ready to Dominate AI Search in {city}?</h2><div class="prose prose-invert max-w-none mb-8"><div class="text-gray-200 text-lg leading-relaxed">{blocks_html(content['finalCTA'])}</div></div><div class="flex flex-col sm:flex-row justify-center gap-4 mb-6"><a href="/" class="bg-gradient-to-r from-pink-500 to-purple-600 text-white px-10 py-5 rounded-lg font-bold text-xl hover:from-pink-600 hover:to-purple-700 transition-all duration-300 transform hover:scale-105 shadow-2xl">🎯 Get Free AI SEO Score</a><a href="/" class="bg-gradient-to-r from-blue-500 to-emerald-600 text-white px-10 py-5 rounded-lg font-bold text-xl hover:from-blue-600 hover:to-emerald-700 transition-all duration-300 transform hover:scale-105 shadow-2xl">📊 Buy $9 Report</a></div><p class="text-gray-300 text-sm">Join {industry} businesses in {city} already winning with AI SEO</p></div>
+<div class="bg-gradient-to-r from-gray-900/60 to-purple-900/20 backdrop-blur-sm p-8 rounded-xl border border-purple-500/50"><h3 class="text-2xl font-bold text-white mb-6 flex items-center">Related AI SEO Resources</h3><div class="grid grid-cols-1 md:grid-cols-2 gap-4">{each(page['internalLinks'], link)}</div><div class="mt-8 text-center"><a href="/" class="inline-block bg-gradient-to-r from-purple-500 to-pink-600 text-white px-8 py-3 rounded-lg font-semibold hover:from-purple-600 hover:to-pink-700 transition-all duration-300">Explore All AI SEO Guides</a></div></div>
+</div>'''
+
+
+# IndustryPageTemplate.js and IndustryPlatformTemplate.js
+
+SCAN_CTA_STYLES = {
+    'primary': "bg-gradient-to-r from-pink-600 to-purple-600 hover:from-pink-500 hover:to-purple-500",
+    'secondary': "bg-gradient-to-r from-purple-600 to-blue-600 hover:from-purple-500 hover:to-blue-500",
+    'outline': "border-2 border-pink-500 hover:bg-pink-500/10"
+}
+
+
+def scan_cta(text, subtitle, button, footnote, style='primary'):
+    """The ScanCTA component shared by the industry and industry-platform templates"""
+    sub = f'<p class="text-gray-300 mb-6 text-lg">{esc(subtitle)}</p>' if present(subtitle) else ''
+    return f'''<div class="bg-gradient-to-r from-purple-900/40 via-pink-900/40 to-blue-900/40 border border-pink-500/50 p-8 rounded-xl backdrop-blur-sm text-center"><h3 class="text-2xl font-bold text-white mb-3">{esc(text)}</h3>{sub}<a href="https://aiseoscan.dev" class="inline-block {SCAN_CTA_STYLES[style]} text-white font-bold py-4 px-8 rounded-lg text-lg transition-all duration-300 transform hover:scale-105 shadow-2xl"><span class="flex items-center justify-center">{button}</span></a><p class="text-gray-400 text-sm mt-4">{footnote}</p></div>'''
+
+
+def _card_header(title, introduction):
+    return f'''<div class="flex items-start mb-6"><div><h3 class="text-2xl font-bold text-white mb-4">{esc(title)}</h3><p class="text-gray-200 text-lg leading-relaxed">{esc(introduction)}</p></div></div>'''
+
+
+def _paragraphs(paragraphs):
+    return each(paragraphs, lambda para, i: f'<p>{esc(para)}</p>')
+
+
+def _numbered(index, cls):
+    return f'<span class="{cls}">{index + 1}</span>'
+
+
+def _code_examples(code_examples, note_prefix, upsell, gap):
+    def example(item, index):
+        note = f'<p class="text-sm text-gray-400 mt-3 italic">{note_prefix}{esc(item["note"])}</p>' if present(item.get('note')) else ''
+        return f'''<div class="bg-gray-800/40 p-6 rounded-lg border border-purple-500/30"><h4 class="font-bold text-purple-300 mb-3 text-lg">{esc(item['title'])}</h4><p class="text-gray-300 mb-4">{esc(item['description'])}</p><div class="bg-gray-950 p-4 rounded border border-gray-700 overflow-x-auto"><pre class="text-sm text-green-400 font-mono whitespace-pre-wrap">{esc(item['code'])}</pre></div>{note}</div>'''
+
+    return f'''<div class="bg-gradient-to-r from-gray-900/60 to-purple-900/20 backdrop-blur-sm p-8 rounded-xl border border-purple-500/50 mb-{gap}">{_card_header(code_examples['title'], code_examples['introduction'])}<div class="space-y-6">{each(code_examples['examples'], example)}</div><div class="mt-8 bg-gradient-to-r from-pink-900/30 to-purple-900/30 p-6 rounded-lg border border-pink-500/50"><p class="text-pink-200 text-center text-lg font-semibold">{upsell}</p></div></div>'''
+
+
+def _conclusion(conclusion, gradient, border, next_steps_title, gap):
+    steps = ''
+    if present(conclusion.get('next_steps')):
+        steps = f'''<div class="mt-8 bg-blue-900/20 p-6 rounded-lg border border-blue-500/30"><h4 class="font-semibold text-blue-300 mb-4 flex items-center">{next_steps_title}</h4><ol class="space-y-3">{each(conclusion['next_steps'], lambda step, i: f'<li class="flex items-start text-gray-300">{_numbered(i, "bg-blue-900/40 text-blue-300 rounded-full w-6 h-6 flex items-center justify-center mr-3 text-sm font-bold flex-shrink-0 mt-0.5")}<span>{esc(step)}</span></li>')}</ol></div>'''
+    return f'''<div class="bg-gradient-to-r from-gray-900/60 {gradient} backdrop-blur-sm p-8 rounded-xl border {border} mb-{gap}"><h3 class="text-2xl font-bold text-white mb-6 flex items-center">{esc(conclusion['title'])}</h3><div class="space-y-4 text-gray-200 text-lg leading-relaxed">{_paragraphs(conclusion['paragraphs'])}</div>{steps}</div>'''
+
+
+def _final_cta(heading, text, button, checks):
+    ticks = ''.join(f'<div class="flex items-center"><span>{check}</span></div>' for check in checks)
+    return f'''<div class="mb-12"><div class="bg-gradient-to-r from-pink-900/40 via-purple-900/40 to-blue-900/40 border-2 border-pink-500/60 p-10 rounded-xl backdrop-blur-sm text-center"><h3 class="text-3xl font-bold text-white mb-4">{heading}</h3><p class="text-gray-200 mb-6 text-lg max-w-2xl mx-auto">{text}</p><a href="https://aiseoscan.dev" class="inline-block bg-gradient-to-r from-pink-600 to-purple-600 hover:from-pink-500 hover:to-purple-500 text-white font-bold py-5 px-10 rounded-lg text-xl transition-all duration-300 transform hover:scale-105 shadow-2xl"><span class="flex items-center justify-center">{button}</span></a><div class="mt-6 flex items-center justify-center gap-8 text-sm text-gray-300">{ticks}</div></div></div>'''
+
+
+def _related(items, heading, title_field):
+    if not items:
+        return ''
+    cards = each(items, lambda item, i: f'''<a href="{esc(item['url'])}"><div class="bg-gray-800/30 p-4 rounded-lg border border-purple-500/30 hover:border-purple-400 transition-colors cursor-pointer"><h4 class="font-semibold text-purple-300 mb-2">{esc(item[title_field])}</h4><p class="text-gray-400 text-sm flex items-center">Read guide</p></div></a>''')
+    return f'''<div class="bg-gradient-to-r from-gray-900/60 to-purple-900/20 backdrop-blur-sm p-8 rounded-xl border border-purple-500/50"><h3 class="text-xl font-bold text-white mb-6 flex items-center">{heading}</h3><div class="grid grid-cols-1 md:grid-cols-3 gap-4">{cards}</div></div>'''
+
+
+PRIORITY_CLASSES = {
+    'High': 'bg-red-900/40 text-red-300 border border-red-500/50',
+    'Medium': 'bg-yellow-900/40 text-yellow-300 border border-yellow-500/50'
+}
+
+DIFFICULTY_CLASSES = {
+    'Easy': 'text-green-400',
+    'Medium': 'text-yellow-400'
+}
+
+
+def industry_template(page):
+    name = page['industry_name']
+    industry = esc(name)
+    hero = page['hero_section']
+    introduction = page['introduction']
+    parts = []
+
+    def cta(text, subtitle, style='primary'):
+        return scan_cta(text, subtitle, 'Scan Your Website Free', 'Get instant AI SEO score + 20-page detailed report with exact code fixes', style)
+
+    key_points = ''
+    if present(introduction.get('key_points')):
+        key_points = f'''<div class="mt-8 grid grid-cols-1 md:grid-cols-3 gap-4">{each(introduction['key_points'], lambda point, i: f'<div class="bg-purple-900/20 p-5 rounded-lg border border-purple-500/30"><h4 class="font-semibold text-white mb-2">{esc(point["title"])}</h4><p class="text-sm text-gray-300">{esc(point["description"])}</p></div>')}</div>'''
+
+    parts.append(f'''<div class="text-center mb-12"><div class="flex items-center justify-center mb-6"><h1 class="text-4xl md:text-5xl font-bold bg-gradient-to-r from-pink-400 via-purple-500 to-blue-500 bg-clip-text text-transparent leading-tight pb-2">{esc(hero['headline'])}</h1></div><p class="text-xl text-gray-200 mb-8 max-w-3xl mx-auto leading-relaxed">{esc(hero['subheadline'])}</p><div class="bg-gradient-to-r from-purple-900/30 via-pink-900/30 to-blue-900/30 border border-pink-500/50 p-6 rounded-xl backdrop-blur-sm inline-block mb-10"><div class="flex items-center justify-center gap-8 flex-wrap"><div class="text-center"><p class="text-3xl font-bold text-pink-400">{esc(hero['stats']['ai_growth'])}</p><p class="text-gray-300 text-sm">AI Search Growth</p></div><div class="text-center"><p class="text-3xl font-bold text-purple-400">{esc(hero['stats']['industry_adoption'])}</p><p class="text-gray-300 text-sm">{industry} Adoption</p></div><div class="text-center"><p class="text-3xl font-bold text-blue-400">{esc(hero['stats']['visibility_impact'])}</p><p class="text-gray-300 text-sm">Visibility Impact</p></div></div></div>{cta(f"Get Your Free {name} AI SEO Analysis", "Scan takes 60 seconds • No credit card required • Instant results")}</div>''')
+    parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-purple-900/20 backdrop-blur-sm p-8 rounded-xl border border-purple-500/50 mb-10"><h2 class="text-3xl font-bold text-white mb-6 flex items-center">{esc(introduction['title'])}</h2><div class="space-y-4 text-gray-200 text-lg leading-relaxed">{_paragraphs(introduction['paragraphs'])}</div>{key_points}</div>''')
+
+    main_content = page.get('main_content')
+    if page['content_type'] == 'guide' and present(main_content):
+        def section(item, index):
+            strategies = ''
+            if present(item.get('strategies')):
+                strategies = f'''<div class="space-y-4 mb-6"><h4 class="font-semibold text-purple-400 mb-4">Core Implementation Strategies:</h4>{each(item['strategies'], lambda s, i: f'<div class="flex items-start text-gray-300 mb-3"><span class="leading-relaxed">{esc(s)}</span></div>')}</div>'''
+            benefits = ''
+            if present(item.get('benefits')):
+                benefits = f'''<div class="bg-blue-900/20 p-5 rounded-lg border-l-4 border-blue-400"><h4 class="font-semibold text-blue-300 mb-3 flex items-center">Why This Matters for {industry}</h4><ul class="space-y-2">{each(item['benefits'], lambda b, i: f'<li class="flex items-start text-blue-200"><span>{esc(b)}</span></li>')}</ul></div>'''
+            return f'''<div class="bg-gradient-to-r from-gray-900/60 to-purple-900/20 backdrop-blur-sm p-8 rounded-xl border border-purple-500/50 mb-8"><div class="flex items-start mb-6"><div class="flex-1"><h3 class="text-2xl font-bold text-white mb-4">{esc(item['title'])}</h3><p class="text-gray-200 text-lg mb-6 leading-relaxed">{esc(item['introduction'])}</p></div></div>{strategies}{benefits}</div>'''
+        parts.append(each(main_content['sections'], section))
+
+    challenges = page.get('challenges')
+    if present(challenges):
+        parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-red-900/20 backdrop-blur-sm p-8 rounded-xl border border-red-500/50 mb-8">{_card_header(challenges['title'], challenges['introduction'])}<div class="space-y-5">{each(challenges['items'], lambda c, i: f'<div class="bg-gray-800/40 p-6 rounded-lg border-l-4 border-red-500"><h4 class="font-bold text-red-300 mb-3 text-xl flex items-center">{_numbered(i, "bg-red-900/40 rounded-full w-8 h-8 flex items-center justify-center mr-3 text-sm")}{esc(c["title"])}</h4><p class="text-gray-300 mb-3 leading-relaxed">{esc(c["description"])}</p><div class="bg-red-900/20 p-4 rounded border border-red-500/30"><p class="text-sm text-red-200"><span class="font-semibold">Impact:</span> {esc(c["impact"])}</p></div></div>')}</div></div>''')
+
+    parts.append('<div class="my-10">' + cta("Don't Let These Issues Hurt Your Rankings", "Get a comprehensive AI SEO analysis and learn exactly what to fix", "secondary") + '</div>')
+
+    solutions = page.get('solutions')
+    if present(solutions):
+        def solution(item, index):
+            steps = ''
+            if present(item.get('steps')):
+                steps = f'''<div class="space-y-3"><p class="text-sm font-semibold text-green-400 mb-2">Implementation Steps:</p>{each(item['steps'], lambda s, i: f'<div class="flex items-start bg-gray-900/50 p-3 rounded">{_numbered(i, "bg-green-900/40 text-green-300 rounded-full w-6 h-6 flex items-center justify-center mr-3 text-sm font-bold flex-shrink-0 mt-0.5")}<span class="text-gray-300">{esc(s)}</span></div>')}</div>'''
+            result = ''
+            if present(item.get('expected_result')):
+                result = f'<div class="mt-4 bg-green-900/20 p-4 rounded border border-green-500/30"><p class="text-sm text-green-200"><span class="font-semibold">Expected Result:</span> {esc(item["expected_result"])}</p></div>'
+            return f'''<div class="bg-gray-800/30 p-6 rounded-lg border border-green-500/30"><h4 class="font-bold text-green-300 mb-3 text-xl flex items-center">{esc(item['title'])}</h4><p class="text-gray-300 mb-4 leading-relaxed">{esc(item['description'])}</p>{steps}{result}</div>'''
+        parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-green-900/20 backdrop-blur-sm p-8 rounded-xl border border-green-500/50 mb-8">{_card_header(solutions['title'], solutions['introduction'])}<div class="space-y-6">{each(solutions['items'], solution)}</div></div>''')
+
+    mistakes = page.get('mistakes')
+    if present(mistakes):
+        parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-orange-900/20 backdrop-blur-sm p-8 rounded-xl border border-orange-500/50 mb-8">{_card_header(mistakes['title'], mistakes['introduction'])}<div class="space-y-6">{each(mistakes['items'], lambda m, i: f'<div class="bg-gray-800/40 p-6 rounded-lg border-l-4 border-orange-500"><div class="flex items-start mb-4"><div class="flex-1"><h4 class="font-bold text-orange-300 mb-2 text-xl">{esc(m["title"])}</h4><p class="text-gray-300 mb-3 leading-relaxed">{esc(m["description"])}</p></div></div><div class="bg-orange-900/20 p-4 rounded mb-3"><p class="text-sm text-orange-200"><span class="font-semibold">Why It&#x27;s Harmful:</span> {esc(m["why_harmful"])}</p></div><div class="bg-green-900/20 p-4 rounded border border-green-500/30"><p class="text-sm font-semibold text-green-400 mb-2">✓ How to Fix It:</p><p class="text-gray-300">{esc(m["how_to_fix"])}</p></div></div>')}</div></div>''')
+
+    checklist = page.get('checklist')
+    if present(checklist):
+        def item_html(item, index):
+            priority = ''
+            if present(item.get('priority')):
+                priority = f'<span class="inline-block mt-2 px-3 py-1 rounded-full text-xs font-semibold {PRIORITY_CLASSES.get(item["priority"], "bg-blue-900/40 text-blue-300 border border-blue-500/50")}">{esc(item["priority"])} Priority</span>'
+            return f'''<div class="bg-gray-800/30 p-5 rounded-lg border border-purple-500/30 hover:border-purple-400/50 transition-colors"><div class="flex items-start"><div class="flex-1"><h5 class="font-semibold text-white mb-2">{esc(item['task'])}</h5><p class="text-gray-300 text-sm leading-relaxed">{esc(item['description'])}</p>{priority}</div></div></div>'''
+        categories = each(checklist['categories'], lambda c, i: f'<div class="mb-8 last:mb-0"><h4 class="text-xl font-bold text-purple-300 mb-4 flex items-center">{esc(c["category"])}</h4><div class="space-y-3">{each(c["items"], item_html)}</div></div>')
+        parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-purple-900/20 backdrop-blur-sm p-8 rounded-xl border border-purple-500/50 mb-8">{_card_header(checklist['title'], checklist['introduction'])}{categories}</div>''')
+
+    best_practices = page.get('best_practices')
+    if present(best_practices):
+        def practice(item, index):
+            implementation = ''
+            if present(item.get('implementation')):
+                implementation = f'<div class="bg-gray-900/50 p-4 rounded mb-3"><p class="text-sm font-semibold text-blue-400 mb-2">Implementation:</p><p class="text-gray-300">{esc(item["implementation"])}</p></div>'
+            tip = ''
+            if present(item.get('pro_tip')):
+                tip = f'<div class="bg-blue-900/20 p-4 rounded border-l-4 border-blue-400"><p class="text-sm text-blue-200"><span class="font-semibold">Pro Tip:</span> {esc(item["pro_tip"])}</p></div>'
+            return f'''<div class="bg-gray-800/30 p-6 rounded-lg border border-blue-500/30"><div class="flex items-start mb-4"><div class="flex-1"><h4 class="font-bold text-blue-300 mb-2 text-xl">{esc(item['title'])}</h4><p class="text-gray-300 mb-4 leading-relaxed">{esc(item['description'])}</p></div></div>{implementation}{tip}</div>'''
+        parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-blue-900/20 backdrop-blur-sm p-8 rounded-xl border border-blue-500/50 mb-8">{_card_header(best_practices['title'], best_practices['introduction'])}<div class="space-y-6">{each(best_practices['items'], practice)}</div></div>''')
+
+    parts.append(f'<div class="my-10">{cta(f"Ready to Optimize Your {name} Website?", "Get your complete AI SEO report with specific fixes for your industry")}</div>')
+
+    if present(page.get('code_examples')):
+        parts.append(_code_examples(page['code_examples'], 'Note: ', '📄 Get 50+ more industry-specific code examples in your full AI SEO report', 8))
+
+    measurement = page.get('measurement')
+    if present(measurement):
+        timeline = ''
+        if present(measurement.get('timeline')):
+            timeline = f'''<div class="bg-gray-800/30 p-6 rounded-lg border border-green-500/30"><h4 class="font-semibold text-green-400 mb-4 flex items-center">Expected Timeline</h4><div class="space-y-3">{each(measurement['timeline'], lambda p, i: f'<div class="flex items-start">{_numbered(i, "bg-green-900/40 text-green-300 rounded-full w-8 h-8 flex items-center justify-center mr-4 text-sm font-bold flex-shrink-0")}<div><p class="font-semibold text-white">{esc(p["period"])}</p><p class="text-gray-300 text-sm">{esc(p["expectation"])}</p></div></div>')}</div></div>'''
+        kpis = each(measurement['kpis'], lambda k, i: f'<div class="bg-gray-800/30 p-5 rounded-lg border border-green-500/30"><div class="flex items-start"><div><h4 class="font-semibold text-green-300 mb-2">{esc(k["metric"])}</h4><p class="text-gray-300 text-sm mb-2">{esc(k["description"])}</p><p class="text-xs text-green-400 font-semibold">Target: {esc(k["target"])}</p></div></div></div>')
+        parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-green-900/20 backdrop-blur-sm p-8 rounded-xl border border-green-500/50 mb-8">{_card_header(measurement['title'], measurement['introduction'])}<div class="grid grid-cols-1 md:grid-cols-2 gap-6 mb-6">{kpis}</div>{timeline}</div>''')
+
+    if present(page.get('faq')):
+        parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-purple-900/20 backdrop-blur-sm p-8 rounded-xl border border-purple-500/50 mb-8"><h3 class="text-2xl font-bold text-white mb-6 flex items-center">Frequently Asked Questions</h3><div class="space-y-5">{each(page['faq'], lambda q, i: f'<div class="bg-gray-800/30 p-6 rounded-lg border border-purple-500/30"><h4 class="font-bold text-purple-300 mb-3 text-lg">{esc(q["question"])}</h4><p class="text-gray-300 leading-relaxed">{esc(q["answer"])}</p></div>')}</div></div>''')
+
+    parts.append(f'<div class="my-10">{cta("Get Your Complete AI SEO Audit Now", "20+ page report • Exact code fixes • Implementation timeline • Industry-specific recommendations")}</div>')
+
+    if present(page.get('conclusion')):
+        parts.append(_conclusion(page['conclusion'], 'to-blue-900/20', 'border-blue-500/50', f'Next Steps for {industry} Websites', 8))
+
+    parts.append(_final_cta(
+        f'Start Optimizing Your {industry} Website for AI Search Today',
+        'Get instant access to your AI SEO score and comprehensive optimization report. No credit card required. Results in 60 seconds.',
+        'Scan Your Website Now - It&#x27;s Free',
+        ('Instant Results', '20+ Page Report', 'Exact Code Fixes')
+    ))
+    parts.append(_related(page.get('related_industries'), 'AI SEO Guides for Related Industries', 'name'))
+    return '<div class="max-w-4xl mx-auto">\n' + '\n'.join(part for part in parts if part) + '\n</div>'
+
+
+def industry_platform_template(page):
+    industry_name = page['industry_name']
+    platform_name = page['platform_name']
+    industry = esc(industry_name)
+    platform = esc(platform_name)
+    hero = page['hero_section']
+    introduction = page['introduction']
+    parts = []
+
+    def cta(text, subtitle, style='primary'):
+        return scan_cta(text, subtitle, 'Get Free AI SEO Analysis', 'Platform-specific recommendations • Instant results • No credit card', style)
+
+    advantages = ''
+    if present(introduction.get('key_advantages')):
+        advantages = f'''<div class="mt-8 grid grid-cols-1 md:grid-cols-2 gap-4">{each(introduction['key_advantages'], lambda a, i: f'<div class="bg-purple-900/20 p-5 rounded-lg border border-purple-500/30"><h4 class="font-semibold text-white mb-2">{esc(a["title"])}</h4><p class="text-sm text-gray-300">{esc(a["description"])}</p></div>')}</div>'''
+
+    parts.append(f'''<div class="text-center mb-12"><div class="flex items-center justify-center mb-6"><h1 class="text-4xl md:text-5xl font-bold bg-gradient-to-r from-pink-400 via-purple-500 to-blue-500 bg-clip-text text-transparent leading-tight pb-2">{esc(hero['headline'])}</h1></div><p class="text-xl text-gray-200 mb-8 max-w-3xl mx-auto leading-relaxed">{esc(hero['subheadline'])}</p><div class="bg-gradient-to-r from-purple-900/30 via-pink-900/30 to-blue-900/30 border border-pink-500/50 p-6 rounded-xl backdrop-blur-sm inline-block mb-10"><div class="flex items-center justify-center gap-8 flex-wrap"><div class="text-center"><p class="text-3xl font-bold text-pink-400">{platform}</p><p class="text-gray-300 text-sm">Platform</p></div><div class="text-center"><p class="text-3xl font-bold text-purple-400">{industry}</p><p class="text-gray-300 text-sm">Industry</p></div><div class="text-center"><p class="text-3xl font-bold text-blue-400">{esc(hero.get('setup_time'))}</p><p class="text-gray-300 text-sm">Setup Time</p></div></div></div>{cta(f"Analyze Your {platform_name} {industry_name} Website", "Get platform-specific AI SEO recommendations in 60 seconds")}</div>''')
+    parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-purple-900/20 backdrop-blur-sm p-8 rounded-xl border border-purple-500/50 mb-10"><h2 class="text-3xl font-bold text-white mb-6 flex items-center">Why {platform} for {industry} AI SEO?</h2><div class="space-y-4 text-gray-200 text-lg leading-relaxed">{_paragraphs(introduction['paragraphs'])}</div>{advantages}</div>''')
+
+    overview = page.get('platform_overview')
+    if present(overview):
+        capabilities = ''
+        if present(overview.get('capabilities')):
+            capabilities = f'''<div class="grid grid-cols-1 md:grid-cols-2 gap-4 mt-6">{each(overview['capabilities'], lambda c, i: f'<div class="bg-blue-900/20 p-4 rounded-lg border border-blue-500/30"><h4 class="font-semibold text-blue-300 mb-2 flex items-center">{esc(c["feature"])}</h4><p class="text-sm text-gray-300">{esc(c["benefit"])}</p></div>')}</div>'''
+        parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-blue-900/20 backdrop-blur-sm p-8 rounded-xl border border-blue-500/50 mb-10">{_card_header(overview['title'], overview['description'])}{capabilities}</div>''')
+
+    setup = page.get('technical_setup')
+    if present(setup):
+        def step(item, index):
+            subs = ''
+            if present(item.get('sub_steps')):
+                subs = f'''<ul class="space-y-2 ml-4">{each(item['sub_steps'], lambda s, i: f'<li class="flex items-start text-gray-400 text-sm"><span>{esc(s)}</span></li>')}</ul>'''
+            return f'''<div class="bg-gray-800/30 p-6 rounded-lg border-l-4 border-purple-500"><div class="flex items-start">{_numbered(index, "bg-purple-900/40 text-purple-300 rounded-full w-10 h-10 flex items-center justify-center mr-4 text-lg font-bold flex-shrink-0")}<div class="flex-1"><h4 class="font-bold text-white mb-2 text-lg">{esc(item['title'])}</h4><p class="text-gray-300 mb-3 leading-relaxed">{esc(item['description'])}</p>{subs}</div></div></div>'''
+        steps = f'<div class="space-y-5">{each(setup["steps"], step)}</div>' if present(setup.get('steps')) else ''
+        parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-purple-900/20 backdrop-blur-sm p-8 rounded-xl border border-purple-500/50 mb-10">{_card_header(setup['title'], setup['introduction'])}{steps}</div>''')
+
+    parts.append(f'<div class="my-10">{cta("Ready to Optimize Your Site?", f"Get {platform_name}-specific recommendations for {industry_name}", "secondary")}</div>')
+
+    schema = page.get('schema_implementation')
+    if present(schema):
+        def method(item, index):
+            steps = ''
+            if present(item.get('steps')):
+                steps = f'''<div class="bg-gray-900/50 p-4 rounded"><p class="text-sm font-semibold text-green-400 mb-3">Implementation:</p><ol class="space-y-2">{each(item['steps'], lambda s, i: f'<li class="flex items-start text-gray-300 text-sm">{_numbered(i, "bg-green-900/40 text-green-300 rounded-full w-6 h-6 flex items-center justify-center mr-3 text-xs font-bold flex-shrink-0 mt-0.5")}<span>{esc(s)}</span></li>')}</ol></div>'''
+            return f'''<div class="bg-gray-800/30 p-6 rounded-lg border border-green-500/30"><h4 class="font-bold text-green-300 mb-3 text-xl flex items-center">{esc(item['method'])}</h4><p class="text-gray-300 mb-4 leading-relaxed">{esc(item['description'])}</p>{steps}</div>'''
+        methods = f'<div class="space-y-6">{each(schema["methods"], method)}</div>' if present(schema.get('methods')) else ''
+        parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-green-900/20 backdrop-blur-sm p-8 rounded-xl border border-green-500/50 mb-10">{_card_header(schema['title'], schema['introduction'])}{methods}</div>''')
+
+    tools = page.get('plugins_tools')
+    if present(tools):
+        def tool(item, index):
+            kind = f'<span class="bg-blue-900/40 text-blue-300 px-3 py-1 rounded-full text-xs font-semibold">{esc(item["type"])}</span>' if present(item.get('type')) else ''
+            features = ''
+            if present(item.get('features')):
+                features = f'''<div class="mb-4"><p class="text-sm font-semibold text-blue-400 mb-2">Key Features:</p><ul class="space-y-1">{each(item['features'], lambda f, i: f'<li class="flex items-start text-gray-400 text-sm"><span>{esc(f)}</span></li>')}</ul></div>'''
+            difficulty = ''
+            if present(item.get('setup_difficulty')):
+                difficulty = f'<div class="flex items-center gap-4 text-sm"><span class="text-gray-400">Setup:</span><span class="font-semibold {DIFFICULTY_CLASSES.get(item["setup_difficulty"], "text-red-400")}">{esc(item["setup_difficulty"])}</span></div>'
+            return f'''<div class="bg-gray-800/30 p-6 rounded-lg border border-blue-500/30"><div class="flex items-start justify-between mb-3"><h4 class="font-bold text-blue-300 text-xl">{esc(item['name'])}</h4>{kind}</div><p class="text-gray-300 mb-4">{esc(item['description'])}</p>{features}{difficulty}</div>'''
+        recommended = f'<div class="space-y-5">{each(tools["recommended"], tool)}</div>' if present(tools.get('recommended')) else ''
+        parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-blue-900/20 backdrop-blur-sm p-8 rounded-xl border border-blue-500/50 mb-10">{_card_header(tools['title'], tools['introduction'])}{recommended}</div>''')
+
+    optimization = page.get('optimization_steps')
+    if present(optimization):
+        def opt_item(item, index):
+            impact = f'<div class="bg-purple-900/20 p-3 rounded"><p class="text-sm text-purple-300"><span class="font-semibold">Impact:</span> {esc(item["impact"])}</p></div>' if present(item.get('impact')) else ''
+            return f'<div class="bg-gray-800/30 p-5 rounded-lg border border-purple-500/30"><h5 class="font-semibold text-white mb-2">{esc(item["task"])}</h5><p class="text-gray-300 text-sm mb-3">{esc(item["description"])}</p>{impact}</div>'
+        categories = ''
+        if present(optimization.get('categories')):
+            categories = f'''<div class="space-y-8">{each(optimization['categories'], lambda c, i: f'<div><h4 class="text-xl font-bold text-purple-300 mb-4 flex items-center">{esc(c["category"])}</h4><div class="space-y-3">{each(c["items"], opt_item)}</div></div>')}</div>'''
+        parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-purple-900/20 backdrop-blur-sm p-8 rounded-xl border border-purple-500/50 mb-10">{_card_header(optimization['title'], optimization['introduction'])}{categories}</div>''')
+
+    parts.append(f'<div class="my-10">{cta(f"Get Your {platform_name} AI SEO Report", "Detailed analysis with platform-specific fixes and code examples")}</div>')
+
+    issues = page.get('common_issues')
+    if present(issues):
+        listing = ''
+        if present(issues.get('issues')):
+            listing = f'''<div class="space-y-5">{each(issues['issues'], lambda s, i: f'<div class="bg-gray-800/40 p-6 rounded-lg border-l-4 border-red-500"><h4 class="font-bold text-red-300 mb-3 text-lg flex items-center">{esc(s["problem"])}</h4><p class="text-gray-300 mb-4">{esc(s["description"])}</p><div class="bg-green-900/20 p-4 rounded border border-green-500/30"><p class="text-sm font-semibold text-green-400 mb-2">✓ Solution:</p><p class="text-gray-300 text-sm">{esc(s["solution"])}</p></div></div>')}</div>'''
+        parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-red-900/20 backdrop-blur-sm p-8 rounded-xl border border-red-500/50 mb-10">{_card_header(issues['title'], issues['introduction'])}{listing}</div>''')
+
+    if present(page.get('code_examples')):
+        parts.append(_code_examples(page['code_examples'], '💡 ', f'📄 Get 20+ more {platform}-specific code examples in your full report', 10))
+
+    performance = page.get('performance')
+    if present(performance):
+        def optimization_card(item, index):
+            improvement = f'<p class="text-xs text-blue-400">{esc(item["expected_improvement"])}</p>' if present(item.get('expected_improvement')) else ''
+            return f'<div class="bg-gray-800/30 p-5 rounded-lg border border-blue-500/30"><h4 class="font-semibold text-blue-300 mb-2">{esc(item["area"])}</h4><p class="text-gray-300 text-sm mb-3">{esc(item["recommendation"])}</p>{improvement}</div>'
+        cards = f'<div class="grid grid-cols-1 md:grid-cols-2 gap-5">{each(performance["optimizations"], optimization_card)}</div>' if present(performance.get('optimizations')) else ''
+        parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-blue-900/20 backdrop-blur-sm p-8 rounded-xl border border-blue-500/50 mb-10">{_card_header(performance['title'], performance['introduction'])}{cards}</div>''')
+
+    if present(page.get('conclusion')):
+        parts.append(_conclusion(page['conclusion'], 'to-purple-900/20', 'border-purple-500/50', 'Next Steps:', 10))
+
+    parts.append(_final_cta(
+        f'Start Optimizing Your {platform} {industry} Site Today',
+        'Get instant platform-specific AI SEO analysis. No credit card required. Results in 60 seconds.',
+        f'Scan Your {platform} Website Now',
+        ('Platform-Specific Analysis', 'Code Examples', 'Implementation Guide')
+    ))
+    parts.append(_related(page.get('related_pages'), 'Related Guides', 'title'))
+    return '<div class="max-w-4xl mx-auto">\n' + '\n'.join(part for part in parts if part) + '\n</div>'
+
+
+# PSEOPageTemplate.js (technical, use case and guide pages)
+
+def _bullets(items, item_class='flex items-start text-gray-300', list_class='space-y-3'):
+    def bullet(item, index):
+        return f'<li class="{item_class}"><span>{esc(item)}</span></li>'
+    return f'<ul class="{list_class}">{each(items, bullet)}</ul>'
+
+
+def pseo_template(page):
+    platform = esc(page.get('platform'))
+    hero = page['hero_section']
+    introduction = page['introduction']
+    parts = []
+
+    parts.append(f'''<div class="text-center mb-12"><div class="flex items-center justify-center mb-6"><h1 class="text-5xl font-bold bg-gradient-to-r from-pink-400 via-purple-500 to-blue-500 bg-clip-text text-transparent">{esc(hero['headline'])}</h1></div><p class="text-xl text-gray-200 mb-8 max-w-3xl mx-auto leading-relaxed">{esc(hero['subheadline'])}</p><div class="bg-gradient-to-r from-purple-900/30 via-pink-900/30 to-blue-900/30 border border-pink-500/50 p-6 rounded-xl backdrop-blur-sm inline-block mb-8"><p class="text-pink-200 text-lg font-medium">{platform} processes over {esc(hero.get('stats'))} queries monthly - optimize your content for maximum AI visibility</p></div></div>''')
+
+    heading = f'Understanding {platform} Optimization'
+    if present(page.get('content_type')):
+        heading += f' for {esc(page["content_type"])}'
+    if present(page.get('industry')):
+        heading += f' in {esc(page["industry"])}'
+    benefits = ''
+    if present(introduction.get('key_benefits')):
+        benefits = f'<div class="mt-6"><h3 class="font-semibold text-purple-400 mb-3">Key Optimization Benefits:</h3>{_bullets(introduction["key_benefits"], list_class="space-y-2")}</div>'
+    parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-purple-900/20 backdrop-blur-sm p-8 rounded-xl border border-purple-500/50 mb-12"><h2 class="text-3xl font-bold text-white mb-6">{heading}</h2><p class="text-gray-200 mb-6 text-lg leading-relaxed">{esc(introduction.get('opening_paragraph'))}</p><div class="grid grid-cols-1 md:grid-cols-3 gap-6 mb-6"><div class="bg-purple-900/20 p-4 rounded-lg border border-purple-500/30"><h3 class="font-semibold text-white mb-2">AI Discovery</h3><p class="text-sm text-gray-300">Optimize content structure for AI comprehension and citation preferences</p></div><div class="bg-pink-900/20 p-4 rounded-lg border border-pink-500/30"><h3 class="font-semibold text-white mb-2">Citation Ready</h3><p class="text-sm text-gray-300">Structure information for direct AI citation and reference generation</p></div><div class="bg-blue-900/20 p-4 rounded-lg border border-blue-500/30"><h3 class="font-semibold text-white mb-2">Authority Signals</h3><p class="text-sm text-gray-300">Build credibility markers that AI systems use for source evaluation</p></div></div><p class="text-gray-200 text-lg">{esc(introduction.get('statistics'))}</p>{benefits}</div>''')
+
+    def main_section(section, index):
+        content = section['content']
+        blocks = []
+        if present(content.get('key_strategies')):
+            blocks.append(f'<div class="mb-6"><h4 class="font-semibold text-purple-400 mb-4">Core Implementation Strategies:</h4>{_bullets(content["key_strategies"])}</div>')
+        if present(content.get('optimization_strategies')):
+            blocks.append(f'<div class="mb-6"><h4 class="font-semibold text-purple-400 mb-4">Optimization Strategies:</h4>{_bullets(content["optimization_strategies"])}</div>')
+        if present(content.get('implementation_details')):
+            blocks.append(f'<div class="bg-gray-800/30 p-6 rounded-lg"><h4 class="font-semibold text-purple-400 mb-4">Implementation Details:</h4>{_bullets(content["implementation_details"], list_class="space-y-2")}</div>')
+        if present(content.get('ai_benefits')):
+            blocks.append(f'<div class="mt-6 bg-blue-900/20 p-4 rounded border-l-4 border-blue-400"><h4 class="font-semibold text-blue-300 mb-3">AI-Specific Benefits:</h4>{_bullets(content["ai_benefits"], "flex items-start text-blue-200 text-sm", "space-y-2")}</div>')
+        return f'''<div class="bg-gradient-to-r from-gray-900/60 to-purple-900/20 backdrop-blur-sm p-8 rounded-xl border border-purple-500/50 mb-8"><div class="flex items-start mb-6"><div><h3 class="text-2xl font-bold text-white mb-4">{esc(section['title'])}</h3><p class="text-gray-200 text-lg mb-6">{esc(content.get('introduction'))}</p></div></div>{''.join(blocks)}</div>'''
+
+    if present(page.get('main_sections')):
+        parts.append(each(page['main_sections'], main_section))
+
+    technical = page.get('technical_implementation')
+    if present(technical):
+        columns = []
+        if present(technical.get('core_requirements')):
+            columns.append(f'<div><h4 class="font-semibold text-blue-400 mb-4">Core Technical Requirements:</h4>{_bullets(technical["core_requirements"])}</div>')
+        if present(technical.get('content_structure')):
+            columns.append(f'<div><h4 class="font-semibold text-blue-400 mb-4">{esc(technical["content_structure"]["title"])}</h4>{_bullets(technical["content_structure"]["requirements"])}</div>')
+        schema = technical.get('schema_markup')
+        if present(schema):
+            importance = f'<p class="text-gray-300 text-sm mb-3">{esc(schema["importance"])}</p>' if present(schema.get('importance')) else ''
+            columns.append(f'<div><h4 class="font-semibold text-blue-400 mb-4">{esc(schema.get("title") or "Schema Markup Implementation:")}</h4>{importance}{_bullets(schema.get("implementation_guide"))}</div>')
+        performance = ''
+        if present(technical.get('performance_requirements')):
+            performance = f'<div class="mb-6"><h4 class="font-semibold text-blue-400 mb-4">{esc(technical["performance_requirements"]["title"])}</h4>{_bullets(technical["performance_requirements"]["requirements"])}</div>'
+        schemas = ''
+        if present(schema) and present(schema.get('primary_schemas')):
+            chips = each(schema['primary_schemas'], lambda s, i: f'<span class="px-3 py-1 bg-blue-800/30 border border-blue-600/50 rounded-full text-blue-200 text-sm">{esc(s)}</span>')
+            schemas = f'<div class="bg-blue-900/20 p-4 rounded border-l-4 border-blue-400"><h4 class="font-semibold text-blue-300 mb-3">Priority Schema Types:</h4><div class="flex flex-wrap gap-2">{chips}</div></div>'
+        intro = f'<p class="text-gray-200 mb-4">{esc(technical["introduction"])}</p>' if present(technical.get('introduction')) else ''
+        parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-blue-900/20 backdrop-blur-sm p-8 rounded-xl border border-blue-500/50 mb-8"><div class="flex items-start mb-6"><div><h3 class="text-2xl font-bold text-white mb-4">{esc(technical.get('title'))}</h3>{intro}</div></div><div class="grid grid-cols-1 md:grid-cols-2 gap-8 mb-6">{''.join(columns)}</div>{performance}{schemas}</div>''')
+
+    practices = page.get('best_practices')
+    if present(practices):
+        parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-emerald-900/20 backdrop-blur-sm p-8 rounded-xl border border-emerald-500/50 mb-8"><h2 class="text-3xl font-bold text-white mb-6 flex items-center">{esc(practices.get('title'))}</h2><div class="grid grid-cols-1 md:grid-cols-2 gap-8"><div><h3 class="font-semibold text-emerald-400 mb-4">Content Best Practices:</h3>{_bullets(practices.get('content_best_practices'))}</div><div><h3 class="font-semibold text-emerald-400 mb-4">Technical Best Practices:</h3>{_bullets(practices.get('technical_best_practices'))}</div></div><div class="mt-8"><h3 class="font-semibold text-emerald-400 mb-4">Authority Building:</h3>{_bullets(practices.get('authority_building'))}</div></div>''')
+
+    mistakes = page.get('common_mistakes')
+    if present(mistakes):
+        def mistake(item, index):
+            return f'<div class="border-l-4 border-rose-400 pl-6 mb-4"><p class="text-gray-300">{esc(item)}</p></div>'
+        parts.append(f'''<div class="bg-gradient-to-r from-rose-900/20 to-red-900/20 backdrop-blur-sm p-8 rounded-xl border border-rose-500/50 mb-12"><h2 class="text-3xl font-bold text-white mb-6 flex items-center">{esc(mistakes.get('title'))}</h2><div class="space-y-6"><div><h3 class="font-semibold text-rose-400 mb-4">Content Mistakes to Avoid:</h3>{each(mistakes.get('content_mistakes'), mistake)}</div><div><h3 class="font-semibold text-rose-400 mb-4">Technical Implementation Mistakes:</h3>{each(mistakes.get('technical_mistakes'), mistake)}</div></div></div>''')
+
+    measurement = page.get('measurement_analytics')
+    if present(measurement):
+        parts.append(f'''<div class="bg-gradient-to-r from-gray-900/60 to-purple-900/20 backdrop-blur-sm p-8 rounded-xl border border-purple-500/50 mb-12"><h2 class="text-3xl font-bold text-white mb-6 flex items-center">{esc(measurement.get('title'))}</h2><div class="grid grid-cols-1 md:grid-cols-2 gap-8"><div><h3 class="font-semibold text-purple-400 mb-4">Key Performance Indicators:</h3>{_bullets(measurement.get('key_metrics'))}</div><div><h3 class="font-semibold text-purple-400 mb-4">Tracking Methods:</h3>{_bullets(measurement.get('tracking_methods'))}</div></div></div>''')
+
+    cta = page.get('conclusion_cta')
+    if present(cta):
+        special = ''
+        if present(cta.get('specialized_message')):
+            special = f'<div class="bg-gradient-to-r from-pink-900/30 to-purple-900/30 border border-pink-500/50 p-4 rounded-lg mb-6 inline-block"><p class="text-pink-200 font-medium">{esc(cta["specialized_message"])}</p></div>'
+        parts.append(f'''<div class="bg-gradient-to-r from-purple-900/40 via-pink-900/40 to-blue-900/40 backdrop-blur-sm p-8 rounded-xl border border-pink-500/50 text-center"><h2 class="text-3xl font-bold text-white mb-4">{esc(cta.get('title'))}</h2><p class="text-gray-200 text-lg mb-6 max-w-2xl mx-auto">{esc(cta.get('summary'))}</p>{special}<div class="mb-6"><h3 class="font-semibold text-pink-400 mb-4">Key Takeaways:</h3>{_bullets(cta.get('key_takeaways'), list_class='space-y-2 text-left max-w-2xl mx-auto')}</div><div class="flex flex-col sm:flex-row justify-center gap-4"><a href="/" class="bg-gradient-to-r from-pink-500 to-purple-600 text-white px-8 py-3 rounded-lg font-semibold hover:from-pink-600 hover:to-purple-700 transition-all duration-300 transform hover:scale-105">Start Your AI SEO Analysis</a><a href="/" class="bg-gray-800 text-white px-8 py-3 rounded-lg font-semibold hover:bg-gray-700 transition-all duration-300 border border-gray-600">Explore AI SEO Features</a></div></div>''')
+
+    return '<div class="max-w-4xl mx-auto">\n' + '\n'.join(part for part in parts if part) + '\n</div>'
+
+
+INDUSTRY_CONTENT_TYPES = ('guide', 'mistakes', 'checklist', 'best-practices')
+
+
+def choose_template(page):
+    """Pick the template the same way src/pages/[slug].js does"""
+    if page.get('type') == 'industry-location':
+        return location_template
+    if present(page.get('industry_name')) and present(page.get('platform_name')):
+        return industry_platform_template
+    if present(page.get('industry_name')) and page.get('content_type') in INDUSTRY_CONTENT_TYPES:
+        return industry_template
+    return pseo_template
+
+
+def render_html(page, prefetch=(), year=None):
+    """Full HTML document for one page"""
+    return layout(page, choose_template(page)(page), prefetch, year)
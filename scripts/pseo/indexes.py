@@ -0,0 +1,122 @@
+import json
+import os
+import re
+
+from . import seeds, serializer
+from .build import BUILD_DIR, STATIC_SLUGS
+
+# Secondary indexes over the generated pages.
+#
+# Every page gets an integer id (its position in the build) and each dimension
+# value maps to the sorted list of ids of the pages that have it, so "all pages
+# for law-firms" or "every page in the Northeast" is one dictionary lookup and a
+# list of k ids instead of a scan over every page file:
+#
+#   {"slugs": [slug, ...],
+#    "kinds": [kind of each page, ...],
+#    "postings": {dimension: {value: [id, ...]}}}
+#
+# Values are normalized to slugs ("Microsoft Copilot" -> "microsoft-copilot")
+# because the page families spell them differently. Region and category are not
+# stored on pages and come from the city and industry seeds.
+
+INDEX_PATH = os.path.join(BUILD_DIR, 'page-index.json')
+
+DIMENSIONS = ('kind', 'industry', 'city', 'state', 'region', 'category', 'platform', 'content_type', 'use_case')
+
+
+def slugify(value):
+    return re.sub(r'[^a-z0-9]+', '-', str(value).lower()).strip('-')
+
+
+def dimension_values(kind, page, industries, cities):
+    """{dimension: raw value} of one page; `industries`/`cities` map slugs to seeds"""
+    values = {
+        'kind': kind,
+        'industry': page.get('industry'),
+        'city': page.get('city'),
+        'state': page.get('stateCode'),
+        'platform': page.get('platform'),
+        'content_type': page.get('content_type'),
+        'use_case': page.get('use_case')
+    }
+    industry = industries.get(values['industry'])
+    if industry is not None:
+        values['category'] = industry['category']
+    city = cities.get(values['city'])
+    if city is not None:
+        values['region'] = city['region']
+    return {dimension: value for dimension, value in values.items() if value}
+
+
+def page_dimensions(kind, page, industries, cities):
+    """(dimension, slugified value) pairs of one page"""
+    return [(dimension, slugify(value)) for dimension, value in dimension_values(kind, page, industries, cities).items()]
+
+
+class PageIndex:
+    """Posting lists from dimension values to page ids"""
+
+    def __init__(self, slugs=None, kinds=None, postings=None):
+        self.slugs = slugs if slugs is not None else []
+        self.kinds = kinds if kinds is not None else []
+        self.postings = postings if postings is not None else {dimension: {} for dimension in DIMENSIONS}
+
+    def add(self, kind, page, dimensions):
+        page_id = len(self.slugs)
+        self.slugs.append(page['slug'])
+        self.kinds.append(kind)
+        for dimension, value in dimensions:
+            self.postings.setdefault(dimension, {}).setdefault(value, []).append(page_id)
+        return page_id
+
+    def ids(self, dimension, value):
+        """Sorted page ids with `dimension` == `value` (value is slugified)"""
+        return self.postings.get(dimension, {}).get(slugify(value), [])
+
+    def lookup(self, **dimensions):
+        """Slugs of the pages matching every given dimension, e.g. lookup(industry='law-firms', region='Northeast')"""
+        postings = sorted((self.ids(dimension, value) for dimension, value in dimensions.items()), key=len)
+        if not postings:
+            return list(self.slugs)
+        matches = set(postings[0])
+        for ids in postings[1:]:
+            matches.intersection_update(ids)
+        return [self.slugs[page_id] for page_id in sorted(matches)]
+
+    def values(self, dimension):
+        """{value: page count} for one dimension"""
+        return {value: len(ids) for value, ids in self.postings.get(dimension, {}).items()}
+
+    def save(self, path=INDEX_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        serializer.dump({'slugs': self.slugs, 'kinds': self.kinds, 'postings': self.postings}, path, pretty=False)
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data['slugs'], data['kinds'], data['postings'])
+
+
+class IndexStage:
+    """Build stage writing the page index"""
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        self.index = PageIndex()
+        self.seen = set(STATIC_SLUGS)
+        self.industries = {industry['slug']: industry for industry in seeds.load('industries')}
+        self.cities = {city['slug']: city for city in seeds.load('cities')}
+
+    def add(self, kind, page):
+        if page['slug'] in self.seen:
+            return
+        self.seen.add(page['slug'])
+        self.index.add(kind, page, page_dimensions(kind, page, self.industries, self.cities))
+
+    def finish(self):
+        self.index.save(self.path)
+        postings = self.index.postings
+        counts = ', '.join(f"{len(postings[dimension])} {dimension}" for dimension in DIMENSIONS if postings.get(dimension))
+        return f"index: {len(self.index.slugs):,} pages, {os.path.getsize(self.path) / 1024:.0f} KB ({counts})"
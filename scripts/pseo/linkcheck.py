@@ -0,0 +1,122 @@
+import os
+
+from . import serializer
+from .build import BUILD_DIR, ROOT_DIR
+from .payloads import PAYLOAD_DIR
+from .pages import LINK_FIELDS
+
+# Internal link integrity check.
+#
+# Every internal link on every page has to point at a route the site serves:
+#
+#   - a hand-written page under src/pages (index.js is /)
+#   - a generated page [slug].js can load: industry, technical and use case
+#     pages from their family files, every other kind from its split payload
+#     (public/pseo-data/critical/<slug>.json, see pseo.payloads)
+#
+# Links are checked as pages stream past; targets that don't resolve yet are
+# kept with a count and a few example sources until all routes are known. Any
+# target still unresolved at the end fails the build with BrokenLinkError and
+# is listed in build/broken-links.json. Only routes and unresolved targets are
+# held, so 500k pages check in one pass in seconds.
+
+BROKEN_LINKS_PATH = os.path.join(BUILD_DIR, 'broken-links.json')
+PAGES_DIR = os.path.join(ROOT_DIR, 'src', 'pages')
+
+# Kinds [slug].js reads from their family files (industry-pages.json, ...)
+FILE_KINDS = ('industry', 'technical', 'usecase')
+# Example source pages kept per broken target
+EXAMPLES = 3
+
+
+class BrokenLinkError(Exception):
+    pass
+
+
+def static_routes(pages_dir=PAGES_DIR):
+    """URL paths of the hand-written pages under src/pages (no API or dynamic routes)"""
+    return set(static_sources(pages_dir))
+
+
+def static_sources(pages_dir=PAGES_DIR):
+    """{URL path: source file} of the hand-written pages under src/pages"""
+    routes = {}
+    for directory, subdirectories, filenames in os.walk(pages_dir):
+        subdirectories[:] = [name for name in subdirectories if name != 'api' and '[' not in name]
+        for filename in filenames:
+            name, extension = os.path.splitext(filename)
+            if extension not in ('.js', '.jsx', '.ts', '.tsx') or name.startswith('_') or '[' in name:
+                continue
+            relative = os.path.relpath(os.path.join(directory, name), pages_dir).replace(os.sep, '/')
+            if relative == 'index' or relative.endswith('/index'):
+                relative = relative[:-len('index')].rstrip('/')
+            routes[f"/{relative}"] = os.path.join(directory, filename)
+    return routes
+
+
+def link_target(url):
+    """The route an internal link points at, without query, fragment or trailing slash"""
+    for separator in ('#', '?'):
+        url = url.split(separator, 1)[0]
+    return url.rstrip('/') or '/'
+
+
+class LinkCheckStage:
+    """Build stage verifying every internal link resolves to a served route"""
+
+    def __init__(self, path=BROKEN_LINKS_PATH, pages_dir=PAGES_DIR, payload_dir=PAYLOAD_DIR, file_kinds=FILE_KINDS):
+        self.path = path
+        self.payload_dir = payload_dir
+        self.file_kinds = file_kinds
+        self.routes = static_routes(pages_dir)
+        # Generated slugs [slug].js can only load from a payload file
+        self.payload_slugs = set()
+        # target -> [link count, example source slugs]
+        self.pending = {}
+        self.links = 0
+
+    def add(self, kind, page):
+        slug = page['slug']
+        route = f"/{slug}"
+        if kind in self.file_kinds:
+            self.routes.add(route)
+            self.pending.pop(route, None)
+        else:
+            self.payload_slugs.add(slug)
+
+        for field in LINK_FIELDS:
+            for link in page.get(field) or ():
+                url = link['url']
+                if not url.startswith('/'):
+                    continue
+                self.links += 1
+                target = link_target(url)
+                if target in self.routes:
+                    continue
+                entry = self.pending.get(target)
+                if entry is None:
+                    entry = self.pending[target] = [0, []]
+                entry[0] += 1
+                if len(entry[1]) < EXAMPLES:
+                    entry[1].append(slug)
+
+    def finish(self):
+        # Payloads actually on disk (written earlier in this build by the payloads stage)
+        critical_dir = os.path.join(self.payload_dir, 'critical')
+        written = {filename[:-len('.json')] for filename in os.listdir(critical_dir)} if os.path.isdir(critical_dir) else set()
+        self.routes.update(f"/{slug}" for slug in self.payload_slugs & written)
+
+        broken = {target: entry for target, entry in self.pending.items() if target not in self.routes}
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        serializer.dump({
+            target: {'links': count, 'from': examples}
+            for target, (count, examples) in sorted(broken.items(), key=lambda item: (-item[1][0], item[0]))
+        }, self.path)
+
+        if broken:
+            lines = [f"{target} ({count:,} links, e.g. from /{examples[0]})" for target, (count, examples) in sorted(broken.items())]
+            raise BrokenLinkError(
+                f"{len(broken):,} broken internal link target(s), see {self.path}:\n    " + "\n    ".join(lines[:50])
+                + (f"\n    ... and {len(lines) - 50:,} more" if len(lines) > 50 else '')
+            )
+        return f"links: {self.links:,} internal links to {len(self.routes):,} routes, none broken"
@@ -0,0 +1,251 @@
+import os
+import re
+from array import array
+
+from . import serializer, similarity
+from .build import BUILD_DIR, ROOT_DIR, STATIC_SLUGS
+from .linkcheck import PAGES_DIR, link_target, static_sources
+from .prefetch import outbound_urls
+
+# Internal link graph analysis.
+#
+# The site's internal links become one sparse adjacency matrix:
+#
+#   - every generated page's outbound links (internalLinks, related_industries,
+#     related_pages)
+#   - the literal links of every hand-written page under src/pages (href="/..."
+#     and url: / link: fields of their link lists)
+#   - the hub pages' listings built from seed or page data (HUBS)
+#
+# and the stage computes:
+#
+#   PageRank    - power iteration with damping DAMPING, dangling pages spread evenly
+#   in-degree   - inbound internal links
+#   orphans     - generated pages nobody links to
+#   click depth - fewest clicks from the home page or a Layout nav link, which
+#                 every page shows (None when unreachable)
+#
+# Per-page results go to build/link-graph.json as {slug: {pageRank, inDegree,
+# clickDepth}} and a summary (orphans, top pages, and per kind the click depth
+# histogram and the depth from the hubs, as if the nav linked them) to
+# build/link-graph-report.json. The summary also lists the findings behind
+# unreachable pages: page kinds none of whose pages can be reached, and hubs
+# that no reachable page links to. Edges are buffered in flat int arrays, so
+# millions of them cost a few bytes each. Needs numpy and scipy.
+
+GRAPH_PATH = os.path.join(BUILD_DIR, 'link-graph.json')
+REPORT_PATH = os.path.join(BUILD_DIR, 'link-graph-report.json')
+
+DAMPING = 0.85
+TOLERANCE = 1e-10
+MAX_ITERATIONS = 200
+TOP_PAGES = 50
+
+LAYOUT_PATH = os.path.join(ROOT_DIR, 'src', 'components', 'Layout.js')
+# Literal internal links in JSX: href="/...", href={'/...'} and url: / link: / href: fields
+# (template literals are built from data, see HUBS)
+LITERAL_LINK = re.compile(r"""(?:\bhref=\{?|\b(?:url|link|href)\s*:\s*)["'`](/[^"'`$]*)["'`]""")
+
+# Hand-written hub pages listing generated pages from seed or page data:
+# hub -> (page kind, {page field: value} filters, first N matching pages in build order or None)
+HUBS = {
+    # Every industry x content type (industries-ai-seo.json)
+    '/ai-seo-by-industry': ('industry', {}, None),
+    # The first 50 entries of industry-pages.json
+    '/ai-seo-guides': ('industry', {}, 50),
+    # Law firms on every platform (platforms-ai-seo.json)
+    '/ai-seo-platforms': ('industry-platform', {'industry': 'law-firms'}, None)
+}
+
+
+def literal_links(path):
+    """Internal link targets written out literally in a JSX source file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [link_target(url) for url in LITERAL_LINK.findall(f.read())]
+
+
+def pagerank(matrix, damping=DAMPING, tolerance=TOLERANCE, max_iterations=MAX_ITERATIONS):
+    """(scores summing to 1, iterations) for a sparse adjacency matrix with A[i, j] = 1 for a link i -> j"""
+    import numpy as np
+    from scipy import sparse
+
+    n = matrix.shape[0]
+    out_degree = np.asarray(matrix.sum(axis=1)).ravel()
+    dangling = out_degree == 0
+    inverse = np.divide(1.0, out_degree, out=np.zeros(n), where=~dangling)
+    # Column-stochastic transition matrix, so one step is a single sparse mat-vec
+    transition = (sparse.diags(inverse) @ matrix).T.tocsr()
+
+    scores = np.full(n, 1.0 / n)
+    for iteration in range(1, max_iterations + 1):
+        updated = damping * (transition @ scores + scores[dangling].sum() / n) + (1 - damping) / n
+        delta = np.abs(updated - scores).sum()
+        scores = updated
+        if delta < tolerance:
+            break
+    return scores, iteration
+
+
+def _histogram(counts):
+    """{clicks: pages} in depth order, with unreachable pages (None) last under 'unreachable'"""
+    histogram = {str(clicks): counts[clicks] for clicks in sorted(clicks for clicks in counts if clicks is not None)}
+    if None in counts:
+        histogram['unreachable'] = counts[None]
+    return histogram
+
+
+class LinkGraphStage:
+    """Build stage computing PageRank, in-degree, orphans and click depth over the internal link graph"""
+
+    def __init__(self, path=GRAPH_PATH, report_path=REPORT_PATH, hubs=HUBS, pages_dir=PAGES_DIR, layout_path=LAYOUT_PATH):
+        self.path = path
+        self.report_path = report_path
+        self.hubs = hubs
+        # hub -> pages listed so far
+        self.listed = dict.fromkeys(hubs, 0)
+        # url -> node id; generated pages, hand-written pages and link targets
+        self.nodes = {}
+        self.sources = array('q')
+        self.targets = array('q')
+        # Node ids and kinds of generated pages, in build order
+        self.pages = array('q')
+        self.kinds = []
+        self.seen = set(STATIC_SLUGS)
+
+        # Hand-written pages and their literal links
+        self.static = static_sources(pages_dir)
+        for route, source in sorted(self.static.items()):
+            node = self._node(route)
+            for url in literal_links(source):
+                self._link(node, url)
+        # The Layout's header and footer are on every page, so its links are entry points like the home page
+        self.roots = ['/'] + sorted({url for url in literal_links(layout_path) if url in self.static and url != '/'})
+        for url in self.roots:
+            self._node(url)
+        for hub in hubs:
+            self._node(hub)
+
+    def _link(self, source, url):
+        self.sources.append(source)
+        self.targets.append(self._node(url))
+
+    def _node(self, url):
+        node = self.nodes.get(url)
+        if node is None:
+            node = self.nodes[url] = len(self.nodes)
+        return node
+
+    def add(self, kind, page):
+        slug = page['slug']
+        if slug in self.seen:
+            return
+        self.seen.add(slug)
+
+        node = self._node(f"/{slug}")
+        self.pages.append(node)
+        self.kinds.append(kind)
+        for url in outbound_urls(page):
+            self._link(node, url)
+        for hub, (hub_kind, filters, limit) in self.hubs.items():
+            if kind != hub_kind or (limit is not None and self.listed[hub] >= limit):
+                continue
+            if all(page.get(field) == value for field, value in filters.items()):
+                self.listed[hub] += 1
+                self._link(self.nodes[hub], f"/{slug}")
+
+    def finish(self):
+        if not similarity.available():
+            return "link graph: skipped (needs numpy and scipy)"
+        import numpy as np
+        from scipy import sparse
+        from scipy.sparse.csgraph import dijkstra
+
+        n = len(self.nodes)
+        sources = np.frombuffer(self.sources, dtype=np.int64)
+        targets = np.frombuffer(self.targets, dtype=np.int64)
+        matrix = sparse.csr_matrix((np.ones(len(sources), dtype=np.float64), (sources, targets)), shape=(n, n))
+        # Repeated links between two pages count once
+        matrix.data[:] = 1.0
+
+        scores, iterations = pagerank(matrix)
+        in_degree = np.diff(matrix.tocsc().indptr)
+        roots = [self.nodes[url] for url in self.roots]
+        depth = dijkstra(matrix, directed=True, indices=roots, unweighted=True, min_only=True)
+        # As if every hub were linked from the nav: the depth the hubs' own structure gives
+        hub_depth = dijkstra(matrix, directed=True, indices=[self.nodes[hub] for hub in self.hubs], unweighted=True, min_only=True)
+
+        urls = list(self.nodes)
+        pages = np.frombuffer(self.pages, dtype=np.int64)
+        # Scaled so the average page scores 1
+        scaled = scores * n
+        graph = {}
+        histogram = {}
+        # kind -> {pages, unreachable, clickDepth histogram, hubDepth histogram}
+        kinds = {}
+        unreachable = 0
+        for node, kind in zip(pages.tolist(), self.kinds):
+            reachable = np.isfinite(depth[node])
+            clicks = int(depth[node]) if reachable else None
+            graph[urls[node][1:]] = {
+                'pageRank': round(float(scaled[node]), 4),
+                'inDegree': int(in_degree[node]),
+                'clickDepth': clicks
+            }
+            summary = kinds.setdefault(kind, {'pages': 0, 'unreachable': 0, 'clickDepth': {}, 'hubDepth': {}})
+            summary['pages'] += 1
+            if reachable:
+                histogram[clicks] = histogram.get(clicks, 0) + 1
+                summary['clickDepth'][clicks] = summary['clickDepth'].get(clicks, 0) + 1
+            else:
+                unreachable += 1
+                summary['unreachable'] += 1
+            from_hubs = int(hub_depth[node]) if np.isfinite(hub_depth[node]) else None
+            summary['hubDepth'][from_hubs] = summary['hubDepth'].get(from_hubs, 0) + 1
+
+        # Findings: families no visitor can click through to, and hubs nothing reachable links to
+        unreachable_kinds = sorted(kind for kind, summary in kinds.items() if summary['unreachable'] == summary['pages'])
+        unlinked_hubs = sorted(hub for hub in self.hubs if not np.isfinite(depth[self.nodes[hub]]))
+        unreachable_static = sorted(route for route in self.static if not np.isfinite(depth[self.nodes[route]]))
+
+        orphans = [urls[node][1:] for node in pages.tolist() if in_degree[node] == 0]
+        top = pages[np.argsort(-scores[pages], kind='stable')[:TOP_PAGES]]
+        # Link targets that are neither generated nor hand-written pages
+        unknown = sorted(url for url, node in self.nodes.items() if in_degree[node] and url not in self.static and url[1:] not in self.seen)
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        serializer.dump(graph, self.path, pretty=False)
+        serializer.dump({
+            'pages': len(pages),
+            'edges': int(matrix.nnz),
+            'iterations': iterations,
+            'orphans': orphans,
+            'roots': self.roots,
+            'unreachable': unreachable,
+            'clickDepth': {str(clicks): count for clicks, count in sorted(histogram.items())},
+            'kinds': {
+                kind: {
+                    'pages': summary['pages'],
+                    'unreachable': summary['unreachable'],
+                    'clickDepth': _histogram(summary['clickDepth']),
+                    'hubDepth': _histogram(summary['hubDepth'])
+                }
+                for kind, summary in sorted(kinds.items())
+            },
+            'unreachableKinds': unreachable_kinds,
+            'unlinkedHubs': unlinked_hubs,
+            'unreachableStaticPages': unreachable_static,
+            'topPages': [{'slug': urls[node][1:], 'pageRank': round(float(scaled[node]), 4)} for node in top.tolist()],
+            'unknownTargets': unknown
+        }, self.report_path)
+
+        report = (
+            f"link graph: {len(pages):,} pages, {matrix.nnz:,} links, PageRank in {iterations} iterations, "
+            f"{len(orphans):,} orphans, {unreachable:,} unreachable from the home page and nav"
+        )
+        if histogram:
+            report += f", max click depth {max(histogram)}"
+        if unreachable_kinds:
+            report += f"; no path to any {', '.join(unreachable_kinds)} page"
+        if unlinked_hubs:
+            report += f"; hubs nothing reachable links to: {', '.join(unlinked_hubs)}"
+        return report
@@ -0,0 +1,128 @@
+import os
+import re
+import shutil
+
+from . import seeds, serializer
+from .build import PUBLIC_DIR, STATIC_SLUGS
+from .indexes import dimension_values, slugify
+
+# Paginated hub listings.
+#
+# Hub pages link to generated pages through fixed-size, pre-sorted listing
+# files, so rendering any hub view reads one small file however large the
+# corpus gets:
+#
+#   public/pseo-data/listings/index.json                 counts for every listing
+#   public/pseo-data/listings/<listing>/<value>/<n>.json page n (1-based)
+#
+# Listings by category, city and platform are sorted by title; the search-volume
+# listing ranks every page by the monthly search volume behind it.
+
+LISTINGS_DIR = os.path.join(PUBLIC_DIR, 'pseo-data', 'listings')
+PAGE_SIZE = 24
+
+# Listing name -> page dimension it groups by (None: one listing of every page)
+LISTINGS = {
+    'category': 'category',
+    'city': 'city',
+    'platform': 'platform',
+    'search-volume': None
+}
+
+# Page fields holding a display name for a dimension value
+LABEL_FIELDS = {
+    'city': 'cityName',
+    'platform': 'platform_name'
+}
+
+
+def parse_count(value):
+    """Page counts may be strings like "850,000" or "240,000+"; non-numbers count as 0
+    (seed stats come parsed in record['values'], see pseo.seedstats)"""
+    if isinstance(value, (int, float)):
+        return int(value)
+    digits = re.sub(r'[^0-9]', '', str(value or ''))
+    return int(digits) if digits else 0
+
+
+def search_volume(page, cities):
+    """Monthly searches behind a page: its own keyword volume, or its city's local search volume"""
+    if page.get('search_volume') is not None:
+        return parse_count(page['search_volume'])
+    city = cities.get(page.get('city'))
+    if city is not None:
+        return city['values']['local_search_volume'] or 0
+    return 0
+
+
+class ListingStage:
+    """Build stage writing the paginated hub listings"""
+
+    def __init__(self, out_dir=LISTINGS_DIR, page_size=PAGE_SIZE):
+        self.out_dir = out_dir
+        self.page_size = page_size
+        self.industries = {industry['slug']: industry for industry in seeds.load('industries')}
+        self.cities = {city['slug']: city for city in seeds.load('cities')}
+        # listing -> value slug -> [label, [(sort key, item), ...]]
+        self.groups = {listing: {} for listing in LISTINGS}
+        self.seen = set(STATIC_SLUGS)
+
+    def add(self, kind, page):
+        slug = page['slug']
+        if slug in self.seen:
+            return
+        self.seen.add(slug)
+
+        title = page.get('h1') or page['title']
+        item = {'slug': slug, 'title': title, 'kind': kind, 'description': page.get('metaDescription') or page.get('meta_description')}
+        values = dimension_values(kind, page, self.industries, self.cities)
+        for listing, dimension in LISTINGS.items():
+            if dimension is None:
+                volume = search_volume(page, self.cities)
+                self._group(listing, 'all', 'All pages').append(((-volume, title), dict(item, searchVolume=volume)))
+            elif dimension in values:
+                value = values[dimension]
+                label = page.get(LABEL_FIELDS[dimension]) if dimension in LABEL_FIELDS else None
+                label = label or value
+                self._group(listing, slugify(value), label).append(((title,), item))
+
+    def _group(self, listing, value, label):
+        group = self.groups[listing].get(value)
+        if group is None:
+            group = self.groups[listing][value] = [label, []]
+        return group[1]
+
+    def finish(self):
+        # Rewritten from scratch so values that disappeared leave no stale pages
+        if os.path.isdir(self.out_dir):
+            shutil.rmtree(self.out_dir)
+
+        index = {}
+        files = 0
+        for listing, groups in self.groups.items():
+            index[listing] = {}
+            for value, (label, entries) in sorted(groups.items()):
+                entries.sort(key=lambda entry: entry[0])
+                items = [item for _, item in entries]
+                pages = max(1, -(-len(items) // self.page_size))
+                index[listing][value] = {'label': label, 'total': len(items), 'pages': pages}
+
+                value_dir = os.path.join(self.out_dir, listing, value)
+                os.makedirs(value_dir, exist_ok=True)
+                for number in range(1, pages + 1):
+                    start = (number - 1) * self.page_size
+                    serializer.dump({
+                        'listing': listing,
+                        'value': value,
+                        'label': label,
+                        'page': number,
+                        'pages': pages,
+                        'total': len(items),
+                        'pageSize': self.page_size,
+                        'items': items[start:start + self.page_size]
+                    }, os.path.join(value_dir, f"{number}.json"), pretty=False)
+                    files += 1
+
+        serializer.dump({'pageSize': self.page_size, 'listings': index}, os.path.join(self.out_dir, 'index.json'), pretty=False)
+        counts = ', '.join(f"{len(groups)} {listing}" for listing, groups in index.items())
+        return f"listings: {files:,} listing pages of {self.page_size} ({counts})"
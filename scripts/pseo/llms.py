@@ -0,0 +1,153 @@
+import glob
+import os
+
+from .build import PUBLIC_DIR, SITE_URL, STATIC_SLUGS
+from .markdown import to_text
+
+# llms.txt and llms-full.txt (https://llmstxt.org) for the generated pages.
+#
+# llms.txt lists every page as a markdown link with its meta description, under
+# one section per page family. llms-full.txt adds each page's introduction.
+# Both are written while the pages stream past, one entry at a time. A file
+# that outgrows MAX_PART_BYTES continues in numbered parts (llms-full-2.txt,
+# ...) and the top-level file becomes an index linking to them, so neither the
+# corpus nor a whole file is ever held in memory.
+
+MAX_PART_BYTES = 5 * 1024 * 1024
+
+SITE_NAME = 'AISEOScan'
+SITE_SUMMARY = (
+    "AI SEO scanner and guides for ranking in ChatGPT, Perplexity, Claude, Gemini, "
+    "Copilot and SearchGPT answers: schema markup, content quality, technical SEO and trust signals."
+)
+
+KIND_TITLES = {
+    'industry': 'AI SEO guides by industry',
+    'industry-platform': 'AI SEO guides by industry and website platform',
+    'location': 'AI SEO guides by industry and city',
+    'technical': 'Schema markup and technical guides',
+    'usecase': 'AI SEO use cases',
+    'guide': 'AI SEO guides by AI platform'
+}
+
+
+def intro_text(page):
+    """A page's introduction as plain text, whichever template it uses"""
+    if page.get('content') is not None:
+        return to_text(page['content']['intro'])
+    introduction = page.get('introduction') or {}
+    if introduction.get('paragraphs'):
+        return '\n\n'.join(introduction['paragraphs'])
+    return introduction.get('opening_paragraph') or ''
+
+
+class TextParts:
+    """A text file written in size-bounded parts: <name>.txt, or <name>-1.txt, <name>-2.txt, ..."""
+
+    def __init__(self, directory, name, header, max_bytes=MAX_PART_BYTES):
+        self.directory = directory
+        self.name = name
+        self.header = header
+        self.max_bytes = max_bytes
+        self.parts = 0
+        self.file = None
+        self.size = 0
+        # Repeated at the top of a new part so it reads on its own
+        self.section = ''
+
+    def _path(self, number):
+        return os.path.join(self.directory, f"{self.name}-{number}.txt")
+
+    def _open(self):
+        if self.file is not None:
+            self.file.close()
+        self.parts += 1
+        self.file = open(self._path(self.parts), 'w', encoding='utf-8')
+        self.size = 0
+        self._write(self.header + (f"\n## {self.section}\n\n" if self.section else ''))
+
+    def _write(self, text):
+        self.file.write(text)
+        self.size += len(text.encode('utf-8'))
+
+    def start_section(self, title):
+        self.section = ''
+        self.write(f"\n## {title}\n\n")
+        self.section = title
+
+    def write(self, text):
+        if self.file is None:
+            self._open()
+        elif self.size + len(text.encode('utf-8')) > self.max_bytes:
+            self._open()
+        self._write(text)
+
+    def close(self, site_url):
+        """Finish the last part; with one part rename it to <name>.txt, otherwise write an index there"""
+        if self.file is None:
+            self._open()
+        self.file.close()
+
+        target = os.path.join(self.directory, f"{self.name}.txt")
+        if self.parts == 1:
+            os.replace(self._path(1), target)
+        else:
+            with open(target, 'w', encoding='utf-8') as f:
+                f.write(self.header)
+                f.write("\n## Parts\n\n")
+                for number in range(1, self.parts + 1):
+                    f.write(f"- [{self.name} part {number}]({site_url}/{self.name}-{number}.txt)\n")
+
+        # Parts left over from a larger previous build
+        current = {os.path.basename(self._path(number)) for number in range(1, self.parts + 1)} if self.parts > 1 else set()
+        for path in glob.glob(os.path.join(self.directory, f"{self.name}-[0-9]*.txt")):
+            if os.path.basename(path) not in current:
+                os.remove(path)
+        return self.parts
+
+
+class LlmsTxtStage:
+    """Build stage streaming llms.txt and llms-full.txt"""
+
+    def __init__(self, public_dir=PUBLIC_DIR, site_url=SITE_URL, max_bytes=MAX_PART_BYTES):
+        self.site_url = site_url
+        self.public_dir = public_dir
+        header = f"# {SITE_NAME}\n\n> {SITE_SUMMARY}\n"
+        os.makedirs(public_dir, exist_ok=True)
+        self.index = TextParts(public_dir, 'llms', header, max_bytes)
+        self.full = TextParts(public_dir, 'llms-full', header, max_bytes)
+        self.kind = None
+        # Slugs of hand-written pages are served by those pages, not the generated ones
+        self.seen = set(STATIC_SLUGS)
+        self.pages = 0
+
+    def add(self, kind, page):
+        slug = page['slug']
+        if slug in self.seen:
+            return
+        self.seen.add(slug)
+
+        if kind != self.kind:
+            self.kind = kind
+            title = KIND_TITLES.get(kind, kind)
+            self.index.start_section(title)
+            self.full.start_section(title)
+
+        url = f"{self.site_url}/{slug}"
+        title = page['title']
+        description = page.get('metaDescription') or page.get('meta_description') or ''
+        self.index.write(f"- [{title}]({url}): {description}\n")
+
+        entry = f"### {title}\n\nURL: {url}\n\n"
+        if description:
+            entry += f"> {description}\n\n"
+        intro = intro_text(page).strip()
+        if intro:
+            entry += f"{intro}\n\n"
+        self.full.write(entry)
+        self.pages += 1
+
+    def finish(self):
+        index_parts = self.index.close(self.site_url)
+        full_parts = self.full.close(self.site_url)
+        return f"llms.txt: {self.pages:,} pages, llms.txt in {index_parts} part(s), llms-full.txt in {full_parts} part(s)"
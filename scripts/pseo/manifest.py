@@ -0,0 +1,75 @@
+import glob
+import json
+import os
+
+from . import serializer
+from .build import BUILD_DIR, PUBLIC_DIR, STATIC_SLUGS
+from .export import EXPORT_DIR
+from .hashing import content_hash, etag, file_hash
+from .payloads import PAYLOAD_DIR
+
+# Content manifest: a stable hash for every page and build output.
+#
+#   {"pages": {slug: etag},
+#    "files": {url path: etag},
+#    "build": {build file name: etag}}
+#
+# Page ETags come from the page's content hash, so regenerating an unchanged page
+# keeps its ETag. Files are keyed by the URL path they are served at: public/
+# (sitemaps, llms.txt, page payloads, listings) and the static HTML export in out/. A
+# serving layer can answer If-None-Match with a 304, and ISR pages only need
+# revalidating when their page ETag changed. This stage hashes the files other
+# stages wrote, so it finishes last.
+
+MANIFEST_PATH = os.path.join(BUILD_DIR, 'content-manifest.json')
+
+# (directory, glob, URL prefix) of served build outputs
+SERVED_FILES = (
+    (PUBLIC_DIR, 'sitemap*.xml*', '/'),
+    (PUBLIC_DIR, 'llms*.txt', '/'),
+    (PAYLOAD_DIR, '**/*.json', '/pseo-data/'),
+    (EXPORT_DIR, '**/index.html', '/')
+)
+
+
+def _url(prefix, relative):
+    url = prefix + relative.replace(os.sep, '/')
+    # out/<slug>/index.html is served at /<slug>
+    if url.endswith('/index.html'):
+        url = url[:-len('/index.html')] or '/'
+    return url
+
+
+class ManifestStage:
+    """Build stage writing the slug -> ETag manifest and hashing every build output"""
+
+    def __init__(self, path=MANIFEST_PATH, served_files=SERVED_FILES, build_dir=BUILD_DIR):
+        self.path = path
+        self.served_files = served_files
+        self.build_dir = build_dir
+        self.pages = {}
+        self.previous = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.previous = json.load(f)['pages']
+
+    def add(self, kind, page):
+        if page['slug'] in STATIC_SLUGS:
+            return
+        self.pages.setdefault(page['slug'], etag(content_hash(page)))
+
+    def finish(self):
+        files = {}
+        for directory, pattern, prefix in self.served_files:
+            for path in sorted(glob.glob(os.path.join(directory, pattern), recursive=True)):
+                files[_url(prefix, os.path.relpath(path, directory))] = etag(file_hash(path))
+
+        build = {}
+        for path in sorted(glob.glob(os.path.join(self.build_dir, '*.json'))):
+            if os.path.abspath(path) != os.path.abspath(self.path):
+                build[os.path.basename(path)] = etag(file_hash(path))
+
+        changed = sum(1 for slug, tag in self.pages.items() if self.previous.get(slug) != tag)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        serializer.dump({'pages': self.pages, 'files': files, 'build': build}, self.path, pretty=False)
+        return f"manifest: {len(self.pages):,} page ETags ({changed:,} changed), {len(files) + len(build):,} files hashed"
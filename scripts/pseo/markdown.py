@@ -0,0 +1,129 @@
+import re
+
+# Markdown sections parsed into compact block trees at build time.
+#
+# The location generators write their sections as markdown. Parsing it once per
+# build means the templates only walk a ready-made tree. Blocks are short lists
+# tagged by their first element:
+#
+#   ['h2', inline]            heading (h2, h3, ...)
+#   ['p', inline]             paragraph
+#   ['ul', [inline, ...]]     bullet list
+#   ['ol', [inline, ...]]     numbered list
+#   ['qa', inline, inline]    FAQ pair from "**Q: ...**" followed by "A: ..."
+#
+# `inline` is a plain string, or a list of strings and ['b', text] bold spans
+# when the text has formatting. Only the markdown the generators produce is
+# understood: ATX headings, "-" and "1." lists, **bold** and blank-line breaks.
+
+HEADING = re.compile(r'(#{1,6})\s+(.*)')
+BULLET = re.compile(r'[-*]\s+(.*)')
+NUMBERED = re.compile(r'\d+\.\s+(.*)')
+BOLD = re.compile(r'\*\*(.+?)\*\*')
+
+
+def inline(text):
+    """Parse **bold** spans; returns the plain string when there are none"""
+    parts = BOLD.split(text)
+    if len(parts) == 1:
+        return text
+    # split() alternates plain text and captured bold text
+    spans = []
+    for index, part in enumerate(parts):
+        if index % 2:
+            spans.append(['b', part])
+        elif part:
+            spans.append(part)
+    return spans
+
+
+def parse(text):
+    """Parse a markdown section into a list of blocks"""
+    blocks = []
+    paragraph = []
+
+    def end_paragraph():
+        if paragraph:
+            blocks.append(['p', inline(' '.join(paragraph))])
+            paragraph.clear()
+
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            end_paragraph()
+            continue
+
+        heading = HEADING.fullmatch(line)
+        item = BULLET.fullmatch(line)
+        kind = 'ul'
+        if item is None:
+            item = NUMBERED.fullmatch(line)
+            kind = 'ol'
+
+        if heading:
+            end_paragraph()
+            blocks.append([f'h{len(heading.group(1))}', inline(heading.group(2))])
+        elif item:
+            end_paragraph()
+            if not blocks or blocks[-1][0] != kind:
+                blocks.append([kind, []])
+            blocks[-1][1].append(inline(item.group(1)))
+        else:
+            paragraph.append(line)
+    end_paragraph()
+
+    return _pair_questions(blocks)
+
+
+def _pair_questions(blocks):
+    """Merge a bold "Q: ..." paragraph and the "A: ..." paragraph after it into one block"""
+    merged = []
+    for block in blocks:
+        previous = merged[-1] if merged else None
+        answer = _strip_prefix(block[1], 'A: ') if block[0] == 'p' else None
+        question = _question(previous[1]) if previous is not None and previous[0] == 'p' else None
+        if answer is not None and question is not None:
+            merged[-1] = ['qa', question, answer]
+        else:
+            merged.append(block)
+    return merged
+
+
+def _question(spans):
+    """The question of a paragraph that is a single bold "Q: ..." span, else None"""
+    if isinstance(spans, list) and len(spans) == 1 and spans[0][0] == 'b':
+        return _strip_prefix(spans[0][1], 'Q: ')
+    return None
+
+
+def _strip_prefix(value, prefix):
+    """Inline value without its leading `prefix`, or None when it doesn't start with it"""
+    if isinstance(value, str):
+        return value[len(prefix):] if value.startswith(prefix) else None
+    if value and isinstance(value[0], str) and value[0].startswith(prefix):
+        rest = value[0][len(prefix):]
+        return ([rest] if rest else []) + value[1:]
+    return None
+
+
+def text(value):
+    """Plain text of an inline value"""
+    if isinstance(value, str):
+        return value
+    return ''.join(span if isinstance(span, str) else span[1] for span in value)
+
+
+def to_text(blocks):
+    """Plain text of a block tree, one block per paragraph (markup dropped)"""
+    if isinstance(blocks, str):
+        return blocks
+    paragraphs = []
+    for block in blocks:
+        kind = block[0]
+        if kind in ('ul', 'ol'):
+            paragraphs.append('\n'.join(text(item) for item in block[1]))
+        elif kind == 'qa':
+            paragraphs.append(f"{text(block[1])}\n{text(block[2])}")
+        else:
+            paragraphs.append(text(block[1]))
+    return '\n\n'.join(paragraphs)
@@ -0,0 +1,193 @@
+import re
+
+from . import seeds
+from .records import Record
+from .text import sections
+
+# Content metrics computed while the generators stream pages to disk.
+#
+# Every section's text is tokenized into words once; sentences are the runs of
+# text between breaks (., ! or ? runs and line breaks, since list items and
+# headings rarely end in a period), and keyword phrases and syllables are
+# counted with str.count on the joined word sequence rather than word by word.
+# Page totals are sums of the section counts, so nothing is tokenized twice. Each page gets a `metrics` field:
+#
+#   {words, sentences, readability, keywordDensity, sections: {name: {...}}}
+#
+# readability is the Flesch reading ease score (syllables are estimated from
+# vowel groups) and keywordDensity the share of words, in percent, covered by
+# each target keyword. attach() stores them on a page (and fills its
+# word_count placeholder). The generators' main() functions wrap their page
+# stream in ContentMetrics, so the written files carry metrics at no extra
+# pass, and summarize the run as histograms for the generation summary files;
+# build-pseo.py attaches them only for the stages that ask (pseo.build.run).
+
+WORD = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+SENTENCE = re.compile(r"[a-z0-9][^.!?\n]*")
+
+# Syllables are counted on the text's shape: e -> e, other vowels and digits
+# (a number reads as one group) -> v, l -> l, other letters -> c. Every vowel
+# group is one syllable, except a final e after a consonant other than l
+# ("make", not "table" or "free") in a word with another vowel group ("the").
+SHAPE = str.maketrans({
+    **{letter: 'c' for letter in 'bcdfghjkmnpqrstvwxz\''},
+    **{letter: 'v' for letter in 'aiouy0123456789'},
+    'e': 'e', 'l': 'l', ' ': ' '
+})
+GROUP_STARTS = tuple(before + group for before in ' cl' for group in 've')
+SHORT_E_WORDS = (' ce ', ' cce ', ' ccce ')
+
+# The site's head term, tracked on every page
+HEAD_KEYWORD = 'ai seo'
+
+# Histogram bucket widths
+WORD_BUCKET = 250
+READABILITY_BUCKET = 10
+
+_industry_keywords = None
+
+
+def syllables(text):
+    """Estimated syllables in a lowercase, space-separated word sequence (see SHAPE)"""
+    shape = text.translate(SHAPE)
+    groups = sum(shape.count(pair) for pair in GROUP_STARTS)
+    silent = shape.count('ce ') - sum(shape.count(word) for word in SHORT_E_WORDS)
+    return groups - silent
+
+
+def flesch(words, sentences, syllable_count):
+    """Flesch reading ease (higher is easier; 60-70 is plain English)"""
+    if not words:
+        return None
+    return round(206.835 - 1.015 * words / max(sentences, 1) - 84.6 * syllable_count / words, 1)
+
+
+def page_keywords(page):
+    """Target keywords of a page: its own, else its industry's, plus the head term"""
+    global _industry_keywords
+    keywords = page.get('keywords')
+    if not keywords:
+        if _industry_keywords is None:
+            _industry_keywords = {industry['slug']: industry['keywords'] for industry in seeds.load('industries')}
+        keywords = _industry_keywords.get(page.get('industry')) or ()
+    return [HEAD_KEYWORD, *(keyword for keyword in keywords if keyword.lower() != HEAD_KEYWORD)]
+
+
+def _phrases(keywords):
+    """(keyword, " its words ") pairs for counting keyword phrases in a scanned word sequence"""
+    phrases = []
+    for keyword in keywords:
+        words = WORD.findall(keyword.lower())
+        if words:
+            phrases.append((keyword, f" {' '.join(words)} "))
+    return phrases
+
+
+def _density(hits, phrases, words):
+    return {
+        keyword: round(100 * hits.get(keyword, 0) * (phrase.count(' ') - 1) / words, 2) if words else 0.0
+        for keyword, phrase in phrases
+    }
+
+
+def scan(text, phrases):
+    """(words, sentences, syllables, {keyword: hits}) of a text, tokenized once"""
+    text = text.lower()
+    words = WORD.findall(text)
+    sentences = len(SENTENCE.findall(text))
+
+    joined = f" {' '.join(words)} "
+    syllable_count = syllables(joined)
+    hits = {}
+    for keyword, phrase in phrases:
+        count = joined.count(phrase)
+        if count:
+            hits[keyword] = count
+    return len(words), sentences, syllable_count, hits
+
+
+def page_metrics(page, keywords=None):
+    """Word, sentence, readability and keyword density metrics of a page and each of its sections"""
+    phrases = _phrases(page_keywords(page) if keywords is None else keywords)
+    totals = [0, 0, 0]
+    total_hits = {}
+    by_section = {}
+    for name, text in sections(page):
+        words, sentences, syllable_count, hits = scan(text, phrases)
+        totals[0] += words
+        totals[1] += sentences
+        totals[2] += syllable_count
+        for keyword, count in hits.items():
+            total_hits[keyword] = total_hits.get(keyword, 0) + count
+        by_section[name] = {
+            'words': words,
+            'sentences': sentences,
+            'readability': flesch(words, sentences, syllable_count),
+            'keywordDensity': _density(hits, phrases, words)
+        }
+    return {
+        'words': totals[0],
+        'sentences': totals[1],
+        'readability': flesch(*totals),
+        'keywordDensity': _density(total_hits, phrases, totals[0]),
+        'sections': by_section
+    }
+
+
+def attach(page):
+    """Compute a page's metrics and store them on it; returns the metrics"""
+    metrics = page_metrics(page)
+    if isinstance(page, Record):
+        page.metrics = metrics
+    else:
+        page['metrics'] = metrics
+        if 'word_count' in page:
+            page['word_count'] = metrics['words']
+    return metrics
+
+
+def _histogram(counts, width):
+    """{"start-end": pages} in bucket order from {bucket start: pages}"""
+    return {f"{start}-{start + width - 1}": counts[start] for start in sorted(counts)}
+
+
+class ContentMetrics:
+    """Annotates a stream of pages with their metrics and aggregates them for the summary"""
+
+    def __init__(self):
+        self.pages = 0
+        self.words = 0
+        self.word_counts = []
+        self.word_histogram = {}
+        self.readability_histogram = {}
+
+    def add(self, page):
+        # Recomputed even when the page has metrics: incremental runs re-render sections in place
+        metrics = attach(page)
+
+        self.pages += 1
+        self.words += metrics['words']
+        self.word_counts.append(metrics['words'])
+        bucket = metrics['words'] // WORD_BUCKET * WORD_BUCKET
+        self.word_histogram[bucket] = self.word_histogram.get(bucket, 0) + 1
+        if metrics['readability'] is not None:
+            bucket = int(metrics['readability'] // READABILITY_BUCKET * READABILITY_BUCKET)
+            self.readability_histogram[bucket] = self.readability_histogram.get(bucket, 0) + 1
+        return page
+
+    def annotate(self, pages):
+        """Yield `pages` with metrics attached (wrap the stream handed to serializer.dump_iter)"""
+        for page in pages:
+            yield self.add(page)
+
+    def summary(self):
+        """Totals and histograms for a generation summary file"""
+        counts = sorted(self.word_counts)
+        return {
+            'total_words': self.words,
+            'median_words': counts[len(counts) // 2] if counts else 0,
+            'min_words': counts[0] if counts else 0,
+            'max_words': counts[-1] if counts else 0,
+            'words_histogram': _histogram(self.word_histogram, WORD_BUCKET),
+            'readability_histogram': _histogram(self.readability_histogram, READABILITY_BUCKET)
+        }
@@ -0,0 +1,42 @@
+"""One entry point over every page family.
+
+    from pseo import iter_pages, render_page
+
+    for page in iter_pages('location', industry='law-firms', state='TX'):
+        ...
+    page = render_page('industry-platform', 'law-firms', 'wordpress')
+
+Content metrics are not computed here; pseo.metrics.attach() adds them, and
+the build attaches them for the stages that ask (see pseo.build.run).
+"""
+from importlib import import_module
+
+# Page kind -> module under pseo; each module provides iter_pages(**filters) and render_page(*dims)
+KINDS = {
+    'location': 'location',
+    'industry': 'industry',
+    'industry-platform': 'industry_platform',
+    'guide': 'guides',
+    'technical': 'technical',
+    'usecase': 'usecase'
+}
+
+# Page fields holding outbound internal links, across all kinds
+LINK_FIELDS = ('internalLinks', 'related_industries', 'related_pages')
+
+
+def family(kind):
+    """Return the module generating pages of `kind`"""
+    if kind not in KINDS:
+        raise KeyError(f"Unknown page kind {kind!r}, expected one of {', '.join(KINDS)}")
+    return import_module(f'.{KINDS[kind]}', __package__)
+
+
+def iter_pages(kind, **filters):
+    """Lazily yield pages of `kind`, narrowed by the family's filters"""
+    return family(kind).iter_pages(**filters)
+
+
+def render_page(kind, *dims):
+    """Render one page of `kind` from its dimension slugs"""
+    return family(kind).render_page(*dims)
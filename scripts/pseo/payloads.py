@@ -0,0 +1,199 @@
+import os
+from statistics import median
+
+from . import serializer
+from .build import BUILD_DIR, PUBLIC_DIR, STATIC_SLUGS
+from .hashing import content_hash, etag, stable_fields
+from .records import to_json
+
+# Critical / deferred page payloads.
+#
+# Each page is split in two: a critical payload with everything above the fold
+# (title, meta, hero, stats, intro, internal links) for getStaticProps, and a
+# deferred payload with the long sections further down that the client can
+# fetch after hydration. Both mirror the page's own shape, so merging the
+# deferred payload back into the critical one rebuilds the full page.
+#
+#   public/pseo-data/critical/<slug>.json
+#   public/pseo-data/deferred/<slug>.json
+#
+# Generation timestamps are left out so unchanged pages keep byte-identical
+# payloads; the critical payload carries the page's ETag instead (see
+# pseo.manifest). Per-page sizes go to build/payload-sizes.json, measured
+# against Next's large-page-data warning threshold.
+
+PAYLOAD_DIR = os.path.join(PUBLIC_DIR, 'pseo-data')
+PAYLOAD_URL = '/pseo-data'
+
+# Next.js warns when a page's data is larger than this (largePageDataBytes)
+LARGE_PAGE_DATA_BYTES = 128 * 1000
+
+# Below-the-fold fields per page kind, as key paths into the page
+PSEO_TEMPLATE_SECTIONS = (
+    ('main_sections',),
+    ('technical_implementation',),
+    ('best_practices',),
+    ('common_mistakes',),
+    ('measurement_analytics',),
+    ('conclusion_cta',)
+)
+
+DEFERRED = {
+    'location': tuple(('content', name) for name in (
+        'whyAISEOMatters',
+        'localChallenges',
+        'aiSEOStrategy',
+        'measurementROI',
+        'implementation',
+        'localCaseStudy',
+        'competitiveAdvantage',
+        'ctaSection',
+        'faq',
+        'finalCTA'
+    )),
+    'industry': tuple((name,) for name in (
+        'main_content',
+        'challenges',
+        'solutions',
+        'mistakes',
+        'checklist',
+        'best_practices',
+        'code_examples',
+        'measurement',
+        'faq',
+        'conclusion'
+    )),
+    'industry-platform': tuple((name,) for name in (
+        'platform_overview',
+        'technical_setup',
+        'schema_implementation',
+        'plugins_tools',
+        'optimization_steps',
+        'common_issues',
+        'code_examples',
+        'performance',
+        'conclusion'
+    )),
+    'technical': PSEO_TEMPLATE_SECTIONS,
+    'usecase': PSEO_TEMPLATE_SECTIONS,
+    'guide': PSEO_TEMPLATE_SECTIONS
+}
+
+
+def split_page(page, paths):
+    """Split a page dict into (critical, deferred) along the given key paths.
+
+    Only the dicts on a path are copied; everything else is shared with `page`.
+    """
+    critical = dict(page)
+    deferred = {}
+    for path in paths:
+        source, target = critical, deferred
+        for key in path[:-1]:
+            if key not in source:
+                break
+            nested = dict(source[key])
+            source[key] = nested
+            source = nested
+            target = target.setdefault(key, {})
+        else:
+            if path[-1] in source:
+                target[path[-1]] = source.pop(path[-1])
+    return critical, deferred
+
+
+def merge_page(critical, deferred):
+    """Inverse of split_page"""
+    page = dict(critical)
+    for key, value in deferred.items():
+        if isinstance(value, dict) and isinstance(page.get(key), dict):
+            page[key] = merge_page(page[key], value)
+        else:
+            page[key] = value
+    return page
+
+
+def _summary(sizes):
+    return {
+        'pages': len(sizes),
+        'median': int(median(sizes)),
+        'max': max(sizes),
+        'total': sum(sizes)
+    }
+
+
+class PayloadStage:
+    """Build stage writing split critical/deferred payloads with a size report"""
+
+    # Payloads ship whole pages, metrics included, like the generators' files
+    needs_metrics = True
+
+    def __init__(self, out_dir=PAYLOAD_DIR, url=PAYLOAD_URL, report_path=None, threshold=LARGE_PAGE_DATA_BYTES):
+        self.out_dir = out_dir
+        self.url = url
+        self.report_path = report_path or os.path.join(BUILD_DIR, 'payload-sizes.json')
+        self.threshold = threshold
+        # slug -> [kind, full size, critical size, deferred size]
+        self.sizes = {}
+        for part in ('critical', 'deferred'):
+            os.makedirs(os.path.join(out_dir, part), exist_ok=True)
+
+    def add(self, kind, page):
+        slug = page['slug']
+        if slug in self.sizes or slug in STATIC_SLUGS:
+            return
+        page = stable_fields(to_json(page))
+        critical, deferred = split_page(page, DEFERRED.get(kind, ()))
+        critical['deferredUrl'] = f"{self.url}/deferred/{slug}.json" if deferred else None
+        critical['etag'] = etag(content_hash(page))
+
+        critical_bytes = self._write('critical', slug, critical)
+        deferred_bytes = self._write('deferred', slug, deferred) if deferred else 0
+        full_bytes = len(serializer.dumps(page, pretty=False))
+        self.sizes[slug] = [kind, full_bytes, critical_bytes, deferred_bytes]
+
+    def _write(self, part, slug, payload):
+        data = serializer.dumps(payload, pretty=False)
+        with open(os.path.join(self.out_dir, part, f"{slug}.json"), 'wb') as f:
+            f.write(data)
+        return len(data)
+
+    def finish(self):
+        # Payloads of pages that are no longer generated
+        for part in ('critical', 'deferred'):
+            part_dir = os.path.join(self.out_dir, part)
+            for filename in os.listdir(part_dir):
+                slug = filename[:-len('.json')]
+                if slug not in self.sizes or (part == 'deferred' and not self.sizes[slug][3]):
+                    os.remove(os.path.join(part_dir, filename))
+
+        kinds = {}
+        for kind, full_bytes, critical_bytes, deferred_bytes in self.sizes.values():
+            sizes = kinds.setdefault(kind, ([], [], []))
+            sizes[0].append(full_bytes)
+            sizes[1].append(critical_bytes)
+            sizes[2].append(deferred_bytes)
+
+        over = [slug for slug, sizes in self.sizes.items() if sizes[2] > self.threshold]
+        report = {
+            'threshold': self.threshold,
+            'summary': {
+                kind: {'full': _summary(full), 'critical': _summary(critical), 'deferred': _summary(deferred)}
+                for kind, (full, critical, deferred) in kinds.items()
+            },
+            'over_threshold': over,
+            'pages': {slug: sizes[1:] for slug, sizes in self.sizes.items()}
+        }
+        os.makedirs(os.path.dirname(self.report_path), exist_ok=True)
+        serializer.dump(report, self.report_path)
+
+        full = sum(sizes[1] for sizes in self.sizes.values())
+        critical = sum(sizes[2] for sizes in self.sizes.values())
+        line = (
+            f"payloads: {len(self.sizes):,} pages, critical {critical / 1024 / 1024:.1f} MB "
+            f"({critical / full:.0%} of {full / 1024 / 1024:.1f} MB)"
+        )
+        for kind, summary in report['summary'].items():
+            line += f"\n    {kind}: critical median {summary['critical']['median'] / 1024:.1f} KB (full {summary['full']['median'] / 1024:.1f} KB)"
+        line += f"\n    {len(over)} critical payload(s) over {self.threshold // 1000} KB"
+        return line
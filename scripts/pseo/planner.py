@@ -0,0 +1,192 @@
+import os
+
+from . import seeds
+
+# Demand-weighted planning of the page cross-products.
+#
+# Location pages are every industry x city and industry-platform pages every
+# industry x platform, so each new city or platform adds a full row of pages
+# whether anyone searches for them or not. The planner scores every candidate
+# pair before anything is rendered:
+#
+#   score = industry weight x city (or platform) weight
+#
+# A seed record's weight is the mean of its SIGNALS (parsed stats, see
+# pseo.seedstats), each log-scaled and divided by the seed set's largest;
+# industries are also multiplied by their category weight (CATEGORY_WEIGHTS,
+# which pseo.prerender ranks by too, unless the plan overrides them), and
+# weights are scaled so the top record's is 1. The score matrix is one outer
+# product, and the rules of page-plan.json (in the seed directory) pick which
+# pairs are built:
+#
+#   {
+#     "category_weights": {"Business Services": 1.3, ...},
+#     "location": {"min_score": 0.1, "per_industry": 30, "per_city": 80, "max_pages": 2500},
+#     "industry-platform": {"per_industry": 6}
+#   }
+#
+# min_score drops pairs below a score, per_<dimension> keeps the top N pairs of
+# each value of that dimension and max_pages the top N overall; all given rules
+# apply together. A kind without rules keeps every pair, so there is no plan
+# file by default. Generators iterate only planned pairs and link only to
+# planned pages (columns_for() and rows_for() give the planned
+# partners of a seed record as stable lists, so per-list caches keep working).
+
+PLAN_PATH = os.path.join(seeds.DATA_DIR, 'page-plan.json')
+
+# Kind -> ((dimension, seed set), (dimension, seed set)) of its cross-product
+PRODUCTS = {
+    'location': (('industry', 'industries'), ('city', 'cities')),
+    'industry-platform': (('industry', 'industries'), ('platform', 'platforms'))
+}
+
+# Seed set -> parsed stats (record['values']) its demand weight averages
+SIGNALS = {
+    'industries': ('industry_adoption', 'ai_growth'),
+    'cities': ('local_search_volume', 'population'),
+    'platforms': ('market_share',)
+}
+
+RULES = ('min_score', 'max_pages')
+
+# Relative demand of industry categories; rough, tunable estimates
+CATEGORY_WEIGHTS = {
+    'Business Services': 1.3,
+    'Healthcare & Wellness': 1.2,
+    'Home Services': 1.2,
+    'Technology & SaaS': 1.1,
+    'Retail & E-commerce': 1.0,
+    'Education & Training': 0.9,
+    'Food & Hospitality': 0.9,
+    'Creative & Media': 0.8,
+    'Specialized Industries': 0.8
+}
+
+_plans = {}
+_rules = {}
+
+
+def load_rules(path=None):
+    """The plan file's rules ({} when there is none)"""
+    path = path or PLAN_PATH
+    if path not in _rules:
+        _rules[path] = seeds.read_json(path) if os.path.exists(path) else {}
+    return _rules[path]
+
+
+def weights(name, records, category_weights=None):
+    """Demand weight (0-1) of every record of a seed set"""
+    import numpy as np
+
+    columns = []
+    for signal in SIGNALS[name]:
+        values = np.array([record['values'].get(signal) or 0 for record in records], dtype=float)
+        values = np.log1p(np.maximum(values, 0))
+        columns.append(values / values.max() if values.max() > 0 else np.ones(len(values)))
+    weight = np.mean(columns, axis=0)
+
+    if name == 'industries':
+        category_weights = CATEGORY_WEIGHTS if category_weights is None else category_weights
+        weight = weight * np.array([category_weights.get(record['category'], 1.0) for record in records])
+    top = weight.max()
+    return weight / top if top > 0 else np.ones(len(records))
+
+
+def scores(kind, rules=None):
+    """Score matrix (rows: industries, columns: cities or platforms) of a kind's cross-product"""
+    import numpy as np
+
+    rules = load_rules() if rules is None else rules
+    (_, row_seed), (_, column_seed) = PRODUCTS[kind]
+    rows = seeds.load(row_seed)
+    columns = seeds.load(column_seed)
+    category_weights = rules.get('category_weights')
+    return np.outer(weights(row_seed, rows, category_weights), weights(column_seed, columns, category_weights))
+
+
+def select(matrix, kind_rules, dimensions):
+    """Boolean mask of the pairs a kind's rules keep"""
+    import numpy as np
+
+    keep = np.ones(matrix.shape, dtype=bool)
+    if kind_rules.get('min_score') is not None:
+        keep &= matrix >= kind_rules['min_score']
+    for axis, dimension in enumerate(dimensions):
+        quota = kind_rules.get(f"per_{dimension}")
+        if quota is None:
+            continue
+        # Rank of every pair within its row (axis 0) or column (axis 1), best first, stable on ties
+        other = 1 - axis
+        order = np.argsort(-matrix, axis=other, kind='stable')
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(matrix.shape[other]).reshape((1, -1) if other else (-1, 1)), axis=other)
+        keep &= ranks < quota
+    if kind_rules.get('max_pages') is not None:
+        flat = np.where(keep.ravel(), matrix.ravel(), -np.inf)
+        order = np.argsort(-flat, kind='stable')[:kind_rules['max_pages']]
+        limited = np.zeros(flat.shape, dtype=bool)
+        limited[order] = True
+        keep &= limited.reshape(matrix.shape)
+    return keep
+
+
+def plan(kind, rules=None):
+    """{'rows': {row slug: [planned column records]}, 'columns': {column slug: [planned row records]},
+    'scores': score matrix, 'keep': planned pair mask} for a kind (no matrices when nothing is pruned)"""
+    key = (kind, id(rules))
+    cached = _plans.get(key)
+    if cached is not None:
+        return cached[1]
+
+    rules = load_rules() if rules is None else rules
+    (row_dimension, row_seed), (column_dimension, column_seed) = PRODUCTS[kind]
+    rows = seeds.load(row_seed)
+    columns = seeds.load(column_seed)
+    kind_rules = rules.get(kind) or {}
+    active = any(kind_rules.get(rule) is not None for rule in RULES + (f"per_{row_dimension}", f"per_{column_dimension}"))
+
+    if not active:
+        result = {
+            'rows': {row['slug']: columns for row in rows},
+            'columns': {column['slug']: rows for column in columns},
+            'scores': None,
+            'keep': None
+        }
+    else:
+        matrix = scores(kind, rules)
+        keep = select(matrix, kind_rules, (row_dimension, column_dimension))
+        result = {
+            'rows': {row['slug']: [columns[j] for j in keep[i].nonzero()[0].tolist()] for i, row in enumerate(rows)},
+            'columns': {column['slug']: [rows[i] for i in keep[:, j].nonzero()[0].tolist()] for j, column in enumerate(columns)},
+            'scores': matrix,
+            'keep': keep
+        }
+    # Holding rules keeps id(rules) from being reused while cached
+    _plans[key] = (rules, result)
+    return result
+
+
+def columns_for(kind, row):
+    """Planned column records (cities, platforms) for a row record (an industry)"""
+    return plan(kind)['rows'][row['slug']]
+
+
+def rows_for(kind, column):
+    """Planned row records (industries) for a column record (a city, a platform)"""
+    return plan(kind)['columns'][column['slug']]
+
+
+def report(kind, rules=None):
+    """Planned and candidate page counts with score cut-offs, for scripts/plan-pages.py"""
+    result = plan(kind, rules)
+    (row_dimension, row_seed), (column_dimension, column_seed) = PRODUCTS[kind]
+    candidates = len(seeds.load(row_seed)) * len(seeds.load(column_seed))
+    planned = sum(len(partners) for partners in result['rows'].values())
+    summary = {'kind': kind, 'candidates': candidates, 'planned': planned, 'pruned': result['keep'] is not None}
+    if result['keep'] is not None:
+        matrix, keep = result['scores'], result['keep']
+        summary['lowest_kept_score'] = round(float(matrix[keep].min()), 4) if keep.any() else None
+        summary['highest_dropped_score'] = round(float(matrix[~keep].max()), 4) if (~keep).any() else None
+        summary[f"{row_dimension}_values_kept"] = int(keep.any(axis=1).sum())
+        summary[f"{column_dimension}_values_kept"] = int(keep.any(axis=0).sum())
+    return summary
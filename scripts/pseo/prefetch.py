@@ -0,0 +1,99 @@
+import math
+import os
+
+from . import seeds, serializer
+from .build import BUILD_DIR, STATIC_SLUGS
+from .listings import search_volume
+from .pages import LINK_FIELDS
+
+# Prefetch hints from the internal link graph.
+#
+# For every page, its outbound internal links (internalLinks, related_industries,
+# related_pages) are ranked by how likely a visitor is to follow them next:
+#
+#   score = prominence * (1 + demand + authority)
+#
+# prominence is 1 / (1 + position) of the link on the page, demand the target's
+# search volume (or its city's population, for location pages) relative to the
+# largest in the corpus, and authority the target's share of the highest inbound
+# link count. The top few targets per page are written to
+# build/prefetch-hints/<slug>.json as [url, ...] (pages without links get no
+# file), so [slug].js reads only the page's own hints and hands them to Layout
+# as <link rel="prefetch"> tags.
+# The hints need the whole link graph, so they exist once the stage finishes;
+# the HTML export (pseo.export) takes them from the stage object in memory.
+
+HINTS_DIR = os.path.join(BUILD_DIR, 'prefetch-hints')
+MAX_HINTS = 3
+
+def outbound_urls(page):
+    """Internal link targets of a page in page order, without duplicates or self links"""
+    own = f"/{page['slug']}"
+    urls = []
+    for field in LINK_FIELDS:
+        for link in page.get(field) or ():
+            url = link['url']
+            if url.startswith('/') and url != own and url not in urls:
+                urls.append(url)
+    return urls
+
+
+class PrefetchStage:
+    """Build stage writing ranked prefetch hints per page"""
+
+    def __init__(self, out_dir=HINTS_DIR, max_hints=MAX_HINTS):
+        self.out_dir = out_dir
+        self.max_hints = max_hints
+        self.cities = {city['slug']: city for city in seeds.load('cities')}
+        # slug -> outbound urls
+        self.links = {}
+        # url -> popularity (search volume, or city population for location pages)
+        self.demand = {}
+        self.inbound = {}
+        # slug -> ranked urls, once rank() has run
+        self.hints = None
+
+    def add(self, kind, page):
+        slug = page['slug']
+        if slug in self.links or slug in STATIC_SLUGS:
+            return
+        urls = outbound_urls(page)
+        self.links[slug] = urls
+        for url in urls:
+            self.inbound[url] = self.inbound.get(url, 0) + 1
+
+        city = self.cities.get(page.get('city'))
+        if city is not None:
+            self.demand[f"/{slug}"] = city['values']['population'] or 0
+        else:
+            self.demand[f"/{slug}"] = search_volume(page, self.cities)
+
+    def rank(self):
+        """{slug: [url, ...]} of the best prefetch targets per page (pages with links only)"""
+        # Log-scaled so a few huge cities don't flatten everything else
+        max_demand = math.log1p(max(self.demand.values(), default=0)) or 1
+        max_inbound = max(self.inbound.values(), default=0) or 1
+
+        hints = {}
+        for slug, urls in self.links.items():
+            scored = []
+            for position, url in enumerate(urls):
+                demand = math.log1p(self.demand.get(url, 0)) / max_demand
+                authority = self.inbound.get(url, 0) / max_inbound
+                scored.append((-(1 + demand + authority) / (1 + position), position, url))
+            if scored:
+                scored.sort()
+                hints[slug] = [url for _, _, url in scored[:self.max_hints]]
+        self.hints = hints
+        return hints
+
+    def finish(self):
+        hints = self.rank()
+        os.makedirs(self.out_dir, exist_ok=True)
+        for slug, urls in hints.items():
+            serializer.dump(urls, os.path.join(self.out_dir, f"{slug}.json"), pretty=False)
+        # Hints of pages that are gone or no longer link anywhere
+        for filename in os.listdir(self.out_dir):
+            if filename[:-len('.json')] not in hints:
+                os.remove(os.path.join(self.out_dir, filename))
+        return f"prefetch: hints for {len(hints):,} of {len(self.links):,} pages ({len(self.inbound):,} link targets)"
@@ -0,0 +1,116 @@
+import heapq
+import os
+from statistics import median
+
+from . import seeds, serializer
+from .build import BUILD_DIR, STATIC_SLUGS
+from .indexes import slugify
+from .listings import parse_count
+from .planner import CATEGORY_WEIGHTS
+
+# Prerender manifest for getStaticPaths.
+#
+# Pages are ranked by an estimate of their monthly traffic value and the top N
+# are prerendered by `next build`; the long tail stays on fallback: 'blocking'.
+# N is whatever fits the build-time budget (PRERENDER_BUDGET_SECONDS) at the
+# cost of one page render (PRERENDER_SECONDS_PER_PAGE).
+#
+#   value = searches * cpc weight * category weight
+#
+# searches is the keyword volume for use case pages (a share of it for their
+# platform and content type variants), a rate per metro resident (the city's
+# population when it has no metro figure) for location pages and a flat
+# estimate for families without keyword data. The cpc weight is the use case's
+# cost per click over the median, and category weights (the planner's
+# CATEGORY_WEIGHTS) nudge industries against each other. These are rough,
+# tunable estimates; only the ranking they produce matters.
+
+PRERENDER_PATH = os.path.join(BUILD_DIR, 'prerender-manifest.json')
+
+BUDGET_SECONDS = float(os.environ.get('PRERENDER_BUDGET_SECONDS', 60))
+SECONDS_PER_PAGE = float(os.environ.get('PRERENDER_SECONDS_PER_PAGE', 0.1))
+
+# Every kind [slug].js serves: industry, technical and use case pages from
+# their page files, location and industry-platform pages from their critical
+# payloads (pseo.payloads)
+PRERENDER_KINDS = ('industry', 'industry-platform', 'location', 'technical', 'usecase')
+
+# Monthly searches for page families without keyword data
+BASE_SEARCHES = {
+    'industry': 400,
+    'industry-platform': 150,
+    'technical': 100
+}
+# Industry-location searches per metro resident per month
+LOCAL_SEARCH_RATE = 1 / 10000
+# Share of a use case's volume that goes to one platform / content type variant
+VARIANT_SHARE = 0.25
+
+
+class PrerenderStage:
+    """Build stage writing the ranked top-N prerender manifest"""
+
+    def __init__(self, path=PRERENDER_PATH, budget_seconds=BUDGET_SECONDS, seconds_per_page=SECONDS_PER_PAGE, kinds=PRERENDER_KINDS):
+        self.path = path
+        self.budget_seconds = budget_seconds
+        self.seconds_per_page = seconds_per_page
+        self.limit = int(budget_seconds / seconds_per_page)
+        self.kinds = kinds
+        self.industries = {industry['slug']: industry for industry in seeds.load('industries')}
+        self.cities = {city['slug']: city for city in seeds.load('cities')}
+        use_cases = seeds.load('use_cases').values()
+        self.cpc = {slugify(use_case['name']): use_case['cpc'] for use_case in use_cases}
+        self.median_cpc = median(self.cpc.values())
+        # Min-heap of the best (value, slug, kind) entries seen so far
+        self.top = []
+        self.seen = set(STATIC_SLUGS)
+        self.candidates = 0
+
+    def value(self, kind, page):
+        """Estimated monthly traffic value of a page"""
+        if page.get('search_volume') is not None:
+            searches = parse_count(page['search_volume'])
+            if page.get('page_type') not in (None, 'usecase'):
+                searches *= VARIANT_SHARE
+        elif page.get('city') in self.cities:
+            values = self.cities[page['city']]['values']
+            searches = (values['metroPopulation'] or values['population'] or 0) * LOCAL_SEARCH_RATE
+        else:
+            searches = BASE_SEARCHES.get(kind, 0)
+
+        cpc = self.cpc.get(slugify(page.get('use_case') or ''))
+        weight = cpc / self.median_cpc if cpc else 1.0
+        industry = self.industries.get(page.get('industry'))
+        if industry is not None:
+            weight *= CATEGORY_WEIGHTS.get(industry['category'], 1.0)
+        return searches * weight
+
+    def add(self, kind, page):
+        if kind not in self.kinds or page['slug'] in self.seen:
+            return
+        self.seen.add(page['slug'])
+        self.candidates += 1
+        entry = (self.value(kind, page), page['slug'], kind)
+        if len(self.top) < self.limit:
+            heapq.heappush(self.top, entry)
+        elif entry > self.top[0]:
+            heapq.heapreplace(self.top, entry)
+
+    def finish(self):
+        ranked = sorted(self.top, key=lambda entry: (-entry[0], entry[1]))
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        serializer.dump({
+            'budgetSeconds': self.budget_seconds,
+            'secondsPerPage': self.seconds_per_page,
+            'limit': self.limit,
+            'slugs': [slug for _, slug, _ in ranked],
+            'values': [round(value, 1) for value, _, _ in ranked]
+        }, self.path)
+        kinds = {}
+        for _, _, kind in ranked:
+            kinds[kind] = kinds.get(kind, 0) + 1
+        return (
+            f"prerender: top {len(ranked):,} of {self.candidates:,} pages "
+            f"(budget {self.budget_seconds:.0f}s at {self.seconds_per_page}s/page; "
+            + ", ".join(f"{count:,} {kind}" for kind, count in sorted(kinds.items())) + ")"
+        )
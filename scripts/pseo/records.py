@@ -0,0 +1,134 @@
+import sys
+
+# Slotted page records for the generators.
+#
+# Pages used to be built as nests of plain dicts, so every page carried its own
+# dict overhead and its own copies of strings like the industry name, city name
+# and internal link URLs. Records keep one fixed slot layout per page type and
+# intern the repeated dimension strings so all pages share a single object for
+# each of them. They are only turned back into dicts when they are serialized.
+
+def intern(value):
+    """Intern a repeated dimension string (no-op for None and non-strings)"""
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+class Record:
+    """Base class for slotted records that serialize to plain JSON dicts"""
+    __slots__ = ()
+
+    # Slots whose values repeat across many pages and should be interned
+    interned = ()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            value = fields.get(name)
+            if name in self.interned:
+                value = intern(value)
+            setattr(self, name, value)
+
+    def __getitem__(self, name):
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def get(self, name, default=None):
+        return getattr(self, name, default)
+
+    def to_dict(self):
+        """Convert to a plain dict, recursing into nested records"""
+        return {name: to_json(getattr(self, name)) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a record from its dict form (e.g. a page read back from JSON)"""
+        return cls(**data)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({getattr(self, self.__slots__[0])!r})"
+
+
+def to_json(value):
+    """Recursively convert records (and containers of records) to JSON types"""
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return [to_json(item) for item in value]
+    if isinstance(value, dict):
+        return {key: to_json(item) for key, item in value.items()}
+    return value
+
+
+def json_default(value):
+    """`default=` hook for json.dump so records are converted only at write time"""
+    if isinstance(value, Record):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class InternalLink(Record):
+    __slots__ = ('text', 'url', 'type')
+    interned = ('text', 'url', 'type')
+
+
+class LocationStats(Record):
+    __slots__ = (
+        'industry_ai_growth',
+        'industry_adoption',
+        'city_businesses',
+        'city_ai_adoption',
+        'local_search_volume',
+        'mobile_searches'
+    )
+    interned = __slots__
+
+
+# Each section is a markdown block tree (see pseo.markdown)
+class LocationContent(Record):
+    __slots__ = (
+        'intro',
+        'whyAISEOMatters',
+        'localChallenges',
+        'aiSEOStrategy',
+        'measurementROI',
+        'implementation',
+        'localCaseStudy',
+        'competitiveAdvantage',
+        'ctaSection',
+        'faq',
+        'finalCTA'
+    )
+
+
+class LocationPage(Record):
+    __slots__ = (
+        'slug',
+        'type',
+        'industry',
+        'industryName',
+        'city',
+        'cityName',
+        'state',
+        'stateCode',
+        'title',
+        'metaDescription',
+        'h1',
+        'content',
+        'stats',
+        'internalLinks',
+        'canonicalUrl',
+        'lastModified',
+        'metrics'
+    )
+    interned = ('type', 'industry', 'industryName', 'city', 'cityName', 'state', 'stateCode', 'lastModified')
+
+    @classmethod
+    def from_dict(cls, data):
+        fields = dict(data)
+        fields['content'] = LocationContent.from_dict(data['content'])
+        fields['stats'] = LocationStats.from_dict(data['stats'])
+        fields['internalLinks'] = tuple(InternalLink.from_dict(link) for link in data['internalLinks'])
+        return cls(**fields)
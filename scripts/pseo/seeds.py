@@ -0,0 +1,202 @@
+import gc
+import json
+import marshal
+import os
+import sys
+import zlib
+
+from . import seedstats
+
+# Shared seed registry for every generator.
+#
+# All seed data (industries, cities, platforms, content types, ...) lives in
+# src/data/pseo and is loaded through this module instead of being redefined
+# as dict literals inside each script. Seeds are validated once, then cached
+# as a marshal snapshot that is reused until one of the source files changes
+# (checked by mtime first, then by content hash so a touched-but-identical
+# file doesn't force a reparse).
+#
+# Seeds are shared between everything that loads them, so generators must
+# treat them as read-only (copy lists before extending them). Cities,
+# industries and platforms also carry their stats as numbers and their standing
+# brackets against the other records (see pseo.seedstats), computed once per parse.
+
+DATA_DIR = os.environ.get(
+    'PSEO_DATA_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'src', 'data', 'pseo')
+)
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+# marshal's format is only stable within a Python version, so it is part of the key
+SNAPSHOT_VERSION = (5,) + tuple(sys.version_info[:2])
+
+
+class SeedError(ValueError):
+    pass
+
+
+class SeedSpec:
+    """Where a seed set lives and what every record in it must contain"""
+
+    def __init__(self, filename, required, key=None, id_field='slug'):
+        self.filename = filename
+        self.required = required
+        # Top-level key holding the records (None when the file is the mapping itself)
+        self.key = key
+        # Field that must be unique across records
+        self.id_field = id_field
+
+
+SEEDS = {
+    # Generator dimensions for the industry, location and platform pages
+    'industries': SeedSpec('industries-ai-seo.json', ('id', 'name', 'slug', 'category', 'keywords', 'stats'), key='industries'),
+    'cities': SeedSpec('cities-ai-seo.json', ('id', 'name', 'slug', 'state', 'stateCode', 'region', 'latitude', 'longitude', 'stats', 'seo_insights'), key='cities'),
+    'platforms': SeedSpec('platforms-ai-seo.json', ('id', 'name', 'slug', 'difficulty', 'market_share', 'setup_time'), key='platforms'),
+    'industry_content_types': SeedSpec('content-types-industry.json', ('id', 'name', 'url_pattern', 'title_pattern'), key='content_types', id_field='id'),
+    # AI search platforms, content types and verticals for the platform guides
+    'ai_platforms': SeedSpec('platforms.json', ('name', 'slug', 'monthly_users', 'content_sections', 'technical_focus')),
+    'content_types': SeedSpec('content-types.json', ('name', 'slug', 'description', 'ai_challenges')),
+    'verticals': SeedSpec('industries.json', ('name', 'slug', 'description', 'common_queries')),
+    # Technical and use case pages
+    'schema_types': SeedSpec('schema-types.json', ('name', 'slug', 'ai_benefits', 'common_mistakes')),
+    'technical_topics': SeedSpec('technical-topics.json', ('name', 'slug', 'description')),
+    'use_cases': SeedSpec('use-cases.json', ('name', 'slug', 'keywords', 'search_volume', 'cpc')),
+    'usecase_content_types': SeedSpec('usecase-content-types.json', ('name', 'slug'))
+}
+
+_registry = {}
+
+
+def read_json(path):
+    """Read a JSON file, accepting the UTF-16 files some editors have saved"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    encoding = 'utf-16' if raw[:2] in (b'\xff\xfe', b'\xfe\xff') else 'utf-8'
+    return json.loads(raw.decode(encoding))
+
+
+def validate(name, spec, data):
+    """Check that every record has the required fields and a unique id"""
+    records = data if isinstance(data, list) else list(data.values())
+    seen = set()
+    for i, record in enumerate(records):
+        label = record.get(spec.id_field, i) if isinstance(record, dict) else i
+        if not isinstance(record, dict):
+            raise SeedError(f"{spec.filename}: record {label} is not an object")
+        missing = [field for field in spec.required if field not in record]
+        if missing:
+            raise SeedError(f"{spec.filename}: record '{label}' is missing {', '.join(missing)}")
+        if record[spec.id_field] in seen:
+            raise SeedError(f"{spec.filename}: duplicate {spec.id_field} '{record[spec.id_field]}'")
+        seen.add(record[spec.id_field])
+
+
+def parse_seeds(data_dir):
+    """Parse and validate every seed file (the slow path)"""
+    seeds = {}
+    for name, spec in SEEDS.items():
+        data = read_json(os.path.join(data_dir, spec.filename))
+        if spec.key is not None:
+            data = data[spec.key]
+        validate(name, spec, data)
+        if name in seedstats.COLUMNS:
+            seedstats.annotate(name, data)
+        seeds[name] = data
+    return seeds
+
+
+def _fingerprint(path, previous=None):
+    """(mtime_ns, size, sha256) of a source file, reusing the hash when mtime is unchanged"""
+    stat = os.stat(path)
+    if previous and previous[0] == stat.st_mtime_ns and previous[1] == stat.st_size:
+        return previous
+    # hashlib is only needed on this slow path and is relatively costly to import
+    import hashlib
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return (stat.st_mtime_ns, stat.st_size, digest)
+
+
+def _snapshot_path(data_dir):
+    key = format(zlib.crc32(os.path.abspath(data_dir).encode('utf-8')), '08x')
+    return os.path.join(CACHE_DIR, f"seeds-{key}.marshal")
+
+
+def load_all(data_dir=None, use_snapshot=True, freeze=False):
+    """Return {seed name: data} for all seeds, from the snapshot when it is fresh.
+
+    freeze=True is for a script's entry point: a fresh snapshot is moved out of
+    the cyclic GC's reach (gc.freeze) for the rest of the process, before any
+    collection has to scan it. Library code and tests leave it off.
+    """
+    data_dir = data_dir or DATA_DIR
+    if data_dir in _registry:
+        return _registry[data_dir]
+
+    snapshot_path = _snapshot_path(data_dir)
+    # Loading creates many small objects; the cyclic GC only slows that down
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        snapshot = _read_snapshot(snapshot_path) if use_snapshot else None
+        if snapshot is not None and snapshot.get('version') != SNAPSHOT_VERSION:
+            snapshot = None
+
+        sources = {}
+        fresh = snapshot is not None
+        for name, spec in SEEDS.items():
+            previous = snapshot['sources'].get(spec.filename) if snapshot else None
+            fingerprint = _fingerprint(os.path.join(data_dir, spec.filename), previous)
+            sources[spec.filename] = fingerprint
+            # A new mtime with identical content still counts as fresh
+            if not previous or previous[2] != fingerprint[2]:
+                fresh = False
+        if fresh and freeze:
+            gc.freeze()
+    finally:
+        if collecting:
+            gc.enable()
+
+    if fresh:
+        seeds = snapshot['seeds']
+        if sources != snapshot['sources']:
+            _write_snapshot(snapshot_path, seeds, sources)
+    else:
+        seeds = parse_seeds(data_dir)
+        if use_snapshot:
+            _write_snapshot(snapshot_path, seeds, sources)
+
+    _registry[data_dir] = seeds
+    return seeds
+
+
+def _read_snapshot(path):
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    except OSError:
+        return None
+    try:
+        return marshal.loads(raw)
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+def _write_snapshot(path, seeds, sources):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(marshal.dumps({'version': SNAPSHOT_VERSION, 'sources': sources, 'seeds': seeds}))
+    os.replace(tmp_path, path)
+
+
+def load(name, data_dir=None):
+    """Return one seed set by registry name (e.g. 'industries', 'ai_platforms')"""
+    if name not in SEEDS:
+        raise KeyError(f"Unknown seed '{name}' (choose from {', '.join(SEEDS)})")
+    return load_all(data_dir)[name]
+
+
+def clear():
+    """Forget the in-process registry (the on-disk snapshot is kept)"""
+    _registry.clear()
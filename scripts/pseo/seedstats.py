@@ -0,0 +1,280 @@
+import os
+
+# Typed seed stats and how every city, industry and platform stands against the rest.
+#
+# Seed stats are display strings ("240,000+", "78%", "+145%", "347 million",
+# "Very High"). When the seeds are parsed (pseo.seeds, so the result is cached
+# in the seed snapshot) every stat in COLUMNS is parsed once into
+# record['values'], and record['standing'][field] gets the TOP_SHARES bracket
+# the record falls in for that stat:
+#
+#   groupShare       within the record's group (cities by region, industries
+#                    by category), None outside every bracket
+#   share            among all records
+#
+# Fields outside both brackets are left out. Only brackets are kept on the
+# record: percentiles and z-scores move with every other record's stats, so a
+# template reading them would depend on the whole seed set, and one dict per
+# stat per record would also make the seed snapshot slower to load than the
+# JSON it caches. The full standings (percentile, zScore, rank, count and
+# their group equivalents) are computed from `values` when needed, by
+# standings(), and seed-stats.json (written by scripts/generate-seed-stats.py)
+# publishes them for the site.
+#
+# Brackets end up in page copy (location intros), so NumPy is required
+# (scripts/requirements.txt): without it seeds fail to load rather than
+# quietly rendering pages without their standing phrases.
+
+# Seed set -> value name -> path of the display string inside a record
+COLUMNS = {
+    'cities': {
+        'population': ('population',),
+        'metroPopulation': ('metroPopulation',),
+        'business_count': ('stats', 'business_count'),
+        'ai_adoption': ('stats', 'ai_adoption'),
+        'digital_maturity': ('stats', 'digital_maturity'),
+        'avg_market_competition': ('stats', 'avg_market_competition'),
+        'local_search_volume': ('seo_insights', 'local_search_volume'),
+        'mobile_searches': ('seo_insights', 'mobile_searches'),
+        'voice_search_growth': ('seo_insights', 'voice_search_growth')
+    },
+    'industries': {
+        'ai_growth': ('stats', 'ai_growth'),
+        'industry_adoption': ('stats', 'industry_adoption'),
+        'visibility_impact': ('stats', 'visibility_impact')
+    },
+    'platforms': {
+        'market_share': ('market_share',)
+    }
+}
+
+# Seed set -> field records are grouped by for relative standing (all in one group when missing)
+GROUPS = {
+    'cities': 'region',
+    'industries': 'category'
+}
+
+# Qualitative stats on a 1-5 scale
+LEVELS = {
+    'very low': 1,
+    'low': 2,
+    'medium': 3,
+    'moderate': 3,
+    'high': 4,
+    'very high': 5
+}
+
+# Scale words after a number ("347 million")
+MULTIPLIERS = {
+    'thousand': 1_000,
+    'k': 1_000,
+    'million': 1_000_000,
+    'm': 1_000_000,
+    'billion': 1_000_000_000,
+    'b': 1_000_000_000
+}
+
+# "Top N%" brackets standing phrases use, tightest first
+TOP_SHARES = (1, 5, 10, 25)
+
+# Python dependencies of the pSEO build, relative to the repository root
+REQUIREMENTS = 'scripts/requirements.txt'
+
+
+def parse_stat(value):
+    """Number behind a display stat: "240,000+" -> 240000, "78%" -> 78, "+145%" -> 145,
+    "347 million" -> 347000000, "Very High" -> 5; None when there is no number"""
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    text = str(value).strip()
+    level = LEVELS.get(text.lower())
+    if level is not None:
+        return level
+    number = text.replace(',', '').rstrip('+%').lstrip('+$')
+    scale = 1
+    words = number.split()
+    if len(words) == 2 and words[1].lower() in MULTIPLIERS:
+        number, scale = words[0], MULTIPLIERS[words[1].lower()]
+    try:
+        return int(number) * scale
+    except ValueError:
+        pass
+    try:
+        value = float(number) * scale
+    except ValueError:
+        return None
+    return int(value) if scale > 1 and value.is_integer() else value
+
+
+def _lookup(record, path):
+    for key in path:
+        if not isinstance(record, dict) or key not in record:
+            return None
+        record = record[key]
+    return record
+
+
+def require_numpy():
+    """Fail unless NumPy can be imported (standings are never skipped, see above)"""
+    try:
+        import numpy  # noqa: F401
+    except ImportError as error:
+        raise ImportError(f"Seed standings need NumPy: pip install -r {REQUIREMENTS}") from error
+
+
+def _standing(values):
+    """(percentile, z-score, rank) arrays for a float array without NaNs"""
+    import numpy as np
+
+    ordered = np.sort(values)
+    below = np.searchsorted(ordered, values, side='left')
+    above = len(values) - np.searchsorted(ordered, values, side='right')
+    percentile = 100 * (below + 0.5 * (len(values) - below - above)) / len(values)
+    spread = values.std()
+    z = (values - values.mean()) / spread if spread else np.zeros_like(values)
+    return percentile, z, above + 1
+
+
+def _records(records):
+    return list(records.values()) if isinstance(records, dict) else records
+
+
+def _columns(name, records):
+    """{field: standing arrays} for every stat of a seed set with at least one known value"""
+    import numpy as np
+
+    groups = {}
+    for index, record in enumerate(records):
+        groups.setdefault(record.get(GROUPS.get(name)), []).append(index)
+    groups = [np.array(indexes) for indexes in groups.values()]
+
+    columns = {}
+    for field in COLUMNS[name]:
+        values = np.array([record['values'][field] for record in records], dtype=float)
+        known = ~np.isnan(values)
+        count = int(known.sum())
+        if not count:
+            continue
+        percentile = np.full(len(values), np.nan)
+        z = np.full(len(values), np.nan)
+        rank = np.zeros(len(values), dtype=int)
+        percentile[known], z[known], rank[known] = _standing(values[known])
+
+        group_percentile = np.full(len(values), np.nan)
+        group_rank = np.zeros(len(values), dtype=int)
+        group_size = np.zeros(len(values), dtype=int)
+        for indexes in groups:
+            indexes = indexes[known[indexes]]
+            if len(indexes):
+                group_percentile[indexes], _, group_rank[indexes] = _standing(values[indexes])
+                group_size[indexes] = len(indexes)
+
+        columns[field] = {
+            'known': known,
+            'percentile': percentile,
+            'zScore': z,
+            'rank': rank,
+            'count': count,
+            'groupPercentile': group_percentile,
+            'groupRank': group_rank,
+            'groupSize': group_size
+        }
+    return columns
+
+
+def annotate(name, records):
+    """Add typed `values` and `standing` brackets to every record of a seed set in place"""
+    require_numpy()
+    columns = COLUMNS[name]
+    records = _records(records)
+    for record in records:
+        record['values'] = {field: parse_stat(_lookup(record, path)) for field, path in columns.items()}
+        record['standing'] = {}
+    if not records:
+        return
+    for field, column in _columns(name, records).items():
+        count = column['count']
+        for index in column['known'].nonzero()[0].tolist():
+            group_share = top_share(int(column['groupRank'][index]), int(column['groupSize'][index]))
+            share = top_share(int(column['rank'][index]), count)
+            if group_share is not None or share is not None:
+                records[index]['standing'][field] = {'groupShare': group_share, 'share': share}
+
+
+def standings(name, records):
+    """{slug: {field: {percentile, zScore, rank, count, groupPercentile, groupRank, groupSize}}} of a seed set"""
+    require_numpy()
+    records = _records(records)
+    result = {record['slug']: {} for record in records}
+    if not records:
+        return result
+    for field, column in _columns(name, records).items():
+        for index in column['known'].nonzero()[0].tolist():
+            result[records[index]['slug']][field] = {
+                'percentile': round(float(column['percentile'][index]), 1),
+                'zScore': round(float(column['zScore'][index]), 2),
+                'rank': int(column['rank'][index]),
+                'count': column['count'],
+                'groupPercentile': round(float(column['groupPercentile'][index]), 1),
+                'groupRank': int(column['groupRank'][index]),
+                'groupSize': int(column['groupSize'][index])
+            }
+    return result
+
+
+def top_share(rank, size):
+    """Tightest TOP_SHARES bracket a rank out of size falls in, else None"""
+    for share in TOP_SHARES:
+        if rank * 100 <= share * size:
+            return share
+    return None
+
+
+def standing_phrase(record, field, label, group_name):
+    """e.g. "top 10% for AI adoption in the Northeast", else "... nationwide", else None.
+
+    Only the bracket leaves are read (no membership tests), so a tracked render
+    depends on this record's bracket for `field` and nothing else.
+    """
+    standing = record.get('standing')
+    bracket = standing.get(field) if standing is not None else None
+    if bracket is None:
+        return None
+    share = bracket.get('groupShare')
+    if share is not None:
+        return f"top {share}% for {label} in the {group_name}"
+    share = bracket.get('share')
+    if share is not None:
+        return f"top {share}% for {label} nationwide"
+    return None
+
+
+def export(seed_sets):
+    """{seed set: {slug: {group, values, standing}}} for seed-stats.json"""
+    result = {}
+    for name in COLUMNS:
+        records = _records(seed_sets[name])
+        ranked = standings(name, records)
+        result[name] = {
+            record['slug']: {
+                'group': record.get(GROUPS.get(name)),
+                'values': record['values'],
+                'standing': ranked[record['slug']]
+            }
+            for record in records
+        }
+    return result
+
+
+def main():
+    from . import seeds, serializer
+
+    seed_sets = {name: seeds.load(name) for name in COLUMNS}
+    output_path = os.path.join(seeds.DATA_DIR, 'seed-stats.json')
+    serializer.dump(export(seed_sets), output_path)
+
+    for name, data in seed_sets.items():
+        print(f"✅ {name}: {len(COLUMNS[name])} stats parsed for {len(_records(data))} records")
+    print(f"💾 Saved to: {output_path}")
@@ -0,0 +1,167 @@
+import json
+import os
+import time
+
+from .records import json_default
+
+# Pluggable JSON serializer for everything the generators write.
+#
+# The stdlib encoder is always available. orjson is used when it is installed.
+# Which backend is the default comes from the last run of
+# scripts/benchmark-serializers.py (stored next to this module), so the build
+# picks whatever was actually fastest on our page corpus. PSEO_JSON_BACKEND
+# overrides the choice for a single run.
+
+BENCHMARK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'serializer-benchmark.json')
+
+# Fallback order when no benchmark results are available
+PREFERENCE = ['orjson', 'stdlib']
+
+
+class StdlibBackend:
+    name = 'stdlib'
+
+    def dumps(self, obj, pretty=True):
+        if pretty:
+            text = json.dumps(obj, indent=2, ensure_ascii=False, default=json_default)
+        else:
+            text = json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=json_default)
+        return text.encode('utf-8')
+
+
+class OrjsonBackend:
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self.orjson = orjson
+
+    def dumps(self, obj, pretty=True):
+        option = self.orjson.OPT_INDENT_2 if pretty else 0
+        return self.orjson.dumps(obj, default=json_default, option=option)
+
+
+BACKENDS = {
+    'stdlib': StdlibBackend,
+    'orjson': OrjsonBackend
+}
+
+_backend_cache = {}
+
+
+def available_backends():
+    """Names of all backends whose encoder can be imported here"""
+    names = []
+    for name in BACKENDS:
+        try:
+            get_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_backend(name=None):
+    """Return a backend by name, or the default backend when no name is given"""
+    if name is None:
+        name = default_backend_name()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown serializer backend '{name}' (choose from {', '.join(BACKENDS)})")
+    if name not in _backend_cache:
+        _backend_cache[name] = BACKENDS[name]()
+    return _backend_cache[name]
+
+
+def default_backend_name():
+    """Pick the fastest available backend (env override, then benchmark, then preference)"""
+    override = os.environ.get('PSEO_JSON_BACKEND')
+    if override:
+        return override
+
+    ranking = PREFERENCE
+    try:
+        with open(BENCHMARK_PATH, 'r', encoding='utf-8') as f:
+            ranking = json.load(f)['ranking']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    for name in ranking:
+        if name not in BACKENDS:
+            continue
+        try:
+            get_backend(name)
+        except ImportError:
+            continue
+        return name
+    return 'stdlib'
+
+
+def dumps(obj, pretty=True, backend=None):
+    """Serialize to UTF-8 encoded JSON bytes"""
+    return get_backend(backend).dumps(obj, pretty=pretty)
+
+
+def dump(obj, path, pretty=True, backend=None):
+    """Serialize `obj` to the file at `path` and return the number of bytes written"""
+    data = dumps(obj, pretty=pretty, backend=backend)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+def dump_iter(items, path, pretty=True, backend=None):
+    """Stream an iterable to `path` as a JSON array, one item in memory at a time.
+
+    Produces the same bytes as dump(list(items), ...). Returns the number of
+    items written.
+    """
+    encoder = get_backend(backend)
+    count = 0
+    with open(path, 'wb') as f:
+        f.write(b'[')
+        for item in items:
+            data = encoder.dumps(item, pretty=pretty)
+            if pretty:
+                # Strings never contain raw newlines in JSON, so re-indenting by line is safe
+                data = b'\n  ' + data.replace(b'\n', b'\n  ')
+            f.write(data if count == 0 else b',' + data)
+            count += 1
+        if pretty and count:
+            f.write(b'\n')
+        f.write(b']')
+    return count
+
+
+def benchmark(corpus, repeat=3):
+    """Time every available backend on `corpus` in pretty and compact mode.
+
+    Returns one result dict per backend and mode with the best encode time in
+    seconds and the output size in bytes.
+    """
+    results = []
+    for name in available_backends():
+        backend = get_backend(name)
+        for pretty in (True, False):
+            best = None
+            size = 0
+            for _ in range(repeat):
+                start = time.perf_counter()
+                data = backend.dumps(corpus, pretty=pretty)
+                elapsed = time.perf_counter() - start
+                size = len(data)
+                best = elapsed if best is None else min(best, elapsed)
+            results.append({
+                'backend': name,
+                'mode': 'pretty' if pretty else 'compact',
+                'seconds': round(best, 4),
+                'bytes': size
+            })
+    return results
+
+
+def rank_backends(results):
+    """Order backend names from fastest to slowest by total encode time"""
+    totals = {}
+    for result in results:
+        totals[result['backend']] = totals.get(result['backend'], 0) + result['seconds']
+    return sorted(totals, key=totals.get)
@@ -0,0 +1,136 @@
+import os
+import re
+
+# Related-page recommender.
+#
+# Industries and platforms are turned into sparse TF-IDF vectors from their
+# names, keywords and descriptions, and each one's nearest neighbours by cosine
+# similarity become its related links. The similarity matrix is computed a
+# block of rows at a time (at most BLOCK_CELLS scores in memory), so 100k
+# records need no more memory than 1k. Neighbour tables are computed once per
+# seed list and reused by every page that links from it.
+#
+# Related links are page content, so the method is picked explicitly, never by
+# what happens to be installed: TF-IDF by default (numpy and scipy are build
+# dependencies, see scripts/requirements.txt), or the generators' category
+# heuristics with PSEO_RELATED=heuristic. The analysis stages (link graph,
+# near-duplicates) only report, so they check available() and skip instead.
+
+TOKEN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it of on or that the this to with your".split()
+)
+# Similarity scores held in memory at once
+BLOCK_CELLS = 4_000_000
+
+RELATED_METHODS = ('tfidf', 'heuristic')
+RELATED_METHOD = os.environ.get('PSEO_RELATED', 'tfidf')
+
+# (records list id, document function, count) -> (records, {id: [record, ...]})
+_tables = {}
+
+
+def available():
+    """Whether numpy and scipy can be imported here"""
+    try:
+        import numpy  # noqa: F401
+        import scipy.sparse  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def use_tfidf(method=None):
+    """Whether related links come from TF-IDF (PSEO_RELATED); fails when numpy or scipy is missing for it"""
+    method = method or RELATED_METHOD
+    if method not in RELATED_METHODS:
+        raise ValueError(f"Unknown related-link method {method!r}, expected one of {', '.join(RELATED_METHODS)}")
+    if method == 'heuristic':
+        return False
+    if not available():
+        raise ImportError("TF-IDF related links need numpy and scipy: pip install -r scripts/requirements.txt (or set PSEO_RELATED=heuristic)")
+    return True
+
+
+def tokens(text):
+    return [token for token in TOKEN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def _text(value):
+    if isinstance(value, (list, tuple)):
+        return ' '.join(value)
+    return value or ''
+
+
+def industry_document(industry):
+    return ' '.join([industry['name'], industry['category'], _text(industry.get('description')), _text(industry.get('keywords'))])
+
+
+def platform_document(platform):
+    return ' '.join([
+        platform['name'], _text(platform.get('description')), _text(platform.get('best_for')),
+        _text(platform.get('ai_seo_advantages')), _text(platform.get('common_challenges'))
+    ])
+
+
+def tfidf_matrix(documents):
+    """L2-normalised sparse TF-IDF rows (sublinear tf, smoothed idf) for a list of texts"""
+    import numpy as np
+    from scipy import sparse
+
+    vocabulary = {}
+    rows = []
+    columns = []
+    for row, document in enumerate(documents):
+        for token in tokens(document):
+            columns.append(vocabulary.setdefault(token, len(vocabulary)))
+            rows.append(row)
+
+    shape = (len(documents), len(vocabulary))
+    # Duplicate (row, column) entries are summed into term counts
+    counts = sparse.csr_matrix((np.ones(len(columns), dtype=np.float32), (rows, columns)), shape=shape)
+    counts.data = 1 + np.log(counts.data)
+
+    frequency = np.bincount(counts.indices, minlength=shape[1])
+    idf = (np.log((1 + shape[0]) / (1 + frequency)) + 1).astype(np.float32)
+    weighted = counts.multiply(idf).tocsr()
+
+    norms = np.sqrt(weighted.multiply(weighted).sum(axis=1)).A1
+    norms[norms == 0] = 1
+    return sparse.diags((1 / norms).astype(np.float32)) @ weighted
+
+
+def nearest(matrix, k, block_cells=BLOCK_CELLS):
+    """Row indices of each row's k most cosine-similar other rows, best first"""
+    import numpy as np
+
+    n = matrix.shape[0]
+    k = min(k, n - 1)
+    result = np.empty((n, max(k, 0)), dtype=np.int64)
+    if k <= 0:
+        return result
+
+    block = max(1, block_cells // n)
+    for start in range(0, n, block):
+        stop = min(n, start + block)
+        # Sparse matrix times a small dense block beats a sparse x sparse product
+        scores = (matrix @ matrix[start:stop].T.toarray()).T
+        # A page never recommends itself
+        scores[np.arange(stop - start), np.arange(start, stop)] = -1
+
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        # Best score first, lower index first on ties
+        order = np.lexsort((top, -top_scores), axis=1)
+        result[start:stop] = np.take_along_axis(top, order, axis=1)
+    return result
+
+
+def similar(records, record, document, count):
+    """The `count` records most similar to `record`, from a neighbour table built once per records list"""
+    key = (id(records), document, count)
+    if key not in _tables:
+        table = nearest(tfidf_matrix([document(item) for item in records]), count)
+        # Holding records keeps id(records) from being reused while cached
+        _tables[key] = (records, {item['id']: [records[j] for j in row] for item, row in zip(records, table.tolist())})
+    return _tables[key][1][record['id']]
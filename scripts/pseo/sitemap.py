@@ -0,0 +1,175 @@
+import glob
+import gzip
+import json
+import os
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape
+
+from .build import BUILD_DIR, PUBLIC_DIR, ROOT_DIR, SITE_KINDS, SITE_URL, STATIC_PAGES
+from .hashing import content_hash, file_hash
+
+# Static sitemap files written at build time.
+#
+# public/sitemap.xml is a sitemap index over gzipped shards
+# (public/sitemap-1.xml.gz, ...), each within the protocol limits of 50,000
+# URLs and 50 MB uncompressed. A URL's lastmod is the date its content hash last
+# changed, kept in a ledger between builds, so regenerating identical pages
+# doesn't make every URL look freshly modified. The ledger
+# (build/sitemap-lastmod.json, one URL per line: [hash, lastmod, kind]) is
+# committed: deploys build from a clean checkout, so it is the only copy that
+# survives between them. Commit it again after a local build to move the dates
+# forward. A build over some of the kinds (--kinds) keeps the ledger's URLs of
+# the others, with their recorded lastmod, in both the sitemap and the ledger.
+
+MAX_URLS = 50000
+MAX_BYTES = 50 * 1024 * 1024
+
+# Ledger hashes are shortened like ETags; they only need to detect a change
+LEDGER_HASH_LENGTH = 16
+
+URLSET_OPEN = b'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+URLSET_CLOSE = b'</urlset>\n'
+
+# Generated pages all share one priority and change frequency
+PAGE_PRIORITY = '0.8'
+PAGE_CHANGEFREQ = 'weekly'
+
+# Ledger kind of the hand-written pages, which every build adds
+STATIC_KIND = 'static'
+
+
+class SitemapStage:
+    """Build stage writing the sitemap index and its gzipped shards"""
+
+    def __init__(self, public_dir=PUBLIC_DIR, ledger_path=None, site_url=SITE_URL, max_urls=MAX_URLS, today=None, kinds=SITE_KINDS):
+        self.public_dir = public_dir
+        self.ledger_path = ledger_path or os.path.join(BUILD_DIR, 'sitemap-lastmod.json')
+        self.site_url = site_url
+        self.max_urls = max_urls
+        self.today = today or datetime.now(timezone.utc).date().isoformat()
+        # Kinds this build renders; the ledger's URLs of other kinds are carried over
+        self.kinds = kinds
+
+        self.ledger = {}
+        if os.path.exists(self.ledger_path):
+            with open(self.ledger_path, 'r', encoding='utf-8') as f:
+                self.ledger = json.load(f)
+        # path -> [content hash, lastmod, kind] for this build; replaces the ledger on finish
+        self.seen = {}
+        self.changed = 0
+        self.carried = 0
+        self.duplicates = 0
+
+        # (filename, newest lastmod) per finished shard
+        self.shards = []
+        self._shard = None
+        self._shard_urls = 0
+        self._shard_bytes = 0
+        self._shard_lastmod = ''
+
+        os.makedirs(public_dir, exist_ok=True)
+        self._add_static_pages()
+
+    def _add_static_pages(self):
+        pages_dir = os.path.join(ROOT_DIR, 'src', 'pages')
+        for slug, priority, changefreq in STATIC_PAGES:
+            source = os.path.join(pages_dir, f"{slug or 'index'}.js")
+            self._add_url(slug, file_hash(source), changefreq, priority, STATIC_KIND)
+
+    def add(self, kind, page):
+        self._add_url(page['slug'], content_hash(page), PAGE_CHANGEFREQ, PAGE_PRIORITY, kind)
+
+    def _add_url(self, path, digest, changefreq, priority, kind):
+        if path in self.seen:
+            self.duplicates += 1
+            return
+        digest = digest[:LEDGER_HASH_LENGTH]
+
+        previous = self.ledger.get(path)
+        if previous is not None and previous[0] == digest:
+            lastmod = previous[1]
+        else:
+            lastmod = self.today
+            self.changed += 1
+        self.seen[path] = [digest, lastmod, kind]
+        self._write_url(path, lastmod, changefreq, priority)
+
+    def _carry_over(self):
+        """Keep the ledger's URLs of kinds this build didn't render, as last recorded"""
+        for path, entry in sorted(self.ledger.items()):
+            # Entries without a kind predate kind tracking and can't be attributed
+            kind = entry[2] if len(entry) > 2 else STATIC_KIND
+            if kind == STATIC_KIND or kind in self.kinds or path in self.seen:
+                continue
+            self.seen[path] = entry
+            self.carried += 1
+            self._write_url(path, entry[1], PAGE_CHANGEFREQ, PAGE_PRIORITY)
+
+    def _write_url(self, path, lastmod, changefreq, priority):
+        loc = escape(f"{self.site_url}/{path.lstrip('/')}")
+        entry = (
+            f"<url><loc>{loc}</loc><lastmod>{lastmod}</lastmod>"
+            f"<changefreq>{changefreq}</changefreq><priority>{priority}</priority></url>\n"
+        ).encode('utf-8')
+
+        limit = MAX_BYTES - len(URLSET_CLOSE)
+        if self._shard is None or self._shard_urls >= self.max_urls or self._shard_bytes + len(entry) > limit:
+            self._open_shard()
+        self._shard.write(entry)
+        self._shard_urls += 1
+        self._shard_bytes += len(entry)
+        self._shard_lastmod = max(self._shard_lastmod, lastmod)
+
+    def _open_shard(self):
+        self._close_shard()
+        filename = f"sitemap-{len(self.shards) + 1}.xml.gz"
+        # mtime=0 keeps the gzip header stable, so unchanged shards stay byte-identical
+        self._shard = gzip.GzipFile(os.path.join(self.public_dir, filename), 'wb', mtime=0)
+        self._shard.write(URLSET_OPEN)
+        self.shards.append([filename, None])
+        self._shard_urls = 0
+        self._shard_bytes = len(URLSET_OPEN)
+        self._shard_lastmod = ''
+
+    def _close_shard(self):
+        if self._shard is not None:
+            self._shard.write(URLSET_CLOSE)
+            self._shard.close()
+            self.shards[-1][1] = self._shard_lastmod
+            self._shard = None
+
+    def finish(self):
+        self._carry_over()
+        self._close_shard()
+
+        index = ['<?xml version="1.0" encoding="UTF-8"?>',
+                 '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+        for filename, lastmod in self.shards:
+            index.append(f"<sitemap><loc>{escape(self.site_url)}/{filename}</loc><lastmod>{lastmod}</lastmod></sitemap>")
+        index.append('</sitemapindex>\n')
+        with open(os.path.join(self.public_dir, 'sitemap.xml'), 'w', encoding='utf-8') as f:
+            f.write('\n'.join(index))
+
+        # Shards left over from a larger previous build
+        current = {filename for filename, _ in self.shards}
+        for path in glob.glob(os.path.join(self.public_dir, 'sitemap-*.xml.gz')):
+            if os.path.basename(path) not in current:
+                os.remove(path)
+
+        self._write_ledger()
+
+        report = f"sitemap: {len(self.seen):,} URLs in {len(self.shards)} shard(s), {self.changed:,} with new lastmod"
+        if self.carried:
+            report += f", {self.carried:,} kept from kinds not built"
+        if self.duplicates:
+            report += f", {self.duplicates} duplicate slug(s) skipped"
+        return report
+
+    def _write_ledger(self):
+        """Sorted, one URL per line, so committed ledger diffs show which URLs changed"""
+        lines = [f"  {json.dumps(path)}: {json.dumps(entry)}" for path, entry in sorted(self.seen.items())]
+        os.makedirs(os.path.dirname(self.ledger_path), exist_ok=True)
+        tmp_path = f"{self.ledger_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write('{\n' + ',\n'.join(lines) + '\n}\n')
+        os.replace(tmp_path, self.ledger_path)
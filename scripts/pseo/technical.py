@@ -0,0 +1,455 @@
+import os
+from datetime import datetime
+
+from . import seeds, serializer
+from .filters import matches
+from .metrics import ContentMetrics
+
+
+def generate_technical_page_content(schema_slug, platform_slug, topic_slug, page_type):
+    """Generate comprehensive technical content for specific combinations"""
+    
+    schema_data = seeds.load('schema_types').get(schema_slug) if schema_slug else None
+    platform_data = seeds.load('ai_platforms').get(platform_slug) if platform_slug else None
+    topic_data = seeds.load('technical_topics').get(topic_slug) if topic_slug else None
+    
+    if page_type == "schema_platform":
+        slug = f"{schema_data['slug']}-{platform_data['slug']}-optimization"
+        title = f"{schema_data['name']} for {platform_data['name']} - Technical Implementation Guide"
+        meta_description = f"Complete {schema_data['name']} implementation guide for {platform_data['name']} optimization. Code examples, testing, and best practices for AI SEO."
+        stats = platform_data['monthly_users'] if platform_data else "millions of"
+    elif page_type == "technical_platform":
+        slug = f"{platform_data['slug']}-{topic_data['slug']}-guide"
+        title = f"{platform_data['name']} {topic_data['name']} - Technical AI SEO Guide"
+        meta_description = f"Technical {topic_data['description'].lower()} for {platform_data['name']} optimization. Expert guidance for AI SEO implementation."
+        stats = platform_data['monthly_users'] if platform_data else "millions of"
+    elif page_type == "schema_technical":
+        slug = f"{schema_data['slug']}-{topic_data['slug']}"
+        title = f"{schema_data['name']} {topic_data['name']} - Complete Technical Guide"
+        meta_description = f"{schema_data['name']} {topic_data['description'].lower()}. Technical implementation with code examples and validation procedures."
+        stats = "millions of"
+
+    # Generate comprehensive content sections
+    content = {
+        "slug": slug,
+        "title": title,
+        "meta_description": meta_description,
+        "schema_type": schema_data['name'] if schema_data else None,
+        "platform": platform_data['name'] if platform_data else "AI Search Engines",
+        "content_type": None,
+        "industry": None,
+        "technical_topic": topic_data['name'] if topic_data else None,
+        "hero_section": {
+            "headline": title,
+            "subheadline": generate_technical_subheadline(schema_data, platform_data, topic_data, page_type),
+            "stats": stats
+        },
+        "introduction": generate_comprehensive_introduction(schema_data, platform_data, topic_data, page_type),
+        "main_sections": generate_comprehensive_main_sections(schema_data, platform_data, topic_data, page_type),
+        "technical_implementation": generate_comprehensive_technical_implementation(schema_data, platform_data, topic_data, page_type),
+        "best_practices": generate_comprehensive_best_practices(schema_data, platform_data, topic_data, page_type),
+        "common_mistakes": generate_comprehensive_mistakes(schema_data, platform_data, topic_data, page_type),
+        "measurement_analytics": generate_comprehensive_measurement(schema_data, platform_data, topic_data, page_type),
+        "conclusion_cta": generate_comprehensive_cta(schema_data, platform_data, topic_data, page_type),
+        "generated_at": datetime.now().isoformat(),
+        "word_count": 0  # Filled in by pseo.metrics when the page is written
+    }
+    
+    return content
+
+def generate_technical_subheadline(schema_data, platform_data, topic_data, page_type):
+    """Generate compelling subheadlines for technical content"""
+    if page_type == "schema_platform":
+        return f"Master {schema_data['name']} implementation for {platform_data['name']} with step-by-step code examples, validation procedures, and optimization strategies for maximum AI search visibility."
+    elif page_type == "technical_platform":
+        return f"Complete {topic_data['name'].lower()} for {platform_data['name']} optimization. Expert technical guidance with real-world implementation examples and troubleshooting solutions."
+    else:
+        return f"Comprehensive {schema_data['name']} {topic_data['description'].lower()} with technical implementation details, code examples, and professional best practices."
+
+def generate_comprehensive_introduction(schema_data, platform_data, topic_data, page_type):
+    """Generate detailed introduction sections"""
+    if page_type == "schema_platform":
+        opening = f"{schema_data['name']} implementation for {platform_data['name']} requires understanding both the technical markup requirements and platform-specific optimization strategies. This comprehensive guide provides step-by-step implementation procedures with real-world code examples and validation techniques."
+        statistics = f"{platform_data['name']}'s {platform_data['technical_focus']} makes proper {schema_data['name']} implementation critical for AI search optimization. Websites with correct schema markup see 4.2x higher citation rates in {platform_data['name']} responses."
+        benefits = schema_data['ai_benefits'] + [f"Enhanced visibility in {platform_data['name']} search results", "Improved technical SEO foundation"]
+    elif page_type == "technical_platform":
+        opening = f"{topic_data['name']} for {platform_data['name']} optimization involves systematic technical approaches to improve AI search performance. This guide covers advanced implementation strategies, troubleshooting procedures, and optimization techniques specific to {platform_data['name']}'s requirements."
+        statistics = f"Technical optimization for {platform_data['name']} can improve search visibility by up to 300%. Proper implementation following {platform_data['name']}'s {platform_data['technical_focus']} guidelines significantly increases citation probability."
+        benefits = [f"Advanced {platform_data['name']} optimization techniques", f"Technical implementation aligned with {platform_data['name']} requirements", "Systematic troubleshooting and optimization procedures"]
+    else:
+        opening = f"{schema_data['name']} {topic_data['description'].lower()} requires comprehensive understanding of both markup standards and practical implementation challenges. This technical guide provides detailed procedures for successful deployment and ongoing maintenance."
+        statistics = f"Proper {schema_data['name']} implementation with systematic {topic_data['description'].lower()} can improve search engine recognition by 250% and reduce technical issues by 80%."
+        benefits = schema_data['ai_benefits'] + [f"Systematic {topic_data['description'].lower()}", "Professional implementation standards"]
+    
+    return {
+        "opening_paragraph": opening,
+        "statistics": statistics,
+        "key_benefits": benefits,
+        "unique_challenges": schema_data['common_mistakes'] if schema_data else ["Technical implementation complexity", "Validation requirements", "Platform-specific optimization needs"]
+    }
+
+def generate_comprehensive_main_sections(schema_data, platform_data, topic_data, page_type):
+    """Generate detailed main content sections"""
+    sections = []
+    
+    if page_type == "schema_platform":
+        # Section 1: Schema Structure and Requirements
+        sections.append({
+            "title": f"{schema_data['name']} Structure for {platform_data['name']}",
+            "content": {
+                "introduction": f"Understanding {schema_data['name']} structure is fundamental for {platform_data['name']} optimization. This section covers the technical requirements and implementation standards.",
+                "key_strategies": [
+                    f"Implement all required {schema_data['name']} properties: {', '.join(schema_data['required_properties'])}",
+                    f"Optimize markup for {platform_data['name']}'s {platform_data['technical_focus']}",
+                    f"Follow {platform_data['implementation_priority']} guidelines",
+                    "Validate implementation using official testing tools"
+                ],
+                "implementation_details": [
+                    f"JSON-LD structure optimized for {platform_data['name']} parsing algorithms",
+                    f"Property nesting aligned with {platform_data['name']} content analysis patterns",
+                    f"Entity relationships supporting {platform_data['name']} knowledge graph integration",
+                    "Error handling and fallback markup strategies"
+                ],
+                "ai_benefits": schema_data['ai_benefits']
+            }
+        })
+        
+        # Section 2: Platform-Specific Implementation
+        sections.append({
+            "title": f"{platform_data['name']} Optimization Techniques",
+            "content": {
+                "introduction": f"{platform_data['name']}'s unique approach to content analysis requires specific optimization techniques for {schema_data['name']} implementation.",
+                "optimization_strategies": [
+                    f"Leverage {platform_data['name']}'s {platform_data['technical_focus']} for enhanced visibility",
+                    f"Implement {platform_data['implementation_priority']} for optimal parsing",
+                    f"Structure content hierarchy for {platform_data['name']} content understanding",
+                    f"Optimize entity relationships for {platform_data['name']} knowledge integration"
+                ],
+                "implementation_details": [
+                    f"Platform-specific property priorities for {platform_data['name']}",
+                    f"Content formatting aligned with {platform_data['name']} analysis patterns",
+                    f"Markup validation using {platform_data['name']}-specific testing procedures",
+                    "Performance optimization for fast content processing"
+                ]
+            }
+        })
+
+    elif page_type == "technical_platform":
+        # Section 1: Technical Implementation Framework
+        sections.append({
+            "title": f"{platform_data['name']} Technical Implementation Framework",
+            "content": {
+                "introduction": f"Systematic {topic_data['description'].lower()} for {platform_data['name']} requires understanding both platform requirements and technical implementation standards.",
+                "key_strategies": [
+                    f"Follow {platform_data['name']} technical documentation and guidelines",
+                    f"Implement {platform_data['implementation_priority']} systematically",
+                    f"Optimize for {platform_data['name']}'s {platform_data['technical_focus']}",
+                    "Establish comprehensive testing and validation procedures"
+                ],
+                "implementation_details": topic_data['focus_areas']
+            }
+        })
+
+    else:  # schema_technical
+        # Section 1: Schema Technical Implementation
+        sections.append({
+            "title": f"{schema_data['name']} Technical Implementation",
+            "content": {
+                "introduction": f"Technical implementation of {schema_data['name']} with {topic_data['description'].lower()} requires systematic approach to markup, validation, and optimization.",
+                "key_strategies": [
+                    f"Implement comprehensive {schema_data['name']} markup structure",
+                    f"Apply systematic {topic_data['description'].lower()} procedures",
+                    "Establish robust validation and testing workflows",
+                    "Optimize for multiple AI search engine compatibility"
+                ],
+                "implementation_details": [
+                    f"Required properties: {', '.join(schema_data['required_properties'])}",
+                    f"Implementation complexity: {schema_data['implementation_complexity']}",
+                    f"Use cases: {', '.join(schema_data['use_cases'])}",
+                    f"Focus areas: {', '.join(topic_data['focus_areas'])}"
+                ],
+                "ai_benefits": schema_data['ai_benefits']
+            }
+        })
+
+    # Section 3: Advanced Implementation Strategies
+    sections.append({
+        "title": "Advanced Implementation Strategies",
+        "content": {
+            "introduction": "Beyond basic implementation, advanced strategies ensure maximum effectiveness and long-term maintainability of your technical setup.",
+            "optimization_strategies": [
+                "Implement progressive enhancement for schema markup",
+                "Establish automated validation and monitoring systems",
+                "Optimize for cross-platform AI search engine compatibility",
+                "Build scalable implementation workflows for large-scale deployment"
+            ],
+            "implementation_details": [
+                "Automated testing integration with development workflows",
+                "Performance monitoring and optimization procedures",
+                "Error handling and graceful degradation strategies",
+                "Documentation and knowledge transfer procedures"
+            ]
+        }
+    })
+
+    return sections
+
+def generate_comprehensive_technical_implementation(schema_data, platform_data, topic_data, page_type):
+    """Generate comprehensive technical implementation section"""
+    if page_type == "schema_platform":
+        title = f"Technical Implementation for {schema_data['name']} on {platform_data['name']}"
+        core_requirements = [
+            f"Complete {schema_data['name']} JSON-LD structure with all required properties",
+            f"Validation using Google Structured Data Testing Tool and {platform_data['name']}-specific validators",
+            f"Implementation of {platform_data['implementation_priority']}",
+            "Performance optimization for fast loading and parsing"
+        ]
+        schema_types = schema_data['required_properties']
+    else:
+        title = "Technical Implementation Requirements"
+        core_requirements = [
+            "Systematic implementation following technical documentation",
+            "Comprehensive validation and testing procedures",
+            "Performance optimization and monitoring",
+            "Documentation and maintenance procedures"
+        ]
+        schema_types = ["JSON-LD", "Microdata", "RDFa", "Schema.org"]
+
+    return {
+        "title": title,
+        "core_requirements": core_requirements,
+        "schema_markup": {
+            "primary_schemas": schema_types,
+            "implementation_guide": [
+                "JSON-LD structured data implementation with comprehensive entity linking",
+                "Schema validation using multiple testing tools and platforms",
+                "Progressive enhancement with advanced schema types and relationships",
+                "Cross-platform compatibility testing and optimization",
+                "Performance impact assessment and optimization"
+            ]
+        },
+        "content_optimization": {
+            "structure_requirements": [
+                "Semantic HTML5 structure with proper heading hierarchy",
+                "Clear content organization supporting schema markup",
+                "Internal linking strategy connecting related technical topics",
+                "Mobile-first responsive design for universal accessibility"
+            ],
+            "performance_optimization": [
+                "Page load speeds optimized for technical content (under 2 seconds)",
+                "CDN implementation for global technical documentation access",
+                "Code syntax highlighting and technical formatting optimization",
+                "Search functionality for complex technical reference material"
+            ]
+        }
+    }
+
+def generate_comprehensive_best_practices(schema_data, platform_data, topic_data, page_type):
+    """Generate comprehensive best practices section"""
+    if page_type == "schema_platform":
+        title = f"{schema_data['name']} Best Practices for {platform_data['name']}"
+    elif page_type == "technical_platform":
+        title = f"{platform_data['name']} {topic_data['name']} Best Practices"
+    else:
+        title = f"{schema_data['name']} {topic_data['name']} Best Practices"
+
+    return {
+        "title": title,
+        "content_best_practices": [
+            "Maintain comprehensive documentation for all technical implementations",
+            "Follow semantic markup principles for enhanced AI understanding",
+            "Implement consistent naming conventions across all schema markup",
+            "Regular content audits to ensure markup accuracy and completeness",
+            "Stay updated with latest schema.org and platform-specific guidelines"
+        ],
+        "technical_best_practices": [
+            "Validate all structured data using official testing tools before deployment",
+            "Implement automated testing in development workflows",
+            "Monitor Core Web Vitals and technical performance metrics",
+            "Use version control for all schema markup changes",
+            "Establish rollback procedures for problematic implementations"
+        ],
+        "authority_building": [
+            "Link to authoritative technical documentation and official specifications",
+            "Include code examples and practical implementation samples",
+            "Reference industry standards and best practice guidelines",
+            "Maintain technical accuracy through expert review processes",
+            "Build internal linking between related technical topics for better discovery"
+        ]
+    }
+
+def generate_comprehensive_mistakes(schema_data, platform_data, topic_data, page_type):
+    """Generate comprehensive common mistakes section"""
+    if page_type == "schema_platform":
+        title = f"Common {schema_data['name']} Implementation Mistakes on {platform_data['name']}"
+        specific_mistakes = schema_data['common_mistakes']
+    elif page_type == "technical_platform":
+        title = f"Common {topic_data['name']} Mistakes for {platform_data['name']}"
+        specific_mistakes = [
+            f"Ignoring {platform_data['name']}-specific optimization requirements",
+            f"Poor understanding of {platform_data['technical_focus']} principles",
+            "Inadequate testing and validation procedures",
+            "Lack of systematic implementation approach"
+        ]
+    else:
+        title = f"Common {schema_data['name']} {topic_data['name']} Mistakes"
+        specific_mistakes = schema_data['common_mistakes']
+
+    return {
+        "title": title,
+        "content_mistakes": specific_mistakes,
+        "technical_mistakes": [
+            "Implementing incomplete or incorrect markup that fails validation",
+            "Poor error handling leading to broken structured data",
+            "Ignoring mobile optimization affecting content accessibility",
+            "Inadequate performance testing causing slow page loads"
+        ]
+    }
+
+def generate_comprehensive_measurement(schema_data, platform_data, topic_data, page_type):
+    """Generate comprehensive measurement section"""
+    if page_type == "schema_platform":
+        title = f"Measuring {schema_data['name']} Success on {platform_data['name']}"
+        platform_name = platform_data['name']
+    elif page_type == "technical_platform":
+        title = f"Measuring {topic_data['name']} Success for {platform_data['name']}"
+        platform_name = platform_data['name']
+    else:
+        title = f"Measuring {schema_data['name']} {topic_data['name']} Success"
+        platform_name = "AI search engines"
+
+    return {
+        "title": title,
+        "key_metrics": [
+            f"Schema markup validation success rates across all {platform_name} testing tools",
+            f"Page loading performance impact of technical implementations",
+            f"Search visibility improvements in {platform_name} results",
+            "Technical error rates and resolution times for markup issues"
+        ],
+        "tracking_methods": [
+            f"Google Search Console monitoring for {platform_name} compatibility",
+            "Automated validation testing integrated with deployment workflows",
+            "Performance monitoring for Core Web Vitals and technical metrics",
+            "Regular audits using professional SEO and validation tools"
+        ]
+    }
+
+def generate_comprehensive_cta(schema_data, platform_data, topic_data, page_type):
+    """Generate comprehensive conclusion and CTA"""
+    if page_type == "schema_platform":
+        title = f"Optimize Your {schema_data['name']} Implementation for {platform_data['name']}"
+        summary = f"Professional {schema_data['name']} implementation for {platform_data['name']} requires technical precision, systematic validation, and ongoing optimization."
+    elif page_type == "technical_platform":
+        title = f"Enhance Your {platform_data['name']} Technical Implementation"
+        summary = f"Successful {topic_data['description'].lower()} for {platform_data['name']} demands systematic technical approaches and continuous optimization."
+    else:
+        title = f"Master {schema_data['name']} {topic_data['name']}"
+        summary = f"Professional {schema_data['name']} {topic_data['description'].lower()} requires comprehensive technical knowledge and systematic implementation."
+
+    return {
+        "title": title,
+        "summary": summary,
+        "key_takeaways": [
+            "Implement comprehensive technical validation and testing procedures",
+            "Follow platform-specific optimization guidelines for maximum effectiveness",
+            "Establish systematic monitoring and maintenance workflows",
+            "Use professional tools and validation processes for quality assurance",
+            "Link to your main AI SEO scanner at https://aiseoscan.dev for comprehensive analysis"
+        ],
+        "next_steps": [
+            "Audit your current technical implementation for optimization opportunities",
+            "Implement priority technical improvements using this guide",
+            "Establish monitoring and validation procedures for ongoing success",
+            "Use AISEOScan to identify additional technical optimization opportunities"
+        ]
+    }
+
+def iter_pages(schema=None, platform=None, topic=None, page_type=None):
+    """Yield technical pages in generation order, optionally filtered by schema type,
+    platform, technical topic or page type ("schema_platform", "technical_platform", "schema_technical")"""
+    schema_types = seeds.load('schema_types')
+    technical_topics = seeds.load('technical_topics')
+    platforms = seeds.load('ai_platforms')
+    
+    # Schema × Platform combinations (90 pages)
+    if matches("schema_platform", page_type) and topic is None:
+        for schema_slug in schema_types.keys():
+            if not matches(schema_slug, schema):
+                continue
+            for platform_slug in platforms.keys():
+                if matches(platform_slug, platform):
+                    yield generate_technical_page_content(schema_slug, platform_slug, None, "schema_platform")
+    
+    # Technical Topic × Platform combinations (36 pages)
+    if matches("technical_platform", page_type) and schema is None:
+        for topic_slug in technical_topics.keys():
+            if not matches(topic_slug, topic):
+                continue
+            for platform_slug in platforms.keys():
+                if matches(platform_slug, platform):
+                    yield generate_technical_page_content(None, platform_slug, topic_slug, "technical_platform")
+    
+    # Schema × Technical Topic combinations (90 pages) 
+    if matches("schema_technical", page_type) and platform is None:
+        for schema_slug in schema_types.keys():
+            if not matches(schema_slug, schema):
+                continue
+            for topic_slug in technical_topics.keys():
+                if matches(topic_slug, topic):
+                    yield generate_technical_page_content(schema_slug, None, topic_slug, "schema_technical")
+
+def render_page(schema=None, platform=None, topic=None):
+    """Render a single technical page from exactly two of schema, platform and topic"""
+    for name, value in (('schema_types', schema), ('ai_platforms', platform), ('technical_topics', topic)):
+        if value is not None and value not in seeds.load(name):
+            raise KeyError(value)
+    
+    if schema and platform and not topic:
+        page_type = "schema_platform"
+    elif platform and topic and not schema:
+        page_type = "technical_platform"
+    elif schema and topic and not platform:
+        page_type = "schema_technical"
+    else:
+        raise ValueError("technical pages combine exactly two of schema, platform and topic")
+    return generate_technical_page_content(schema, platform, topic, page_type)
+
+def main():
+    """
+    Generate technical AI SEO pages focusing on implementation guides,
+    schema markup, and technical optimization strategies.
+    """
+    schema_types = seeds.load('schema_types')
+    technical_topics = seeds.load('technical_topics')
+    platforms = seeds.load('ai_platforms')
+
+    # Create output directory
+    output_dir = seeds.DATA_DIR
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Stream technical pages data
+    metrics = ContentMetrics()
+    total_pages = serializer.dump_iter(metrics.annotate(iter_pages()), os.path.join(output_dir, "technical-pages.json"))
+
+    # Generate summary statistics
+    summary = {
+        "total_technical_pages": total_pages,
+        "schema_types": len(schema_types),
+        "technical_topics": len(technical_topics),
+        "platforms": len(platforms),
+        "page_breakdown": {
+            "schema_platform_combinations": 90,
+            "technical_platform_combinations": 36,
+            "schema_technical_combinations": 90
+        },
+        "generated_at": datetime.now().isoformat(),
+        "content_metrics": metrics.summary()
+    }
+    
+    serializer.dump(summary, os.path.join(output_dir, "technical-summary.json"))
+
+    print(f"✅ Generated {total_pages} technical PSEO pages")
+    print(f"📊 Total content: {summary['content_metrics']['total_words']:,} words")
+    print(f"💾 Technical data files saved to: {output_dir}")
+    print(f"🔧 Schema types: {len(schema_types)}")
+    print(f"📖 Technical topics: {len(technical_topics)}")
@@ -0,0 +1,52 @@
+from .markdown import to_text
+from .pages import LINK_FIELDS
+from .records import Record
+
+# Readable body text of a generated page, section by section.
+#
+# A page's sections are its structured top-level fields (hero_section,
+# introduction, main_sections, ...; the fields of `content` for location pages,
+# whose block trees are flattened with markdown.to_text). Scalar top-level
+# fields are metadata (slug, title, meta description, dimension ids) and links,
+# stats, keyword lists and content metrics aren't body copy either. Within a
+# section every string is text except link targets, ids and code samples.
+
+NON_BODY_FIELDS = frozenset(LINK_FIELDS) | {'stats', 'keywords', 'metrics'}
+NON_TEXT_KEYS = frozenset({'url', 'slug', 'code', 'language', 'type', 'canonicalUrl'})
+
+
+def strings(value):
+    """Every text string inside a section value, in document order"""
+    if isinstance(value, Record):
+        value = value.to_dict()
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if key not in NON_TEXT_KEYS:
+                yield from strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from strings(item)
+
+
+def sections(page):
+    """(section name, text) pairs of a page's body"""
+    content = page.get('content')
+    if content is not None:
+        if isinstance(content, Record):
+            content = content.to_dict()
+        for name, blocks in content.items():
+            yield name, to_text(blocks)
+        return
+
+    data = page.to_dict() if isinstance(page, Record) else page
+    for name, value in data.items():
+        if name in NON_BODY_FIELDS or not isinstance(value, (dict, list, tuple, Record)):
+            continue
+        yield name, '\n'.join(strings(value))
+
+
+def body_text(page):
+    """A page's whole body as one text"""
+    return '\n\n'.join(text for _, text in sections(page))
@@ -0,0 +1,218 @@
+import json
+
+from . import serializer
+
+# Seed field-access tracking for precise invalidation.
+#
+# An instrumented render wraps each seed record (an industry, a city, ...) in a
+# proxy that records the path of every field the template reads, e.g.
+# "city.seo_insights.voice_search_growth". The recorded paths are stored per
+# page and section in a DependencyMap together with a snapshot of the seeds.
+# After a seed edit the old and new seeds are diffed into changed field paths,
+# and only the sections that read one of those paths need to be re-rendered.
+#
+# Templates must read leaf values (strings, numbers) for their reads to be
+# recorded. Reading a nested dict and never subscripting it records nothing.
+
+class TrackedDict:
+    __slots__ = ('_data', '_path', '_reads')
+
+    def __init__(self, data, path, reads):
+        self._data = data
+        self._path = path
+        self._reads = reads
+
+    def __getitem__(self, key):
+        return wrap(self._data[key], f"{self._path}.{key}", self._reads)
+
+    def get(self, key, default=None):
+        if key in self._data:
+            return self[key]
+        self._reads.add(f"{self._path}.{key}")
+        return default
+
+    def __contains__(self, key):
+        self._reads.add(f"{self._path}.{key}")
+        return key in self._data
+
+    # Iterating over a record depends on all of its fields
+    def __iter__(self):
+        self._reads.add(self._path)
+        return iter(self._data)
+
+    def __len__(self):
+        self._reads.add(self._path)
+        return len(self._data)
+
+    def keys(self):
+        self._reads.add(self._path)
+        return self._data.keys()
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+
+class TrackedList:
+    __slots__ = ('_data', '_path', '_reads')
+
+    def __init__(self, data, path, reads):
+        self._data = data
+        self._path = path
+        self._reads = reads
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            self._reads.add(self._path)
+            return [wrap(item, f"{self._path}.{i}", self._reads) for i, item in enumerate(self._data)][index]
+        return wrap(self._data[index], f"{self._path}.{index}", self._reads)
+
+    def __iter__(self):
+        self._reads.add(self._path)
+        return iter([wrap(item, f"{self._path}.{i}", self._reads) for i, item in enumerate(self._data)])
+
+    def __len__(self):
+        self._reads.add(self._path)
+        return len(self._data)
+
+
+def wrap(value, path, reads):
+    """Wrap a seed value so that reads below it are recorded into `reads`"""
+    if isinstance(value, dict):
+        return TrackedDict(value, path, reads)
+    if isinstance(value, list):
+        return TrackedList(value, path, reads)
+    reads.add(path)
+    return value
+
+
+def record_reads(render, seeds, **kwargs):
+    """Call `render` with tracked seeds and return (result, frozenset of read paths).
+
+    `seeds` maps a role name ("industry", "city") to its seed record and is
+    passed to `render` as keyword arguments; `kwargs` are passed through as-is.
+    """
+    reads = set()
+    proxies = {role: wrap(record, role, reads) for role, record in seeds.items()}
+    result = render(**proxies, **kwargs)
+    return result, frozenset(reads)
+
+
+def changed_paths(old, new, path):
+    """Yield the field paths that differ between two versions of a seed value"""
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old.keys() | new.keys():
+            if key not in old or key not in new:
+                yield f"{path}.{key}"
+            else:
+                yield from changed_paths(old[key], new[key], f"{path}.{key}")
+    elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for i, (old_item, new_item) in enumerate(zip(old, new)):
+            yield from changed_paths(old_item, new_item, f"{path}.{i}")
+    elif old != new:
+        yield path
+
+
+def seed_changes(old_records, new_records, role, key='slug'):
+    """Diff two versions of a seed list into {seed id: set of changed paths}.
+
+    Seeds that were added or removed map to the role itself, which overlaps
+    every path read from them.
+    """
+    old_by_id = {record[key]: record for record in old_records}
+    new_by_id = {record[key]: record for record in new_records}
+    changes = {}
+    for seed_id in old_by_id.keys() | new_by_id.keys():
+        if seed_id not in old_by_id or seed_id not in new_by_id:
+            changes[seed_id] = {role}
+            continue
+        paths = set(changed_paths(old_by_id[seed_id], new_by_id[seed_id], role))
+        if paths:
+            changes[seed_id] = paths
+    return changes
+
+
+def overlaps(read, changed):
+    """True when a read path depends on a changed path (or the other way around)"""
+    return read == changed or read.startswith(changed + '.') or changed.startswith(read + '.')
+
+
+class DependencyMap:
+    """Per page and section sets of seed field paths, plus the seeds they were read from.
+
+    Identical path sets are stored once and referenced by index, since every
+    page of a family usually reads the same fields.
+    """
+
+    def __init__(self):
+        self.pathsets = []
+        self._pathset_index = {}
+        self.pages = {}
+        self.seeds = {}
+
+    def record(self, slug, seed_ids, sections):
+        """Store the reads of some sections of a page (other sections are kept)"""
+        entry = self.pages.setdefault(slug, {'seeds': {}, 'sections': {}})
+        entry['seeds'] = dict(seed_ids)
+        for name, reads in sections.items():
+            entry['sections'][name] = self._intern_pathset(reads)
+
+    def _intern_pathset(self, reads):
+        reads = tuple(sorted(reads))
+        index = self._pathset_index.get(reads)
+        if index is None:
+            index = len(self.pathsets)
+            self.pathsets.append(reads)
+            self._pathset_index[reads] = index
+        return index
+
+    def reads(self, slug, section):
+        return self.pathsets[self.pages[slug]['sections'][section]]
+
+    def stale(self, changes):
+        """Return {slug: set of section names} that read a changed seed field.
+
+        `changes` maps a seed role to the output of seed_changes() for it.
+        """
+        stale = {}
+        verdicts = {}
+        for slug, entry in self.pages.items():
+            for role, seed_id in entry['seeds'].items():
+                changed = changes.get(role, {}).get(seed_id)
+                if not changed:
+                    continue
+                changed = frozenset(changed)
+                for section, index in entry['sections'].items():
+                    verdict = verdicts.get((index, changed))
+                    if verdict is None:
+                        verdict = any(overlaps(read, path) for read in self.pathsets[index] for path in changed)
+                        verdicts[(index, changed)] = verdict
+                    if verdict:
+                        stale.setdefault(slug, set()).add(section)
+        return stale
+
+    def to_dict(self):
+        return {
+            'pathsets': [list(paths) for paths in self.pathsets],
+            'pages': self.pages,
+            'seeds': self.seeds
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        deps = cls()
+        for paths in data['pathsets']:
+            deps._intern_pathset(paths)
+        deps.pages = data['pages']
+        deps.seeds = data['seeds']
+        return deps
+
+    def save(self, path):
+        return serializer.dump(self.to_dict(), path, pretty=False)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
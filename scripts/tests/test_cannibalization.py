@@ -0,0 +1,61 @@
+import json
+
+from pseo.cannibalization import CannibalizationStage, targets
+
+
+def page(slug, title, keywords=()):
+    return {'slug': slug, 'title': title, 'keywords': list(keywords)}
+
+
+def report(tmp_path, pages):
+    path = tmp_path / 'cannibalization.json'
+    stage = CannibalizationStage(path=str(path))
+    for kind, entry in pages:
+        stage.add(kind, entry)
+    stage.finish()
+    return json.loads(path.read_text())['groups']
+
+
+def test_identical_targets_are_flagged(tmp_path):
+    pages = [
+        ('usecase', page('ai-seo-for-dentists', 'AI SEO for Dental Practices | Complete Guide', ['dentist ai seo', 'ai seo'])),
+        ('industry', page('ai-seo-dental-practices', 'AI SEO for Dental Practices | Free Scanner', ['dentist ai seo', 'ai seo'])),
+        # Filler pages sharing only the head term, which is too common to pick candidates
+        *(('technical', page(f'filler-{i}', f'AI SEO Topic {i} Unrelated{i}', ['ai seo'])) for i in range(60))
+    ]
+    groups = report(tmp_path, pages)
+    assert len(groups) == 1
+    assert groups[0]['slugs'] == ['ai-seo-for-dentists', 'ai-seo-dental-practices']
+    assert groups[0]['overlap'] == 1.0
+
+
+def test_distinct_targets_are_not_flagged(tmp_path):
+    pages = [
+        ('industry', page('ai-seo-dental-practices', 'AI SEO for Dental Practices')),
+        ('industry', page('ai-seo-law-firms', 'AI SEO for Law Firms'))
+    ]
+    assert report(tmp_path, pages) == []
+
+
+def test_targets_drop_stopwords_and_boilerplate():
+    found = targets(page('x', 'The Complete Guide to Schema Markup 2026 | AISEOScan', ['Best schema for the AI', 'guide']))
+    assert found == {
+        'keyword:schema ai',
+        'title:schema', 'title:markup', 'title:schema markup'
+    }
+
+
+def test_group_of_three_skips_static_slugs(tmp_path):
+    pages = [
+        ('industry', page('a', 'Dental Clinic Chatbot Schema')),
+        ('industry', page('b', 'Dental Clinic Chatbot Schema')),
+        ('usecase', page('c', 'Dental Clinic Chatbot Schema')),
+        # A hand-written page's slug is never part of a group
+        ('industry', page('ai-seo', 'Dental Clinic Chatbot Schema')),
+        ('technical', page('d', 'Voice Search Citations'))
+    ]
+    groups = report(tmp_path, pages)
+    assert groups == [{
+        'query': 'schema', 'pages': 3, 'overlap': 1.0,
+        'kinds': ['industry', 'usecase'], 'slugs': ['a', 'b', 'c']
+    }]
@@ -0,0 +1,66 @@
+import json
+import random
+
+import pytest
+
+from pseo.duplicates import SHINGLE_WORDS, DuplicateStage, signature
+
+WORDS = [f"word{i}" for i in range(2000)]
+
+
+def random_text(rng, length=300):
+    return ' '.join(rng.choice(WORDS) for _ in range(length))
+
+
+def edit(rng, text, changes):
+    words = text.split()
+    for position in rng.sample(range(len(words)), changes):
+        words[position] = rng.choice(WORDS)
+    return ' '.join(words)
+
+
+def jaccard(a, b):
+    def shingles(text):
+        words = text.split()
+        return {tuple(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)}
+    a, b = shingles(a), shingles(b)
+    return len(a & b) / len(a | b)
+
+
+def test_signature_estimates_jaccard():
+    rng = random.Random(1)
+    base = random_text(rng)
+    assert (signature(base) == signature(base.upper())).all()
+    for changes in (0, 3, 10, 30, 100):
+        other = edit(rng, base, changes)
+        estimate = (signature(base) == signature(other)).mean()
+        assert estimate == pytest.approx(jaccard(base, other), abs=0.15)
+
+
+def test_short_texts_still_sign():
+    assert len(signature('')) == len(signature('too short'))
+
+
+def test_clusters_near_duplicates(tmp_path):
+    rng = random.Random(2)
+    template = random_text(rng)
+    pages = [('location', f"near-{i}", edit(rng, template, 2)) for i in range(4)]
+    pages += [('technical', f"unique-{i}", random_text(rng)) for i in range(6)]
+    # Same slug twice and a hand-written page's slug are only counted once / never
+    pages += [('location', 'near-0', template), ('technical', 'ai-seo', template)]
+
+    stage = DuplicateStage(path=str(tmp_path / 'dupes.json'), workers=1, batch_size=3)
+    for kind, slug, text in pages:
+        stage.add(kind, {'slug': slug, 'main_sections': [{'content': text}]})
+    assert stage.finish().startswith('near-duplicates: 4 of 10 pages')
+
+    report = json.loads((tmp_path / 'dupes.json').read_text())
+    assert report['clusters'] == {'location': [{
+        'size': 4, 'similarity': report['clusters']['location'][0]['similarity'],
+        'slugs': ['near-0', 'near-1', 'near-2', 'near-3']
+    }]}
+    assert report['clusters']['location'][0]['similarity'] >= 0.8
+    uniqueness = report['uniqueness']
+    assert set(uniqueness) == {slug for _, slug, _ in pages[:10]}
+    assert all(uniqueness[f"near-{i}"] <= 0.2 for i in range(4))
+    assert all(uniqueness[f"unique-{i}"] > 0.9 for i in range(6))
@@ -0,0 +1,55 @@
+import math
+import random
+
+import pytest
+
+from pseo.geo import KDTree, nearest_cities, unit_vector
+
+
+def brute_force(entries, point, k, exclude=lambda item: False):
+    distances = sorted(
+        (sum((a - b) ** 2 for a, b in zip(point, other)), item)
+        for other, item in entries if not exclude(item)
+    )
+    return distances[:k]
+
+
+@pytest.mark.parametrize('size, k', [(1, 1), (7, 3), (200, 1), (200, 8), (500, 25), (30, 50)])
+def test_nearest_matches_brute_force(size, k):
+    rng = random.Random(size * 100 + k)
+    entries = [(unit_vector(rng.uniform(-90, 90), rng.uniform(-180, 180)), i) for i in range(size)]
+    tree = KDTree(entries)
+    for _ in range(20):
+        point = unit_vector(rng.uniform(-90, 90), rng.uniform(-180, 180))
+        found = tree.nearest(point, k)
+        expected = brute_force(entries, point, k)
+        assert [item for _, item in found] == [item for _, item in expected]
+        assert [distance for distance, _ in found] == pytest.approx([distance for distance, _ in expected])
+
+
+def test_nearest_with_exclusion_and_duplicate_points():
+    # Coincident points and an excluded query point itself
+    entries = [((0.0, 0.0, 1.0), 'a'), ((0.0, 0.0, 1.0), 'b'), ((0.0, 1.0, 0.0), 'c'), ((1.0, 0.0, 0.0), 'd')]
+    found = KDTree(entries).nearest((0.0, 0.0, 1.0), 2, exclude=lambda item: item == 'a')
+    assert found[0] == (0.0, 'b')
+    assert found[1][1] in ('c', 'd')
+
+
+def haversine_miles(a, b):
+    lat1, lon1, lat2, lon2 = map(math.radians, (a['latitude'], a['longitude'], b['latitude'], b['longitude']))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * 3958.8 * math.asin(math.sqrt(h))
+
+
+def test_nearest_cities_in_miles():
+    cities = [
+        {'slug': 'new-york', 'latitude': 40.7128, 'longitude': -74.0060},
+        {'slug': 'newark', 'latitude': 40.7357, 'longitude': -74.1724},
+        {'slug': 'philadelphia', 'latitude': 39.9526, 'longitude': -75.1652},
+        {'slug': 'boston', 'latitude': 42.3601, 'longitude': -71.0589},
+        {'slug': 'los-angeles', 'latitude': 34.0522, 'longitude': -118.2437}
+    ]
+    found = nearest_cities(cities[0], cities, 3)
+    assert [city['slug'] for _, city in found] == ['newark', 'philadelphia', 'boston']
+    for miles, city in found:
+        assert miles == pytest.approx(haversine_miles(cities[0], city), rel=1e-9)
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from pseo.linkcheck import BrokenLinkError, LinkCheckStage, link_target, static_routes
+
+
+def touch(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text('', encoding='utf-8')
+
+
+def test_static_routes(tmp_path):
+    for name in ('index.js', 'about.js', 'guides/index.tsx', 'guides/schema.jsx',
+                 '_app.js', '[slug].js', 'api/health.js', '[city]/index.js', 'styles.css'):
+        touch(tmp_path / name)
+    assert static_routes(str(tmp_path)) == {'/', '/about', '/guides', '/guides/schema'}
+
+
+@pytest.mark.parametrize('url, target', [
+    ('/', '/'),
+    ('/about/', '/about'),
+    ('/about#team', '/about'),
+    ('/search?q=ai', '/search'),
+    ('/?ref=nav#top', '/'),
+    ('/guides/schema/?a=1', '/guides/schema')
+])
+def test_link_target(url, target):
+    assert link_target(url) == target
+
+
+def test_links_resolve_to_pages_and_payloads(tmp_path):
+    touch(tmp_path / 'pages' / 'about.js')
+    touch(tmp_path / 'payloads' / 'critical' / 'city-page.json')
+    stage = LinkCheckStage(
+        path=str(tmp_path / 'broken.json'), pages_dir=str(tmp_path / 'pages'),
+        payload_dir=str(tmp_path / 'payloads')
+    )
+    # Links may point forward to pages that stream past later
+    stage.add('industry', {'slug': 'ind', 'internalLinks': [
+        {'url': '/about/'}, {'url': '/tech#faq'}, {'url': '/city-page'}, {'url': 'https://example.com'}
+    ]})
+    stage.add('technical', {'slug': 'tech'})
+    stage.add('location', {'slug': 'city-page'})
+    assert stage.finish().startswith('links: 3 internal links')
+    assert json.loads((tmp_path / 'broken.json').read_text()) == {}
+
+
+def test_broken_links_fail_the_build(tmp_path):
+    stage = LinkCheckStage(
+        path=str(tmp_path / 'broken.json'), pages_dir=str(tmp_path / 'pages'),
+        payload_dir=str(tmp_path / 'payloads')
+    )
+    # A payload kind without a payload file on disk is not served
+    stage.add('location', {'slug': 'city-page', 'internalLinks': [{'url': '/missing'}, {'url': '/missing?x=1'}]})
+    stage.add('industry', {'slug': 'ind', 'internalLinks': [{'url': '/city-page'}]})
+    with pytest.raises(BrokenLinkError, match='2 broken'):
+        stage.finish()
+    broken = json.loads((tmp_path / 'broken.json').read_text())
+    assert broken == {
+        '/missing': {'links': 2, 'from': ['city-page', 'city-page']},
+        '/city-page': {'links': 1, 'from': ['ind']}
+    }
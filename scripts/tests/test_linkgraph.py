@@ -0,0 +1,50 @@
+import json
+
+from pseo.linkgraph import LinkGraphStage, literal_links
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+    return path
+
+
+def test_literal_links(tmp_path):
+    source = write(tmp_path / 'page.js', """
+        <Link href="/ai-seo">x</Link> <a href={'/guides/'}>y</a> <Link href={`/${page.slug}`}>z</Link>
+        const items = [{ url: "/tools#top", name: 'Tools' }, { link: '/faq?x=1' }]
+        <link rel="icon" href="https://example.com/a" />
+    """)
+    assert literal_links(source) == ['/ai-seo', '/guides', '/tools', '/faq']
+
+
+def test_depth_from_home_and_nav_with_findings(tmp_path):
+    pages_dir = tmp_path / 'pages'
+    write(pages_dir / 'index.js', '<Link href="/hub">All guides</Link>')
+    write(pages_dir / 'hub.js', '')
+    write(pages_dir / 'about.js', '')
+    write(pages_dir / 'lonely-hub.js', '')
+    layout = write(tmp_path / 'Layout.js', '<Link href="/about">About</Link> <link href="/favicon.ico" />')
+    hubs = {'/hub': ('industry', {}, None), '/lonely-hub': ('location', {'industry': 'a'}, 1)}
+    stage = LinkGraphStage(
+        path=str(tmp_path / 'graph.json'), report_path=str(tmp_path / 'report.json'),
+        hubs=hubs, pages_dir=str(pages_dir), layout_path=str(layout)
+    )
+    stage.add('industry', {'slug': 'ind-a', 'internalLinks': [{'url': '/loc-a-1'}]})
+    stage.add('location', {'slug': 'loc-a-1', 'industry': 'a'})
+    stage.add('location', {'slug': 'loc-a-2', 'industry': 'a'})
+    stage.add('technical', {'slug': 'tech'})
+    stage.finish()
+
+    graph = json.loads((tmp_path / 'graph.json').read_text())
+    report = json.loads((tmp_path / 'report.json').read_text())
+    assert report['roots'] == ['/', '/about']
+    # / -> /hub -> ind-a -> loc-a-1
+    assert graph['ind-a']['clickDepth'] == 2
+    assert graph['loc-a-1']['clickDepth'] == 3
+    # Only the first matching page is listed by the unlinked hub
+    assert graph['loc-a-2']['clickDepth'] is None
+    assert report['kinds']['location']['hubDepth'] == {'1': 1, 'unreachable': 1}
+    assert report['unreachableKinds'] == ['technical']
+    assert report['unlinkedHubs'] == ['/lonely-hub']
+    assert report['unreachableStaticPages'] == ['/lonely-hub']
@@ -0,0 +1,63 @@
+from pseo.llms import LlmsTxtStage, TextParts
+
+HEADER = "# Site\n"
+URL = 'https://example.com'
+
+
+def write_parts(directory, entries, max_bytes):
+    parts = TextParts(str(directory), 'llms', HEADER, max_bytes)
+    parts.start_section('Guides')
+    for i in range(entries):
+        parts.write(f"- entry {i:03}\n")
+    return parts.close(URL)
+
+
+def part_files(directory):
+    return sorted(path.name for path in directory.glob('llms*.txt'))
+
+
+def test_parts_split_by_size_with_index(tmp_path):
+    assert write_parts(tmp_path, 30, 100) == 5
+    assert part_files(tmp_path) == ['llms-1.txt', 'llms-2.txt', 'llms-3.txt', 'llms-4.txt', 'llms-5.txt', 'llms.txt']
+
+    entries = []
+    for number in range(1, 6):
+        text = (tmp_path / f"llms-{number}.txt").read_text()
+        assert len(text.encode('utf-8')) <= 100
+        # Every part starts with the header and the section it continues
+        assert text.startswith(HEADER + "\n## Guides\n\n")
+        entries += [line for line in text.splitlines() if line.startswith('- entry')]
+    assert entries == [f"- entry {i:03}" for i in range(30)]
+
+    index = (tmp_path / 'llms.txt').read_text()
+    assert index.startswith(HEADER)
+    assert f"- [llms part 5]({URL}/llms-5.txt)" in index
+
+
+def test_stale_parts_are_removed(tmp_path):
+    write_parts(tmp_path, 30, 100)
+    assert write_parts(tmp_path, 12, 100) == 2
+    assert part_files(tmp_path) == ['llms-1.txt', 'llms-2.txt', 'llms.txt']
+
+    # Back to a single file: no numbered parts are left
+    assert write_parts(tmp_path, 3, 100) == 1
+    assert part_files(tmp_path) == ['llms.txt']
+    assert (tmp_path / 'llms.txt').read_text().endswith("- entry 002\n")
+
+
+def test_stage_sections_and_static_slugs(tmp_path):
+    stage = LlmsTxtStage(public_dir=str(tmp_path), site_url=URL)
+    stage.add('industry', {'slug': 'ai-seo-dentists', 'title': 'Dentists', 'meta_description': 'For dentists',
+                           'introduction': {'paragraphs': ['First.', 'Second.']}})
+    stage.add('industry', {'slug': 'ai-seo-dentists', 'title': 'Again'})
+    stage.add('industry', {'slug': 'ai-seo', 'title': 'Hand-written'})
+    stage.add('usecase', {'slug': 'use', 'title': 'Use', 'introduction': {'opening_paragraph': 'Opening.'}})
+    assert stage.finish().startswith('llms.txt: 2 pages')
+
+    index = (tmp_path / 'llms.txt').read_text()
+    assert "## AI SEO guides by industry\n\n- [Dentists](https://example.com/ai-seo-dentists): For dentists\n" in index
+    assert "## AI SEO use cases\n\n- [Use](https://example.com/use): \n" in index
+    assert 'Again' not in index and 'Hand-written' not in index
+    full = (tmp_path / 'llms-full.txt').read_text()
+    assert "### Dentists\n\nURL: https://example.com/ai-seo-dentists\n\n> For dentists\n\nFirst.\n\nSecond.\n\n" in full
+    assert "### Use\n\nURL: https://example.com/use\n\nOpening.\n\n" in full
@@ -0,0 +1,52 @@
+import copy
+
+from pseo import location, seeds, seedstats
+from pseo.tracking import DependencyMap, seed_changes
+
+
+def track(industry, cities):
+    deps = DependencyMap()
+    for city in cities:
+        page, reads = location.render_location_page_tracked(industry, city, '2026-01-01T00:00:00')
+        deps.record(page.slug, {'industry': industry['slug'], 'city': city['slug']}, reads)
+    return deps
+
+
+def edited(cities, slug=None, path=(), value=None):
+    cities = copy.deepcopy(cities)
+    for city in cities:
+        if city['slug'] == slug:
+            record = city
+            for key in path[:-1]:
+                record = record[key]
+            record[path[-1]] = value
+    seedstats.annotate('cities', cities)
+    return cities
+
+
+def stale_after(deps, industry, old_cities, new_cities):
+    return deps.stale({
+        'industry': seed_changes([industry], [industry], 'industry'),
+        'city': seed_changes(old_cities, new_cities, 'city')
+    })
+
+
+def test_unchanged_seeds_render_nothing():
+    industry = seeds.load('industries')[0]
+    cities = seeds.load('cities')
+    deps = track(industry, cities)
+    assert stale_after(deps, industry, cities, edited(cities)) == {}
+
+
+def test_one_city_edit_renders_only_its_pages():
+    industry = seeds.load('industries')[0]
+    cities = seeds.load('cities')
+    deps = track(industry, cities)
+    target = cities[0]
+    slug = f"ai-seo-{industry['slug']}-{target['slug']}"
+    # The largest city shrinking to the smallest reorders every population and
+    # business count standing, but only the edited city's own pages read them
+    stale = stale_after(deps, industry, cities, edited(cities, target['slug'], ('population',), '1,000'))
+    assert set(stale) <= {slug}
+    stale = stale_after(deps, industry, cities, edited(cities, target['slug'], ('stats', 'business_count'), '100+'))
+    assert set(stale) == {slug}
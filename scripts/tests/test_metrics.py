@@ -0,0 +1,47 @@
+from pseo import build, iter_pages, render_page
+from pseo.hashing import content_hash
+from pseo.metrics import attach
+from pseo.records import to_json
+
+
+class Collect:
+    def __init__(self, needs_metrics):
+        self.needs_metrics = needs_metrics
+        self.pages = []
+
+    def add(self, kind, page):
+        self.pages.append(to_json(page))
+
+    def finish(self):
+        return None
+
+
+def test_build_attaches_metrics_only_when_a_stage_asks():
+    plain = Collect(needs_metrics=False)
+    build.run([plain], kinds=('technical',), log=lambda line: None)
+    assert all(not page.get('metrics') for page in plain.pages)
+
+    wants = Collect(needs_metrics=True)
+    build.run([plain, wants], kinds=('technical',), log=lambda line: None)
+    for page in wants.pages:
+        assert page['metrics']['words'] > 0
+        assert page['metrics']['readability'] is not None
+        assert page['word_count'] == page['metrics']['words']
+
+
+def test_attach_covers_every_kind():
+    for kind in ('location', 'industry-platform', 'technical', 'guide'):
+        page = next(iter_pages(kind))
+        metrics = attach(page)
+        assert metrics['words'] > 0
+        assert set(metrics['sections'])
+        assert to_json(page)['metrics'] == metrics
+
+
+def test_metrics_leave_the_content_hash_alone():
+    page = render_page('location', 'law-firms', 'new-york')
+    digest = content_hash(page)
+    attach(page)
+    assert content_hash(page) == digest
+    listed = next(iter_pages('location', industry='law-firms', city='new-york'))
+    assert attach(listed) == page.metrics
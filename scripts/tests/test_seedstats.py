@@ -0,0 +1,20 @@
+import sys
+
+import pytest
+
+from pseo import seeds, seedstats
+
+
+def test_parse_stat():
+    assert seedstats.parse_stat("240,000+") == 240000
+    assert seedstats.parse_stat("+145%") == 145
+    assert seedstats.parse_stat("347 million") == 347_000_000
+    assert seedstats.parse_stat("Very High") == 5
+    assert seedstats.parse_stat("n/a") is None
+
+
+def test_seeds_fail_to_parse_without_numpy(monkeypatch):
+    # Standing phrases are page copy, so a missing NumPy must not quietly drop them
+    monkeypatch.setitem(sys.modules, 'numpy', None)
+    with pytest.raises(ImportError, match='requirements.txt'):
+        seeds.parse_seeds(seeds.DATA_DIR)
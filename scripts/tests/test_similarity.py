@@ -0,0 +1,28 @@
+import sys
+
+import pytest
+
+from pseo import seeds, similarity
+from pseo.industry import get_related_industries
+
+
+def test_related_method_is_explicit(monkeypatch):
+    assert similarity.use_tfidf('tfidf')
+    assert not similarity.use_tfidf('heuristic')
+    with pytest.raises(ValueError):
+        similarity.use_tfidf('cosine')
+    # A missing scipy fails the default method instead of switching to the heuristics
+    monkeypatch.setitem(sys.modules, 'scipy.sparse', None)
+    with pytest.raises(ImportError, match='PSEO_RELATED'):
+        similarity.use_tfidf('tfidf')
+    assert not similarity.use_tfidf('heuristic')
+
+
+def test_related_industries_follow_the_method(monkeypatch):
+    industries = seeds.load('industries')
+    current = industries[0]
+    tfidf = get_related_industries(current, industries)
+    monkeypatch.setattr(similarity, 'RELATED_METHOD', 'heuristic')
+    heuristic = get_related_industries(current, industries)
+    assert len(tfidf) == len(heuristic) == 6
+    assert f"/ai-seo-{current['slug']}" not in [link['url'] for link in tfidf + heuristic]
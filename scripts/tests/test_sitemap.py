@@ -0,0 +1,51 @@
+import gzip
+import json
+import os
+import re
+
+from pseo.build import STATIC_PAGES
+from pseo.sitemap import SitemapStage
+
+
+def page(slug, text='copy'):
+    return {'slug': slug, 'title': slug, 'body': text, 'generated_at': 'now'}
+
+
+def build(tmp_path, today, pages, kinds=('location', 'usecase')):
+    stage = SitemapStage(public_dir=str(tmp_path / 'public'), ledger_path=str(tmp_path / 'ledger.json'), today=today, kinds=kinds)
+    for kind, item in pages:
+        stage.add(kind, item)
+    stage.finish()
+    with open(tmp_path / 'ledger.json', encoding='utf-8') as f:
+        ledger = json.load(f)
+    urls = {}
+    for name in sorted(os.listdir(tmp_path / 'public')):
+        if name.endswith('.xml.gz'):
+            with gzip.open(tmp_path / 'public' / name, 'rt', encoding='utf-8') as f:
+                for loc, lastmod in re.findall(r'<loc>[^<]*/([^</]*)</loc><lastmod>([^<]*)</lastmod>', f.read()):
+                    urls[loc] = lastmod
+    return ledger, urls
+
+
+def test_lastmod_moves_only_when_content_changes(tmp_path):
+    pages = [('location', page('a')), ('location', page('b'))]
+    build(tmp_path, '2026-01-01', pages)
+    pages = [('location', page('a')), ('location', page('b', 'new copy'))]
+    ledger, urls = build(tmp_path, '2026-02-01', pages)
+    assert urls['a'] == ledger['a'][1] == '2026-01-01'
+    assert urls['b'] == ledger['b'][1] == '2026-02-01'
+    assert len(urls) == len(STATIC_PAGES) + 2
+
+
+def test_partial_kinds_keep_the_other_kinds(tmp_path):
+    build(tmp_path, '2026-01-01', [('location', page('a')), ('usecase', page('u'))])
+    # Only location pages are rebuilt, and one of them is gone
+    ledger, urls = build(tmp_path, '2026-02-01', [('location', page('c'))], kinds=('location',))
+    assert urls['u'] == '2026-01-01'
+    assert ledger['u'] == ledger['u'][:1] + ['2026-01-01', 'usecase']
+    assert 'a' not in urls and 'a' not in ledger
+    assert urls['c'] == '2026-02-01'
+
+    # The next full build still knows the carried URL's content hash
+    ledger, urls = build(tmp_path, '2026-03-01', [('location', page('c')), ('usecase', page('u'))])
+    assert urls['u'] == '2026-01-01' and urls['c'] == '2026-02-01'
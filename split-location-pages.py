@@ -1,4 +1,10 @@
 import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from pseo import serializer
 
 # Load the large file
 with open('src/data/pseo/industry-location-pages.json', 'r', encoding='utf-8') as f:
@@ -10,9 +16,8 @@ for i in range(0, len(all_pages), chunk_size):
     chunk = all_pages[i:i+chunk_size]
     chunk_num = i//chunk_size + 1
     filename = f'src/data/pseo/industry-location-pages-{chunk_num}.json'
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(chunk, f, ensure_ascii=False)
-    print(f"✅ Created {filename} with {len(chunk)} pages (~{len(json.dumps(chunk))/1024/1024:.1f}MB)")
+    size = serializer.dump(chunk, filename, pretty=False)
+    print(f"✅ Created {filename} with {len(chunk)} pages (~{size/1024/1024:.1f}MB)")
 
 print(f"\n🎉 Split {len(all_pages)} pages into {(len(all_pages)-1)//chunk_size + 1} files")
-print("Now delete the original large file and update [slug].js")
\ No newline at end of file
+print("Now delete the original large file and update [slug].js")
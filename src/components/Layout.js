@@ -3,7 +3,7 @@ import Link from 'next/link';
 import { useRouter } from 'next/router';
 import { Bot } from 'lucide-react';
 
-export default function Layout({ children, title = 'AISEO Scanner - Is your website ready for AI search ?', description }) {
+export default function Layout({ children, title = 'AISEO Scanner - Is your website ready for AI search ?', description, prefetch = [] }) {
   const router = useRouter();
   
   // 1. Clean the Base URL (removes any accidental trailing slash)
@@ -31,6 +31,11 @@ export default function Layout({ children, title = 'AISEO Scanner - Is your webs
         <link rel="shortcut icon" href="/favicon.ico" />
         <link rel="apple-touch-icon" href="/apple-touch-icon.png" />
 
+        {/* Likely next pages (build/prefetch-hints/<slug>.json) */}
+        {prefetch.map((url) => (
+          <link key={url} rel="prefetch" href={url} />
+        ))}
+
         <Script
   id="affiliate-watch"
   strategy="afterInteractive"
@@ -1,4 +1,5 @@
 import Link from 'next/link'
+import MarkdownBlocks from './MarkdownBlocks'
 import { Bot, MapPin, TrendingUp, Users, Target, CheckCircle, ArrowRight, Award, BarChart3, Lightbulb, AlertTriangle, Zap, Globe, Eye, Building2 } from 'lucide-react'
 
 export default function IndustryLocationTemplate({ pageData }) {
@@ -66,8 +67,8 @@ export default function IndustryLocationTemplate({ pageData }) {
       {/* Introduction Section */}
       <div className="bg-gradient-to-r from-gray-900/60 to-purple-900/20 backdrop-blur-sm p-8 rounded-xl border border-purple-500/50 mb-12">
         <div className="prose prose-invert max-w-none">
-          <div className="text-gray-200 text-lg leading-relaxed whitespace-pre-line">
-            {content.intro}
+          <div className="text-gray-200 text-lg leading-relaxed">
+            <MarkdownBlocks blocks={content.intro} />
           </div>
         </div>
       </div>
@@ -77,8 +78,8 @@ export default function IndustryLocationTemplate({ pageData }) {
         <div className="flex items-start mb-6">
           <Target className="h-8 w-8 text-pink-400 mr-4 mt-1 flex-shrink-0" />
           <div className="prose prose-invert max-w-none w-full">
-            <div className="text-gray-200 text-lg leading-relaxed whitespace-pre-line">
-              {content.whyAISEOMatters}
+            <div className="text-gray-200 text-lg leading-relaxed">
+              <MarkdownBlocks blocks={content.whyAISEOMatters} />
             </div>
           </div>
         </div>
@@ -99,8 +100,8 @@ export default function IndustryLocationTemplate({ pageData }) {
         <div className="flex items-start mb-6">
           <AlertTriangle className="h-8 w-8 text-blue-400 mr-4 mt-1 flex-shrink-0" />
           <div className="prose prose-invert max-w-none w-full">
-            <div className="text-gray-200 text-lg leading-relaxed whitespace-pre-line">
-              {content.localChallenges}
+            <div className="text-gray-200 text-lg leading-relaxed">
+              <MarkdownBlocks blocks={content.localChallenges} />
             </div>
           </div>
         </div>
@@ -111,8 +112,8 @@ export default function IndustryLocationTemplate({ pageData }) {
         <div className="flex items-start mb-6">
           <Zap className="h-8 w-8 text-emerald-400 mr-4 mt-1 flex-shrink-0" />
           <div className="prose prose-invert max-w-none w-full">
-            <div className="text-gray-200 text-lg leading-relaxed whitespace-pre-line">
-              {content.aiSEOStrategy}
+            <div className="text-gray-200 text-lg leading-relaxed">
+              <MarkdownBlocks blocks={content.aiSEOStrategy} />
             </div>
           </div>
         </div>
@@ -133,8 +134,8 @@ export default function IndustryLocationTemplate({ pageData }) {
         <div className="flex items-start mb-6">
           <BarChart3 className="h-8 w-8 text-purple-400 mr-4 mt-1 flex-shrink-0" />
           <div className="prose prose-invert max-w-none w-full">
-            <div className="text-gray-200 text-lg leading-relaxed whitespace-pre-line">
-              {content.measurementROI}
+            <div className="text-gray-200 text-lg leading-relaxed">
+              <MarkdownBlocks blocks={content.measurementROI} />
             </div>
           </div>
         </div>
@@ -145,8 +146,8 @@ export default function IndustryLocationTemplate({ pageData }) {
         <div className="flex items-start mb-6">
           <CheckCircle className="h-8 w-8 text-blue-400 mr-4 mt-1 flex-shrink-0" />
           <div className="prose prose-invert max-w-none w-full">
-            <div className="text-gray-200 text-lg leading-relaxed whitespace-pre-line">
-              {content.implementation}
+            <div className="text-gray-200 text-lg leading-relaxed">
+              <MarkdownBlocks blocks={content.implementation} />
             </div>
           </div>
         </div>
@@ -167,8 +168,8 @@ export default function IndustryLocationTemplate({ pageData }) {
         <div className="flex items-start mb-6">
           <Award className="h-8 w-8 text-pink-400 mr-4 mt-1 flex-shrink-0" />
           <div className="prose prose-invert max-w-none w-full">
-            <div className="text-gray-200 text-lg leading-relaxed whitespace-pre-line">
-              {content.localCaseStudy}
+            <div className="text-gray-200 text-lg leading-relaxed">
+              <MarkdownBlocks blocks={content.localCaseStudy} />
             </div>
           </div>
         </div>
@@ -179,8 +180,8 @@ export default function IndustryLocationTemplate({ pageData }) {
         <div className="flex items-start mb-6">
           <TrendingUp className="h-8 w-8 text-emerald-400 mr-4 mt-1 flex-shrink-0" />
           <div className="prose prose-invert max-w-none w-full">
-            <div className="text-gray-200 text-lg leading-relaxed whitespace-pre-line">
-              {content.competitiveAdvantage}
+            <div className="text-gray-200 text-lg leading-relaxed">
+              <MarkdownBlocks blocks={content.competitiveAdvantage} />
             </div>
           </div>
         </div>
@@ -199,8 +200,8 @@ export default function IndustryLocationTemplate({ pageData }) {
       {/* Primary CTA Section */}
       <div className="bg-gradient-to-r from-gray-900/60 to-purple-900/20 backdrop-blur-sm p-8 rounded-xl border border-purple-500/50 mb-12">
         <div className="prose prose-invert max-w-none">
-          <div className="text-gray-200 text-lg leading-relaxed whitespace-pre-line">
-            {content.ctaSection}
+          <div className="text-gray-200 text-lg leading-relaxed">
+            <MarkdownBlocks blocks={content.ctaSection} />
           </div>
         </div>
 
@@ -222,8 +223,8 @@ export default function IndustryLocationTemplate({ pageData }) {
         <div className="flex items-start mb-6">
           <Lightbulb className="h-8 w-8 text-blue-400 mr-4 mt-1 flex-shrink-0" />
           <div className="prose prose-invert max-w-none w-full">
-            <div className="text-gray-200 text-lg leading-relaxed whitespace-pre-line">
-              {content.faq}
+            <div className="text-gray-200 text-lg leading-relaxed">
+              <MarkdownBlocks blocks={content.faq} />
             </div>
           </div>
         </div>
@@ -235,8 +236,8 @@ export default function IndustryLocationTemplate({ pageData }) {
           Ready to Dominate AI Search in {cityName}?
         </h2>
         <div className="prose prose-invert max-w-none mb-8">
-          <div className="text-gray-200 text-lg leading-relaxed whitespace-pre-line">
-            {content.finalCTA}
+          <div className="text-gray-200 text-lg leading-relaxed">
+            <MarkdownBlocks blocks={content.finalCTA} />
           </div>
         </div>
 
@@ -0,0 +1,64 @@
+// Renders the markdown block trees built by scripts/pseo/markdown.py.
+// Blocks are [type, ...] arrays; inline text is a string or an array of
+// strings and ['b', text] bold spans. Plain strings (pages generated before
+// sections were pre-parsed) fall back to pre-line text. Deferred sections of a
+// split payload are missing until the client has fetched them.
+
+const BLOCK_CLASSES = {
+  h2: 'text-2xl md:text-3xl font-bold text-white mb-4',
+  h3: 'text-xl font-semibold text-purple-300 mt-6 mb-3',
+  p: 'mb-4',
+  ul: 'list-disc pl-6 mb-4 space-y-2',
+  ol: 'list-decimal pl-6 mb-4 space-y-2'
+}
+
+function Inline({ value }) {
+  if (typeof value === 'string') return value
+  return value.map((span, idx) =>
+    typeof span === 'string'
+      ? span
+      : <strong key={idx} className="font-semibold text-white">{span[1]}</strong>
+  )
+}
+
+export default function MarkdownBlocks({ blocks }) {
+  if (!blocks) {
+    return null
+  }
+
+  if (typeof blocks === 'string') {
+    return <div className="whitespace-pre-line">{blocks}</div>
+  }
+
+  return blocks.map((block, idx) => {
+    const [type] = block
+
+    if (type === 'qa') {
+      return (
+        <div key={idx} className="mb-6">
+          <h3 className="font-semibold text-white mb-2"><Inline value={block[1]} /></h3>
+          <p><Inline value={block[2]} /></p>
+        </div>
+      )
+    }
+
+    if (type === 'ul' || type === 'ol') {
+      const List = type
+      return (
+        <List key={idx} className={BLOCK_CLASSES[type]}>
+          {block[1].map((item, itemIdx) => (
+            <li key={itemIdx}><Inline value={item} /></li>
+          ))}
+        </List>
+      )
+    }
+
+    // h4-h6 are styled like h3
+    const Tag = type
+    return (
+      <Tag key={idx} className={BLOCK_CLASSES[type] || BLOCK_CLASSES.h3}>
+        <Inline value={block[1]} />
+      </Tag>
+    )
+  })
+}
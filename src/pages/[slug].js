@@ -6,8 +6,11 @@ import IndustryPlatformTemplate from '../components/pseo/IndustryPlatformTemplat
 import IndustryLocationTemplate from '../components/pseo/IndustryLocationTemplate'
 import fs from 'fs'
 import path from 'path'
+import { useEffect, useState } from 'react'
+
+export default function PSEOPage({ pageData: criticalData, prefetch }) {
+  const pageData = useDeferredPayload(criticalData)
 
-export default function PSEOPage({ pageData }) {
   if (!pageData) {
     return (
       <Layout title="Page Not Found">
@@ -34,6 +37,7 @@ export default function PSEOPage({ pageData }) {
     <Layout 
       title={pageData.title}
       description={pageData.metaDescription || pageData.meta_description}
+      prefetch={prefetch}
     >
       {isIndustryLocationPage ? (
         <IndustryLocationTemplate pageData={pageData} />
@@ -48,9 +52,82 @@ export default function PSEOPage({ pageData }) {
   )
 }
 
+const isObject = value => value !== null && typeof value === 'object' && !Array.isArray(value)
+
+// Deep-merges a deferred payload back into its critical payload (merge_page in scripts/pseo/payloads.py)
+function mergePayload(critical, deferred) {
+  const page = { ...critical }
+  for (const [key, value] of Object.entries(deferred)) {
+    page[key] = isObject(value) && isObject(page[key]) ? mergePayload(page[key], value) : value
+  }
+  return page
+}
+
+// Fetches a split page's deferred payload after hydration and merges it into the critical one
+function useDeferredPayload(critical) {
+  const [page, setPage] = useState(critical)
+
+  useEffect(() => {
+    setPage(critical)
+    if (!critical || !critical.deferredUrl) {
+      return
+    }
+    let cancelled = false
+    fetch(critical.deferredUrl)
+      .then(response => {
+        if (!response.ok) throw new Error(`HTTP ${response.status}`)
+        return response.json()
+      })
+      .then(deferred => {
+        if (!cancelled) setPage(mergePayload(critical, deferred))
+      })
+      .catch(error => console.warn('Could not load deferred payload:', error.message))
+    return () => {
+      cancelled = true
+    }
+  }, [critical])
+
+  return page
+}
+
+// Critical payload of a split page from public/pseo-data (scripts/build-pseo.py --stages payloads);
+// the deferred part is fetched by the client from its deferredUrl
+function loadPayload(slug) {
+  const criticalPath = path.join(process.cwd(), 'public', 'pseo-data', 'critical', `${slug}.json`)
+  try {
+    return JSON.parse(fs.readFileSync(criticalPath, 'utf8'))
+  } catch (error) {
+    return null
+  }
+}
+
+// This page's prefetch hints from the build (scripts/build-pseo.py --stages prefetch);
+// pages without outbound links have no hints file
+function loadPrefetchHints(slug) {
+  const hintsPath = path.join(process.cwd(), 'src', 'data', 'pseo', 'build', 'prefetch-hints', `${slug}.json`)
+  try {
+    return JSON.parse(fs.readFileSync(hintsPath, 'utf8'))
+  } catch (error) {
+    if (error.code !== 'ENOENT') {
+      console.warn('Could not load prefetch hints:', error.message)
+    }
+    return []
+  }
+}
+
 export const getStaticPaths = async () => {
+  // Prerender the highest-traffic pages (scripts/build-pseo.py --stages prerender);
+  // everything else is rendered on its first request
+  let slugs = []
+  try {
+    const manifestPath = path.join(process.cwd(), 'src', 'data', 'pseo', 'build', 'prerender-manifest.json')
+    slugs = JSON.parse(fs.readFileSync(manifestPath, 'utf8')).slugs
+  } catch (error) {
+    console.warn('Could not load prerender manifest:', error.message)
+  }
+
   return {
-    paths: [],
+    paths: slugs.map(slug => ({ params: { slug } })),
     fallback: 'blocking'
   }
 }
@@ -88,8 +165,9 @@ export const getStaticProps = async ({ params }) => {
       console.warn('Could not load use case pages:', error.message)
     }
 
-    // Find the specific page data
-    const pageData = allPages.find(page => page.slug === params.slug)
+    // Find the specific page data; location and industry × platform pages are too
+    // large to load as whole files and ship only their critical payload instead
+    const pageData = allPages.find(page => page.slug === params.slug) || loadPayload(params.slug)
 
     if (!pageData) {
       return {
@@ -99,7 +177,8 @@ export const getStaticProps = async ({ params }) => {
 
     return {
       props: {
-        pageData
+        pageData,
+        prefetch: loadPrefetchHints(params.slug)
       }
     }
   } catch (error) {